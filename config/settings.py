@@ -59,6 +59,13 @@ class DataConfig(BaseSettings):
         default=Path("data/raw"),
         description="Directory for raw data files",
     )
+    feature_store_dir: Path | None = Field(
+        default=None,
+        description=(
+            "Directory for columnar (Parquet) feature storage; when unset, "
+            "features are stored as JSONB in computed_features"
+        ),
+    )
     default_timeframe: str = Field(
         default="1Min",
         description="Default bar timeframe",
@@ -2,8 +2,10 @@ package server
 
 import (
 	"context"
+	"encoding/binary"
 	"fmt"
 	"log/slog"
+	"math"
 	"time"
 
 	"google.golang.org/grpc/codes"
@@ -164,14 +166,22 @@ func (s *MarketServer) BulkUpsertTickers(ctx context.Context, req *pb.BulkUpsert
 
 // --- Bar RPCs ---
 
+// parsePageToken decodes a GetBars page token (RFC3339 timestamp of the last bar).
+func parsePageToken(token string) (*time.Time, error) {
+	if token == "" {
+		return nil, nil
+	}
+	t, err := time.Parse(time.RFC3339Nano, token)
+	if err != nil {
+		return nil, status.Errorf(codes.InvalidArgument, "invalid page_token: %v", err)
+	}
+	return &t, nil
+}
+
 func (s *MarketServer) GetBars(ctx context.Context, req *pb.GetBarsRequest) (*pb.GetBarsResponse, error) {
-	var pageToken *time.Time
-	if req.PageToken != "" {
-		t, err := time.Parse(time.RFC3339Nano, req.PageToken)
-		if err != nil {
-			return nil, status.Errorf(codes.InvalidArgument, "invalid page_token: %v", err)
-		}
-		pageToken = &t
+	pageToken, err := parsePageToken(req.PageToken)
+	if err != nil {
+		return nil, err
 	}
 
 	bars, err := s.bars.GetBars(ctx, req.TickerId, req.Timeframe, tsPtr(req.Start), tsPtr(req.End), req.PageSize, pageToken)
@@ -195,6 +205,30 @@ func (s *MarketServer) GetBars(ctx context.Context, req *pb.GetBarsRequest) (*pb
 	}, nil
 }
 
+// GetBarsColumnar pages bars like GetBars but returns each page as column buffers.
+func (s *MarketServer) GetBarsColumnar(ctx context.Context, req *pb.GetBarsRequest) (*pb.GetBarsColumnarResponse, error) {
+	pageToken, err := parsePageToken(req.PageToken)
+	if err != nil {
+		return nil, err
+	}
+
+	bars, err := s.bars.GetBars(ctx, req.TickerId, req.Timeframe, tsPtr(req.Start), tsPtr(req.End), req.PageSize, pageToken)
+	if err != nil {
+		s.logger.Error("GetBarsColumnar failed", "ticker_id", req.TickerId, "error", err)
+		return nil, mapError(err, "GetBarsColumnar")
+	}
+
+	var nextPageToken string
+	if len(bars) > 0 && int32(len(bars)) == req.PageSize {
+		nextPageToken = bars[len(bars)-1].Timestamp.Format(time.RFC3339Nano)
+	}
+
+	return &pb.GetBarsColumnarResponse{
+		Columns:       barsToColumns(bars),
+		NextPageToken: nextPageToken,
+	}, nil
+}
+
 func (s *MarketServer) StreamBars(req *pb.StreamBarsRequest, stream pb.MarketDataService_StreamBarsServer) error {
 	bars, err := s.bars.StreamBars(stream.Context(), req.TickerId, req.Timeframe, tsPtr(req.Start), tsPtr(req.End))
 	if err != nil {
@@ -490,6 +524,36 @@ func barToProto(b *repository.OHLCVBar) *pb.OHLCVBar {
 	return bar
 }
 
+// barsToColumns packs bars into little-endian column buffers (see BarColumns).
+func barsToColumns(bars []repository.OHLCVBar) *pb.BarColumns {
+	n := len(bars)
+	timestamps := make([]byte, 8*n)
+	open := make([]byte, 8*n)
+	high := make([]byte, 8*n)
+	low := make([]byte, 8*n)
+	closes := make([]byte, 8*n)
+	volume := make([]byte, 8*n)
+	for i := range bars {
+		b := &bars[i]
+		off := 8 * i
+		binary.LittleEndian.PutUint64(timestamps[off:], uint64(b.Timestamp.UnixMicro()))
+		binary.LittleEndian.PutUint64(open[off:], math.Float64bits(b.Open))
+		binary.LittleEndian.PutUint64(high[off:], math.Float64bits(b.High))
+		binary.LittleEndian.PutUint64(low[off:], math.Float64bits(b.Low))
+		binary.LittleEndian.PutUint64(closes[off:], math.Float64bits(b.Close))
+		binary.LittleEndian.PutUint64(volume[off:], uint64(b.Volume))
+	}
+	return &pb.BarColumns{
+		Count:      int32(n),
+		Timestamps: timestamps,
+		Open:       open,
+		High:       high,
+		Low:        low,
+		Close:      closes,
+		Volume:     volume,
+	}
+}
+
 func featureToProto(f *repository.ComputedFeature) *pb.ComputedFeature {
 	pf := &pb.ComputedFeature{
 		Id:             f.ID,
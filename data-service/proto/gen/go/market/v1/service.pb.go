@@ -24,13 +24,14 @@ var File_market_v1_service_proto protoreflect.FileDescriptor
 
 const file_market_v1_service_proto_rawDesc = "" +
 	"\n" +
-	"\x17market/v1/service.proto\x12\tmarket.v1\x1a\x16market/v1/ticker.proto\x1a\x13market/v1/bar.proto\x1a\x17market/v1/feature.proto\x1a\x18market/v1/sync_log.proto2\x9f\x0e\n" +
+	"\x17market/v1/service.proto\x12\tmarket.v1\x1a\x16market/v1/ticker.proto\x1a\x13market/v1/bar.proto\x1a\x17market/v1/feature.proto\x1a\x18market/v1/sync_log.proto2\xf1\x0e\n" +
 	"\x11MarketDataService\x12F\n" +
 	"\tGetTicker\x12\x1b.market.v1.GetTickerRequest\x1a\x1c.market.v1.GetTickerResponse\x12L\n" +
 	"\vListTickers\x12\x1d.market.v1.ListTickersRequest\x1a\x1e.market.v1.ListTickersResponse\x12^\n" +
 	"\x11GetOrCreateTicker\x12#.market.v1.GetOrCreateTickerRequest\x1a$.market.v1.GetOrCreateTickerResponse\x12^\n" +
 	"\x11BulkUpsertTickers\x12#.market.v1.BulkUpsertTickersRequest\x1a$.market.v1.BulkUpsertTickersResponse\x12@\n" +
-	"\aGetBars\x12\x19.market.v1.GetBarsRequest\x1a\x1a.market.v1.GetBarsResponse\x12A\n" +
+	"\aGetBars\x12\x19.market.v1.GetBarsRequest\x1a\x1a.market.v1.GetBarsResponse\x12P\n" +
+	"\x0fGetBarsColumnar\x12\x19.market.v1.GetBarsRequest\x1a\".market.v1.GetBarsColumnarResponse\x12A\n" +
 	"\n" +
 	"StreamBars\x12\x1c.market.v1.StreamBarsRequest\x1a\x13.market.v1.OHLCVBar0\x01\x12U\n" +
 	"\x0eBulkInsertBars\x12 .market.v1.BulkInsertBarsRequest\x1a!.market.v1.BulkInsertBarsResponse\x12I\n" +
@@ -78,22 +79,23 @@ var file_market_v1_service_proto_goTypes = []any{
 	(*GetOrCreateTickerResponse)(nil),        // 23: market.v1.GetOrCreateTickerResponse
 	(*BulkUpsertTickersResponse)(nil),        // 24: market.v1.BulkUpsertTickersResponse
 	(*GetBarsResponse)(nil),                  // 25: market.v1.GetBarsResponse
-	(*OHLCVBar)(nil),                         // 26: market.v1.OHLCVBar
-	(*BulkInsertBarsResponse)(nil),           // 27: market.v1.BulkInsertBarsResponse
-	(*DeleteBarsResponse)(nil),               // 28: market.v1.DeleteBarsResponse
-	(*GetLatestTimestampResponse)(nil),       // 29: market.v1.GetLatestTimestampResponse
-	(*GetEarliestTimestampResponse)(nil),     // 30: market.v1.GetEarliestTimestampResponse
-	(*GetBarCountResponse)(nil),              // 31: market.v1.GetBarCountResponse
-	(*GetBarIdsForTimestampsResponse)(nil),   // 32: market.v1.GetBarIdsForTimestampsResponse
-	(*GetFeaturesResponse)(nil),              // 33: market.v1.GetFeaturesResponse
-	(*GetExistingFeatureBarIdsResponse)(nil), // 34: market.v1.GetExistingFeatureBarIdsResponse
-	(*BulkUpsertFeaturesResponse)(nil),       // 35: market.v1.BulkUpsertFeaturesResponse
-	(*StoreStatesResponse)(nil),              // 36: market.v1.StoreStatesResponse
-	(*GetStatesResponse)(nil),                // 37: market.v1.GetStatesResponse
-	(*GetLatestStatesResponse)(nil),          // 38: market.v1.GetLatestStatesResponse
-	(*GetSyncLogResponse)(nil),               // 39: market.v1.GetSyncLogResponse
-	(*UpdateSyncLogResponse)(nil),            // 40: market.v1.UpdateSyncLogResponse
-	(*ListSyncLogsResponse)(nil),             // 41: market.v1.ListSyncLogsResponse
+	(*GetBarsColumnarResponse)(nil),          // 26: market.v1.GetBarsColumnarResponse
+	(*OHLCVBar)(nil),                         // 27: market.v1.OHLCVBar
+	(*BulkInsertBarsResponse)(nil),           // 28: market.v1.BulkInsertBarsResponse
+	(*DeleteBarsResponse)(nil),               // 29: market.v1.DeleteBarsResponse
+	(*GetLatestTimestampResponse)(nil),       // 30: market.v1.GetLatestTimestampResponse
+	(*GetEarliestTimestampResponse)(nil),     // 31: market.v1.GetEarliestTimestampResponse
+	(*GetBarCountResponse)(nil),              // 32: market.v1.GetBarCountResponse
+	(*GetBarIdsForTimestampsResponse)(nil),   // 33: market.v1.GetBarIdsForTimestampsResponse
+	(*GetFeaturesResponse)(nil),              // 34: market.v1.GetFeaturesResponse
+	(*GetExistingFeatureBarIdsResponse)(nil), // 35: market.v1.GetExistingFeatureBarIdsResponse
+	(*BulkUpsertFeaturesResponse)(nil),       // 36: market.v1.BulkUpsertFeaturesResponse
+	(*StoreStatesResponse)(nil),              // 37: market.v1.StoreStatesResponse
+	(*GetStatesResponse)(nil),                // 38: market.v1.GetStatesResponse
+	(*GetLatestStatesResponse)(nil),          // 39: market.v1.GetLatestStatesResponse
+	(*GetSyncLogResponse)(nil),               // 40: market.v1.GetSyncLogResponse
+	(*UpdateSyncLogResponse)(nil),            // 41: market.v1.UpdateSyncLogResponse
+	(*ListSyncLogsResponse)(nil),             // 42: market.v1.ListSyncLogsResponse
 }
 var file_market_v1_service_proto_depIdxs = []int32{
 	0,  // 0: market.v1.MarketDataService.GetTicker:input_type -> market.v1.GetTickerRequest
@@ -101,45 +103,47 @@ var file_market_v1_service_proto_depIdxs = []int32{
 	2,  // 2: market.v1.MarketDataService.GetOrCreateTicker:input_type -> market.v1.GetOrCreateTickerRequest
 	3,  // 3: market.v1.MarketDataService.BulkUpsertTickers:input_type -> market.v1.BulkUpsertTickersRequest
 	4,  // 4: market.v1.MarketDataService.GetBars:input_type -> market.v1.GetBarsRequest
-	5,  // 5: market.v1.MarketDataService.StreamBars:input_type -> market.v1.StreamBarsRequest
-	6,  // 6: market.v1.MarketDataService.BulkInsertBars:input_type -> market.v1.BulkInsertBarsRequest
-	7,  // 7: market.v1.MarketDataService.DeleteBars:input_type -> market.v1.DeleteBarsRequest
-	8,  // 8: market.v1.MarketDataService.GetLatestTimestamp:input_type -> market.v1.GetLatestTimestampRequest
-	9,  // 9: market.v1.MarketDataService.GetEarliestTimestamp:input_type -> market.v1.GetEarliestTimestampRequest
-	10, // 10: market.v1.MarketDataService.GetBarCount:input_type -> market.v1.GetBarCountRequest
-	11, // 11: market.v1.MarketDataService.GetBarIdsForTimestamps:input_type -> market.v1.GetBarIdsForTimestampsRequest
-	12, // 12: market.v1.MarketDataService.GetFeatures:input_type -> market.v1.GetFeaturesRequest
-	13, // 13: market.v1.MarketDataService.GetExistingFeatureBarIds:input_type -> market.v1.GetExistingFeatureBarIdsRequest
-	14, // 14: market.v1.MarketDataService.BulkUpsertFeatures:input_type -> market.v1.BulkUpsertFeaturesRequest
-	15, // 15: market.v1.MarketDataService.StoreStates:input_type -> market.v1.StoreStatesRequest
-	16, // 16: market.v1.MarketDataService.GetStates:input_type -> market.v1.GetStatesRequest
-	17, // 17: market.v1.MarketDataService.GetLatestStates:input_type -> market.v1.GetLatestStatesRequest
-	18, // 18: market.v1.MarketDataService.GetSyncLog:input_type -> market.v1.GetSyncLogRequest
-	19, // 19: market.v1.MarketDataService.UpdateSyncLog:input_type -> market.v1.UpdateSyncLogRequest
-	20, // 20: market.v1.MarketDataService.ListSyncLogs:input_type -> market.v1.ListSyncLogsRequest
-	21, // 21: market.v1.MarketDataService.GetTicker:output_type -> market.v1.GetTickerResponse
-	22, // 22: market.v1.MarketDataService.ListTickers:output_type -> market.v1.ListTickersResponse
-	23, // 23: market.v1.MarketDataService.GetOrCreateTicker:output_type -> market.v1.GetOrCreateTickerResponse
-	24, // 24: market.v1.MarketDataService.BulkUpsertTickers:output_type -> market.v1.BulkUpsertTickersResponse
-	25, // 25: market.v1.MarketDataService.GetBars:output_type -> market.v1.GetBarsResponse
-	26, // 26: market.v1.MarketDataService.StreamBars:output_type -> market.v1.OHLCVBar
-	27, // 27: market.v1.MarketDataService.BulkInsertBars:output_type -> market.v1.BulkInsertBarsResponse
-	28, // 28: market.v1.MarketDataService.DeleteBars:output_type -> market.v1.DeleteBarsResponse
-	29, // 29: market.v1.MarketDataService.GetLatestTimestamp:output_type -> market.v1.GetLatestTimestampResponse
-	30, // 30: market.v1.MarketDataService.GetEarliestTimestamp:output_type -> market.v1.GetEarliestTimestampResponse
-	31, // 31: market.v1.MarketDataService.GetBarCount:output_type -> market.v1.GetBarCountResponse
-	32, // 32: market.v1.MarketDataService.GetBarIdsForTimestamps:output_type -> market.v1.GetBarIdsForTimestampsResponse
-	33, // 33: market.v1.MarketDataService.GetFeatures:output_type -> market.v1.GetFeaturesResponse
-	34, // 34: market.v1.MarketDataService.GetExistingFeatureBarIds:output_type -> market.v1.GetExistingFeatureBarIdsResponse
-	35, // 35: market.v1.MarketDataService.BulkUpsertFeatures:output_type -> market.v1.BulkUpsertFeaturesResponse
-	36, // 36: market.v1.MarketDataService.StoreStates:output_type -> market.v1.StoreStatesResponse
-	37, // 37: market.v1.MarketDataService.GetStates:output_type -> market.v1.GetStatesResponse
-	38, // 38: market.v1.MarketDataService.GetLatestStates:output_type -> market.v1.GetLatestStatesResponse
-	39, // 39: market.v1.MarketDataService.GetSyncLog:output_type -> market.v1.GetSyncLogResponse
-	40, // 40: market.v1.MarketDataService.UpdateSyncLog:output_type -> market.v1.UpdateSyncLogResponse
-	41, // 41: market.v1.MarketDataService.ListSyncLogs:output_type -> market.v1.ListSyncLogsResponse
-	21, // [21:42] is the sub-list for method output_type
-	0,  // [0:21] is the sub-list for method input_type
+	4,  // 5: market.v1.MarketDataService.GetBarsColumnar:input_type -> market.v1.GetBarsRequest
+	5,  // 6: market.v1.MarketDataService.StreamBars:input_type -> market.v1.StreamBarsRequest
+	6,  // 7: market.v1.MarketDataService.BulkInsertBars:input_type -> market.v1.BulkInsertBarsRequest
+	7,  // 8: market.v1.MarketDataService.DeleteBars:input_type -> market.v1.DeleteBarsRequest
+	8,  // 9: market.v1.MarketDataService.GetLatestTimestamp:input_type -> market.v1.GetLatestTimestampRequest
+	9,  // 10: market.v1.MarketDataService.GetEarliestTimestamp:input_type -> market.v1.GetEarliestTimestampRequest
+	10, // 11: market.v1.MarketDataService.GetBarCount:input_type -> market.v1.GetBarCountRequest
+	11, // 12: market.v1.MarketDataService.GetBarIdsForTimestamps:input_type -> market.v1.GetBarIdsForTimestampsRequest
+	12, // 13: market.v1.MarketDataService.GetFeatures:input_type -> market.v1.GetFeaturesRequest
+	13, // 14: market.v1.MarketDataService.GetExistingFeatureBarIds:input_type -> market.v1.GetExistingFeatureBarIdsRequest
+	14, // 15: market.v1.MarketDataService.BulkUpsertFeatures:input_type -> market.v1.BulkUpsertFeaturesRequest
+	15, // 16: market.v1.MarketDataService.StoreStates:input_type -> market.v1.StoreStatesRequest
+	16, // 17: market.v1.MarketDataService.GetStates:input_type -> market.v1.GetStatesRequest
+	17, // 18: market.v1.MarketDataService.GetLatestStates:input_type -> market.v1.GetLatestStatesRequest
+	18, // 19: market.v1.MarketDataService.GetSyncLog:input_type -> market.v1.GetSyncLogRequest
+	19, // 20: market.v1.MarketDataService.UpdateSyncLog:input_type -> market.v1.UpdateSyncLogRequest
+	20, // 21: market.v1.MarketDataService.ListSyncLogs:input_type -> market.v1.ListSyncLogsRequest
+	21, // 22: market.v1.MarketDataService.GetTicker:output_type -> market.v1.GetTickerResponse
+	22, // 23: market.v1.MarketDataService.ListTickers:output_type -> market.v1.ListTickersResponse
+	23, // 24: market.v1.MarketDataService.GetOrCreateTicker:output_type -> market.v1.GetOrCreateTickerResponse
+	24, // 25: market.v1.MarketDataService.BulkUpsertTickers:output_type -> market.v1.BulkUpsertTickersResponse
+	25, // 26: market.v1.MarketDataService.GetBars:output_type -> market.v1.GetBarsResponse
+	26, // 27: market.v1.MarketDataService.GetBarsColumnar:output_type -> market.v1.GetBarsColumnarResponse
+	27, // 28: market.v1.MarketDataService.StreamBars:output_type -> market.v1.OHLCVBar
+	28, // 29: market.v1.MarketDataService.BulkInsertBars:output_type -> market.v1.BulkInsertBarsResponse
+	29, // 30: market.v1.MarketDataService.DeleteBars:output_type -> market.v1.DeleteBarsResponse
+	30, // 31: market.v1.MarketDataService.GetLatestTimestamp:output_type -> market.v1.GetLatestTimestampResponse
+	31, // 32: market.v1.MarketDataService.GetEarliestTimestamp:output_type -> market.v1.GetEarliestTimestampResponse
+	32, // 33: market.v1.MarketDataService.GetBarCount:output_type -> market.v1.GetBarCountResponse
+	33, // 34: market.v1.MarketDataService.GetBarIdsForTimestamps:output_type -> market.v1.GetBarIdsForTimestampsResponse
+	34, // 35: market.v1.MarketDataService.GetFeatures:output_type -> market.v1.GetFeaturesResponse
+	35, // 36: market.v1.MarketDataService.GetExistingFeatureBarIds:output_type -> market.v1.GetExistingFeatureBarIdsResponse
+	36, // 37: market.v1.MarketDataService.BulkUpsertFeatures:output_type -> market.v1.BulkUpsertFeaturesResponse
+	37, // 38: market.v1.MarketDataService.StoreStates:output_type -> market.v1.StoreStatesResponse
+	38, // 39: market.v1.MarketDataService.GetStates:output_type -> market.v1.GetStatesResponse
+	39, // 40: market.v1.MarketDataService.GetLatestStates:output_type -> market.v1.GetLatestStatesResponse
+	40, // 41: market.v1.MarketDataService.GetSyncLog:output_type -> market.v1.GetSyncLogResponse
+	41, // 42: market.v1.MarketDataService.UpdateSyncLog:output_type -> market.v1.UpdateSyncLogResponse
+	42, // 43: market.v1.MarketDataService.ListSyncLogs:output_type -> market.v1.ListSyncLogsResponse
+	22, // [22:44] is the sub-list for method output_type
+	0,  // [0:22] is the sub-list for method input_type
 	0,  // [0:0] is the sub-list for extension type_name
 	0,  // [0:0] is the sub-list for extension extendee
 	0,  // [0:0] is the sub-list for field type_name
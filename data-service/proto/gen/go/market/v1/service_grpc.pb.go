@@ -24,6 +24,7 @@ const (
 	MarketDataService_GetOrCreateTicker_FullMethodName        = "/market.v1.MarketDataService/GetOrCreateTicker"
 	MarketDataService_BulkUpsertTickers_FullMethodName        = "/market.v1.MarketDataService/BulkUpsertTickers"
 	MarketDataService_GetBars_FullMethodName                  = "/market.v1.MarketDataService/GetBars"
+	MarketDataService_GetBarsColumnar_FullMethodName          = "/market.v1.MarketDataService/GetBarsColumnar"
 	MarketDataService_StreamBars_FullMethodName               = "/market.v1.MarketDataService/StreamBars"
 	MarketDataService_BulkInsertBars_FullMethodName           = "/market.v1.MarketDataService/BulkInsertBars"
 	MarketDataService_DeleteBars_FullMethodName               = "/market.v1.MarketDataService/DeleteBars"
@@ -56,6 +57,7 @@ type MarketDataServiceClient interface {
 	BulkUpsertTickers(ctx context.Context, in *BulkUpsertTickersRequest, opts ...grpc.CallOption) (*BulkUpsertTickersResponse, error)
 	// Bar operations
 	GetBars(ctx context.Context, in *GetBarsRequest, opts ...grpc.CallOption) (*GetBarsResponse, error)
+	GetBarsColumnar(ctx context.Context, in *GetBarsRequest, opts ...grpc.CallOption) (*GetBarsColumnarResponse, error)
 	StreamBars(ctx context.Context, in *StreamBarsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[OHLCVBar], error)
 	BulkInsertBars(ctx context.Context, in *BulkInsertBarsRequest, opts ...grpc.CallOption) (*BulkInsertBarsResponse, error)
 	DeleteBars(ctx context.Context, in *DeleteBarsRequest, opts ...grpc.CallOption) (*DeleteBarsResponse, error)
@@ -134,6 +136,16 @@ func (c *marketDataServiceClient) GetBars(ctx context.Context, in *GetBarsReques
 	return out, nil
 }
 
+func (c *marketDataServiceClient) GetBarsColumnar(ctx context.Context, in *GetBarsRequest, opts ...grpc.CallOption) (*GetBarsColumnarResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(GetBarsColumnarResponse)
+	err := c.cc.Invoke(ctx, MarketDataService_GetBarsColumnar_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 func (c *marketDataServiceClient) StreamBars(ctx context.Context, in *StreamBarsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[OHLCVBar], error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	stream, err := c.cc.NewStream(ctx, &MarketDataService_ServiceDesc.Streams[0], MarketDataService_StreamBars_FullMethodName, cOpts...)
@@ -317,6 +329,7 @@ type MarketDataServiceServer interface {
 	BulkUpsertTickers(context.Context, *BulkUpsertTickersRequest) (*BulkUpsertTickersResponse, error)
 	// Bar operations
 	GetBars(context.Context, *GetBarsRequest) (*GetBarsResponse, error)
+	GetBarsColumnar(context.Context, *GetBarsRequest) (*GetBarsColumnarResponse, error)
 	StreamBars(*StreamBarsRequest, grpc.ServerStreamingServer[OHLCVBar]) error
 	BulkInsertBars(context.Context, *BulkInsertBarsRequest) (*BulkInsertBarsResponse, error)
 	DeleteBars(context.Context, *DeleteBarsRequest) (*DeleteBarsResponse, error)
@@ -360,6 +373,9 @@ func (UnimplementedMarketDataServiceServer) BulkUpsertTickers(context.Context, *
 func (UnimplementedMarketDataServiceServer) GetBars(context.Context, *GetBarsRequest) (*GetBarsResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method GetBars not implemented")
 }
+func (UnimplementedMarketDataServiceServer) GetBarsColumnar(context.Context, *GetBarsRequest) (*GetBarsColumnarResponse, error) {
+	return nil, status.Error(codes.Unimplemented, "method GetBarsColumnar not implemented")
+}
 func (UnimplementedMarketDataServiceServer) StreamBars(*StreamBarsRequest, grpc.ServerStreamingServer[OHLCVBar]) error {
 	return status.Error(codes.Unimplemented, "method StreamBars not implemented")
 }
@@ -519,6 +535,24 @@ func _MarketDataService_GetBars_Handler(srv interface{}, ctx context.Context, de
 	return interceptor(ctx, in, info, handler)
 }
 
+func _MarketDataService_GetBarsColumnar_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetBarsRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(MarketDataServiceServer).GetBarsColumnar(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: MarketDataService_GetBarsColumnar_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(MarketDataServiceServer).GetBarsColumnar(ctx, req.(*GetBarsRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 func _MarketDataService_StreamBars_Handler(srv interface{}, stream grpc.ServerStream) error {
 	m := new(StreamBarsRequest)
 	if err := stream.RecvMsg(m); err != nil {
@@ -827,6 +861,10 @@ var MarketDataService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "GetBars",
 			Handler:    _MarketDataService_GetBars_Handler,
 		},
+		{
+			MethodName: "GetBarsColumnar",
+			Handler:    _MarketDataService_GetBarsColumnar_Handler,
+		},
 		{
 			MethodName: "BulkInsertBars",
 			Handler:    _MarketDataService_BulkInsertBars_Handler,
@@ -300,6 +300,154 @@ func (x *GetBarsResponse) GetTotalCount() int32 {
 	return 0
 }
 
+// BarColumns — a page of bars as column buffers. Each buffer holds the raw
+// little-endian bytes of one array, so clients can map a page straight into
+// arrays instead of decoding one OHLCVBar message per bar.
+type BarColumns struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Count         int32                  `protobuf:"varint,1,opt,name=count,proto3" json:"count,omitempty"`
+	Timestamps    []byte                 `protobuf:"bytes,2,opt,name=timestamps,proto3" json:"timestamps,omitempty"` // int64 microseconds since the Unix epoch (UTC)
+	Open          []byte                 `protobuf:"bytes,3,opt,name=open,proto3" json:"open,omitempty"`             // float64
+	High          []byte                 `protobuf:"bytes,4,opt,name=high,proto3" json:"high,omitempty"`             // float64
+	Low           []byte                 `protobuf:"bytes,5,opt,name=low,proto3" json:"low,omitempty"`               // float64
+	Close         []byte                 `protobuf:"bytes,6,opt,name=close,proto3" json:"close,omitempty"`           // float64
+	Volume        []byte                 `protobuf:"bytes,7,opt,name=volume,proto3" json:"volume,omitempty"`         // int64
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *BarColumns) Reset() {
+	*x = BarColumns{}
+	mi := &file_market_v1_bar_proto_msgTypes[3]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *BarColumns) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*BarColumns) ProtoMessage() {}
+
+func (x *BarColumns) ProtoReflect() protoreflect.Message {
+	mi := &file_market_v1_bar_proto_msgTypes[3]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use BarColumns.ProtoReflect.Descriptor instead.
+func (*BarColumns) Descriptor() ([]byte, []int) {
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{3}
+}
+
+func (x *BarColumns) GetCount() int32 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
+func (x *BarColumns) GetTimestamps() []byte {
+	if x != nil {
+		return x.Timestamps
+	}
+	return nil
+}
+
+func (x *BarColumns) GetOpen() []byte {
+	if x != nil {
+		return x.Open
+	}
+	return nil
+}
+
+func (x *BarColumns) GetHigh() []byte {
+	if x != nil {
+		return x.High
+	}
+	return nil
+}
+
+func (x *BarColumns) GetLow() []byte {
+	if x != nil {
+		return x.Low
+	}
+	return nil
+}
+
+func (x *BarColumns) GetClose() []byte {
+	if x != nil {
+		return x.Close
+	}
+	return nil
+}
+
+func (x *BarColumns) GetVolume() []byte {
+	if x != nil {
+		return x.Volume
+	}
+	return nil
+}
+
+// GetBarsColumnar — same paging as GetBars, columnar payload.
+type GetBarsColumnarResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Columns       *BarColumns            `protobuf:"bytes,1,opt,name=columns,proto3" json:"columns,omitempty"`
+	NextPageToken string                 `protobuf:"bytes,2,opt,name=next_page_token,json=nextPageToken,proto3" json:"next_page_token,omitempty"` // empty when no more pages
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetBarsColumnarResponse) Reset() {
+	*x = GetBarsColumnarResponse{}
+	mi := &file_market_v1_bar_proto_msgTypes[4]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetBarsColumnarResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetBarsColumnarResponse) ProtoMessage() {}
+
+func (x *GetBarsColumnarResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_market_v1_bar_proto_msgTypes[4]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetBarsColumnarResponse.ProtoReflect.Descriptor instead.
+func (*GetBarsColumnarResponse) Descriptor() ([]byte, []int) {
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{4}
+}
+
+func (x *GetBarsColumnarResponse) GetColumns() *BarColumns {
+	if x != nil {
+		return x.Columns
+	}
+	return nil
+}
+
+func (x *GetBarsColumnarResponse) GetNextPageToken() string {
+	if x != nil {
+		return x.NextPageToken
+	}
+	return ""
+}
+
 // StreamBars — server streaming for unbounded reads (used by C++ indicator-engine).
 type StreamBarsRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
@@ -313,7 +461,7 @@ type StreamBarsRequest struct {
 
 func (x *StreamBarsRequest) Reset() {
 	*x = StreamBarsRequest{}
-	mi := &file_market_v1_bar_proto_msgTypes[3]
+	mi := &file_market_v1_bar_proto_msgTypes[5]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -325,7 +473,7 @@ func (x *StreamBarsRequest) String() string {
 func (*StreamBarsRequest) ProtoMessage() {}
 
 func (x *StreamBarsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[3]
+	mi := &file_market_v1_bar_proto_msgTypes[5]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -338,7 +486,7 @@ func (x *StreamBarsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use StreamBarsRequest.ProtoReflect.Descriptor instead.
 func (*StreamBarsRequest) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{3}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{5}
 }
 
 func (x *StreamBarsRequest) GetTickerId() int32 {
@@ -381,7 +529,7 @@ type BulkInsertBarsRequest struct {
 
 func (x *BulkInsertBarsRequest) Reset() {
 	*x = BulkInsertBarsRequest{}
-	mi := &file_market_v1_bar_proto_msgTypes[4]
+	mi := &file_market_v1_bar_proto_msgTypes[6]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -393,7 +541,7 @@ func (x *BulkInsertBarsRequest) String() string {
 func (*BulkInsertBarsRequest) ProtoMessage() {}
 
 func (x *BulkInsertBarsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[4]
+	mi := &file_market_v1_bar_proto_msgTypes[6]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -406,7 +554,7 @@ func (x *BulkInsertBarsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use BulkInsertBarsRequest.ProtoReflect.Descriptor instead.
 func (*BulkInsertBarsRequest) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{4}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{6}
 }
 
 func (x *BulkInsertBarsRequest) GetTickerId() int32 {
@@ -446,7 +594,7 @@ type BulkInsertBarsResponse struct {
 
 func (x *BulkInsertBarsResponse) Reset() {
 	*x = BulkInsertBarsResponse{}
-	mi := &file_market_v1_bar_proto_msgTypes[5]
+	mi := &file_market_v1_bar_proto_msgTypes[7]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -458,7 +606,7 @@ func (x *BulkInsertBarsResponse) String() string {
 func (*BulkInsertBarsResponse) ProtoMessage() {}
 
 func (x *BulkInsertBarsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[5]
+	mi := &file_market_v1_bar_proto_msgTypes[7]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -471,7 +619,7 @@ func (x *BulkInsertBarsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use BulkInsertBarsResponse.ProtoReflect.Descriptor instead.
 func (*BulkInsertBarsResponse) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{5}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{7}
 }
 
 func (x *BulkInsertBarsResponse) GetRowsInserted() int32 {
@@ -493,7 +641,7 @@ type DeleteBarsRequest struct {
 
 func (x *DeleteBarsRequest) Reset() {
 	*x = DeleteBarsRequest{}
-	mi := &file_market_v1_bar_proto_msgTypes[6]
+	mi := &file_market_v1_bar_proto_msgTypes[8]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -505,7 +653,7 @@ func (x *DeleteBarsRequest) String() string {
 func (*DeleteBarsRequest) ProtoMessage() {}
 
 func (x *DeleteBarsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[6]
+	mi := &file_market_v1_bar_proto_msgTypes[8]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -518,7 +666,7 @@ func (x *DeleteBarsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use DeleteBarsRequest.ProtoReflect.Descriptor instead.
 func (*DeleteBarsRequest) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{6}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{8}
 }
 
 func (x *DeleteBarsRequest) GetTickerId() int32 {
@@ -558,7 +706,7 @@ type DeleteBarsResponse struct {
 
 func (x *DeleteBarsResponse) Reset() {
 	*x = DeleteBarsResponse{}
-	mi := &file_market_v1_bar_proto_msgTypes[7]
+	mi := &file_market_v1_bar_proto_msgTypes[9]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -570,7 +718,7 @@ func (x *DeleteBarsResponse) String() string {
 func (*DeleteBarsResponse) ProtoMessage() {}
 
 func (x *DeleteBarsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[7]
+	mi := &file_market_v1_bar_proto_msgTypes[9]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -583,7 +731,7 @@ func (x *DeleteBarsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use DeleteBarsResponse.ProtoReflect.Descriptor instead.
 func (*DeleteBarsResponse) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{7}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{9}
 }
 
 func (x *DeleteBarsResponse) GetRowsDeleted() int32 {
@@ -603,7 +751,7 @@ type GetLatestTimestampRequest struct {
 
 func (x *GetLatestTimestampRequest) Reset() {
 	*x = GetLatestTimestampRequest{}
-	mi := &file_market_v1_bar_proto_msgTypes[8]
+	mi := &file_market_v1_bar_proto_msgTypes[10]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -615,7 +763,7 @@ func (x *GetLatestTimestampRequest) String() string {
 func (*GetLatestTimestampRequest) ProtoMessage() {}
 
 func (x *GetLatestTimestampRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[8]
+	mi := &file_market_v1_bar_proto_msgTypes[10]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -628,7 +776,7 @@ func (x *GetLatestTimestampRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetLatestTimestampRequest.ProtoReflect.Descriptor instead.
 func (*GetLatestTimestampRequest) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{8}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{10}
 }
 
 func (x *GetLatestTimestampRequest) GetTickerId() int32 {
@@ -654,7 +802,7 @@ type GetLatestTimestampResponse struct {
 
 func (x *GetLatestTimestampResponse) Reset() {
 	*x = GetLatestTimestampResponse{}
-	mi := &file_market_v1_bar_proto_msgTypes[9]
+	mi := &file_market_v1_bar_proto_msgTypes[11]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -666,7 +814,7 @@ func (x *GetLatestTimestampResponse) String() string {
 func (*GetLatestTimestampResponse) ProtoMessage() {}
 
 func (x *GetLatestTimestampResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[9]
+	mi := &file_market_v1_bar_proto_msgTypes[11]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -679,7 +827,7 @@ func (x *GetLatestTimestampResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetLatestTimestampResponse.ProtoReflect.Descriptor instead.
 func (*GetLatestTimestampResponse) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{9}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{11}
 }
 
 func (x *GetLatestTimestampResponse) GetTimestamp() *timestamppb.Timestamp {
@@ -699,7 +847,7 @@ type GetEarliestTimestampRequest struct {
 
 func (x *GetEarliestTimestampRequest) Reset() {
 	*x = GetEarliestTimestampRequest{}
-	mi := &file_market_v1_bar_proto_msgTypes[10]
+	mi := &file_market_v1_bar_proto_msgTypes[12]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -711,7 +859,7 @@ func (x *GetEarliestTimestampRequest) String() string {
 func (*GetEarliestTimestampRequest) ProtoMessage() {}
 
 func (x *GetEarliestTimestampRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[10]
+	mi := &file_market_v1_bar_proto_msgTypes[12]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -724,7 +872,7 @@ func (x *GetEarliestTimestampRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetEarliestTimestampRequest.ProtoReflect.Descriptor instead.
 func (*GetEarliestTimestampRequest) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{10}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{12}
 }
 
 func (x *GetEarliestTimestampRequest) GetTickerId() int32 {
@@ -750,7 +898,7 @@ type GetEarliestTimestampResponse struct {
 
 func (x *GetEarliestTimestampResponse) Reset() {
 	*x = GetEarliestTimestampResponse{}
-	mi := &file_market_v1_bar_proto_msgTypes[11]
+	mi := &file_market_v1_bar_proto_msgTypes[13]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -762,7 +910,7 @@ func (x *GetEarliestTimestampResponse) String() string {
 func (*GetEarliestTimestampResponse) ProtoMessage() {}
 
 func (x *GetEarliestTimestampResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[11]
+	mi := &file_market_v1_bar_proto_msgTypes[13]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -775,7 +923,7 @@ func (x *GetEarliestTimestampResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetEarliestTimestampResponse.ProtoReflect.Descriptor instead.
 func (*GetEarliestTimestampResponse) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{11}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{13}
 }
 
 func (x *GetEarliestTimestampResponse) GetTimestamp() *timestamppb.Timestamp {
@@ -797,7 +945,7 @@ type GetBarCountRequest struct {
 
 func (x *GetBarCountRequest) Reset() {
 	*x = GetBarCountRequest{}
-	mi := &file_market_v1_bar_proto_msgTypes[12]
+	mi := &file_market_v1_bar_proto_msgTypes[14]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -809,7 +957,7 @@ func (x *GetBarCountRequest) String() string {
 func (*GetBarCountRequest) ProtoMessage() {}
 
 func (x *GetBarCountRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[12]
+	mi := &file_market_v1_bar_proto_msgTypes[14]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -822,7 +970,7 @@ func (x *GetBarCountRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetBarCountRequest.ProtoReflect.Descriptor instead.
 func (*GetBarCountRequest) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{12}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{14}
 }
 
 func (x *GetBarCountRequest) GetTickerId() int32 {
@@ -862,7 +1010,7 @@ type GetBarCountResponse struct {
 
 func (x *GetBarCountResponse) Reset() {
 	*x = GetBarCountResponse{}
-	mi := &file_market_v1_bar_proto_msgTypes[13]
+	mi := &file_market_v1_bar_proto_msgTypes[15]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -874,7 +1022,7 @@ func (x *GetBarCountResponse) String() string {
 func (*GetBarCountResponse) ProtoMessage() {}
 
 func (x *GetBarCountResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[13]
+	mi := &file_market_v1_bar_proto_msgTypes[15]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -887,7 +1035,7 @@ func (x *GetBarCountResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetBarCountResponse.ProtoReflect.Descriptor instead.
 func (*GetBarCountResponse) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{13}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{15}
 }
 
 func (x *GetBarCountResponse) GetCount() int64 {
@@ -908,7 +1056,7 @@ type GetBarIdsForTimestampsRequest struct {
 
 func (x *GetBarIdsForTimestampsRequest) Reset() {
 	*x = GetBarIdsForTimestampsRequest{}
-	mi := &file_market_v1_bar_proto_msgTypes[14]
+	mi := &file_market_v1_bar_proto_msgTypes[16]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -920,7 +1068,7 @@ func (x *GetBarIdsForTimestampsRequest) String() string {
 func (*GetBarIdsForTimestampsRequest) ProtoMessage() {}
 
 func (x *GetBarIdsForTimestampsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[14]
+	mi := &file_market_v1_bar_proto_msgTypes[16]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -933,7 +1081,7 @@ func (x *GetBarIdsForTimestampsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetBarIdsForTimestampsRequest.ProtoReflect.Descriptor instead.
 func (*GetBarIdsForTimestampsRequest) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{14}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{16}
 }
 
 func (x *GetBarIdsForTimestampsRequest) GetTickerId() int32 {
@@ -967,7 +1115,7 @@ type GetBarIdsForTimestampsResponse struct {
 
 func (x *GetBarIdsForTimestampsResponse) Reset() {
 	*x = GetBarIdsForTimestampsResponse{}
-	mi := &file_market_v1_bar_proto_msgTypes[15]
+	mi := &file_market_v1_bar_proto_msgTypes[17]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -979,7 +1127,7 @@ func (x *GetBarIdsForTimestampsResponse) String() string {
 func (*GetBarIdsForTimestampsResponse) ProtoMessage() {}
 
 func (x *GetBarIdsForTimestampsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_market_v1_bar_proto_msgTypes[15]
+	mi := &file_market_v1_bar_proto_msgTypes[17]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -992,7 +1140,7 @@ func (x *GetBarIdsForTimestampsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetBarIdsForTimestampsResponse.ProtoReflect.Descriptor instead.
 func (*GetBarIdsForTimestampsResponse) Descriptor() ([]byte, []int) {
-	return file_market_v1_bar_proto_rawDescGZIP(), []int{15}
+	return file_market_v1_bar_proto_rawDescGZIP(), []int{17}
 }
 
 func (x *GetBarIdsForTimestampsResponse) GetTimestampToId() map[string]int64 {
@@ -1038,7 +1186,21 @@ const file_market_v1_bar_proto_rawDesc = "" +
 	"\x04bars\x18\x01 \x03(\v2\x13.market.v1.OHLCVBarR\x04bars\x12&\n" +
 	"\x0fnext_page_token\x18\x02 \x01(\tR\rnextPageToken\x12\x1f\n" +
 	"\vtotal_count\x18\x03 \x01(\x05R\n" +
-	"totalCount\"\xca\x01\n" +
+	"totalCount\"\xaa\x01\n" +
+	"\n" +
+	"BarColumns\x12\x14\n" +
+	"\x05count\x18\x01 \x01(\x05R\x05count\x12\x1e\n" +
+	"\n" +
+	"timestamps\x18\x02 \x01(\fR\n" +
+	"timestamps\x12\x12\n" +
+	"\x04open\x18\x03 \x01(\fR\x04open\x12\x12\n" +
+	"\x04high\x18\x04 \x01(\fR\x04high\x12\x10\n" +
+	"\x03low\x18\x05 \x01(\fR\x03low\x12\x14\n" +
+	"\x05close\x18\x06 \x01(\fR\x05close\x12\x16\n" +
+	"\x06volume\x18\a \x01(\fR\x06volume\"r\n" +
+	"\x17GetBarsColumnarResponse\x12/\n" +
+	"\acolumns\x18\x01 \x01(\v2\x15.market.v1.BarColumnsR\acolumns\x12&\n" +
+	"\x0fnext_page_token\x18\x02 \x01(\tR\rnextPageToken\"\xca\x01\n" +
 	"\x11StreamBarsRequest\x12\x1b\n" +
 	"\tticker_id\x18\x01 \x01(\x05R\btickerId\x12\x1c\n" +
 	"\ttimeframe\x18\x02 \x01(\tR\ttimeframe\x125\n" +
@@ -1109,49 +1271,52 @@ func file_market_v1_bar_proto_rawDescGZIP() []byte {
 	return file_market_v1_bar_proto_rawDescData
 }
 
-var file_market_v1_bar_proto_msgTypes = make([]protoimpl.MessageInfo, 17)
+var file_market_v1_bar_proto_msgTypes = make([]protoimpl.MessageInfo, 19)
 var file_market_v1_bar_proto_goTypes = []any{
 	(*OHLCVBar)(nil),                       // 0: market.v1.OHLCVBar
 	(*GetBarsRequest)(nil),                 // 1: market.v1.GetBarsRequest
 	(*GetBarsResponse)(nil),                // 2: market.v1.GetBarsResponse
-	(*StreamBarsRequest)(nil),              // 3: market.v1.StreamBarsRequest
-	(*BulkInsertBarsRequest)(nil),          // 4: market.v1.BulkInsertBarsRequest
-	(*BulkInsertBarsResponse)(nil),         // 5: market.v1.BulkInsertBarsResponse
-	(*DeleteBarsRequest)(nil),              // 6: market.v1.DeleteBarsRequest
-	(*DeleteBarsResponse)(nil),             // 7: market.v1.DeleteBarsResponse
-	(*GetLatestTimestampRequest)(nil),      // 8: market.v1.GetLatestTimestampRequest
-	(*GetLatestTimestampResponse)(nil),     // 9: market.v1.GetLatestTimestampResponse
-	(*GetEarliestTimestampRequest)(nil),    // 10: market.v1.GetEarliestTimestampRequest
-	(*GetEarliestTimestampResponse)(nil),   // 11: market.v1.GetEarliestTimestampResponse
-	(*GetBarCountRequest)(nil),             // 12: market.v1.GetBarCountRequest
-	(*GetBarCountResponse)(nil),            // 13: market.v1.GetBarCountResponse
-	(*GetBarIdsForTimestampsRequest)(nil),  // 14: market.v1.GetBarIdsForTimestampsRequest
-	(*GetBarIdsForTimestampsResponse)(nil), // 15: market.v1.GetBarIdsForTimestampsResponse
-	nil,                                    // 16: market.v1.GetBarIdsForTimestampsResponse.TimestampToIdEntry
-	(*timestamppb.Timestamp)(nil),          // 17: google.protobuf.Timestamp
+	(*BarColumns)(nil),                     // 3: market.v1.BarColumns
+	(*GetBarsColumnarResponse)(nil),        // 4: market.v1.GetBarsColumnarResponse
+	(*StreamBarsRequest)(nil),              // 5: market.v1.StreamBarsRequest
+	(*BulkInsertBarsRequest)(nil),          // 6: market.v1.BulkInsertBarsRequest
+	(*BulkInsertBarsResponse)(nil),         // 7: market.v1.BulkInsertBarsResponse
+	(*DeleteBarsRequest)(nil),              // 8: market.v1.DeleteBarsRequest
+	(*DeleteBarsResponse)(nil),             // 9: market.v1.DeleteBarsResponse
+	(*GetLatestTimestampRequest)(nil),      // 10: market.v1.GetLatestTimestampRequest
+	(*GetLatestTimestampResponse)(nil),     // 11: market.v1.GetLatestTimestampResponse
+	(*GetEarliestTimestampRequest)(nil),    // 12: market.v1.GetEarliestTimestampRequest
+	(*GetEarliestTimestampResponse)(nil),   // 13: market.v1.GetEarliestTimestampResponse
+	(*GetBarCountRequest)(nil),             // 14: market.v1.GetBarCountRequest
+	(*GetBarCountResponse)(nil),            // 15: market.v1.GetBarCountResponse
+	(*GetBarIdsForTimestampsRequest)(nil),  // 16: market.v1.GetBarIdsForTimestampsRequest
+	(*GetBarIdsForTimestampsResponse)(nil), // 17: market.v1.GetBarIdsForTimestampsResponse
+	nil,                                    // 18: market.v1.GetBarIdsForTimestampsResponse.TimestampToIdEntry
+	(*timestamppb.Timestamp)(nil),          // 19: google.protobuf.Timestamp
 }
 var file_market_v1_bar_proto_depIdxs = []int32{
-	17, // 0: market.v1.OHLCVBar.timestamp:type_name -> google.protobuf.Timestamp
-	17, // 1: market.v1.OHLCVBar.created_at:type_name -> google.protobuf.Timestamp
-	17, // 2: market.v1.GetBarsRequest.start:type_name -> google.protobuf.Timestamp
-	17, // 3: market.v1.GetBarsRequest.end:type_name -> google.protobuf.Timestamp
+	19, // 0: market.v1.OHLCVBar.timestamp:type_name -> google.protobuf.Timestamp
+	19, // 1: market.v1.OHLCVBar.created_at:type_name -> google.protobuf.Timestamp
+	19, // 2: market.v1.GetBarsRequest.start:type_name -> google.protobuf.Timestamp
+	19, // 3: market.v1.GetBarsRequest.end:type_name -> google.protobuf.Timestamp
 	0,  // 4: market.v1.GetBarsResponse.bars:type_name -> market.v1.OHLCVBar
-	17, // 5: market.v1.StreamBarsRequest.start:type_name -> google.protobuf.Timestamp
-	17, // 6: market.v1.StreamBarsRequest.end:type_name -> google.protobuf.Timestamp
-	0,  // 7: market.v1.BulkInsertBarsRequest.bars:type_name -> market.v1.OHLCVBar
-	17, // 8: market.v1.DeleteBarsRequest.start:type_name -> google.protobuf.Timestamp
-	17, // 9: market.v1.DeleteBarsRequest.end:type_name -> google.protobuf.Timestamp
-	17, // 10: market.v1.GetLatestTimestampResponse.timestamp:type_name -> google.protobuf.Timestamp
-	17, // 11: market.v1.GetEarliestTimestampResponse.timestamp:type_name -> google.protobuf.Timestamp
-	17, // 12: market.v1.GetBarCountRequest.start:type_name -> google.protobuf.Timestamp
-	17, // 13: market.v1.GetBarCountRequest.end:type_name -> google.protobuf.Timestamp
-	17, // 14: market.v1.GetBarIdsForTimestampsRequest.timestamps:type_name -> google.protobuf.Timestamp
-	16, // 15: market.v1.GetBarIdsForTimestampsResponse.timestamp_to_id:type_name -> market.v1.GetBarIdsForTimestampsResponse.TimestampToIdEntry
-	16, // [16:16] is the sub-list for method output_type
-	16, // [16:16] is the sub-list for method input_type
-	16, // [16:16] is the sub-list for extension type_name
-	16, // [16:16] is the sub-list for extension extendee
-	0,  // [0:16] is the sub-list for field type_name
+	3,  // 5: market.v1.GetBarsColumnarResponse.columns:type_name -> market.v1.BarColumns
+	19, // 6: market.v1.StreamBarsRequest.start:type_name -> google.protobuf.Timestamp
+	19, // 7: market.v1.StreamBarsRequest.end:type_name -> google.protobuf.Timestamp
+	0,  // 8: market.v1.BulkInsertBarsRequest.bars:type_name -> market.v1.OHLCVBar
+	19, // 9: market.v1.DeleteBarsRequest.start:type_name -> google.protobuf.Timestamp
+	19, // 10: market.v1.DeleteBarsRequest.end:type_name -> google.protobuf.Timestamp
+	19, // 11: market.v1.GetLatestTimestampResponse.timestamp:type_name -> google.protobuf.Timestamp
+	19, // 12: market.v1.GetEarliestTimestampResponse.timestamp:type_name -> google.protobuf.Timestamp
+	19, // 13: market.v1.GetBarCountRequest.start:type_name -> google.protobuf.Timestamp
+	19, // 14: market.v1.GetBarCountRequest.end:type_name -> google.protobuf.Timestamp
+	19, // 15: market.v1.GetBarIdsForTimestampsRequest.timestamps:type_name -> google.protobuf.Timestamp
+	18, // 16: market.v1.GetBarIdsForTimestampsResponse.timestamp_to_id:type_name -> market.v1.GetBarIdsForTimestampsResponse.TimestampToIdEntry
+	17, // [17:17] is the sub-list for method output_type
+	17, // [17:17] is the sub-list for method input_type
+	17, // [17:17] is the sub-list for extension type_name
+	17, // [17:17] is the sub-list for extension extendee
+	0,  // [0:17] is the sub-list for field type_name
 }
 
 func init() { file_market_v1_bar_proto_init() }
@@ -1161,18 +1326,18 @@ func file_market_v1_bar_proto_init() {
 	}
 	file_market_v1_bar_proto_msgTypes[0].OneofWrappers = []any{}
 	file_market_v1_bar_proto_msgTypes[1].OneofWrappers = []any{}
-	file_market_v1_bar_proto_msgTypes[3].OneofWrappers = []any{}
-	file_market_v1_bar_proto_msgTypes[6].OneofWrappers = []any{}
-	file_market_v1_bar_proto_msgTypes[9].OneofWrappers = []any{}
+	file_market_v1_bar_proto_msgTypes[5].OneofWrappers = []any{}
+	file_market_v1_bar_proto_msgTypes[8].OneofWrappers = []any{}
 	file_market_v1_bar_proto_msgTypes[11].OneofWrappers = []any{}
-	file_market_v1_bar_proto_msgTypes[12].OneofWrappers = []any{}
+	file_market_v1_bar_proto_msgTypes[13].OneofWrappers = []any{}
+	file_market_v1_bar_proto_msgTypes[14].OneofWrappers = []any{}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_market_v1_bar_proto_rawDesc), len(file_market_v1_bar_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   17,
+			NumMessages:   19,
 			NumExtensions: 0,
 			NumServices:   0,
 		},
@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13market/v1/bar.proto\x12\tmarket.v1\x1a\x1fgoogle/protobuf/timestamp.proto\"\x9d\x02\n\x08OHLCVBar\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x11\n\tticker_id\x18\x02 \x01(\x05\x12\x11\n\ttimeframe\x18\x03 \x01(\t\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0c\n\x04open\x18\x05 \x01(\x01\x12\x0c\n\x04high\x18\x06 \x01(\x01\x12\x0b\n\x03low\x18\x07 \x01(\x01\x12\r\n\x05\x63lose\x18\x08 \x01(\x01\x12\x0e\n\x06volume\x18\t \x01(\x03\x12\x18\n\x0btrade_count\x18\n \x01(\x05H\x00\x88\x01\x01\x12\x0e\n\x06source\x18\x0b \x01(\t\x12.\n\ncreated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x0e\n\x0c_trade_count\"\xcd\x01\n\x0eGetBarsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12,\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x12\x11\n\tpage_size\x18\x05 \x01(\x05\x12\x12\n\npage_token\x18\x06 \x01(\tB\x08\n\x06_startB\x06\n\x04_end\"b\n\x0fGetBarsResponse\x12!\n\x04\x62\x61rs\x18\x01 \x03(\x0b\x32\x13.market.v1.OHLCVBar\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xa9\x01\n\x11StreamBarsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12,\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"p\n\x15\x42ulkInsertBarsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12\x0e\n\x06source\x18\x03 \x01(\t\x12!\n\x04\x62\x61rs\x18\x04 \x03(\x0b\x32\x13.market.v1.OHLCVBar\"/\n\x16\x42ulkInsertBarsResponse\x12\x15\n\rrows_inserted\x18\x01 \x01(\x05\"\xa9\x01\n\x11\x44\x65leteBarsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12,\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"*\n\x12\x44\x65leteBarsResponse\x12\x14\n\x0crows_deleted\x18\x01 \x01(\x05\"A\n\x19GetLatestTimestampRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\"^\n\x1aGetLatestTimestampResponse\x12\x32\n\ttimestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x42\x0c\n\n_timestamp\"C\n\x1bGetEarliestTimestampRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\"`\n\x1cGetEarliestTimestampResponse\x12\x32\n\ttimestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x42\x0c\n\n_timestamp\"\xaa\x01\n\x12GetBarCountRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12,\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"$\n\x13GetBarCountResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\"u\n\x1dGetBarIdsForTimestampsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\ntimestamps\x18\x03 \x03(\x0b\x32\x1a.google.protobuf.Timestamp\"\xad\x01\n\x1eGetBarIdsForTimestampsResponse\x12U\n\x0ftimestamp_to_id\x18\x01 \x03(\x0b\x32<.market.v1.GetBarIdsForTimestampsResponse.TimestampToIdEntry\x1a\x34\n\x12TimestampToIdEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\x42\x43ZAgithub.com/algomatic/data-service/proto/gen/go/market/v1;marketv1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13market/v1/bar.proto\x12\tmarket.v1\x1a\x1fgoogle/protobuf/timestamp.proto\"\x9d\x02\n\x08OHLCVBar\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x11\n\tticker_id\x18\x02 \x01(\x05\x12\x11\n\ttimeframe\x18\x03 \x01(\t\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0c\n\x04open\x18\x05 \x01(\x01\x12\x0c\n\x04high\x18\x06 \x01(\x01\x12\x0b\n\x03low\x18\x07 \x01(\x01\x12\r\n\x05\x63lose\x18\x08 \x01(\x01\x12\x0e\n\x06volume\x18\t \x01(\x03\x12\x18\n\x0btrade_count\x18\n \x01(\x05H\x00\x88\x01\x01\x12\x0e\n\x06source\x18\x0b \x01(\t\x12.\n\ncreated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x0e\n\x0c_trade_count\"\xcd\x01\n\x0eGetBarsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12,\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x12\x11\n\tpage_size\x18\x05 \x01(\x05\x12\x12\n\npage_token\x18\x06 \x01(\tB\x08\n\x06_startB\x06\n\x04_end\"b\n\x0fGetBarsResponse\x12!\n\x04\x62\x61rs\x18\x01 \x03(\x0b\x32\x13.market.v1.OHLCVBar\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"w\n\nBarColumns\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x12\n\ntimestamps\x18\x02 \x01(\x0c\x12\x0c\n\x04open\x18\x03 \x01(\x0c\x12\x0c\n\x04high\x18\x04 \x01(\x0c\x12\x0b\n\x03low\x18\x05 \x01(\x0c\x12\r\n\x05\x63lose\x18\x06 \x01(\x0c\x12\x0e\n\x06volume\x18\x07 \x01(\x0c\"Z\n\x17GetBarsColumnarResponse\x12&\n\x07\x63olumns\x18\x01 \x01(\x0b\x32\x15.market.v1.BarColumns\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\xa9\x01\n\x11StreamBarsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12,\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"p\n\x15\x42ulkInsertBarsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12\x0e\n\x06source\x18\x03 \x01(\t\x12!\n\x04\x62\x61rs\x18\x04 \x03(\x0b\x32\x13.market.v1.OHLCVBar\"/\n\x16\x42ulkInsertBarsResponse\x12\x15\n\rrows_inserted\x18\x01 \x01(\x05\"\xa9\x01\n\x11\x44\x65leteBarsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12,\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"*\n\x12\x44\x65leteBarsResponse\x12\x14\n\x0crows_deleted\x18\x01 \x01(\x05\"A\n\x19GetLatestTimestampRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\"^\n\x1aGetLatestTimestampResponse\x12\x32\n\ttimestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x42\x0c\n\n_timestamp\"C\n\x1bGetEarliestTimestampRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\"`\n\x1cGetEarliestTimestampResponse\x12\x32\n\ttimestamp\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x42\x0c\n\n_timestamp\"\xaa\x01\n\x12GetBarCountRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\x05start\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12,\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x42\x08\n\x06_startB\x06\n\x04_end\"$\n\x13GetBarCountResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x03\"u\n\x1dGetBarIdsForTimestampsRequest\x12\x11\n\tticker_id\x18\x01 \x01(\x05\x12\x11\n\ttimeframe\x18\x02 \x01(\t\x12.\n\ntimestamps\x18\x03 \x03(\x0b\x32\x1a.google.protobuf.Timestamp\"\xad\x01\n\x1eGetBarIdsForTimestampsResponse\x12U\n\x0ftimestamp_to_id\x18\x01 \x03(\x0b\x32<.market.v1.GetBarIdsForTimestampsResponse.TimestampToIdEntry\x1a\x34\n\x12TimestampToIdEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\x42\x43ZAgithub.com/algomatic/data-service/proto/gen/go/market/v1;marketv1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -41,32 +41,36 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETBARSREQUEST']._serialized_end=561
   _globals['_GETBARSRESPONSE']._serialized_start=563
   _globals['_GETBARSRESPONSE']._serialized_end=661
-  _globals['_STREAMBARSREQUEST']._serialized_start=664
-  _globals['_STREAMBARSREQUEST']._serialized_end=833
-  _globals['_BULKINSERTBARSREQUEST']._serialized_start=835
-  _globals['_BULKINSERTBARSREQUEST']._serialized_end=947
-  _globals['_BULKINSERTBARSRESPONSE']._serialized_start=949
-  _globals['_BULKINSERTBARSRESPONSE']._serialized_end=996
-  _globals['_DELETEBARSREQUEST']._serialized_start=999
-  _globals['_DELETEBARSREQUEST']._serialized_end=1168
-  _globals['_DELETEBARSRESPONSE']._serialized_start=1170
-  _globals['_DELETEBARSRESPONSE']._serialized_end=1212
-  _globals['_GETLATESTTIMESTAMPREQUEST']._serialized_start=1214
-  _globals['_GETLATESTTIMESTAMPREQUEST']._serialized_end=1279
-  _globals['_GETLATESTTIMESTAMPRESPONSE']._serialized_start=1281
-  _globals['_GETLATESTTIMESTAMPRESPONSE']._serialized_end=1375
-  _globals['_GETEARLIESTTIMESTAMPREQUEST']._serialized_start=1377
-  _globals['_GETEARLIESTTIMESTAMPREQUEST']._serialized_end=1444
-  _globals['_GETEARLIESTTIMESTAMPRESPONSE']._serialized_start=1446
-  _globals['_GETEARLIESTTIMESTAMPRESPONSE']._serialized_end=1542
-  _globals['_GETBARCOUNTREQUEST']._serialized_start=1545
-  _globals['_GETBARCOUNTREQUEST']._serialized_end=1715
-  _globals['_GETBARCOUNTRESPONSE']._serialized_start=1717
-  _globals['_GETBARCOUNTRESPONSE']._serialized_end=1753
-  _globals['_GETBARIDSFORTIMESTAMPSREQUEST']._serialized_start=1755
-  _globals['_GETBARIDSFORTIMESTAMPSREQUEST']._serialized_end=1872
-  _globals['_GETBARIDSFORTIMESTAMPSRESPONSE']._serialized_start=1875
-  _globals['_GETBARIDSFORTIMESTAMPSRESPONSE']._serialized_end=2048
-  _globals['_GETBARIDSFORTIMESTAMPSRESPONSE_TIMESTAMPTOIDENTRY']._serialized_start=1996
-  _globals['_GETBARIDSFORTIMESTAMPSRESPONSE_TIMESTAMPTOIDENTRY']._serialized_end=2048
+  _globals['_BARCOLUMNS']._serialized_start=663
+  _globals['_BARCOLUMNS']._serialized_end=782
+  _globals['_GETBARSCOLUMNARRESPONSE']._serialized_start=784
+  _globals['_GETBARSCOLUMNARRESPONSE']._serialized_end=874
+  _globals['_STREAMBARSREQUEST']._serialized_start=877
+  _globals['_STREAMBARSREQUEST']._serialized_end=1046
+  _globals['_BULKINSERTBARSREQUEST']._serialized_start=1048
+  _globals['_BULKINSERTBARSREQUEST']._serialized_end=1160
+  _globals['_BULKINSERTBARSRESPONSE']._serialized_start=1162
+  _globals['_BULKINSERTBARSRESPONSE']._serialized_end=1209
+  _globals['_DELETEBARSREQUEST']._serialized_start=1212
+  _globals['_DELETEBARSREQUEST']._serialized_end=1381
+  _globals['_DELETEBARSRESPONSE']._serialized_start=1383
+  _globals['_DELETEBARSRESPONSE']._serialized_end=1425
+  _globals['_GETLATESTTIMESTAMPREQUEST']._serialized_start=1427
+  _globals['_GETLATESTTIMESTAMPREQUEST']._serialized_end=1492
+  _globals['_GETLATESTTIMESTAMPRESPONSE']._serialized_start=1494
+  _globals['_GETLATESTTIMESTAMPRESPONSE']._serialized_end=1588
+  _globals['_GETEARLIESTTIMESTAMPREQUEST']._serialized_start=1590
+  _globals['_GETEARLIESTTIMESTAMPREQUEST']._serialized_end=1657
+  _globals['_GETEARLIESTTIMESTAMPRESPONSE']._serialized_start=1659
+  _globals['_GETEARLIESTTIMESTAMPRESPONSE']._serialized_end=1755
+  _globals['_GETBARCOUNTREQUEST']._serialized_start=1758
+  _globals['_GETBARCOUNTREQUEST']._serialized_end=1928
+  _globals['_GETBARCOUNTRESPONSE']._serialized_start=1930
+  _globals['_GETBARCOUNTRESPONSE']._serialized_end=1966
+  _globals['_GETBARIDSFORTIMESTAMPSREQUEST']._serialized_start=1968
+  _globals['_GETBARIDSFORTIMESTAMPSREQUEST']._serialized_end=2085
+  _globals['_GETBARIDSFORTIMESTAMPSRESPONSE']._serialized_start=2088
+  _globals['_GETBARIDSFORTIMESTAMPSRESPONSE']._serialized_end=2261
+  _globals['_GETBARIDSFORTIMESTAMPSRESPONSE_TIMESTAMPTOIDENTRY']._serialized_start=2209
+  _globals['_GETBARIDSFORTIMESTAMPSRESPONSE_TIMESTAMPTOIDENTRY']._serialized_end=2261
 # @@protoc_insertion_point(module_scope)
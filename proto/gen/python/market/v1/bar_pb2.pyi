@@ -63,6 +63,32 @@ class GetBarsResponse(_message.Message):
     total_count: int
     def __init__(self, bars: _Optional[_Iterable[_Union[OHLCVBar, _Mapping]]] = ..., next_page_token: _Optional[str] = ..., total_count: _Optional[int] = ...) -> None: ...
 
+class BarColumns(_message.Message):
+    __slots__ = ("count", "timestamps", "open", "high", "low", "close", "volume")
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMPS_FIELD_NUMBER: _ClassVar[int]
+    OPEN_FIELD_NUMBER: _ClassVar[int]
+    HIGH_FIELD_NUMBER: _ClassVar[int]
+    LOW_FIELD_NUMBER: _ClassVar[int]
+    CLOSE_FIELD_NUMBER: _ClassVar[int]
+    VOLUME_FIELD_NUMBER: _ClassVar[int]
+    count: int
+    timestamps: bytes
+    open: bytes
+    high: bytes
+    low: bytes
+    close: bytes
+    volume: bytes
+    def __init__(self, count: _Optional[int] = ..., timestamps: _Optional[bytes] = ..., open: _Optional[bytes] = ..., high: _Optional[bytes] = ..., low: _Optional[bytes] = ..., close: _Optional[bytes] = ..., volume: _Optional[bytes] = ...) -> None: ...
+
+class GetBarsColumnarResponse(_message.Message):
+    __slots__ = ("columns", "next_page_token")
+    COLUMNS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    columns: BarColumns
+    next_page_token: str
+    def __init__(self, columns: _Optional[_Union[BarColumns, _Mapping]] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
 class StreamBarsRequest(_message.Message):
     __slots__ = ("ticker_id", "timeframe", "start", "end")
     TICKER_ID_FIELD_NUMBER: _ClassVar[int]
@@ -28,7 +28,7 @@ from market.v1 import feature_pb2 as market_dot_v1_dot_feature__pb2
 from market.v1 import sync_log_pb2 as market_dot_v1_dot_sync__log__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17market/v1/service.proto\x12\tmarket.v1\x1a\x16market/v1/ticker.proto\x1a\x13market/v1/bar.proto\x1a\x17market/v1/feature.proto\x1a\x18market/v1/sync_log.proto2\x9f\x0e\n\x11MarketDataService\x12\x46\n\tGetTicker\x12\x1b.market.v1.GetTickerRequest\x1a\x1c.market.v1.GetTickerResponse\x12L\n\x0bListTickers\x12\x1d.market.v1.ListTickersRequest\x1a\x1e.market.v1.ListTickersResponse\x12^\n\x11GetOrCreateTicker\x12#.market.v1.GetOrCreateTickerRequest\x1a$.market.v1.GetOrCreateTickerResponse\x12^\n\x11\x42ulkUpsertTickers\x12#.market.v1.BulkUpsertTickersRequest\x1a$.market.v1.BulkUpsertTickersResponse\x12@\n\x07GetBars\x12\x19.market.v1.GetBarsRequest\x1a\x1a.market.v1.GetBarsResponse\x12\x41\n\nStreamBars\x12\x1c.market.v1.StreamBarsRequest\x1a\x13.market.v1.OHLCVBar0\x01\x12U\n\x0e\x42ulkInsertBars\x12 .market.v1.BulkInsertBarsRequest\x1a!.market.v1.BulkInsertBarsResponse\x12I\n\nDeleteBars\x12\x1c.market.v1.DeleteBarsRequest\x1a\x1d.market.v1.DeleteBarsResponse\x12\x61\n\x12GetLatestTimestamp\x12$.market.v1.GetLatestTimestampRequest\x1a%.market.v1.GetLatestTimestampResponse\x12g\n\x14GetEarliestTimestamp\x12&.market.v1.GetEarliestTimestampRequest\x1a\'.market.v1.GetEarliestTimestampResponse\x12L\n\x0bGetBarCount\x12\x1d.market.v1.GetBarCountRequest\x1a\x1e.market.v1.GetBarCountResponse\x12m\n\x16GetBarIdsForTimestamps\x12(.market.v1.GetBarIdsForTimestampsRequest\x1a).market.v1.GetBarIdsForTimestampsResponse\x12L\n\x0bGetFeatures\x12\x1d.market.v1.GetFeaturesRequest\x1a\x1e.market.v1.GetFeaturesResponse\x12s\n\x18GetExistingFeatureBarIds\x12*.market.v1.GetExistingFeatureBarIdsRequest\x1a+.market.v1.GetExistingFeatureBarIdsResponse\x12\x61\n\x12\x42ulkUpsertFeatures\x12$.market.v1.BulkUpsertFeaturesRequest\x1a%.market.v1.BulkUpsertFeaturesResponse\x12L\n\x0bStoreStates\x12\x1d.market.v1.StoreStatesRequest\x1a\x1e.market.v1.StoreStatesResponse\x12\x46\n\tGetStates\x12\x1b.market.v1.GetStatesRequest\x1a\x1c.market.v1.GetStatesResponse\x12X\n\x0fGetLatestStates\x12!.market.v1.GetLatestStatesRequest\x1a\".market.v1.GetLatestStatesResponse\x12I\n\nGetSyncLog\x12\x1c.market.v1.GetSyncLogRequest\x1a\x1d.market.v1.GetSyncLogResponse\x12R\n\rUpdateSyncLog\x12\x1f.market.v1.UpdateSyncLogRequest\x1a .market.v1.UpdateSyncLogResponse\x12O\n\x0cListSyncLogs\x12\x1e.market.v1.ListSyncLogsRequest\x1a\x1f.market.v1.ListSyncLogsResponseBCZAgithub.com/algomatic/data-service/proto/gen/go/market/v1;marketv1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17market/v1/service.proto\x12\tmarket.v1\x1a\x16market/v1/ticker.proto\x1a\x13market/v1/bar.proto\x1a\x17market/v1/feature.proto\x1a\x18market/v1/sync_log.proto2\xf1\x0e\n\x11MarketDataService\x12\x46\n\tGetTicker\x12\x1b.market.v1.GetTickerRequest\x1a\x1c.market.v1.GetTickerResponse\x12L\n\x0bListTickers\x12\x1d.market.v1.ListTickersRequest\x1a\x1e.market.v1.ListTickersResponse\x12^\n\x11GetOrCreateTicker\x12#.market.v1.GetOrCreateTickerRequest\x1a$.market.v1.GetOrCreateTickerResponse\x12^\n\x11\x42ulkUpsertTickers\x12#.market.v1.BulkUpsertTickersRequest\x1a$.market.v1.BulkUpsertTickersResponse\x12@\n\x07GetBars\x12\x19.market.v1.GetBarsRequest\x1a\x1a.market.v1.GetBarsResponse\x12P\n\x0fGetBarsColumnar\x12\x19.market.v1.GetBarsRequest\x1a\".market.v1.GetBarsColumnarResponse\x12\x41\n\nStreamBars\x12\x1c.market.v1.StreamBarsRequest\x1a\x13.market.v1.OHLCVBar0\x01\x12U\n\x0e\x42ulkInsertBars\x12 .market.v1.BulkInsertBarsRequest\x1a!.market.v1.BulkInsertBarsResponse\x12I\n\nDeleteBars\x12\x1c.market.v1.DeleteBarsRequest\x1a\x1d.market.v1.DeleteBarsResponse\x12\x61\n\x12GetLatestTimestamp\x12$.market.v1.GetLatestTimestampRequest\x1a%.market.v1.GetLatestTimestampResponse\x12g\n\x14GetEarliestTimestamp\x12&.market.v1.GetEarliestTimestampRequest\x1a\'.market.v1.GetEarliestTimestampResponse\x12L\n\x0bGetBarCount\x12\x1d.market.v1.GetBarCountRequest\x1a\x1e.market.v1.GetBarCountResponse\x12m\n\x16GetBarIdsForTimestamps\x12(.market.v1.GetBarIdsForTimestampsRequest\x1a).market.v1.GetBarIdsForTimestampsResponse\x12L\n\x0bGetFeatures\x12\x1d.market.v1.GetFeaturesRequest\x1a\x1e.market.v1.GetFeaturesResponse\x12s\n\x18GetExistingFeatureBarIds\x12*.market.v1.GetExistingFeatureBarIdsRequest\x1a+.market.v1.GetExistingFeatureBarIdsResponse\x12\x61\n\x12\x42ulkUpsertFeatures\x12$.market.v1.BulkUpsertFeaturesRequest\x1a%.market.v1.BulkUpsertFeaturesResponse\x12L\n\x0bStoreStates\x12\x1d.market.v1.StoreStatesRequest\x1a\x1e.market.v1.StoreStatesResponse\x12\x46\n\tGetStates\x12\x1b.market.v1.GetStatesRequest\x1a\x1c.market.v1.GetStatesResponse\x12X\n\x0fGetLatestStates\x12!.market.v1.GetLatestStatesRequest\x1a\".market.v1.GetLatestStatesResponse\x12I\n\nGetSyncLog\x12\x1c.market.v1.GetSyncLogRequest\x1a\x1d.market.v1.GetSyncLogResponse\x12R\n\rUpdateSyncLog\x12\x1f.market.v1.UpdateSyncLogRequest\x1a .market.v1.UpdateSyncLogResponse\x12O\n\x0cListSyncLogs\x12\x1e.market.v1.ListSyncLogsRequest\x1a\x1f.market.v1.ListSyncLogsResponseBCZAgithub.com/algomatic/data-service/proto/gen/go/market/v1;marketv1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -37,5 +37,5 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'ZAgithub.com/algomatic/data-service/proto/gen/go/market/v1;marketv1'
   _globals['_MARKETDATASERVICE']._serialized_start=135
-  _globals['_MARKETDATASERVICE']._serialized_end=1958
+  _globals['_MARKETDATASERVICE']._serialized_end=2040
 # @@protoc_insertion_point(module_scope)
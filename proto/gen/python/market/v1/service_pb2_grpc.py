@@ -64,6 +64,11 @@ class MarketDataServiceStub(object):
                 request_serializer=market_dot_v1_dot_bar__pb2.GetBarsRequest.SerializeToString,
                 response_deserializer=market_dot_v1_dot_bar__pb2.GetBarsResponse.FromString,
                 _registered_method=True)
+        self.GetBarsColumnar = channel.unary_unary(
+                '/market.v1.MarketDataService/GetBarsColumnar',
+                request_serializer=market_dot_v1_dot_bar__pb2.GetBarsRequest.SerializeToString,
+                response_deserializer=market_dot_v1_dot_bar__pb2.GetBarsColumnarResponse.FromString,
+                _registered_method=True)
         self.StreamBars = channel.unary_stream(
                 '/market.v1.MarketDataService/StreamBars',
                 request_serializer=market_dot_v1_dot_bar__pb2.StreamBarsRequest.SerializeToString,
@@ -183,6 +188,12 @@ class MarketDataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetBarsColumnar(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def StreamBars(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -309,6 +320,11 @@ def add_MarketDataServiceServicer_to_server(servicer, server):
                     request_deserializer=market_dot_v1_dot_bar__pb2.GetBarsRequest.FromString,
                     response_serializer=market_dot_v1_dot_bar__pb2.GetBarsResponse.SerializeToString,
             ),
+            'GetBarsColumnar': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBarsColumnar,
+                    request_deserializer=market_dot_v1_dot_bar__pb2.GetBarsRequest.FromString,
+                    response_serializer=market_dot_v1_dot_bar__pb2.GetBarsColumnarResponse.SerializeToString,
+            ),
             'StreamBars': grpc.unary_stream_rpc_method_handler(
                     servicer.StreamBars,
                     request_deserializer=market_dot_v1_dot_bar__pb2.StreamBarsRequest.FromString,
@@ -537,6 +553,33 @@ class MarketDataService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetBarsColumnar(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/market.v1.MarketDataService/GetBarsColumnar',
+            market_dot_v1_dot_bar__pb2.GetBarsRequest.SerializeToString,
+            market_dot_v1_dot_bar__pb2.GetBarsColumnarResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def StreamBars(request,
             target,
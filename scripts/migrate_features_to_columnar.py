@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""Copy JSONB feature rows in computed_features to the columnar feature store.
+
+Feature values are written into per-day Parquet partitions.  The JSONB dicts
+are kept by default since the API and evaluator readers still use them; pass
+--clear-json to empty them once nothing reads JSONB features any more (the
+computed_features rows themselves are kept for the bar link and HMM state).
+Copied rows replace any already in the store, so an interrupted run can be restarted.
+
+Usage:
+    python scripts/migrate_features_to_columnar.py --store-dir data/features
+    python scripts/migrate_features_to_columnar.py --store-dir data/features --symbols AAPL
+    python scripts/migrate_features_to_columnar.py --store-dir data/features --clear-json
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.data.database.connection import get_db_manager
+from src.data.database.market_repository import OHLCVRepository
+from src.data.database.models import VALID_TIMEFRAMES
+from src.data.feature_store import ColumnarFeatureStore
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Migrate JSONB features to the columnar feature store")
+    parser.add_argument("--store-dir", type=Path, required=True, help="Feature store root directory (DATA_FEATURE_STORE_DIR)")
+    parser.add_argument("--symbols", "-s", nargs="+", help="Only migrate specific symbols")
+    parser.add_argument("--timeframes", "-t", nargs="+", choices=VALID_TIMEFRAMES, help="Only migrate specific timeframes")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows read per query")
+    parser.add_argument("--clear-json", action="store_true", help="Empty the JSONB dicts after copying")
+    return parser.parse_args()
+
+
+def migrate_features(
+    store: ColumnarFeatureStore,
+    symbols: list[str] | None = None,
+    timeframes: list[str] | None = None,
+    batch_size: int = 50_000,
+    clear_json: bool = False,
+) -> dict:
+    """Migrate features for all matching tickers and timeframes.
+
+    Each ticker/timeframe is committed separately so progress survives
+    an interruption.
+    """
+    stats = {"migrated": 0, "pairs": 0, "errors": []}
+    target_timeframes = timeframes or VALID_TIMEFRAMES
+
+    with get_db_manager().get_session() as session:
+        repo = OHLCVRepository(session, feature_store=store)
+        tickers = repo.list_tickers(active_only=False)
+        if symbols:
+            wanted = {s.upper() for s in symbols}
+            tickers = [t for t in tickers if t.symbol in wanted]
+
+        for ticker in tickers:
+            for timeframe in target_timeframes:
+                try:
+                    rows = repo.migrate_features_to_store(
+                        ticker.id, timeframe, batch_size=batch_size, clear_json=clear_json,
+                    )
+                    session.commit()
+                except Exception as e:
+                    session.rollback()
+                    logger.error(f"{ticker.symbol}/{timeframe}: ERROR - {e}")
+                    stats["errors"].append(f"{ticker.symbol}/{timeframe}: {e}")
+                    continue
+
+                if rows:
+                    stats["pairs"] += 1
+                    stats["migrated"] += rows
+                    logger.info(f"{ticker.symbol}/{timeframe}: migrated {rows} rows")
+
+    return stats
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    store = ColumnarFeatureStore(args.store_dir)
+    logger.info(f"Migrating features into {store.root}")
+
+    stats = migrate_features(
+        store,
+        symbols=args.symbols,
+        timeframes=args.timeframes,
+        batch_size=args.batch_size,
+        clear_json=args.clear_json,
+    )
+
+    logger.info(f"Migrated {stats['migrated']} rows across {stats['pairs']} ticker/timeframes")
+    if stats["errors"]:
+        logger.warning(f"Errors encountered: {len(stats['errors'])}")
+        for err in stats["errors"]:
+            logger.warning(f"  - {err}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
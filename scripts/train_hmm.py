@@ -4,6 +4,7 @@
 Usage:
     python scripts/train_hmm.py --symbol AAPL --end 2025-01-15 --timeframe 1Min
     python scripts/train_hmm.py --symbol AAPL --end 2025-01-15 --timeframe 1Hour --val-days 14
+    python scripts/train_hmm.py --universe-file universe.txt --timeframes 1Min,5Min --end 2025-01-15 --workers 8
 """
 
 import argparse
@@ -18,6 +19,8 @@ sys.path.insert(0, str(project_root))
 
 from src.data.database.connection import get_db_manager
 from src.data.database.market_repository import OHLCVRepository
+from src.data.session_calendar import get_session_calendar
+from src.features.state.hmm.batch_training import BatchTrainer, BatchTrainingConfig
 from src.features.state.hmm.config import create_default_config, load_feature_spec, DEFAULT_FEATURE_SET
 from src.features.state.hmm.data_pipeline import GapHandler
 from src.features.state.hmm.training import TrainingPipeline, TrainingConfig
@@ -39,8 +42,12 @@ def parse_args():
     _add_data_args(parser)
     _add_training_args(parser)
     _add_model_args(parser)
+    _add_batch_args(parser)
     _add_output_args(parser)
-    return parser.parse_args()
+    args = parser.parse_args()
+    if not (args.symbol or args.symbols or args.universe_file):
+        parser.error("one of --symbol, --symbols or --universe-file is required")
+    return args
 
 
 def _get_epilog() -> str:
@@ -61,12 +68,18 @@ Examples:
 
     # Auto-select number of states via BIC
     python scripts/train_hmm.py --symbol AAPL --end 2025-01-15 --n-states auto
+
+    # Batch: every symbol in a file, two timeframes, 8 worker processes
+    python scripts/train_hmm.py --universe-file universe.txt --timeframes 1Min,5Min --end 2025-01-15 --workers 8
+
+    # Batch: retrain even if the data fingerprint is unchanged
+    python scripts/train_hmm.py --symbols AAPL,MSFT --timeframes 1Hour --end 2025-01-15 --force
     """
 
 
 def _add_data_args(parser: argparse.ArgumentParser) -> None:
     """Add data-related arguments."""
-    parser.add_argument("--symbol", "-s", required=True, help="Ticker symbol (e.g., AAPL)")
+    parser.add_argument("--symbol", "-s", default=None, help="Ticker symbol (e.g., AAPL)")
     parser.add_argument("--end", "-e", default=None, help="End date (YYYY-MM-DD). Required unless --list-features")
     parser.add_argument("--start", default=None, help="Start date (default: 1 year before end)")
     parser.add_argument("--timeframe", "-t", default="1Min", choices=["1Min", "5Min", "15Min", "1Hour", "1Day"])
@@ -88,6 +101,16 @@ def _add_model_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--list-features", action="store_true", help="List available features and exit")
 
 
+def _add_batch_args(parser: argparse.ArgumentParser) -> None:
+    """Add batch (multi-symbol) training arguments."""
+    parser.add_argument("--symbols", default=None, help="Comma-separated symbols to train in batch mode")
+    parser.add_argument("--universe-file", default=None, help="File with one symbol per line (batch mode)")
+    parser.add_argument("--timeframes", default=None, help="Comma-separated timeframes for batch mode (default: --timeframe)")
+    parser.add_argument("--workers", type=int, default=1, help="Training worker processes in batch mode (default: 1)")
+    parser.add_argument("--summary", default=None, help="Batch run summary path (default: <models-dir>/batch_runs/<timestamp>.json)")
+    parser.add_argument("--force", action="store_true", help="Retrain even if the data fingerprint is unchanged")
+
+
 def _add_output_args(parser: argparse.ArgumentParser) -> None:
     """Add output/verbosity arguments (placeholder for future)."""
     pass
@@ -195,20 +218,20 @@ def _log_training_info(args, train_start, train_end, val_start, val_end) -> None
     logger.info(f"Validation period: {val_start.date()} to {val_end.date()}")
 
 
-def _load_feature_spec(args) -> tuple[list[str], object, object]:
+def _load_feature_spec(timeframe: str) -> tuple[list[str], object, object]:
     """Load feature specification from config or defaults."""
     config = None
     config_path = Path("config/state_vector_feature_spec.yaml")
 
     try:
         if config_path.exists():
-            feature_spec = load_feature_spec(config_path, args.timeframe)
+            feature_spec = load_feature_spec(config_path, timeframe)
             feature_names = feature_spec.feature_names
             config = feature_spec.config
             logger.info(f"Loaded {len(feature_names)} features from {config_path}")
         else:
             config = create_default_config()
-            feature_names = config.get_features_for_timeframe(args.timeframe)
+            feature_names = config.get_features_for_timeframe(timeframe)
             logger.info(f"Using {len(feature_names)} default features")
     except Exception as e:
         logger.warning(f"Could not load feature spec: {e}")
@@ -216,7 +239,7 @@ def _load_feature_spec(args) -> tuple[list[str], object, object]:
         logger.info(f"Using fallback feature set ({len(feature_names)} features)")
         return feature_names, None, None
 
-    tf_config = config.get_timeframe_config(args.timeframe) if config else None
+    tf_config = config.get_timeframe_config(timeframe) if config else None
     return feature_names, config, tf_config
 
 
@@ -296,7 +319,7 @@ def _filter_available_features(feature_names, train_df) -> list[str]:
 
 def _clean_data(train_df, val_df, feature_names, args):
     """Handle gaps and clean NaN values from data."""
-    gap_handler = GapHandler(args.timeframe)
+    gap_handler = GapHandler(args.timeframe, calendar=get_session_calendar())
     train_df = gap_handler.handle_gaps(train_df)
     val_df = gap_handler.handle_gaps(val_df)
 
@@ -371,6 +394,68 @@ def _log_training_results(result) -> None:
     logger.info(f"  Metadata: {result.paths.metadata_path}")
 
 
+def _batch_symbols(args) -> list[str]:
+    """Collect the batch symbol universe from --symbol/--symbols/--universe-file."""
+    symbols = [args.symbol] if args.symbol else []
+    if args.symbols:
+        symbols += [s.strip() for s in args.symbols.split(",") if s.strip()]
+    if args.universe_file:
+        with open(args.universe_file) as f:
+            symbols += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return list(dict.fromkeys(s.upper() for s in symbols))
+
+
+def _run_batch(args) -> None:
+    """Train every symbol/timeframe pair on a worker pool and write a run summary."""
+    if not args.end:
+        logger.error("--end date is required for training.")
+        sys.exit(1)
+    end_date = datetime.strptime(args.end, "%Y-%m-%d")
+    start_date = datetime.strptime(args.start, "%Y-%m-%d") if args.start else end_date - timedelta(days=365)
+
+    symbols = _batch_symbols(args)
+    timeframes = [t.strip() for t in (args.timeframes or args.timeframe).split(",") if t.strip()]
+
+    feature_names, n_states, latent_dim = {}, {}, {}
+    for timeframe in timeframes:
+        feature_names[timeframe], _, tf_config = _load_feature_spec(timeframe)
+        n_states[timeframe] = _determine_n_states(args, tf_config)
+        latent_dim[timeframe] = _determine_latent_dim(args, tf_config)
+
+    config = BatchTrainingConfig(
+        symbols=symbols,
+        timeframes=timeframes,
+        start=start_date,
+        end=end_date,
+        feature_names=feature_names,
+        val_days=args.val_days,
+        n_states=n_states,
+        latent_dim=latent_dim,
+        scaler_type=args.scaler,
+        covariance_type=args.covariance,
+        random_seed=args.seed,
+        force=args.force,
+    )
+    logger.info(f"Batch training {len(symbols)} symbols x {len(timeframes)} timeframes")
+
+    summary = BatchTrainer(config, models_root=Path(args.models_dir), max_workers=args.workers).run()
+
+    summary_path = args.summary or (
+        Path(args.models_dir) / "batch_runs" / f"{summary.started_at:%Y%m%dT%H%M%SZ}.json"
+    )
+    summary.save(summary_path)
+
+    logger.info("\n" + "=" * 60)
+    logger.info("BATCH TRAINING COMPLETE")
+    logger.info("=" * 60)
+    logger.info(f"Trained: {summary.count('trained')}, skipped: {summary.count('skipped')}, failed: {summary.count('failed')}")
+    logger.info(f"Elapsed: {(summary.finished_at - summary.started_at).total_seconds():.1f}s")
+    logger.info(f"Summary: {summary_path}")
+
+    if summary.count("failed"):
+        sys.exit(1)
+
+
 def main():
     """Main entry point."""
     args = parse_args()
@@ -378,6 +463,10 @@ def main():
     if args.list_features:
         _list_features(args)
 
+    if args.symbols or args.universe_file or args.timeframes:
+        _run_batch(args)
+        return
+
     start_date, end_date = _parse_dates(args)
     db_manager = get_db_manager()
     tf_summary = _get_data_summary(args, db_manager)
@@ -385,7 +474,7 @@ def main():
     train_start, train_end, val_start, val_end = _calculate_train_val_split(start_date, end_date, args.val_days)
     _log_training_info(args, train_start, train_end, val_start, val_end)
 
-    feature_names, _, tf_config = _load_feature_spec(args)
+    feature_names, _, tf_config = _load_feature_spec(args.timeframe)
     n_states = _determine_n_states(args, tf_config)
     latent_dim = _determine_latent_dim(args, tf_config)
 
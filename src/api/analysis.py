@@ -1,20 +1,27 @@
 """FastAPI router for symbol analysis endpoints (HMM and PCA)."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
 
+from src.api.analysis_jobs import (
+    JOB_FAILED,
+    AnalysisJob,
+    get_analysis_job_manager,
+    report_progress,
+)
 from src.api.auth_middleware import get_current_user
 from src.api._data_helpers import (
     compute_features_internal,
     load_ohlcv_internal,
     PROJECT_ROOT,
 )
-from src.data.database.dependencies import get_market_grpc_client
+from src.data.database.dependencies import grpc_market_client
 from src.data.database.models import VALID_TIMEFRAMES
 from src.features.state.hmm.artifacts import get_model_path, list_models
 from src.features.state.hmm.inference import InferenceEngine
@@ -55,35 +62,149 @@ class PCAAnalyzeResponse(BaseModel):
     message: str
 
 
+class AnalysisJobResponse(BaseModel):
+    """Status of a background analysis job."""
+    job_id: str
+    kind: str
+    symbol: str
+    timeframe: str
+    params: dict[str, Any]
+    status: str
+    progress: float
+    stage: str
+    result: Optional[dict[str, Any]]
+    error: Optional[str]
+    created_at: str
+    started_at: Optional[str]
+    finished_at: Optional[str]
+
+
 # ---------------------------------------------------------------------------
-# HMM analysis
+# Endpoints
+#
+# Analysis is CPU-heavy and takes minutes, so every run goes through the
+# AnalysisJobManager process pool. By default the endpoint awaits the job
+# (without blocking the event loop) and returns the analysis result;
+# ``background=true`` returns the job immediately for polling.
 # ---------------------------------------------------------------------------
 
 
+def _validate_timeframe(timeframe: str) -> None:
+    if timeframe not in VALID_TIMEFRAMES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid timeframe: {timeframe}. Must be one of {list(VALID_TIMEFRAMES)}"
+        )
+
+
+async def _job_response(job: AnalysisJob, background: bool, response: Response, model: type[BaseModel]):
+    """Return the job for polling, or wait for it and return its result."""
+    if background:
+        response.status_code = 202 if not job.done else 200
+        return AnalysisJobResponse(**job.to_dict())
+
+    job = await get_analysis_job_manager().wait(job.job_id)
+    if job.status == JOB_FAILED:
+        raise HTTPException(status_code=job.status_code or 500, detail=job.error)
+    return model(**job.result)
+
+
 @router.post("/api/analyze/{symbol}")
 async def analyze_symbol(
     symbol: str,
+    response: Response,
     timeframe: str = Query("1Min", description="Timeframe to analyze"),
-    repo=Depends(get_market_grpc_client),
+    background: bool = Query(False, description="Return a job to poll instead of waiting"),
+    force: bool = Query(False, description="Rerun even if a recent result is cached"),
     _user_id: int = Depends(get_current_user),
 ):
     """Analyze a symbol: compute features, train model if needed, compute states.
 
-    This endpoint orchestrates:
+    Identical requests share one running job, and completed results are
+    reused for a few minutes unless ``force`` is set.
+    """
+    _validate_timeframe(timeframe)
+    job = get_analysis_job_manager().submit("hmm", run_hmm_analysis, symbol, timeframe, force=force)
+    return await _job_response(job, background, response, AnalyzeResponse)
+
+
+@router.post("/api/pca/analyze/{symbol}")
+async def analyze_symbol_pca(
+    symbol: str,
+    response: Response,
+    timeframe: str = Query("1Min", description="Timeframe to analyze"),
+    n_components: Optional[int] = Query(None, description="Number of PCA components (auto if not specified)"),
+    n_states: Optional[int] = Query(None, description="Number of K-means clusters (auto if not specified)"),
+    background: bool = Query(False, description="Return a job to poll instead of waiting"),
+    force: bool = Query(False, description="Rerun even if a recent result is cached"),
+    _user_id: int = Depends(get_current_user),
+):
+    """Analyze a symbol using PCA + K-means state computation."""
+    _validate_timeframe(timeframe)
+    params = {"n_components": n_components, "n_states": n_states}
+    job = get_analysis_job_manager().submit("pca", run_pca_analysis, symbol, timeframe, params, force=force)
+    return await _job_response(job, background, response, PCAAnalyzeResponse)
+
+
+@router.get("/api/analyze/jobs", response_model=list[AnalysisJobResponse])
+async def list_analysis_jobs(
+    symbol: Optional[str] = Query(None, description="Only jobs for this symbol"),
+    _user_id: int = Depends(get_current_user),
+):
+    """List recent analysis jobs, newest first."""
+    return [AnalysisJobResponse(**job.to_dict()) for job in get_analysis_job_manager().list_jobs(symbol)]
+
+
+@router.get("/api/analyze/jobs/{job_id}", response_model=AnalysisJobResponse)
+async def get_analysis_job(
+    job_id: str,
+    _user_id: int = Depends(get_current_user),
+):
+    """Get status, progress, and (when finished) the result of an analysis job."""
+    job = get_analysis_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Analysis job {job_id} not found")
+    return AnalysisJobResponse(**job.to_dict())
+
+
+# ---------------------------------------------------------------------------
+# Worker entry points (run in the AnalysisJobManager process pool)
+# ---------------------------------------------------------------------------
+
+
+def run_hmm_analysis(symbol: str, timeframe: str, params: dict) -> dict:
+    """Run HMM analysis for one symbol/timeframe in a worker process."""
+    with grpc_market_client() as repo:
+        return asyncio.run(_analyze_hmm(symbol, timeframe, repo))
+
+
+def run_pca_analysis(symbol: str, timeframe: str, params: dict) -> dict:
+    """Run PCA analysis for one symbol/timeframe in a worker process."""
+    with grpc_market_client() as repo:
+        return asyncio.run(_analyze_pca(symbol, timeframe, repo, **params))
+
+
+# ---------------------------------------------------------------------------
+# HMM analysis
+# ---------------------------------------------------------------------------
+
+
+async def _analyze_hmm(symbol: str, timeframe: str, repo) -> dict:
+    """Compute features, train an HMM if needed, and compute states.
+
+    Runs inside an analysis worker process (see ``run_hmm_analysis``):
     1. Compute features for bars that don't have them
     2. Train HMM model if none exists or last training was >30 days ago
     3. Compute states for bars without state entries
+
+    Returns:
+        ``AnalyzeResponse`` fields as a dict
     """
     from src.features.state.hmm.training import TrainingPipeline, TrainingConfig
+    from src.data.session_calendar import get_session_calendar
     from src.features.state.hmm.data_pipeline import GapHandler
     from src.features.state.hmm.config import DEFAULT_FEATURE_SET
 
-    if timeframe not in VALID_TIMEFRAMES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid timeframe: {timeframe}. Must be one of {list(VALID_TIMEFRAMES)}"
-        )
-
     symbol = symbol.upper()
     models_root = PROJECT_ROOT / "models"
 
@@ -99,182 +220,179 @@ async def analyze_symbol(
     }
     messages = []
 
+    # Step 0: Ensure OHLCV data is loaded
+    report_progress(0.05, "loading OHLCV")
+    logger.info("[Analyze] Step 0: Loading OHLCV data for %s/%s", symbol, timeframe)
     try:
-        # Step 0: Ensure OHLCV data is loaded
-        logger.info("[Analyze] Step 0: Loading OHLCV data for %s/%s", symbol, timeframe)
-        try:
-            await load_ohlcv_internal(symbol, timeframe)
-            messages.append("OHLCV data loaded")
-        except HTTPException as e:
-            if e.status_code == 404:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"No OHLCV data available for {symbol}. Ensure Alpaca API is configured."
-                )
-            raise
-
-        # Step 1: Compute features
-        logger.info("[Analyze] Step 1: Computing features for %s/%s", symbol, timeframe)
-        features_result = await compute_features_internal(symbol, force=False)
-        result["features_computed"] = features_result.features_stored
-        if features_result.features_stored > 0:
-            messages.append(f"Computed {features_result.features_stored} features")
-        else:
-            messages.append("Features already computed")
-
-        # Step 2: Check if model needs training
-        logger.info("[Analyze] Step 2: Checking model status for %s %s", symbol, timeframe)
-        available_models = list_models(symbol.upper(), timeframe, models_root)
-        need_training = True
-        current_model_id = None
-
-        if available_models:
-            current_model_id = available_models[-1]
-            paths = get_model_path(symbol.upper(), timeframe, current_model_id, models_root)
-            if paths.exists():
-                metadata = paths.load_metadata()
-                if metadata.created_at:
-                    model_age = datetime.now(timezone.utc) - metadata.created_at
-                    if model_age.days < 30:
-                        need_training = False
-                        result["model_id"] = current_model_id
-                        messages.append(f"Model {current_model_id} is current ({model_age.days} days old)")
-
-        if need_training:
-            logger.info("[Analyze] Training new model for %s", timeframe)
-            ticker = repo.get_ticker(symbol)
-            if not ticker:
-                raise HTTPException(status_code=404, detail=f"Ticker {symbol} not found")
-
-            features_df = repo.get_features(symbol, timeframe)
-            if features_df.empty or len(features_df) < 200:
-                logger.warning("Insufficient features for %s: %d bars available, 200 required", symbol, len(features_df))
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Insufficient data for training. Need at least 200 bars, have {len(features_df)}"
-                )
-
-            available_features = set(features_df.columns)
-            feature_names = [f for f in DEFAULT_FEATURE_SET if f in available_features]
-            if len(feature_names) < 5:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Insufficient features. Need at least 5 features."
-                )
-
-            split_idx = int(len(features_df) * 0.8)
-            train_df = features_df.iloc[:split_idx]
-            val_df = features_df.iloc[split_idx:]
-
-            gap_handler = GapHandler(timeframe)
-            train_df = gap_handler.handle_gaps(train_df)
-            val_df = gap_handler.handle_gaps(val_df)
-
-            train_df_clean = train_df[feature_names].dropna()
-            val_df_clean = val_df[feature_names].dropna()
-
-            if len(train_df_clean) < 100 or len(val_df_clean) < 20:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Insufficient clean data after NaN removal"
-                )
-
-            config = TrainingConfig(
-                timeframe=timeframe,
-                symbols=[symbol],
-                train_start=train_df_clean.index.min(),
-                train_end=train_df_clean.index.max(),
-                val_start=val_df_clean.index.min(),
-                val_end=val_df_clean.index.max(),
-                feature_names=feature_names,
-                scaler_type="robust",
-                encoder_type="pca",
-                latent_dim=None,
-                n_states=None,
-                covariance_type="diag",
-                random_seed=42,
+        await load_ohlcv_internal(symbol, timeframe)
+        messages.append("OHLCV data loaded")
+    except HTTPException as e:
+        if e.status_code == 404:
+            raise HTTPException(
+                status_code=400,
+                detail=f"No OHLCV data available for {symbol}. Ensure Alpaca API is configured."
             )
+        raise
 
-            pipeline = TrainingPipeline(models_root=models_root, random_seed=42)
-            train_result = pipeline.train(config, train_df_clean, val_df_clean)
+    # Step 1: Compute features
+    report_progress(0.2, "computing features")
+    logger.info("[Analyze] Step 1: Computing features for %s/%s", symbol, timeframe)
+    features_result = await compute_features_internal(symbol, force=False)
+    result["features_computed"] = features_result.features_stored
+    if features_result.features_stored > 0:
+        messages.append(f"Computed {features_result.features_stored} features")
+    else:
+        messages.append("Features already computed")
+
+    # Step 2: Check if model needs training
+    report_progress(0.4, "checking model")
+    logger.info("[Analyze] Step 2: Checking model status for %s %s", symbol, timeframe)
+    available_models = list_models(symbol.upper(), timeframe, models_root)
+    need_training = True
+    current_model_id = None
+
+    if available_models:
+        current_model_id = available_models[-1]
+        paths = get_model_path(symbol.upper(), timeframe, current_model_id, models_root)
+        if paths.exists():
+            metadata = paths.load_metadata()
+            if metadata.created_at:
+                model_age = datetime.now(timezone.utc) - metadata.created_at
+                if model_age.days < 30:
+                    need_training = False
+                    result["model_id"] = current_model_id
+                    messages.append(f"Model {current_model_id} is current ({model_age.days} days old)")
+
+    if need_training:
+        report_progress(0.5, "training model")
+        logger.info("[Analyze] Training new model for %s", timeframe)
+        ticker = repo.get_ticker(symbol)
+        if not ticker:
+            raise HTTPException(status_code=404, detail=f"Ticker {symbol} not found")
 
-            result["model_trained"] = True
-            result["model_id"] = train_result.model_id
-            current_model_id = train_result.model_id
-            messages.append(
-                f"Trained new model {train_result.model_id} with {train_result.hmm.n_states} states"
+        features_df = repo.get_features(symbol, timeframe)
+        if features_df.empty or len(features_df) < 200:
+            logger.warning("Insufficient features for %s: %d bars available, 200 required", symbol, len(features_df))
+            raise HTTPException(
+                status_code=400,
+                detail=f"Insufficient data for training. Need at least 200 bars, have {len(features_df)}"
             )
 
-        # Step 3: Compute states
-        logger.info("[Analyze] Step 3: Computing states for %s/%s", symbol, timeframe)
-        if current_model_id:
-            ticker = repo.get_ticker(symbol)
+        available_features = set(features_df.columns)
+        feature_names = [f for f in DEFAULT_FEATURE_SET if f in available_features]
+        if len(feature_names) < 5:
+            raise HTTPException(
+                status_code=400,
+                detail="Insufficient features. Need at least 5 features."
+            )
 
-            bars_df = repo.get_bars(symbol, timeframe)
-            result["total_bars"] = len(bars_df)
+        split_idx = int(len(features_df) * 0.8)
+        train_df = features_df.iloc[:split_idx]
+        val_df = features_df.iloc[split_idx:]
 
-            if bars_df.empty:
-                messages.append("No bars to process")
-            else:
-                existing_states = repo.get_states(symbol, timeframe, current_model_id)
-                existing_timestamps = set(existing_states.index) if not existing_states.empty else set()
-
-                all_timestamps = set(bars_df.index)
-                missing_timestamps = all_timestamps - existing_timestamps
-
-                if missing_timestamps:
-                    features_df = repo.get_features(symbol, timeframe)
-                    features_to_process = features_df[features_df.index.isin(missing_timestamps)]
-
-                    if not features_to_process.empty:
-                        paths = get_model_path(symbol.upper(), timeframe, current_model_id, models_root)
-                        engine = InferenceEngine.from_artifacts(paths)
-                        metadata = paths.load_metadata()
-                        model_features = metadata.feature_names
-
-                        bar_id_map = repo.get_bar_ids_for_timestamps(
-                            ticker.id, timeframe, list(features_to_process.index)
-                        )
-
-                        state_records = []
-                        engine.reset()
-
-                        for ts, row in features_to_process.iterrows():
-                            features = {name: row.get(name, np.nan) for name in model_features}
-                            output = engine.process(features, symbol, ts)
-
-                            bar_id = bar_id_map.get(ts)
-                            if bar_id:
-                                state_records.append({
-                                    "bar_id": bar_id,
-                                    "state_id": output.state_id,
-                                    "state_prob": float(output.state_prob),
-                                    "log_likelihood": float(output.log_likelihood)
-                                    if not np.isinf(output.log_likelihood) else None,
-                                })
-
-                        if state_records:
-                            stored = repo.store_states(state_records, current_model_id)
-                            result["states_computed"] = stored
-                            messages.append(f"Computed {stored} states")
-                        else:
-                            messages.append("No new states to compute")
+        gap_handler = GapHandler(timeframe, calendar=get_session_calendar())
+        train_df = gap_handler.handle_gaps(train_df)
+        val_df = gap_handler.handle_gaps(val_df)
+
+        train_df_clean = train_df[feature_names].dropna()
+        val_df_clean = val_df[feature_names].dropna()
+
+        if len(train_df_clean) < 100 or len(val_df_clean) < 20:
+            raise HTTPException(
+                status_code=400,
+                detail="Insufficient clean data after NaN removal"
+            )
+
+        config = TrainingConfig(
+            timeframe=timeframe,
+            symbols=[symbol],
+            train_start=train_df_clean.index.min(),
+            train_end=train_df_clean.index.max(),
+            val_start=val_df_clean.index.min(),
+            val_end=val_df_clean.index.max(),
+            feature_names=feature_names,
+            scaler_type="robust",
+            encoder_type="pca",
+            latent_dim=None,
+            n_states=None,
+            covariance_type="diag",
+            random_seed=42,
+        )
+
+        pipeline = TrainingPipeline(models_root=models_root, random_seed=42)
+        train_result = pipeline.train(config, train_df_clean, val_df_clean)
+
+        result["model_trained"] = True
+        result["model_id"] = train_result.model_id
+        current_model_id = train_result.model_id
+        messages.append(
+            f"Trained new model {train_result.model_id} with {train_result.hmm.n_states} states"
+        )
+
+    # Step 3: Compute states
+    report_progress(0.8, "computing states")
+    logger.info("[Analyze] Step 3: Computing states for %s/%s", symbol, timeframe)
+    if current_model_id:
+        ticker = repo.get_ticker(symbol)
+
+        bars_df = repo.get_bars(symbol, timeframe)
+        result["total_bars"] = len(bars_df)
+
+        if bars_df.empty:
+            messages.append("No bars to process")
+        else:
+            existing_states = repo.get_states(symbol, timeframe, current_model_id)
+            existing_timestamps = set(existing_states.index) if not existing_states.empty else set()
+
+            all_timestamps = set(bars_df.index)
+            missing_timestamps = all_timestamps - existing_timestamps
+
+            if missing_timestamps:
+                features_df = repo.get_features(symbol, timeframe)
+                features_to_process = features_df[features_df.index.isin(missing_timestamps)]
+
+                if not features_to_process.empty:
+                    paths = get_model_path(symbol.upper(), timeframe, current_model_id, models_root)
+                    engine = InferenceEngine.from_artifacts(paths)
+
+                    bar_id_map = repo.get_bar_ids_for_timestamps(
+                        ticker.id, timeframe, list(features_to_process.index)
+                    )
+
+                    states = engine.infer_batch(features_to_process)
+
+                    state_records = []
+                    for ts, state_id, state_prob, log_lik in zip(
+                        features_to_process.index,
+                        states.state_id.tolist(),
+                        states.state_prob.tolist(),
+                        states.log_likelihood.tolist(),
+                    ):
+                        bar_id = bar_id_map.get(ts)
+                        if bar_id:
+                            state_records.append({
+                                "bar_id": bar_id,
+                                "state_id": state_id,
+                                "state_prob": state_prob,
+                                "log_likelihood": log_lik if not np.isinf(log_lik) else None,
+                            })
+
+                    if state_records:
+                        stored = repo.store_states(state_records, current_model_id)
+                        result["states_computed"] = stored
+                        messages.append(f"Computed {stored} states")
                     else:
-                        messages.append("No features available for missing bars")
+                        messages.append("No new states to compute")
                 else:
-                    messages.append("All bars already have states")
-        else:
-            messages.append("No model available for state computation")
-
-        result["message"] = "; ".join(messages)
-        logger.info("[Analyze] Complete: %s", result["message"])
-        return AnalyzeResponse(**result)
+                    messages.append("No features available for missing bars")
+            else:
+                messages.append("All bars already have states")
+    else:
+        messages.append("No model available for state computation")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.exception("Error analyzing %s: %s", symbol, e)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    result["message"] = "; ".join(messages)
+    logger.info("[Analyze] Complete: %s", result["message"])
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -282,21 +400,22 @@ async def analyze_symbol(
 # ---------------------------------------------------------------------------
 
 
-@router.post("/api/pca/analyze/{symbol}")
-async def analyze_symbol_pca(
+async def _analyze_pca(
     symbol: str,
-    timeframe: str = Query("1Min", description="Timeframe to analyze"),
-    n_components: Optional[int] = Query(None, description="Number of PCA components (auto if not specified)"),
-    n_states: Optional[int] = Query(None, description="Number of K-means clusters (auto if not specified)"),
-    repo=Depends(get_market_grpc_client),
-    _user_id: int = Depends(get_current_user),
-):
-    """Analyze a symbol using PCA + K-means state computation.
-
-    This endpoint:
+    timeframe: str,
+    repo,
+    n_components: Optional[int] = None,
+    n_states: Optional[int] = None,
+) -> dict:
+    """Train a PCA + K-means model and compute states.
+
+    Runs inside an analysis worker process (see ``run_pca_analysis``):
     1. Ensures features are computed
     2. Trains a PCA + K-means model
     3. Computes states for all bars
+
+    Returns:
+        ``PCAAnalyzeResponse`` fields as a dict
     """
     from src.features.state.pca import (
         PCAStateTrainer,
@@ -306,12 +425,6 @@ async def analyze_symbol_pca(
         labels_to_dict,
     )
 
-    if timeframe not in VALID_TIMEFRAMES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid timeframe: {timeframe}. Must be one of {list(VALID_TIMEFRAMES)}"
-        )
-
     symbol = symbol.upper()
     models_root = PROJECT_ROOT / "models"
 
@@ -329,128 +442,124 @@ async def analyze_symbol_pca(
     }
     messages = []
 
+    # Step 0: Ensure OHLCV data is loaded
+    report_progress(0.05, "loading OHLCV")
+    logger.info("[PCA Analyze] Step 0: Loading OHLCV data for %s/%s", symbol, timeframe)
     try:
-        # Step 0: Ensure OHLCV data is loaded
-        logger.info("[PCA Analyze] Step 0: Loading OHLCV data for %s/%s", symbol, timeframe)
-        try:
-            await load_ohlcv_internal(symbol, timeframe)
-            messages.append("OHLCV data loaded")
-        except HTTPException as e:
-            if e.status_code == 404:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"No OHLCV data available for {symbol}. Ensure Alpaca API is configured."
-                )
-            raise
-
-        # Step 1: Ensure features are computed
-        logger.info("[PCA Analyze] Step 1: Computing features for %s/%s", symbol, timeframe)
-        features_result = await compute_features_internal(symbol, force=False)
-        result["features_computed"] = features_result.features_stored
-        if features_result.features_stored > 0:
-            messages.append(f"Computed {features_result.features_stored} features")
-        else:
-            messages.append("Features already computed")
-
-        # Step 2: Get features from database
-        ticker = repo.get_ticker(symbol)
-        if not ticker:
-            raise HTTPException(status_code=404, detail=f"Ticker {symbol} not found")
-
-        features_df = repo.get_features(symbol, timeframe)
-        if features_df.empty or len(features_df) < 200:
+        await load_ohlcv_internal(symbol, timeframe)
+        messages.append("OHLCV data loaded")
+    except HTTPException as e:
+        if e.status_code == 404:
             raise HTTPException(
                 status_code=400,
-                detail=f"Insufficient data for training. Need at least 200 bars, have {len(features_df)}"
+                detail=f"No OHLCV data available for {symbol}. Ensure Alpaca API is configured."
             )
+        raise
 
-        pca_features = [
-            "r1", "r5", "r15", "r60",
-            "rv_60", "vol_z_60",
-            "rsi_14", "macd", "bb_pct",
-            "adx_14", "atr_14",
-            "relvol_60",
-        ]
-        available_features = set(features_df.columns)
-        feature_names = [f for f in pca_features if f in available_features]
-
-        if len(feature_names) < 5:
-            raise HTTPException(
-                status_code=400,
-                detail="Insufficient features for PCA. Need at least 5 features."
-            )
-
-        logger.info("[PCA Analyze] Using %d features: %s", len(feature_names), feature_names)
-
-        # Step 3: Train PCA model
-        logger.info("[PCA Analyze] Step 2: Training PCA + K-means model")
-        model_id = "pca_v001"
-
-        trainer = PCAStateTrainer(
-            n_components=n_components or 6,
-            n_states=n_states or 5,
-            auto_select_components=n_components is None,
-            auto_select_states=n_states is None,
+    # Step 1: Ensure features are computed
+    report_progress(0.2, "computing features")
+    logger.info("[PCA Analyze] Step 1: Computing features for %s/%s", symbol, timeframe)
+    features_result = await compute_features_internal(symbol, force=False)
+    result["features_computed"] = features_result.features_stored
+    if features_result.features_stored > 0:
+        messages.append(f"Computed {features_result.features_stored} features")
+    else:
+        messages.append("Features already computed")
+
+    # Step 2: Get features from database
+    ticker = repo.get_ticker(symbol)
+    if not ticker:
+        raise HTTPException(status_code=404, detail=f"Ticker {symbol} not found")
+
+    features_df = repo.get_features(symbol, timeframe)
+    if features_df.empty or len(features_df) < 200:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Insufficient data for training. Need at least 200 bars, have {len(features_df)}"
         )
 
-        train_result = trainer.fit(
-            df=features_df,
-            feature_names=feature_names,
-            model_id=model_id,
-            timeframe=timeframe,
-            symbols=[symbol],
+    pca_features = [
+        "r1", "r5", "r15", "r60",
+        "rv_60", "vol_z_60",
+        "rsi_14", "macd", "bb_pct",
+        "adx_14", "atr_14",
+        "relvol_60",
+    ]
+    available_features = set(features_df.columns)
+    feature_names = [f for f in pca_features if f in available_features]
+
+    if len(feature_names) < 5:
+        raise HTTPException(
+            status_code=400,
+            detail="Insufficient features for PCA. Need at least 5 features."
         )
 
-        model_path = get_pca_model_path(symbol, timeframe, model_id, models_root)
-        trainer.save(model_path)
-
-        result["model_trained"] = True
-        result["model_id"] = model_id
-        result["n_components"] = train_result.metadata.n_components
-        result["n_states"] = train_result.metadata.n_states
-        result["total_variance_explained"] = train_result.metadata.total_variance_explained
-        messages.append(
-            f"Trained PCA model: {train_result.metadata.n_components} components, "
-            f"{train_result.metadata.n_states} states, "
-            f"{train_result.metadata.total_variance_explained*100:.1f}% variance explained"
-        )
+    logger.info("[PCA Analyze] Using %d features: %s", len(feature_names), feature_names)
 
-        # Step 4: Compute states and store
-        logger.info("[PCA Analyze] Step 3: Computing states")
-        engine = PCAStateEngine.from_artifacts(model_path)
-        state_df = engine.transform(features_df)
+    # Step 3: Train PCA model
+    report_progress(0.4, "training model")
+    logger.info("[PCA Analyze] Step 2: Training PCA + K-means model")
+    model_id = "pca_v001"
 
-        labels = label_pca_states(engine, features_df, feature_names)
-        trainer.metadata.state_mapping = labels_to_dict(labels)
-        trainer.save(model_path)
+    trainer = PCAStateTrainer(
+        n_components=n_components or 6,
+        n_states=n_states or 5,
+        auto_select_components=n_components is None,
+        auto_select_states=n_states is None,
+    )
 
-        bar_id_map = repo.get_bar_ids_for_timestamps(
-            ticker.id, timeframe, list(features_df.index)
-        )
+    train_result = trainer.fit(
+        df=features_df,
+        feature_names=feature_names,
+        model_id=model_id,
+        timeframe=timeframe,
+        symbols=[symbol],
+    )
 
-        state_records = []
-        for ts, row in state_df.iterrows():
-            bar_id = bar_id_map.get(ts)
-            if bar_id:
-                state_records.append({
-                    "bar_id": bar_id,
-                    "state_id": int(row["state_id"]),
-                    "state_prob": 1.0 - min(row["distance"] / trainer.metadata.ood_threshold, 1.0),
-                    "log_likelihood": -float(row["distance"]),
-                })
+    model_path = get_pca_model_path(symbol, timeframe, model_id, models_root)
+    trainer.save(model_path)
+
+    result["model_trained"] = True
+    result["model_id"] = model_id
+    result["n_components"] = train_result.metadata.n_components
+    result["n_states"] = train_result.metadata.n_states
+    result["total_variance_explained"] = train_result.metadata.total_variance_explained
+    messages.append(
+        f"Trained PCA model: {train_result.metadata.n_components} components, "
+        f"{train_result.metadata.n_states} states, "
+        f"{train_result.metadata.total_variance_explained*100:.1f}% variance explained"
+    )
 
-        if state_records:
-            stored_count = repo.store_states(state_records, f"pca_{model_id}")
-            result["states_computed"] = stored_count
-            messages.append(f"Computed {stored_count} states")
+    # Step 4: Compute states and store
+    report_progress(0.8, "computing states")
+    logger.info("[PCA Analyze] Step 3: Computing states")
+    engine = PCAStateEngine.from_artifacts(model_path)
+    state_df = engine.transform(features_df)
 
-        result["message"] = "; ".join(messages)
-        logger.info("[PCA Analyze] Complete: %s", result["message"])
+    labels = label_pca_states(engine, features_df, feature_names)
+    trainer.metadata.state_mapping = labels_to_dict(labels)
+    trainer.save(model_path)
 
-        return PCAAnalyzeResponse(**result)
+    bar_id_map = repo.get_bar_ids_for_timestamps(
+        ticker.id, timeframe, list(features_df.index)
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.exception("PCA analysis failed for %s: %s", symbol, e)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    state_records = []
+    for ts, row in state_df.iterrows():
+        bar_id = bar_id_map.get(ts)
+        if bar_id:
+            state_records.append({
+                "bar_id": bar_id,
+                "state_id": int(row["state_id"]),
+                "state_prob": 1.0 - min(row["distance"] / trainer.metadata.ood_threshold, 1.0),
+                "log_likelihood": -float(row["distance"]),
+            })
+
+    if state_records:
+        stored_count = repo.store_states(state_records, f"pca_{model_id}")
+        result["states_computed"] = stored_count
+        messages.append(f"Computed {stored_count} states")
+
+    result["message"] = "; ".join(messages)
+    logger.info("[PCA Analyze] Complete: %s", result["message"])
+    return result
@@ -0,0 +1,409 @@
+"""Background job runner for long-running analysis endpoints.
+
+Analysis (OHLCV load, feature computation, HMM/PCA training, state
+inference) takes minutes and is CPU-bound, so it must never run on the
+uvicorn event loop. ``AnalysisJobManager`` runs each analysis in a
+bounded process pool and tracks it as an ``AnalysisJob`` with an ID,
+status, and progress that endpoints can poll.
+
+Requests for the same (kind, symbol, timeframe, params) share one job
+while it is running, and completed results are reused for
+``result_ttl`` seconds unless the caller forces a rerun.
+
+Job functions run in worker processes and must be importable module-level
+callables with the signature ``fn(symbol, timeframe, params) -> dict``.
+They report progress through ``report_progress`` and signal client errors
+by raising ``HTTPException``.
+"""
+
+import asyncio
+import logging
+import multiprocessing as mp
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Callable, Optional
+
+from cachetools import TTLCache
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# Progress queue installed in each worker by ``_init_worker``
+_progress_queue = None
+# Job ID of the analysis running on the current worker thread
+_worker_state = threading.local()
+
+
+def _init_worker(queue) -> None:
+    """Pool initializer: remember the queue progress updates go to."""
+    global _progress_queue
+    _progress_queue = queue
+
+
+def report_progress(progress: float, stage: str) -> None:
+    """Report progress of the job running in this worker.
+
+    Safe to call outside a job (e.g. from tests or scripts); the update
+    is then dropped.
+
+    Args:
+        progress: Completion fraction in [0, 1]
+        stage: Short description of the current step
+    """
+    job_id = getattr(_worker_state, "job_id", None)
+    if _progress_queue is not None and job_id is not None:
+        _progress_queue.put((job_id, float(progress), stage))
+
+
+def _run_job(job_id: str, fn: Callable[..., dict], symbol: str, timeframe: str, params: dict) -> dict:
+    """Worker entry point: run ``fn`` and package its outcome.
+
+    Exceptions are converted to plain data so nothing framework-specific
+    has to be pickled back to the API process.
+    """
+    _worker_state.job_id = job_id
+    report_progress(0.0, "started")
+    try:
+        return {"ok": True, "result": fn(symbol, timeframe, params)}
+    except HTTPException as e:
+        return {"ok": False, "status_code": e.status_code, "error": str(e.detail)}
+    except Exception as e:
+        logger.exception("Analysis job %s failed for %s/%s: %s", job_id, symbol, timeframe, e)
+        return {"ok": False, "status_code": 500, "error": "Internal server error"}
+    finally:
+        _worker_state.job_id = None
+
+
+@dataclass
+class AnalysisJob:
+    """State of one background analysis.
+
+    Attributes:
+        job_id: Unique job identifier
+        kind: Analysis kind (e.g. ``"hmm"``, ``"pca"``)
+        symbol: Ticker symbol
+        timeframe: Bar timeframe
+        params: Extra analysis parameters
+        status: One of pending, running, completed, failed
+        progress: Completion fraction in [0, 1]
+        stage: Description of the current step
+        result: Analysis result (when completed)
+        error: Error detail (when failed)
+        status_code: HTTP status describing the failure
+        created_at: Submission time
+        started_at: Time the worker picked the job up
+        finished_at: Completion time
+    """
+
+    job_id: str
+    kind: str
+    symbol: str
+    timeframe: str
+    params: dict[str, Any] = field(default_factory=dict)
+    status: str = JOB_PENDING
+    progress: float = 0.0
+    stage: str = ""
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished (successfully or not)."""
+        return self.status in (JOB_COMPLETED, JOB_FAILED)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "params": self.params,
+            "status": self.status,
+            "progress": self.progress,
+            "stage": self.stage,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class AnalysisJobManager:
+    """Runs analysis jobs in a bounded worker pool with dedup and caching.
+
+    Usage:
+        manager = AnalysisJobManager(max_workers=2)
+        job = manager.submit("hmm", run_hmm_analysis, "AAPL", "1Min")
+        job = await manager.wait(job.job_id)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        result_ttl: float = 600.0,
+        max_history: int = 256,
+        executor_factory: Optional[Callable[..., Executor]] = None,
+        on_complete: Optional[Callable[[AnalysisJob], None]] = None,
+    ):
+        """Initialize manager.
+
+        Args:
+            max_workers: Maximum concurrent analyses
+            result_ttl: Seconds a completed result is reused for
+                identical requests
+            max_history: Finished jobs kept for status queries
+            executor_factory: Pool constructor accepting ``max_workers``,
+                ``initializer`` and ``initargs`` (defaults to a spawn
+                ``ProcessPoolExecutor``)
+            on_complete: Called with each successfully finished job before
+                it is marked completed (e.g. to drop stale caches)
+        """
+        self.max_workers = max_workers
+        self.max_history = max_history
+        self._executor_factory = executor_factory or partial(
+            ProcessPoolExecutor, mp_context=mp.get_context("spawn"),
+        )
+        self._on_complete = on_complete
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[str, AnalysisJob] = OrderedDict()
+        self._futures: dict[str, Future] = {}
+        self._active: dict[tuple, str] = {}
+        self._results: TTLCache = TTLCache(maxsize=max_history, ttl=result_ttl)
+        self._executor: Optional[Executor] = None
+        self._queue = None
+        self._drain_thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _key(kind: str, symbol: str, timeframe: str, params: dict) -> tuple:
+        return (kind, symbol, timeframe, tuple(sorted(params.items())))
+
+    def _ensure_executor(self) -> Executor:
+        """Start the pool and progress drain thread; caller holds the lock."""
+        if self._executor is None:
+            self._queue = mp.get_context("spawn").Queue()
+            self._executor = self._executor_factory(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self._queue,),
+            )
+            self._drain_thread = threading.Thread(
+                target=self._drain_progress, name="analysis-progress", daemon=True,
+            )
+            self._drain_thread.start()
+        return self._executor
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable[..., dict],
+        symbol: str,
+        timeframe: str,
+        params: Optional[dict] = None,
+        force: bool = False,
+    ) -> AnalysisJob:
+        """Submit an analysis, reusing a running or recently completed job.
+
+        Args:
+            kind: Analysis kind used for deduplication
+            fn: Module-level job function ``fn(symbol, timeframe, params)``
+            symbol: Ticker symbol
+            timeframe: Bar timeframe
+            params: Extra parameters passed to ``fn``
+            force: Ignore cached results (a running job is still shared)
+
+        Returns:
+            The new or existing AnalysisJob
+        """
+        symbol = symbol.upper()
+        params = dict(params or {})
+        key = self._key(kind, symbol, timeframe, params)
+
+        with self._lock:
+            active_id = self._active.get(key)
+            if active_id is not None:
+                logger.info("Reusing running analysis job %s for %s/%s", active_id, symbol, timeframe)
+                return self._jobs[active_id]
+
+            cached_id = None if force else self._results.get(key)
+            if cached_id is not None and cached_id in self._jobs:
+                logger.info("Reusing completed analysis job %s for %s/%s", cached_id, symbol, timeframe)
+                return self._jobs[cached_id]
+
+            job = AnalysisJob(
+                job_id=uuid.uuid4().hex,
+                kind=kind,
+                symbol=symbol,
+                timeframe=timeframe,
+                params=params,
+                stage="queued",
+            )
+            future = self._ensure_executor().submit(_run_job, job.job_id, fn, symbol, timeframe, params)
+            self._jobs[job.job_id] = job
+            self._futures[job.job_id] = future
+            self._active[key] = job.job_id
+            self._trim_history()
+
+        logger.info("Submitted analysis job %s: %s %s/%s", job.job_id, kind, symbol, timeframe)
+        future.add_done_callback(partial(self._on_done, job.job_id, key))
+        return job
+
+    def _on_done(self, job_id: str, key: tuple, future: Future) -> None:
+        """Record a finished job's outcome."""
+        try:
+            outcome = future.result()
+        except Exception as e:
+            logger.exception("Analysis job %s crashed: %s", job_id, e)
+            outcome = {"ok": False, "status_code": 500, "error": "Internal server error"}
+
+        # Run the hook before the job is visible as completed, so callers
+        # woken by wait() never see state the hook is meant to refresh
+        job = self.get(job_id)
+        if outcome["ok"] and job is not None and self._on_complete is not None:
+            try:
+                self._on_complete(job)
+            except Exception as e:
+                logger.exception("Completion hook failed for analysis job %s: %s", job_id, e)
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            self._active.pop(key, None)
+            self._futures.pop(job_id, None)
+            if job is None:
+                return
+            job.finished_at = datetime.now(timezone.utc)
+            job.started_at = job.started_at or job.finished_at
+            if outcome["ok"]:
+                job.status = JOB_COMPLETED
+                job.progress = 1.0
+                job.stage = "done"
+                job.result = outcome["result"]
+                self._results[key] = job_id
+            else:
+                job.status = JOB_FAILED
+                job.stage = "failed"
+                job.error = outcome["error"]
+                job.status_code = outcome["status_code"]
+
+        logger.info("Analysis job %s %s", job_id, job.status)
+
+    def _drain_progress(self) -> None:
+        """Apply progress updates sent by workers until shutdown."""
+        queue = self._queue
+        while True:
+            item = queue.get()
+            if item is None:
+                return
+            job_id, progress, stage = item
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job.done:
+                    continue
+                if job.status == JOB_PENDING:
+                    job.status = JOB_RUNNING
+                    job.started_at = datetime.now(timezone.utc)
+                job.progress = max(job.progress, progress)
+                job.stage = stage
+
+    def _trim_history(self) -> None:
+        """Drop the oldest finished jobs beyond ``max_history``."""
+        excess = len(self._jobs) - self.max_history
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].done:
+                del self._jobs[job_id]
+                excess -= 1
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        """Return a job by ID, or None if unknown or expired from history."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, symbol: Optional[str] = None) -> list[AnalysisJob]:
+        """Return known jobs, newest first, optionally for one symbol."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if symbol:
+            jobs = [j for j in jobs if j.symbol == symbol.upper()]
+        return jobs[::-1]
+
+    async def wait(self, job_id: str) -> AnalysisJob:
+        """Wait for a job without blocking the event loop.
+
+        Args:
+            job_id: Job to wait for
+
+        Returns:
+            The finished AnalysisJob
+        """
+        with self._lock:
+            job = self._jobs[job_id]
+            future = self._futures.get(job_id)
+        if future is not None:
+            await asyncio.wrap_future(future)
+            # The done callback may still be finishing on the pool thread
+            while not job.done:
+                await asyncio.sleep(0.01)
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool and progress thread."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            queue, self._queue = self._queue, None
+            thread, self._drain_thread = self._drain_thread, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+        if queue is not None:
+            queue.put(None)
+            if thread is not None:
+                thread.join(timeout=5)
+
+
+_default_manager: Optional[AnalysisJobManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def _invalidate_symbol_cache(job: AnalysisJob) -> None:
+    """Drop cached API responses for a job's symbol; new models/states make them stale."""
+    from src.api._data_helpers import invalidate_cache_for_symbol
+
+    invalidate_cache_for_symbol(job.symbol)
+
+
+def get_analysis_job_manager() -> AnalysisJobManager:
+    """Get the process-wide AnalysisJobManager.
+
+    Completed jobs invalidate the API response cache for their symbol,
+    whether or not a request is waiting on them.
+    """
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = AnalysisJobManager(on_complete=_invalidate_symbol_cache)
+        return _default_manager
+
+
+def shutdown_analysis_job_manager() -> None:
+    """Shut down the process-wide AnalysisJobManager, if started."""
+    global _default_manager
+    with _default_manager_lock:
+        manager, _default_manager = _default_manager, None
+    if manager is not None:
+        manager.shutdown()
@@ -141,24 +141,21 @@ async def get_regimes(
         else:
             bar_id_map = {}
 
-        timestamps = []
-        state_ids = []
-        state_records = []
-
-        engine.reset()
-        for ts, row in features_df.iterrows():
-            features = {name: row.get(name, np.nan) for name in model_features}
-            output = engine.process(features, symbol.upper(), ts)
-            timestamps.append(ts.strftime("%Y-%m-%dT%H:%M:%SZ"))
-            state_ids.append(output.state_id)
+        states = engine.infer_batch(features_df)
+        timestamps = list(features_df.index.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        state_ids = states.state_id.tolist()
 
+        state_records = []
+        for ts, state_id, state_prob, log_lik in zip(
+            features_df.index, state_ids, states.state_prob.tolist(), states.log_likelihood.tolist(),
+        ):
             bar_id = bar_id_map.get(ts)
             if bar_id:
                 state_records.append({
                     "bar_id": bar_id,
-                    "state_id": output.state_id,
-                    "state_prob": float(output.state_prob),
-                    "log_likelihood": float(output.log_likelihood) if not np.isinf(output.log_likelihood) else None,
+                    "state_id": state_id,
+                    "state_prob": state_prob,
+                    "log_likelihood": log_lik if not np.isinf(log_lik) else None,
                 })
 
         if state_records:
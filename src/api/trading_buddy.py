@@ -7,6 +7,7 @@ Provides API endpoints for:
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -151,6 +152,26 @@ def _create_domain_intent(
     )
 
 
+@lru_cache(maxsize=None)
+def _get_context_builder(
+    ensure_fresh_data: bool = False,
+    include_features: bool = True,
+    include_regimes: bool = True,
+    include_key_levels: bool = True,
+) -> ContextPackBuilder:
+    """Return the process-wide ContextPackBuilder for the given options.
+
+    Builders are shared across requests so their bars/features/regimes
+    caches survive past a single request.
+    """
+    return ContextPackBuilder(
+        ensure_fresh_data=ensure_fresh_data,
+        include_features=include_features,
+        include_regimes=include_regimes,
+        include_key_levels=include_key_levels,
+    )
+
+
 def _intent_to_response(intent: DomainTradeIntent) -> TradeIntentResponse:
     """Convert domain intent to API response."""
     return TradeIntentResponse(
@@ -255,7 +276,7 @@ async def evaluate_trade_intent(
         )
 
         # Build context
-        context_builder = ContextPackBuilder(ensure_fresh_data=True)
+        context_builder = _get_context_builder(ensure_fresh_data=True)
         context = context_builder.build(
             symbol=intent.symbol,
             timeframe=intent.timeframe,
@@ -337,7 +358,7 @@ async def get_regime_snapshot(
     """Get current regime snapshot for a symbol/timeframe."""
     logger.debug("get_regime_snapshot: symbol=%s, timeframe=%s", symbol, timeframe)
     try:
-        context_builder = ContextPackBuilder(
+        context_builder = _get_context_builder(
             include_features=False,
             include_key_levels=False,
         )
@@ -375,9 +396,7 @@ async def get_key_levels(
     """Get current key price levels for a symbol."""
     logger.debug("get_key_levels: symbol=%s, timeframe=%s", symbol, timeframe)
     try:
-        context_builder = ContextPackBuilder(
-            include_regimes=False,
-        )
+        context_builder = _get_context_builder(include_regimes=False)
         context = context_builder.build(
             symbol=symbol,
             timeframe=timeframe,
@@ -2,14 +2,18 @@
 
 This module provides:
 - Event-driven backtesting engine
+- Array-backed execution mode for long, multi-symbol histories
 - Realistic execution simulation (slippage, commission)
 - Performance metrics calculation
 - Walk-forward validation
+- Feature cache shared across overlapping walk-forward windows
 - Performance reporting
 """
 
 from src.backtest.engine import BacktestEngine, BacktestConfig, BacktestResult
+from src.backtest.array_engine import ArrayBacktestEngine, ArrayStrategy, AlignedBars
 from src.backtest.metrics import PerformanceMetrics, calculate_metrics
+from src.backtest.feature_cache import FeatureLeakageError, WindowFeatureCache
 from src.backtest.walk_forward import WalkForwardValidator, WalkForwardConfig, WalkForwardResult
 from src.backtest.report import PerformanceReport, ReportConfig
 
@@ -18,6 +22,9 @@ __all__ = [
     "BacktestEngine",
     "BacktestConfig",
     "BacktestResult",
+    "ArrayBacktestEngine",
+    "ArrayStrategy",
+    "AlignedBars",
     # Metrics
     "PerformanceMetrics",
     "calculate_metrics",
@@ -25,6 +32,8 @@ __all__ = [
     "WalkForwardValidator",
     "WalkForwardConfig",
     "WalkForwardResult",
+    "WindowFeatureCache",
+    "FeatureLeakageError",
     # Reporting
     "PerformanceReport",
     "ReportConfig",
@@ -0,0 +1,506 @@
+"""Array-backed backtesting engine.
+
+Runs the same simulation as :class:`BacktestEngine` but pre-aligns every
+symbol onto a single NumPy timeline before the loop starts.  Per-bar work
+is reduced to integer lookups into preallocated price matrices instead of
+``df.loc[timestamp]`` row construction and ``feature_df.loc[:timestamp]``
+label slicing, so run time grows linearly with bar count.
+
+Fills, commission, slippage and equity accounting follow the event-driven
+engine step for step, so both engines produce identical results for the
+same data, strategy and configuration.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from functools import reduce
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+import pandas as pd
+
+from src.backtest.engine import (
+    BacktestEngine,
+    BacktestResult,
+    BaseStrategy,
+    Position,
+    Signal,
+    SignalDirection,
+    Trade,
+)
+from src.backtest.metrics import calculate_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class ArrayStrategy(Protocol):
+    """Optional strategy extension for the array engine.
+
+    Strategies implementing ``generate_signals_at`` receive the full
+    feature frame plus the integer row of the current bar, so no history
+    slice is materialised per bar.  Rows after ``position`` must not be
+    read (they are in the future).
+    """
+
+    def generate_signals_at(
+        self,
+        features: pd.DataFrame,
+        position: int,
+        timestamp: datetime,
+        state: np.ndarray | None = None,
+    ) -> list[Signal]:
+        """Generate trading signals for the bar at ``position``."""
+        ...
+
+
+@dataclass
+class AlignedBars:
+    """All symbols aligned onto one sorted timeline.
+
+    Attributes:
+        symbols: Symbol names in input order
+        timeline: Sorted union of all bar timestamps
+        open: (n_timestamps, n_symbols) open prices, NaN where absent
+        close: (n_timestamps, n_symbols) close prices, NaN where absent
+        present: (n_timestamps, n_symbols) True where the symbol has a bar
+        data_rows: (n_timestamps, n_symbols) row of each bar in its
+            source DataFrame, -1 where absent
+    """
+
+    symbols: list[str]
+    timeline: pd.Index
+    open: np.ndarray
+    close: np.ndarray
+    present: np.ndarray
+    data_rows: np.ndarray
+
+    @classmethod
+    def from_frames(cls, data: dict[str, pd.DataFrame]) -> "AlignedBars":
+        """Align OHLCV frames onto the union of their indexes.
+
+        Args:
+            data: Dictionary of OHLCV DataFrames by symbol. Each index is
+                expected to be sorted and unique.
+
+        Returns:
+            AlignedBars covering every timestamp in ``data``
+        """
+        symbols = list(data.keys())
+        indexes = [df.index for df in data.values()]
+        timeline = reduce(lambda a, b: a.union(b), indexes[1:], indexes[0])
+        if not (timeline.is_unique and timeline.is_monotonic_increasing):
+            timeline = timeline.unique().sort_values()
+
+        n_t, n_s = len(timeline), len(symbols)
+        open_ = np.full((n_t, n_s), np.nan)
+        close = np.full((n_t, n_s), np.nan)
+        data_rows = np.full((n_t, n_s), -1, dtype=np.int64)
+
+        for j, df in enumerate(data.values()):
+            slots = timeline.get_indexer(df.index)
+            data_rows[slots, j] = np.arange(len(df))
+            open_[slots, j] = df["open"].to_numpy(dtype=np.float64)
+            close[slots, j] = df["close"].to_numpy(dtype=np.float64)
+
+        return cls(
+            symbols=symbols,
+            timeline=timeline,
+            open=open_,
+            close=close,
+            present=data_rows >= 0,
+            data_rows=data_rows,
+        )
+
+    def rows_for(self, frame: pd.DataFrame) -> np.ndarray:
+        """Map every timeline slot to a row of ``frame`` (-1 if absent)."""
+        rows = np.full(len(self.timeline), -1, dtype=np.int64)
+        slots = self.timeline.get_indexer(frame.index)
+        found = slots >= 0
+        rows[slots[found]] = np.flatnonzero(found)
+        return rows
+
+
+class ArrayBacktestEngine(BacktestEngine):
+    """Array-backed execution mode for :class:`BacktestEngine`.
+
+    Positions are held in per-symbol NumPy arrays and prices are read from
+    the pre-aligned matrices in :class:`AlignedBars`.  Strategies receive
+    ``features.iloc[:row + 1]`` (a positional slice, no label search), or
+    the full frame plus the current row when they implement
+    :class:`ArrayStrategy`.
+
+    Example:
+        >>> engine = ArrayBacktestEngine(config)
+        >>> result = engine.run(data, strategy)
+    """
+
+    def _reset_arrays(self, n_symbols: int) -> None:
+        """Allocate per-symbol position arrays."""
+        self._qty = np.zeros(n_symbols)
+        self._avg_price = np.zeros(n_symbols)
+        self._unrealized = np.zeros(n_symbols)
+        self._entry_slot = np.full(n_symbols, -1, dtype=np.int64)
+        # Held symbols in insertion order, mirroring the event engine's dict
+        self._held: dict[int, None] = {}
+        self._orders: list[tuple[int, str, float]] = []
+
+    def run(
+        self,
+        data: dict[str, pd.DataFrame],
+        strategy: BaseStrategy,
+        features: dict[str, pd.DataFrame] | None = None,
+        states: dict[str, np.ndarray] | None = None,
+    ) -> BacktestResult:
+        """Run backtest on historical data.
+
+        Args:
+            data: Dictionary of OHLCV DataFrames by symbol
+            strategy: Strategy to backtest
+            features: Optional pre-computed features by symbol
+            states: Optional pre-computed state vectors by symbol
+
+        Returns:
+            BacktestResult with performance data
+        """
+        self._reset_state()
+        bars = AlignedBars.from_frames(data)
+        self._bars = bars
+        self._symbol_slot = {s: j for j, s in enumerate(bars.symbols)}
+        self._reset_arrays(len(bars.symbols))
+
+        timestamps = bars.timeline.tolist()
+        self._timestamps = timestamps
+        n_t = len(timestamps)
+
+        logger.info(
+            "Starting array backtest: %d symbols, %d timestamps",
+            len(bars.symbols), n_t,
+        )
+
+        # Per-symbol signal inputs: frame handed to the strategy and the row
+        # of the current bar within it (-1 means no signal at this slot).
+        frames: list[pd.DataFrame] = []
+        frame_rows: list[np.ndarray] = []
+        state_arrays: list[np.ndarray | None] = []
+        for j, symbol in enumerate(bars.symbols):
+            if features and symbol in features:
+                frames.append(features[symbol])
+                frame_rows.append(bars.rows_for(features[symbol]))
+            else:
+                frames.append(data[symbol])
+                frame_rows.append(bars.data_rows[:, j])
+            state_arrays.append(states[symbol] if states and symbol in states else None)
+
+        use_positions = isinstance(strategy, ArrayStrategy)
+        present_slots = [np.flatnonzero(row) for row in bars.present]
+        equity_values = np.empty(n_t)
+        fill_next = self._config.fill_on_next_bar
+
+        for t in range(n_t):
+            timestamp = timestamps[t]
+            present = present_slots[t]
+
+            if fill_next and t > 0:
+                self._execute_orders(t)
+
+            self._mark_to_market(t)
+
+            equity = self._equity_at(t)
+            equity_values[t] = equity
+            self._positions_history.append({
+                "timestamp": timestamp,
+                "cash": self._cash,
+                "equity": equity,
+                "positions": {
+                    bars.symbols[j]: {"qty": float(self._qty[j]), "avg_price": float(self._avg_price[j])}
+                    for j in self._held
+                },
+            })
+
+            for j in present.tolist():
+                row = int(frame_rows[j][t])
+                if row < 0:
+                    continue
+
+                state = None
+                state_arr = state_arrays[j]
+                if state_arr is not None:
+                    data_row = int(bars.data_rows[t, j])
+                    if data_row < len(state_arr):
+                        state = state_arr[data_row]
+
+                symbol = bars.symbols[j]
+                try:
+                    if use_positions:
+                        signals = strategy.generate_signals_at(frames[j], row, timestamp, state=state)
+                    else:
+                        signals = strategy.generate_signals(
+                            frames[j].iloc[:row + 1],
+                            timestamp,
+                            state=state,
+                        )
+
+                    for signal in signals:
+                        if signal.symbol == "default":
+                            signal = Signal(
+                                timestamp=signal.timestamp,
+                                symbol=symbol,
+                                direction=signal.direction,
+                                strength=signal.strength,
+                                size=signal.size,
+                                metadata=signal.metadata,
+                            )
+
+                        self._signals.append(signal)
+                        self._queue_signal(signal, j, t)
+
+                except Exception:
+                    logger.exception(
+                        "Error generating signals for %s at %s",
+                        symbol, timestamp,
+                    )
+
+            if not fill_next:
+                self._execute_orders(t)
+
+        equity_curve = pd.Series(equity_values, index=bars.timeline, name="equity")
+        self._positions = self._materialize_positions()
+
+        metrics = calculate_metrics(
+            equity_curve,
+            [trade.to_dict() for trade in self._trades],
+            risk_free_rate=self._config.risk_free_rate,
+        )
+
+        logger.info(
+            "Array backtest complete: %d trades, total_return=%.4f, sharpe=%.2f",
+            metrics.total_trades, metrics.total_return, metrics.sharpe_ratio,
+        )
+
+        return BacktestResult(
+            equity_curve=equity_curve,
+            positions_history=self._positions_history,
+            trades=self._trades,
+            signals=self._signals,
+            metrics=metrics,
+            config=self._config,
+        )
+
+    def _mark_to_market(self, t: int) -> None:
+        """Update unrealized P&L of held positions that trade at slot ``t``."""
+        if not self._held:
+            return
+        held = np.fromiter(self._held, dtype=np.int64, count=len(self._held))
+        held = held[self._bars.present[t, held]]
+        qty = self._qty[held]
+        price = self._bars.close[t, held]
+        avg = self._avg_price[held]
+        self._unrealized[held] = np.where(
+            qty > 0,
+            qty * (price - avg),
+            np.abs(qty) * (avg - price),
+        )
+
+    def _position_value(self, j: int, price: float) -> float:
+        """Equity contribution of symbol ``j`` at ``price``."""
+        qty = self._qty[j]
+        if qty > 0:
+            return qty * price
+        # Short position: we owe the shares
+        return qty * price + 2 * qty * self._avg_price[j]
+
+    def _equity_at(self, t: int) -> float:
+        """Portfolio equity using closes at slot ``t``.
+
+        Held positions are summed in insertion order so the floating point
+        result matches the event-driven engine exactly.
+        """
+        equity = self._cash
+        present = self._bars.present[t]
+        close = self._bars.close[t]
+        for j in self._held:
+            if present[j]:
+                equity += self._position_value(j, close[j])
+        return float(equity)
+
+    def _queue_signal(self, signal: Signal, bar_slot: int, t: int) -> None:
+        """Translate a signal into pending orders.
+
+        Args:
+            signal: Trading signal
+            bar_slot: Symbol slot of the bar that produced the signal
+            t: Current timeline slot
+        """
+        j = self._symbol_slot.get(signal.symbol, -1)
+        held = j >= 0 and j in self._held
+
+        if signal.direction == SignalDirection.FLAT:
+            if held:
+                self._orders.append((j, "close", 0.0))
+            return
+
+        if signal.direction == SignalDirection.LONG:
+            if held and self._qty[j] < 0:
+                self._orders.append((j, "close", 0.0))
+            action = "buy"
+        elif signal.direction == SignalDirection.SHORT:
+            if held and self._qty[j] > 0:
+                self._orders.append((j, "close", 0.0))
+            action = "sell"
+        else:
+            return
+
+        size = signal.size if signal.size > 0 else self._signal_size(signal, j, bar_slot, t)
+        if size > 0:
+            self._orders.append((j, action, size))
+
+    def _signal_size(self, signal: Signal, j: int, bar_slot: int, t: int) -> float:
+        """Dollar size for a signal without explicit size.
+
+        Equity is measured the same way as the event engine: cash plus the
+        signal symbol's position valued at the producing bar's close.
+        """
+        equity = self._cash
+        if j >= 0 and j in self._held:
+            equity += self._position_value(j, self._bars.close[t, bar_slot])
+        max_size = equity * self._config.max_position_pct
+        return max_size * signal.strength
+
+    def _execute_orders(self, t: int) -> None:
+        """Fill pending orders at slot ``t`` opens."""
+        orders = self._orders
+        self._orders = []
+        if not orders:
+            return
+        timestamp = self._timestamps[t]
+        logger.debug("Executing %d pending orders at %s", len(orders), timestamp)
+
+        present = self._bars.present[t]
+        opens = self._bars.open[t]
+        slippage_mult = 1 + (self._config.slippage_bps / 10000)
+
+        for j, action, size in orders:
+            if j < 0 or not present[j]:
+                continue
+
+            fill_price = float(opens[j])
+            if action == "buy":
+                fill_price *= slippage_mult
+                self._open(j, size, fill_price, t, SignalDirection.LONG)
+            elif action == "sell":
+                fill_price /= slippage_mult
+                self._open(j, size, fill_price, t, SignalDirection.SHORT)
+            else:
+                self._close(j, fill_price, t)
+
+    def _open(
+        self,
+        j: int,
+        size_dollars: float,
+        fill_price: float,
+        t: int,
+        direction: SignalDirection,
+    ) -> None:
+        """Open or add to the position in symbol slot ``j``."""
+        config = self._config
+        shares = size_dollars / fill_price
+        if not config.allow_fractional_shares:
+            shares = int(shares)
+
+        if shares == 0:
+            return
+
+        commission = abs(shares) * config.commission_per_share
+
+        required_cash = size_dollars + commission
+        if required_cash > self._cash:
+            available_for_position = self._cash - commission
+            if available_for_position <= 0:
+                return
+            shares = available_for_position / fill_price
+            if not config.allow_fractional_shares:
+                shares = int(shares)
+            if shares == 0:
+                return
+            size_dollars = shares * fill_price
+            commission = abs(shares) * config.commission_per_share
+
+        if direction == SignalDirection.SHORT:
+            shares = -shares
+
+        self._cash -= size_dollars + commission
+
+        if j in self._held:
+            qty = self._qty[j]
+            total_shares = qty + shares
+            if total_shares != 0:
+                self._avg_price[j] = (
+                    self._avg_price[j] * abs(qty) + fill_price * abs(shares)
+                ) / abs(total_shares)
+                self._qty[j] = total_shares
+            else:
+                self._drop(j)
+        else:
+            self._held[j] = None
+            self._qty[j] = shares
+            self._avg_price[j] = fill_price
+            self._unrealized[j] = 0.0
+            self._entry_slot[j] = t
+
+    def _close(self, j: int, fill_price: float, t: int) -> None:
+        """Close the position in symbol slot ``j`` and record the trade."""
+        if j not in self._held:
+            return
+
+        qty = float(self._qty[j])
+        avg_price = float(self._avg_price[j])
+        if qty > 0:
+            pnl = qty * (fill_price - avg_price)
+        else:
+            pnl = abs(qty) * (avg_price - fill_price)
+
+        shares = abs(qty)
+        commission = shares * self._config.commission_per_share
+        slippage_cost = shares * fill_price * (self._config.slippage_bps / 10000)
+        net_pnl = pnl - commission - slippage_cost
+
+        self._cash += shares * fill_price + pnl - commission
+
+        self._trades.append(Trade(
+            symbol=self._bars.symbols[j],
+            direction=SignalDirection.LONG if qty > 0 else SignalDirection.SHORT,
+            quantity=shares,
+            entry_price=avg_price,
+            exit_price=fill_price,
+            entry_time=self._timestamps[self._entry_slot[j]],
+            exit_time=self._timestamps[t],
+            pnl=net_pnl,
+            commission=commission,
+            slippage=slippage_cost,
+        ))
+
+        self._drop(j)
+
+    def _drop(self, j: int) -> None:
+        """Remove symbol slot ``j`` from the book."""
+        del self._held[j]
+        self._qty[j] = 0.0
+        self._avg_price[j] = 0.0
+        self._unrealized[j] = 0.0
+        self._entry_slot[j] = -1
+
+    def _materialize_positions(self) -> dict[str, Position]:
+        """Build Position objects for positions still open after the run."""
+        positions: dict[str, Position] = {}
+        for j in self._held:
+            symbol = self._bars.symbols[j]
+            positions[symbol] = Position(
+                symbol=symbol,
+                quantity=float(self._qty[j]),
+                avg_price=float(self._avg_price[j]),
+                entry_time=self._timestamps[self._entry_slot[j]],
+                unrealized_pnl=float(self._unrealized[j]),
+            )
+        return positions
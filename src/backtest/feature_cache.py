@@ -0,0 +1,145 @@
+"""Feature cache shared by overlapping walk-forward windows.
+
+Rolling walk-forward windows overlap heavily, so featurizing each train
+and test slice separately recomputes the same bars many times.  The cache
+computes features once over the full history of each symbol and hands
+every window a slice of that result.  Rows at the start of a window see
+the bars that precede it, so each window's lookback is satisfied by real
+history rather than dropped as leading NaNs.
+
+Because cached rows are computed with the whole history in view, a
+non-causal feature (centered windows, negative shifts) would silently
+leak future bars into a window.  :meth:`WindowFeatureCache.verify_boundary`
+guards against this: it featurizes the bars just before a window end
+twice, with and without the bars that follow, and requires identical
+output for every row before the boundary.
+"""
+
+import logging
+from datetime import datetime
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureLeakageError(ValueError):
+    """Raised when features before a boundary change with later bars."""
+
+
+def localize_bound(index: pd.Index, ts: datetime) -> datetime | pd.Timestamp:
+    """Express a naive window bound in the timezone of ``index``."""
+    if getattr(index, "tz", None) is not None:
+        return pd.Timestamp(ts).tz_localize(index.tz)
+    return ts
+
+
+def slice_window(frame: pd.DataFrame, start: datetime, end: datetime) -> pd.DataFrame:
+    """Return rows of a time-sorted frame with timestamps in ``[start, end)``."""
+    index = frame.index
+    lo = index.searchsorted(localize_bound(index, start), side="left")
+    hi = index.searchsorted(localize_bound(index, end), side="left")
+    return frame.iloc[lo:hi]
+
+
+class WindowFeatureCache:
+    """Compute features once per symbol and slice them per window.
+
+    Example:
+        >>> cache = WindowFeatureCache(pipeline.compute, lookback_bars=pipeline.max_lookback)
+        >>> cache.build(data)
+        >>> cache.verify_boundary(data["AAPL"], "AAPL", window.test_end)
+        >>> test_features = cache.slice("AAPL", window.test_start, window.test_end)
+    """
+
+    def __init__(
+        self,
+        feature_pipeline: Callable[[pd.DataFrame], pd.DataFrame],
+        lookback_bars: int = 0,
+        probe_bars: int = 50,
+        rtol: float = 1e-9,
+    ):
+        """Initialize the cache.
+
+        Args:
+            feature_pipeline: Function computing features from OHLCV
+            lookback_bars: Warmup bars the pipeline needs for valid output
+            probe_bars: Rows checked on each side of a boundary by the
+                leakage guard; lookahead up to this many bars is detected
+            rtol: Relative tolerance when comparing probe outputs
+        """
+        self._pipeline = feature_pipeline
+        self._lookback_bars = lookback_bars
+        self._probe_bars = probe_bars
+        self._rtol = rtol
+        self._features: dict[str, pd.DataFrame] = {}
+
+    @property
+    def features(self) -> dict[str, pd.DataFrame]:
+        """Full-history features by symbol."""
+        return self._features
+
+    def build(self, data: dict[str, pd.DataFrame]) -> None:
+        """Featurize the full history of every symbol.
+
+        Args:
+            data: Dictionary of OHLCV DataFrames by symbol
+        """
+        for symbol, df in data.items():
+            self._features[symbol] = self._pipeline(df)
+            logger.debug(
+                "Cached %d feature rows for %s", len(self._features[symbol]), symbol,
+            )
+
+    def slice(self, symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        """Return cached features with timestamps in ``[start, end)``.
+
+        Args:
+            symbol: Symbol to slice
+            start: Inclusive window start
+            end: Exclusive window end
+
+        Returns:
+            Feature rows for the window
+        """
+        return slice_window(self._features[symbol], start, end)
+
+    def verify_boundary(self, df: pd.DataFrame, symbol: str, end: datetime) -> None:
+        """Check that features before ``end`` do not depend on later bars.
+
+        Args:
+            df: OHLCV data for ``symbol``
+            symbol: Symbol being checked (for error messages)
+            end: Exclusive window end
+
+        Raises:
+            FeatureLeakageError: If any feature before ``end`` changes when
+                bars at or after ``end`` are added
+        """
+        index = df.index
+        end_pos = int(index.searchsorted(localize_bound(index, end), side="left"))
+        if end_pos == 0 or end_pos >= len(df):
+            return
+
+        start_pos = max(0, end_pos - self._lookback_bars - self._probe_bars)
+        stop_pos = min(len(df), end_pos + self._probe_bars)
+
+        truncated = self._pipeline(df.iloc[start_pos:end_pos])
+        extended = self._pipeline(df.iloc[start_pos:stop_pos])
+        extended = extended.loc[extended.index < index[end_pos]]
+
+        if not truncated.index.equals(extended.index) or list(truncated.columns) != list(extended.columns):
+            raise FeatureLeakageError(
+                f"{symbol}: feature rows before {end} change when later bars are added"
+            )
+
+        a = truncated.to_numpy(dtype=np.float64)
+        b = extended.to_numpy(dtype=np.float64)
+        mismatch = ~np.isclose(a, b, rtol=self._rtol, atol=0.0, equal_nan=True)
+        if mismatch.any():
+            columns = sorted({truncated.columns[j] for j in np.nonzero(mismatch)[1]})
+            raise FeatureLeakageError(
+                f"{symbol}: features {columns} before {end} depend on bars after it"
+            )
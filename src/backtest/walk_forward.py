@@ -5,6 +5,8 @@ See: docs/archive/STATE_VECTOR_HMM_IMPLEMENTATION_PLAN.md
 """
 
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Callable
@@ -13,7 +15,9 @@ import numpy as np
 import pandas as pd
 
 from src.backtest.engine import BacktestEngine, BacktestConfig, BacktestResult, BaseStrategy
+from src.backtest.feature_cache import WindowFeatureCache, slice_window
 from src.backtest.metrics import PerformanceMetrics, calculate_metrics
+from src.utils.shared_memory import SharedFrameHandle, SharedMemoryStore, release_blocks
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +33,17 @@ class WalkForwardConfig:
         min_train_samples: Minimum samples required for training
         retrain_state_model: Whether to retrain state model each window
         retrain_strategy: Whether to retrain strategy each window
+        executor: How windows are processed: "serial" or "process".
+            The process executor requires picklable (module-level)
+            strategy factory, state trainer and feature pipeline.
+        max_workers: Worker processes for the process executor
+            (None uses os.cpu_count())
+        reuse_features: Compute features once over the full history and
+            slice them per window instead of featurizing every window
+        feature_lookback_bars: Warmup bars the feature pipeline needs
+            (None reads ``max_lookback`` from the pipeline if available)
+        verify_feature_leakage: With reuse_features, check at every window
+            end that cached features do not depend on later bars
     """
 
     train_period_days: int = 180  # 6 months
@@ -37,6 +52,15 @@ class WalkForwardConfig:
     min_train_samples: int = 1000
     retrain_state_model: bool = True
     retrain_strategy: bool = True
+    executor: str = "serial"
+    max_workers: int | None = None
+    reuse_features: bool = False
+    feature_lookback_bars: int | None = None
+    verify_feature_leakage: bool = True
+
+    def __post_init__(self):
+        if self.executor not in ("serial", "process"):
+            raise ValueError(f"executor must be 'serial' or 'process', got {self.executor!r}")
 
 
 @dataclass
@@ -164,67 +188,35 @@ class WalkForwardValidator:
 
         logger.info("Walk-forward validation: %d windows generated", len(windows))
 
-        # Process each window
-        all_test_equities = []
-        all_test_trades = []
+        feature_cache = None
+        if feature_pipeline and self._config.reuse_features:
+            feature_cache = self._build_feature_cache(data, windows, feature_pipeline)
 
-        for window in windows:
-            logger.debug(
-                "Processing window %d: train=%s to %s, test=%s to %s",
-                window.window_id, window.train_start, window.train_end,
-                window.test_start, window.test_end,
+        # Process each window
+        if self._config.executor == "process" and len(windows) > 1 and self._config.max_workers != 1:
+            results = self._run_windows_parallel(
+                data, windows, strategy_factory, state_trainer, feature_pipeline, feature_cache,
             )
-            # Slice data for this window
-            train_data, test_data = self._slice_data(data, window)
-
-            # Compute features if pipeline provided
-            train_features = None
-            test_features = None
-            if feature_pipeline:
-                train_features = {
-                    s: feature_pipeline(df) for s, df in train_data.items()
-                }
-                test_features = {
-                    s: feature_pipeline(df) for s, df in test_data.items()
-                }
+        else:
+            results = []
+            for window in windows:
+                train_data, test_data = self._slice_data(data, window)
+                window_features = None
+                if feature_cache is not None:
+                    window_features = _window_features(
+                        feature_cache.features, window, train_data, test_data,
+                    )
+                results.append(self._run_window(
+                    window, train_data, test_data,
+                    strategy_factory, state_trainer, feature_pipeline, window_features,
+                ))
 
-            # Train state model if provided
-            train_states = None
-            test_states = None
-            if state_trainer and self._config.retrain_state_model:
-                for symbol, df in train_data.items():
-                    features_df = train_features[symbol] if train_features else df
-                    states, model = state_trainer(features_df)
-                    train_states = {symbol: states}
-
-                    # Apply to test data
-                    if test_features:
-                        test_df = test_features[symbol]
-                    else:
-                        test_df = test_data[symbol]
-                    # Note: In real implementation, transform test data with trained model
-                    test_states = {symbol: np.zeros((len(test_df), states.shape[1]))}
-
-            # Create strategy
-            strategy = strategy_factory()
-
-            # Run training backtest
-            engine = BacktestEngine(self._backtest_config)
-            window.train_result = engine.run(
-                train_data,
-                strategy,
-                features=train_features,
-                states=train_states,
-            )
+        all_test_equities = []
+        all_test_trades = []
 
-            # Run test backtest
-            test_engine = BacktestEngine(self._backtest_config)
-            window.test_result = test_engine.run(
-                test_data,
-                strategy,
-                features=test_features,
-                states=test_states,
-            )
+        for window, (train_result, test_result) in zip(windows, results):
+            window.train_result = train_result
+            window.test_result = test_result
 
             # Collect test results
             if window.test_result:
@@ -270,6 +262,187 @@ class WalkForwardValidator:
             config=self._config,
         )
 
+    def _run_window(
+        self,
+        window: WalkForwardWindow,
+        train_data: dict[str, pd.DataFrame],
+        test_data: dict[str, pd.DataFrame],
+        strategy_factory: Callable[[], BaseStrategy],
+        state_trainer: Callable[[pd.DataFrame], tuple[np.ndarray, Any]] | None,
+        feature_pipeline: Callable[[pd.DataFrame], pd.DataFrame] | None,
+        window_features: tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]] | None = None,
+    ) -> tuple[BacktestResult, BacktestResult]:
+        """Featurize, train and backtest a single window.
+
+        Args:
+            window: Window specification
+            train_data: OHLCV data sliced to the training period
+            test_data: OHLCV data sliced to the test period
+            strategy_factory: Factory function to create new strategy instances
+            state_trainer: Optional function to train state model on data
+            feature_pipeline: Optional function to compute features from OHLCV
+            window_features: Precomputed (train, test) features from the
+                feature cache; skips calling ``feature_pipeline``
+
+        Returns:
+            Tuple of (train_result, test_result)
+        """
+        logger.debug(
+            "Processing window %d: train=%s to %s, test=%s to %s",
+            window.window_id, window.train_start, window.train_end,
+            window.test_start, window.test_end,
+        )
+
+        # Compute features if pipeline provided
+        train_features = None
+        test_features = None
+        if window_features is not None:
+            train_features, test_features = window_features
+        elif feature_pipeline:
+            train_features = {
+                s: feature_pipeline(df) for s, df in train_data.items()
+            }
+            test_features = {
+                s: feature_pipeline(df) for s, df in test_data.items()
+            }
+
+        # Train state model if provided
+        train_states = None
+        test_states = None
+        if state_trainer and self._config.retrain_state_model:
+            for symbol, df in train_data.items():
+                features_df = train_features[symbol] if train_features else df
+                states, model = state_trainer(features_df)
+                train_states = {symbol: states}
+
+                # Apply to test data
+                if test_features:
+                    test_df = test_features[symbol]
+                else:
+                    test_df = test_data[symbol]
+                # Note: In real implementation, transform test data with trained model
+                test_states = {symbol: np.zeros((len(test_df), states.shape[1]))}
+
+        # Create strategy
+        strategy = strategy_factory()
+
+        # Run training backtest
+        engine = BacktestEngine(self._backtest_config)
+        train_result = engine.run(
+            train_data,
+            strategy,
+            features=train_features,
+            states=train_states,
+        )
+
+        # Run test backtest
+        test_engine = BacktestEngine(self._backtest_config)
+        test_result = test_engine.run(
+            test_data,
+            strategy,
+            features=test_features,
+            states=test_states,
+        )
+
+        return train_result, test_result
+
+    def _run_windows_parallel(
+        self,
+        data: dict[str, pd.DataFrame],
+        windows: list[WalkForwardWindow],
+        strategy_factory: Callable[[], BaseStrategy],
+        state_trainer: Callable[[pd.DataFrame], tuple[np.ndarray, Any]] | None,
+        feature_pipeline: Callable[[pd.DataFrame], pd.DataFrame] | None,
+        feature_cache: WindowFeatureCache | None = None,
+    ) -> list[tuple[BacktestResult, BacktestResult]]:
+        """Fan windows out to a process pool.
+
+        The full history is copied into shared memory once; each worker
+        attaches to it and slices its own window, so DataFrames are never
+        pickled per task.  Results are returned in window order.
+
+        Args:
+            data: Full historical data
+            windows: Windows to process
+            strategy_factory: Factory function to create new strategy instances
+            state_trainer: Optional function to train state model on data
+            feature_pipeline: Optional function to compute features from OHLCV
+            feature_cache: Optional full-history feature cache, shared with
+                workers the same way as the OHLCV data
+
+        Returns:
+            (train_result, test_result) per window, in window order
+        """
+        with SharedMemoryStore() as store:
+            handles = {symbol: store.share_frame(df) for symbol, df in data.items()}
+            feature_handles = None
+            if feature_cache is not None:
+                feature_handles = {
+                    symbol: store.share_frame(df) for symbol, df in feature_cache.features.items()
+                }
+            logger.info(
+                "Running %d windows on %s workers (%.1f MB shared)",
+                len(windows), self._config.max_workers or "all", store.nbytes / 1e6,
+            )
+
+            # spawn avoids forking a parent that may hold gRPC/DB threads
+            with ProcessPoolExecutor(
+                max_workers=self._config.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _run_window_worker,
+                        self._config,
+                        self._backtest_config,
+                        window,
+                        handles,
+                        strategy_factory,
+                        state_trainer,
+                        feature_pipeline,
+                        feature_handles,
+                    )
+                    for window in windows
+                ]
+                return [future.result() for future in futures]
+
+    def _build_feature_cache(
+        self,
+        data: dict[str, pd.DataFrame],
+        windows: list[WalkForwardWindow],
+        feature_pipeline: Callable[[pd.DataFrame], pd.DataFrame],
+    ) -> WindowFeatureCache:
+        """Featurize the full history once and guard every window end.
+
+        Args:
+            data: Full historical data
+            windows: Windows that will slice the cache
+            feature_pipeline: Function to compute features from OHLCV
+
+        Returns:
+            Populated feature cache
+
+        Raises:
+            FeatureLeakageError: If a window's features depend on bars
+                after its end
+        """
+        lookback = self._config.feature_lookback_bars
+        if lookback is None:
+            owner = getattr(feature_pipeline, "__self__", feature_pipeline)
+            lookback = int(getattr(owner, "max_lookback", 0))
+
+        cache = WindowFeatureCache(feature_pipeline, lookback_bars=lookback)
+        cache.build(data)
+
+        if self._config.verify_feature_leakage:
+            boundaries = sorted({w.train_end for w in windows} | {w.test_end for w in windows})
+            for symbol, df in data.items():
+                for boundary in boundaries:
+                    cache.verify_boundary(df, symbol, boundary)
+            logger.debug("Leakage guard passed at %d window boundaries", len(boundaries))
+
+        return cache
+
     def _generate_windows(
         self,
         data: dict[str, pd.DataFrame],
@@ -453,3 +626,64 @@ class WalkForwardValidator:
             "win_rate_mean": float(np.mean(win_rates)),
             "consistency": sum(1 for s in sharpes if s > 0) / len(sharpes),
         }
+
+
+def _run_window_worker(
+    config: WalkForwardConfig,
+    backtest_config: BacktestConfig,
+    window: WalkForwardWindow,
+    handles: dict[str, SharedFrameHandle],
+    strategy_factory: Callable[[], BaseStrategy],
+    state_trainer: Callable[[pd.DataFrame], tuple[np.ndarray, Any]] | None,
+    feature_pipeline: Callable[[pd.DataFrame], pd.DataFrame] | None,
+    feature_handles: dict[str, SharedFrameHandle] | None = None,
+) -> tuple[BacktestResult, BacktestResult]:
+    """Process-pool entry point for a single walk-forward window."""
+    validator = WalkForwardValidator(config, backtest_config)
+    attached = {symbol: handle.attach() for symbol, handle in handles.items()}
+    attached_features = {
+        symbol: handle.attach() for symbol, handle in (feature_handles or {}).items()
+    }
+    try:
+        data = {symbol: frame for symbol, (_, frame) in attached.items()}
+        # _slice_data copies, so the window no longer references shared memory
+        train_data, test_data = validator._slice_data(data, window)
+        window_features = None
+        if feature_handles is not None:
+            features = {symbol: frame for symbol, (_, frame) in attached_features.items()}
+            train_features, test_features = _window_features(features, window, train_data, test_data)
+            window_features = (
+                {s: df.copy() for s, df in train_features.items()},
+                {s: df.copy() for s, df in test_features.items()},
+            )
+            del features, train_features, test_features
+        del data
+    finally:
+        blocks = [
+            block
+            for block_list, _ in [*attached.values(), *attached_features.values()]
+            for block in block_list
+        ]
+        del attached, attached_features
+        release_blocks(blocks)
+
+    return validator._run_window(
+        window, train_data, test_data,
+        strategy_factory, state_trainer, feature_pipeline, window_features,
+    )
+
+
+def _window_features(
+    features: dict[str, pd.DataFrame],
+    window: WalkForwardWindow,
+    train_data: dict[str, pd.DataFrame],
+    test_data: dict[str, pd.DataFrame],
+) -> tuple[dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
+    """Slice full-history features to a window's train and test periods."""
+    train_features = {
+        s: slice_window(features[s], window.train_start, window.train_end) for s in train_data
+    }
+    test_features = {
+        s: slice_window(features[s], window.test_start, window.test_end) for s in test_data
+    }
+    return train_features, test_features
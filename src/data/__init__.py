@@ -20,6 +20,7 @@ from src.data.quality import (
     detect_outliers,
     generate_quality_report,
 )
+from src.data.session_calendar import MissingRange, SessionCalendar, get_session_calendar
 from src.data.database import (
     DatabaseManager,
     get_db_manager,
@@ -52,6 +53,10 @@ __all__ = [
     "detect_gaps",
     "detect_outliers",
     "generate_quality_report",
+    # Session calendar
+    "MissingRange",
+    "SessionCalendar",
+    "get_session_calendar",
     # Database
     "DatabaseManager",
     "get_db_manager",
@@ -1,6 +1,9 @@
 """Data access layer for OHLCV market data."""
 
+import io
 import logging
+import struct
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -18,9 +21,77 @@ from src.data.database.models import (
     VALID_TIMEFRAMES,
     ComputedFeature,
 )
+from src.data.feature_store import ColumnarFeatureStore, get_feature_store
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT; keeps each statement under PostgreSQL's bind-parameter limit
+_FEATURE_UPSERT_CHUNK = 5_000
+_INSERT_CHUNK = 5_000
+
+# Frames at least this long are loaded with COPY when the driver supports it
+_COPY_MIN_ROWS = 5_000
+
+_STAGING_TABLE = "ohlcv_bars_staging"
+_STAGING_DDL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+        timestamp TIMESTAMPTZ NOT NULL,
+        open DOUBLE PRECISION NOT NULL,
+        high DOUBLE PRECISION NOT NULL,
+        low DOUBLE PRECISION NOT NULL,
+        close DOUBLE PRECISION NOT NULL,
+        volume BIGINT NOT NULL
+    ) ON COMMIT DROP
+"""
+_STAGING_MERGE = f"""
+    INSERT INTO ohlcv_bars
+        (ticker_id, timeframe, timestamp, open, high, low, close, volume, source, created_at)
+    SELECT %s, %s, timestamp, open, high, low, close, volume, %s, now()
+    FROM {_STAGING_TABLE}
+    ON CONFLICT (ticker_id, timeframe, timestamp) DO NOTHING
+"""
+
+# PostgreSQL binary COPY framing: signature, flags and header extension length
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_COPY_TRAILER = struct.pack("!h", -1)
+_PG_EPOCH = np.datetime64("2000-01-01T00:00:00", "us")
+
+# One fixed-width tuple: field count, then (length, big-endian value) per column
+_COPY_BAR_DTYPE = np.dtype(
+    [("fields", ">i2"), ("timestamp_len", ">i4"), ("timestamp", ">i8")]
+    + [
+        field
+        for column in ("open", "high", "low", "close")
+        for field in ((f"{column}_len", ">i4"), (column, ">f8"))
+    ]
+    + [("volume_len", ">i4"), ("volume", ">i8")]
+)
+
+
+def encode_bars_copy_binary(df: pd.DataFrame) -> bytes:
+    """Encode OHLCV bars in PostgreSQL's binary COPY format.
+
+    Columns are written as (timestamptz, float8 x4, int8) without a
+    per-row Python loop: every tuple has the same width, so the payload
+    is a single NumPy structured array.
+
+    Args:
+        df: DataFrame with a naive (UTC) datetime index and OHLCV columns
+
+    Returns:
+        COPY payload including header and trailer
+    """
+    tuples = np.empty(len(df), dtype=_COPY_BAR_DTYPE)
+    tuples["fields"] = 6
+    tuples["timestamp_len"] = 8
+    tuples["timestamp"] = (df.index.values.astype("datetime64[us]") - _PG_EPOCH).astype(np.int64)
+    for column in ("open", "high", "low", "close"):
+        tuples[f"{column}_len"] = 8
+        tuples[column] = df[column].to_numpy(dtype=np.float64)
+    tuples["volume_len"] = 8
+    tuples["volume"] = df["volume"].to_numpy(dtype=np.int64)
+    return _COPY_HEADER + tuples.tobytes() + _COPY_TRAILER
+
 
 def _normalize_timestamp_to_utc(ts: Optional[datetime]) -> Optional[datetime]:
     """Normalize a timestamp to UTC timezone-aware format.
@@ -46,13 +117,21 @@ class OHLCVRepository:
     from the PostgreSQL database.
     """
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        feature_store: Optional[ColumnarFeatureStore] = None,
+    ):
         """Initialize repository with database session.
 
         Args:
             session: SQLAlchemy session for database operations
+            feature_store: Columnar store for feature values.  Defaults to
+                the store configured in settings; when neither is set,
+                features are stored as JSONB in computed_features.
         """
         self.session = session
+        self.feature_store = feature_store if feature_store is not None else get_feature_store()
 
     # -------------------------------------------------------------------------
     # Helper Methods
@@ -185,6 +264,30 @@ class OHLCVRepository:
             OHLCVBar.timeframe == timeframe,
         ).scalar()
 
+    def get_latest_timestamps(
+        self,
+        symbols: list[str],
+        timeframe: str,
+    ) -> dict[str, Optional[datetime]]:
+        """Get the most recent bar timestamp for many symbols in one query.
+
+        Args:
+            symbols: Stock symbols
+            timeframe: Bar timeframe (e.g., '1Min', '1Day')
+
+        Returns:
+            Mapping of normalized symbol to latest timestamp (None if no data)
+        """
+        normalized = [self._normalize_symbol(s) for s in symbols]
+        rows = self.session.query(
+            Ticker.symbol, func.max(OHLCVBar.timestamp)
+        ).join(OHLCVBar, OHLCVBar.ticker_id == Ticker.id).filter(
+            Ticker.symbol.in_(normalized),
+            OHLCVBar.timeframe == timeframe,
+        ).group_by(Ticker.symbol).all()
+        latest = dict(rows)
+        return {symbol: latest.get(symbol) for symbol in normalized}
+
     def get_earliest_timestamp(
         self,
         symbol: str,
@@ -301,17 +404,22 @@ class OHLCVRepository:
         ticker_id: int,
         timeframe: str,
         source: str = "alpaca",
+        chunk_rows: int = 250_000,
     ) -> int:
         """Efficiently insert multiple bars using bulk operations.
 
-        Uses PostgreSQL ON CONFLICT DO NOTHING for upsert behavior,
-        which safely handles duplicate timestamps.
+        Duplicate timestamps are skipped via ON CONFLICT DO NOTHING.  On
+        PostgreSQL with psycopg2, large frames are streamed with binary
+        COPY into a temporary staging table and merged from there, one
+        chunk at a time.  Other connections (and small frames) use chunked
+        multi-row INSERTs.
 
         Args:
             df: DataFrame with datetime index and OHLCV columns
             ticker_id: ID of the ticker
             timeframe: Bar timeframe
             source: Data source identifier
+            chunk_rows: Rows copied and merged per chunk
 
         Returns:
             Number of rows inserted
@@ -335,29 +443,87 @@ class OHLCVRepository:
                 "Normalize to naive UTC before calling."
             )
 
-        # Prepare data for insertion
-        records = []
-        for timestamp, row in df.iterrows():
-            records.append({
+        started = time.perf_counter()
+        if len(df) >= _COPY_MIN_ROWS and self._supports_copy():
+            inserted = self._copy_insert_bars(df, ticker_id, timeframe, source, chunk_rows)
+        else:
+            inserted = self._insert_bars(df, ticker_id, timeframe, source)
+        elapsed = time.perf_counter() - started
+
+        log = logger.info if len(df) >= _COPY_MIN_ROWS else logger.debug
+        log(
+            "Inserted %d of %d bars for ticker_id=%s/%s in %.2fs (%.0f rows/sec)",
+            inserted, len(df), ticker_id, timeframe, elapsed,
+            len(df) / elapsed if elapsed > 0 else float("inf"),
+        )
+        return inserted
+
+    def _supports_copy(self) -> bool:
+        """Check whether the session is bound to PostgreSQL via psycopg2."""
+        dialect = self.session.get_bind().dialect
+        return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+    def _insert_bars(
+        self,
+        df: pd.DataFrame,
+        ticker_id: int,
+        timeframe: str,
+        source: str,
+    ) -> int:
+        """Insert bars with chunked multi-row INSERT ... ON CONFLICT DO NOTHING."""
+        columns = zip(
+            df.index.to_pydatetime(),
+            *(df[c].to_numpy(dtype=np.float64).tolist() for c in ("open", "high", "low", "close")),
+            df["volume"].to_numpy(dtype=np.int64).tolist(),
+        )
+        records = [
+            {
                 "ticker_id": ticker_id,
                 "timeframe": timeframe,
                 "timestamp": timestamp,
-                "open": float(row["open"]),
-                "high": float(row["high"]),
-                "low": float(row["low"]),
-                "close": float(row["close"]),
-                "volume": int(row["volume"]),
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
                 "source": source,
-            })
-
-        # Use PostgreSQL INSERT ... ON CONFLICT DO NOTHING
-        stmt = pg_insert(OHLCVBar).values(records)
-        stmt = stmt.on_conflict_do_nothing(
-            index_elements=["ticker_id", "timeframe", "timestamp"]
-        )
+            }
+            for timestamp, open_, high, low, close, volume in columns
+        ]
+
+        inserted = 0
+        for i in range(0, len(records), _INSERT_CHUNK):
+            stmt = pg_insert(OHLCVBar).values(records[i:i + _INSERT_CHUNK])
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=["ticker_id", "timeframe", "timestamp"]
+            )
+            inserted += self.session.execute(stmt).rowcount
+        return inserted
 
-        result = self.session.execute(stmt)
-        return result.rowcount
+    def _copy_insert_bars(
+        self,
+        df: pd.DataFrame,
+        ticker_id: int,
+        timeframe: str,
+        source: str,
+        chunk_rows: int,
+    ) -> int:
+        """Stream bars through a staging table with binary COPY and merge them."""
+        # Runs on the session's own connection so it joins the current transaction
+        dbapi_connection = self.session.connection().connection
+        inserted = 0
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(_STAGING_DDL)
+            for i in range(0, len(df), chunk_rows):
+                payload = encode_bars_copy_binary(df.iloc[i:i + chunk_rows])
+                cursor.copy_expert(
+                    f"COPY {_STAGING_TABLE} FROM STDIN WITH (FORMAT binary)",
+                    io.BytesIO(payload),
+                )
+                cursor.execute(_STAGING_MERGE, (ticker_id, timeframe, source))
+                inserted += cursor.rowcount
+                cursor.execute(f"TRUNCATE {_STAGING_TABLE}")
+        return inserted
 
     def delete_bars(
         self,
@@ -526,6 +692,10 @@ class OHLCVRepository:
     ) -> int:
         """Store computed features for a ticker/timeframe.
 
+        Each row's values are stored as a JSONB dict in computed_features.
+        With a columnar feature store configured, the values are also
+        written to it in bulk for the columnar read path.
+
         Args:
             features_df: DataFrame with datetime index and feature columns
             ticker_id: Ticker ID
@@ -551,55 +721,151 @@ class OHLCVRepository:
 
         timestamp_map = {b.timestamp: b.id for b in bars}
 
-        # 2. Prepare records
-        records = []
-        skipped = 0
-        for timestamp, row in features_df.iterrows():
-            if timestamp not in timestamp_map:
-                skipped += 1
-                continue  # Skip features for missing bars
+        # 2. Skip features for missing bars
+        has_bar = np.fromiter(
+            (ts in timestamp_map for ts in features_df.index),
+            dtype=bool,
+            count=len(features_df),
+        )
+        skipped = int((~has_bar).sum())
+        if skipped:
+            logger.warning(
+                "Skipped %d features for missing bars (ticker_id=%s/%s)",
+                skipped, ticker_id, timeframe,
+            )
+        features_df = features_df[has_bar]
+
+        if features_df.empty:
+            logger.debug(f"No features to store for ticker_id={ticker_id}/{timeframe}")
+            return 0
+
+        # 3. Prepare records
+        if self.feature_store is not None:
+            symbol = self.session.query(Ticker.symbol).filter(Ticker.id == ticker_id).scalar()
+            if symbol is None:
+                raise ValueError(f"Ticker not found: id={ticker_id}")
+            self.feature_store.write(symbol, timeframe, features_df, version=version)
 
+        rows = []
+        for _, row in features_df.iterrows():
             # Convert row to dict, handling NaN/Inf (JSON doesn't support these)
             feature_data = {}
             for k, v in row.items():
                 if pd.isna(v) or (isinstance(v, float) and (np.isinf(v) or np.isnan(v))):
                     continue  # Skip NaN/Inf values
                 feature_data[k] = float(v) if isinstance(v, (np.floating, np.integer)) else v
+            rows.append(feature_data)
 
-            records.append({
+        records = [
+            {
                 "bar_id": timestamp_map[timestamp],
                 "ticker_id": ticker_id,
                 "timeframe": timeframe,
                 "timestamp": timestamp,
                 "features": feature_data,
                 "feature_version": version,
-            })
+            }
+            for timestamp, feature_data in zip(features_df.index, rows)
+        ]
 
-        if skipped:
-            logger.warning(
-                "Skipped %d features for missing bars (ticker_id=%s/%s)",
-                skipped, ticker_id, timeframe,
+        # 4. Bulk Upsert (Update existing features for this bar)
+        logger.info(f"Storing {len(records)} feature records for ticker_id={ticker_id}/{timeframe}")
+        rowcount = 0
+        for i in range(0, len(records), _FEATURE_UPSERT_CHUNK):
+            stmt = pg_insert(ComputedFeature).values(records[i:i + _FEATURE_UPSERT_CHUNK])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["bar_id"],  # Unique constraint on bar_id
+                set_={
+                    "features": stmt.excluded.features,
+                    "feature_version": stmt.excluded.feature_version,
+                    "timestamp": stmt.excluded.timestamp, # Update timestamp index just in case
+                }
             )
+            rowcount += self.session.execute(stmt).rowcount
 
-        if not records:
-            logger.debug(f"No features to store for ticker_id={ticker_id}/{timeframe}")
-            return 0
+        logger.debug(f"Upserted {rowcount} feature records")
+        return rowcount
 
-        # 3. Bulk Upsert (Update existing features for this bar)
-        logger.info(f"Storing {len(records)} feature records for ticker_id={ticker_id}/{timeframe}")
-        stmt = pg_insert(ComputedFeature).values(records)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["bar_id"],  # Unique constraint on bar_id
-            set_={
-                "features": stmt.excluded.features,
-                "feature_version": stmt.excluded.feature_version,
-                "timestamp": stmt.excluded.timestamp, # Update timestamp index just in case
-            }
-        )
+    def migrate_features_to_store(
+        self,
+        ticker_id: int,
+        timeframe: str,
+        batch_size: int = 50_000,
+        clear_json: bool = False,
+    ) -> int:
+        """Copy JSONB feature rows for a ticker/timeframe into the feature store.
 
-        result = self.session.execute(stmt)
-        logger.debug(f"Upserted {result.rowcount} feature records")
-        return result.rowcount
+        Rows are read in timestamp order in batches, grouped by feature
+        version and written to the columnar store.  The JSONB dicts are left
+        in place by default because the API and evaluator readers still use
+        them; with ``clear_json`` set they are emptied (keeping the row and
+        any HMM state), so re-running skips already migrated rows.
+
+        Args:
+            ticker_id: Ticker ID
+            timeframe: Bar timeframe
+            batch_size: Rows read per query
+            clear_json: Whether to empty the migrated JSONB dicts
+
+        Returns:
+            Number of rows migrated
+
+        Raises:
+            ValueError: If no feature store is configured or the ticker
+                does not exist
+        """
+        if self.feature_store is None:
+            raise ValueError("No columnar feature store configured")
+
+        symbol = self.session.query(Ticker.symbol).filter(Ticker.id == ticker_id).scalar()
+        if symbol is None:
+            raise ValueError(f"Ticker not found: id={ticker_id}")
+
+        migrated = 0
+        last_timestamp = None
+        while True:
+            query = self.session.query(
+                ComputedFeature.id,
+                ComputedFeature.timestamp,
+                ComputedFeature.features,
+                ComputedFeature.feature_version,
+            ).filter(
+                ComputedFeature.ticker_id == ticker_id,
+                ComputedFeature.timeframe == timeframe,
+                ComputedFeature.features != {},
+            )
+            if last_timestamp is not None:
+                query = query.filter(ComputedFeature.timestamp > last_timestamp)
+            batch = query.order_by(ComputedFeature.timestamp).limit(batch_size).all()
+            if not batch:
+                break
+
+            by_version: dict[Optional[str], list] = {}
+            for row in batch:
+                by_version.setdefault(row.feature_version, []).append(row)
+
+            for version, rows in by_version.items():
+                df = pd.DataFrame.from_records(
+                    [r.features for r in rows],
+                    index=pd.DatetimeIndex([r.timestamp for r in rows], name="timestamp"),
+                )
+                self.feature_store.write(symbol, timeframe, df, version=version)
+
+            if clear_json:
+                self.session.query(ComputedFeature).filter(
+                    ComputedFeature.id.in_([r.id for r in batch])
+                ).update({ComputedFeature.features: {}}, synchronize_session=False)
+
+            migrated += len(batch)
+            last_timestamp = batch[-1].timestamp
+            logger.info(
+                "Migrated %d feature rows for %s/%s (through %s)",
+                migrated, symbol, timeframe, last_timestamp,
+            )
+            if len(batch) < batch_size:
+                break
+
+        return migrated
 
     def get_existing_feature_timestamps(
         self,
@@ -638,23 +904,39 @@ class OHLCVRepository:
         timeframe: str,
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
+        columns: Optional[list[str]] = None,
+        version: Optional[str] = None,
     ) -> pd.DataFrame:
         """Retrieve features as a pandas DataFrame.
 
+        Reads from the columnar feature store when it holds features for
+        the symbol/timeframe, falling back to the JSONB rows otherwise.
+
         Args:
             symbol: Stock symbol
             timeframe: Bar timeframe
             start: Optional start datetime
             end: Optional end datetime
+            columns: Optional subset of feature columns to return
+            version: Feature version to read from the columnar store;
+                defaults to the latest written
 
         Returns:
-            DataFrame with datetime index and feature columns (expanded from JSON)
+            DataFrame with datetime index and feature columns
         """
+        symbol = self._normalize_symbol(symbol)
+        if self.feature_store is not None and self.feature_store.has_features(symbol, timeframe):
+            df = self.feature_store.read(
+                symbol, timeframe, start=start, end=end, version=version, columns=columns,
+            )
+            logger.debug(f"Retrieved {len(df)} feature rows for {symbol}/{timeframe} from the feature store")
+            return df
+
         query = self.session.query(
             ComputedFeature.timestamp,
             ComputedFeature.features,
         ).join(Ticker).filter(
-            Ticker.symbol == self._normalize_symbol(symbol),
+            Ticker.symbol == symbol,
             ComputedFeature.timeframe == timeframe,
         )
 
@@ -670,15 +952,12 @@ class OHLCVRepository:
             logger.debug(f"No features found for {symbol}/{timeframe}")
             return pd.DataFrame()
 
-        # Convert list of (timestamp, feature_dict) to DataFrame
-        data = []
-        for ts, feats in results:
-            row = feats.copy()
-            row["timestamp"] = ts
-            data.append(row)
-
-        df = pd.DataFrame(data)
-        df.set_index("timestamp", inplace=True)
+        # Expand the JSON dicts into columns
+        df = pd.DataFrame.from_records(
+            [feats for _, feats in results],
+            index=pd.DatetimeIndex([ts for ts, _ in results], name="timestamp"),
+            columns=columns,
+        )
         df.sort_index(inplace=True)
 
         logger.debug(f"Retrieved {len(df)} feature rows for {symbol}/{timeframe} with {len(df.columns)} features")
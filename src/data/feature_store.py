@@ -0,0 +1,373 @@
+"""Columnar storage for computed features.
+
+Features were historically stored one JSONB dict per bar in
+``computed_features``, which costs a Python dict per row on every write
+and every read.  This module stores them as typed float32 columns in
+per-day Parquet partitions instead::
+
+    features/
+      timeframe=1Min/
+        symbol=AAPL/
+          version=v2.0/
+            date=2024-01-15/
+              data.parquet
+          _latest
+
+Writes are bulk: a whole DataFrame is cast to a single float32 array and
+split at day boundaries.  Reads hand Arrow buffers straight to pandas
+(``split_blocks``), so each feature column becomes a NumPy-backed column
+without a per-row conversion.  NaN is stored as a float value rather than
+a null so the columns stay eligible for zero-copy conversion.
+"""
+
+import logging
+import os
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_COLUMN = "timestamp"
+UNVERSIONED = "unversioned"
+_LATEST_MARKER = "_latest"
+
+
+def _to_utc(ts: Optional[datetime]) -> Optional[pd.Timestamp]:
+    """Convert a bound to a UTC-aware timestamp (naive is assumed UTC)."""
+    if ts is None:
+        return None
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+def _utc_index(index: pd.Index) -> pd.DatetimeIndex:
+    """Return ``index`` as a UTC-aware DatetimeIndex."""
+    index = pd.DatetimeIndex(index)
+    return index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+
+
+class ColumnarFeatureStore:
+    """Per-day Parquet partitions of float32 feature columns.
+
+    Partitions are keyed by timeframe, symbol, feature version and UTC
+    date.  Writing rows for a day that already has a partition merges
+    them in: rows with the same timestamp are replaced and new feature
+    columns are added.
+
+    Example:
+        >>> store = ColumnarFeatureStore(Path("data/features"))
+        >>> store.write("AAPL", "1Min", features_df, version="v2.0")
+        >>> df = store.read("AAPL", "1Min", start=start, end=end, columns=["r1", "rv_60"])
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        compression: str = "zstd",
+        dtype: np.dtype = np.float32,
+    ):
+        """Initialize the store.
+
+        Args:
+            root: Root directory for feature partitions
+            compression: Parquet compression codec
+            dtype: Floating point type of stored feature columns
+        """
+        self.root = Path(root)
+        self.compression = compression
+        self.dtype = np.dtype(dtype)
+        self._arrow_type = pa.from_numpy_dtype(self.dtype)
+
+    # -------------------------------------------------------------------------
+    # Layout
+    # -------------------------------------------------------------------------
+
+    def _symbol_dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / f"timeframe={timeframe}" / f"symbol={symbol.upper()}"
+
+    def _version_dir(self, symbol: str, timeframe: str, version: Optional[str]) -> Path:
+        return self._symbol_dir(symbol, timeframe) / f"version={version or UNVERSIONED}"
+
+    def _partition_path(self, version_dir: Path, day: date) -> Path:
+        return version_dir / f"date={day.isoformat()}" / "data.parquet"
+
+    def list_versions(self, symbol: str, timeframe: str) -> list[str]:
+        """List feature versions stored for a symbol/timeframe.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+
+        Returns:
+            Sorted list of version names
+        """
+        symbol_dir = self._symbol_dir(symbol, timeframe)
+        if not symbol_dir.exists():
+            return []
+        return sorted(
+            p.name.removeprefix("version=")
+            for p in symbol_dir.iterdir()
+            if p.is_dir() and p.name.startswith("version=")
+        )
+
+    def latest_version(self, symbol: str, timeframe: str) -> Optional[str]:
+        """Return the most recently written version, or None if there is none.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+        """
+        marker = self._symbol_dir(symbol, timeframe) / _LATEST_MARKER
+        if marker.exists():
+            return marker.read_text().strip()
+        versions = self.list_versions(symbol, timeframe)
+        return versions[-1] if versions else None
+
+    def has_features(self, symbol: str, timeframe: str) -> bool:
+        """Check whether any features are stored for a symbol/timeframe."""
+        return self.latest_version(symbol, timeframe) is not None
+
+    def _partition_paths(
+        self,
+        symbol: str,
+        timeframe: str,
+        version: Optional[str],
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+    ) -> list[Path]:
+        """Partition files overlapping ``[start, end]`` in date order."""
+        version_dir = self._version_dir(symbol, timeframe, version)
+        if not version_dir.exists():
+            return []
+
+        first = start.date().isoformat() if start is not None else ""
+        last = end.date().isoformat() if end is not None else "9999-12-31"
+        paths = []
+        for day_dir in sorted(version_dir.iterdir()):
+            day = day_dir.name.removeprefix("date=")
+            if first <= day <= last and (day_dir / "data.parquet").exists():
+                paths.append(day_dir / "data.parquet")
+        return paths
+
+    # -------------------------------------------------------------------------
+    # Write
+    # -------------------------------------------------------------------------
+
+    def write(
+        self,
+        symbol: str,
+        timeframe: str,
+        features_df: pd.DataFrame,
+        version: Optional[str] = None,
+    ) -> int:
+        """Write feature rows, merging them into existing day partitions.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+            features_df: DataFrame with datetime index and numeric feature columns
+            version: Optional feature version string
+
+        Returns:
+            Number of rows written
+        """
+        if features_df.empty:
+            return 0
+
+        features_df = features_df[~features_df.index.duplicated(keep="last")].sort_index()
+        index = _utc_index(features_df.index)
+        values = features_df.to_numpy(dtype=self.dtype, na_value=np.nan)
+        columns = [str(c) for c in features_df.columns]
+
+        # Split the sorted rows at UTC day boundaries
+        days = index.floor("D")
+        bounds = np.flatnonzero(days[1:] != days[:-1]) + 1
+        starts = np.r_[0, bounds]
+        stops = np.r_[bounds, len(index)]
+
+        version_dir = self._version_dir(symbol, timeframe, version)
+        for lo, hi in zip(starts, stops):
+            table = self._to_table(index[lo:hi], values[lo:hi], columns)
+            path = self._partition_path(version_dir, days[lo].date())
+            if path.exists():
+                table = self._merge(pq.read_table(path), table)
+            self._write_table(table, path)
+
+        marker = self._symbol_dir(symbol, timeframe) / _LATEST_MARKER
+        marker.write_text(version or UNVERSIONED)
+
+        logger.debug(
+            "Wrote %d feature rows for %s/%s (%s) across %d partitions",
+            len(index), symbol, timeframe, version or UNVERSIONED, len(starts),
+        )
+        return len(index)
+
+    def _to_table(self, index: pd.DatetimeIndex, values: np.ndarray, columns: list[str]) -> pa.Table:
+        arrays = [pa.array(index.as_unit("us"), type=pa.timestamp("us", tz="UTC"))]
+        arrays.extend(pa.array(np.ascontiguousarray(values[:, j]), type=self._arrow_type) for j in range(values.shape[1]))
+        return pa.Table.from_arrays(arrays, names=[TIMESTAMP_COLUMN] + columns)
+
+    def _merge(self, existing: pa.Table, new: pa.Table) -> pa.Table:
+        """Replace rows of ``existing`` that ``new`` redefines and add the rest."""
+        keep = pc.invert(pc.is_in(existing[TIMESTAMP_COLUMN], value_set=new[TIMESTAMP_COLUMN]))
+        merged = pa.concat_tables(
+            [existing.filter(keep), new], promote_options="default",
+        )
+        merged = self._fill_missing(merged)
+        return merged.sort_by(TIMESTAMP_COLUMN)
+
+    def _fill_missing(self, table: pa.Table) -> pa.Table:
+        """Replace nulls from column promotion with NaN."""
+        for i, name in enumerate(table.column_names):
+            column = table.column(i)
+            if name != TIMESTAMP_COLUMN and column.null_count:
+                table = table.set_column(i, name, pc.fill_null(column, float("nan")))
+        return table
+
+    def _write_table(self, table: pa.Table, path: Path) -> None:
+        """Write a partition atomically so readers never see a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp_path, compression=self.compression)
+        os.replace(tmp_path, path)
+
+    # -------------------------------------------------------------------------
+    # Read
+    # -------------------------------------------------------------------------
+
+    def read_table(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        version: Optional[str] = None,
+        columns: Optional[list[str]] = None,
+    ) -> Optional[pa.Table]:
+        """Read feature rows as an Arrow table.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+            start: Optional start datetime (inclusive, naive is UTC)
+            end: Optional end datetime (inclusive, naive is UTC)
+            version: Feature version; defaults to the latest written
+            columns: Optional subset of feature columns to read
+
+        Returns:
+            Table with a ``timestamp`` column and the feature columns, or
+            None if no partitions match
+        """
+        version = version or self.latest_version(symbol, timeframe)
+        start_ts, end_ts = _to_utc(start), _to_utc(end)
+        paths = self._partition_paths(symbol, timeframe, version, start_ts, end_ts)
+        if not paths:
+            return None
+
+        read_columns = None if columns is None else [TIMESTAMP_COLUMN] + list(columns)
+        tables = []
+        for path in paths:
+            parquet_file = pq.ParquetFile(path, memory_map=True)
+            names = parquet_file.schema_arrow.names
+            # Only decode the requested columns present in this partition
+            tables.append(parquet_file.read(
+                columns=None if read_columns is None else [c for c in read_columns if c in names],
+            ))
+        table = pa.concat_tables(tables, promote_options="default")
+        if read_columns is not None:
+            missing = [c for c in read_columns if c not in table.column_names]
+            for name in missing:
+                table = table.append_column(
+                    name, pa.array(np.full(len(table), np.nan, dtype=self.dtype)),
+                )
+            table = table.select(read_columns)
+        table = self._fill_missing(table)
+
+        ts = table[TIMESTAMP_COLUMN]
+        mask = None
+        if start_ts is not None:
+            mask = pc.greater_equal(ts, pa.scalar(start_ts, type=ts.type))
+        if end_ts is not None:
+            upper = pc.less_equal(ts, pa.scalar(end_ts, type=ts.type))
+            mask = upper if mask is None else pc.and_(mask, upper)
+        if mask is not None:
+            table = table.filter(mask)
+        return table
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        version: Optional[str] = None,
+        columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
+        """Read feature rows into a NumPy-backed DataFrame.
+
+        Each feature column is handed to pandas as its own block, so columns
+        are not consolidated (copied) into a single 2-D array.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+            start: Optional start datetime (inclusive, naive is UTC)
+            end: Optional end datetime (inclusive, naive is UTC)
+            version: Feature version; defaults to the latest written
+            columns: Optional subset of feature columns to read
+
+        Returns:
+            DataFrame with a UTC ``timestamp`` index and float feature columns
+        """
+        table = self.read_table(symbol, timeframe, start, end, version, columns)
+        if table is None:
+            return pd.DataFrame(
+                columns=columns or [],
+                index=pd.DatetimeIndex([], tz=timezone.utc, name=TIMESTAMP_COLUMN),
+            )
+
+        table = table.combine_chunks()
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        df.set_index(TIMESTAMP_COLUMN, inplace=True)
+        df.index = df.index.as_unit("ns")
+        return df
+
+    def timestamps(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        version: Optional[str] = None,
+    ) -> pd.DatetimeIndex:
+        """Return the stored timestamps without reading feature columns."""
+        table = self.read_table(symbol, timeframe, start, end, version, columns=[])
+        if table is None:
+            return pd.DatetimeIndex([], tz=timezone.utc)
+        return pd.DatetimeIndex(table[TIMESTAMP_COLUMN].to_pandas()).as_unit("ns")
+
+
+@lru_cache(maxsize=1)
+def get_feature_store() -> Optional[ColumnarFeatureStore]:
+    """Return the configured feature store, or None if it is disabled.
+
+    The store is enabled by setting ``DATA_FEATURE_STORE_DIR``.
+    """
+    try:
+        from config.settings import get_settings
+        root = get_settings().data.feature_store_dir
+    except Exception:
+        logger.debug("Could not load settings for the feature store", exc_info=True)
+        return None
+    if root is None:
+        return None
+    logger.info("Using columnar feature store at %s", root)
+    return ColumnarFeatureStore(root)
@@ -6,7 +6,7 @@ table operations (tickers, ohlcv_bars, computed_features, data_sync_log).
 
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
 
 import grpc
 import numpy as np
@@ -23,6 +23,18 @@ from proto.gen.python.market.v1 import (
 
 logger = logging.getLogger(__name__)
 
+# Row pages carry one OHLCVBar message per bar; columnar pages are ~48 bytes
+# per bar, so 100k bars stay well under the 20 MB receive limit.
+_ROW_PAGE_SIZE = 2000
+_COLUMNAR_PAGE_SIZE = 100_000
+
+# Without GetBarsColumnar, reads larger than this use the server-streaming
+# StreamBars RPC instead of one GetBars round trip per 2000 bars.
+_STREAM_THRESHOLD = 20_000
+_STREAM_CHUNK_ROWS = 50_000
+
+_BAR_COLUMNS = ["open", "high", "low", "close", "volume"]
+
 
 def _dt_to_pb(dt: Optional[datetime]) -> Optional[Timestamp]:
     """Convert a Python datetime to a protobuf Timestamp."""
@@ -42,11 +54,123 @@ def _pb_to_dt(ts: Optional[Timestamp]) -> Optional[datetime]:
     return ts.ToDatetime().replace(tzinfo=None)
 
 
+def bars_to_columns(df: pd.DataFrame) -> bar_pb2.BarColumns:
+    """Pack an OHLCV DataFrame into a BarColumns message.
+
+    Args:
+        df: DataFrame with a naive (UTC) datetime index and OHLCV columns
+
+    Returns:
+        BarColumns with little-endian column buffers
+    """
+    timestamps = df.index.values.astype("datetime64[us]").astype("<i8")
+    return bar_pb2.BarColumns(
+        count=len(df),
+        timestamps=timestamps.tobytes(),
+        open=df["open"].to_numpy(dtype="<f8").tobytes(),
+        high=df["high"].to_numpy(dtype="<f8").tobytes(),
+        low=df["low"].to_numpy(dtype="<f8").tobytes(),
+        close=df["close"].to_numpy(dtype="<f8").tobytes(),
+        volume=df["volume"].to_numpy(dtype="<i8").tobytes(),
+    )
+
+
+def columns_to_bars(pages: list[bar_pb2.BarColumns]) -> pd.DataFrame:
+    """Decode BarColumns pages into an OHLCV DataFrame.
+
+    Each column buffer is viewed as a NumPy array without touching
+    individual bars; multiple pages are concatenated per column.
+
+    Args:
+        pages: BarColumns messages in timestamp order
+
+    Returns:
+        DataFrame with a naive-UTC DatetimeIndex and OHLCV columns
+    """
+    def column(field: str, dtype: str) -> np.ndarray:
+        buffers = [getattr(p, field) for p in pages]
+        return np.frombuffer(buffers[0] if len(buffers) == 1 else b"".join(buffers), dtype=dtype)
+
+    index = pd.DatetimeIndex(column("timestamps", "<i8").astype("datetime64[us]").astype("datetime64[ns]"))
+    return pd.DataFrame(
+        {
+            "open": column("open", "<f8"),
+            "high": column("high", "<f8"),
+            "low": column("low", "<f8"),
+            "close": column("close", "<f8"),
+            "volume": column("volume", "<i8"),
+        },
+        index=index,
+    )
+
+
+class _BarBuffer:
+    """Preallocated column arrays that streamed OHLCVBar messages are copied into."""
+
+    def __init__(self, capacity: int):
+        self.size = 0
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.open = np.empty(capacity, dtype=np.float64)
+        self.high = np.empty(capacity, dtype=np.float64)
+        self.low = np.empty(capacity, dtype=np.float64)
+        self.close = np.empty(capacity, dtype=np.float64)
+        self.volume = np.empty(capacity, dtype=np.int64)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, bar: bar_pb2.OHLCVBar) -> None:
+        """Copy one bar into the next free slot, doubling the arrays when full."""
+        if self.size == self.capacity:
+            self._grow(max(2 * self.capacity, 1024))
+        i = self.size
+        ts = bar.timestamp
+        self.timestamps[i] = ts.seconds * 1_000_000 + ts.nanos // 1000
+        self.open[i] = bar.open
+        self.high[i] = bar.high
+        self.low[i] = bar.low
+        self.close[i] = bar.close
+        self.volume[i] = bar.volume
+        self.size = i + 1
+
+    def _grow(self, capacity: int) -> None:
+        for name in ("timestamps", "open", "high", "low", "close", "volume"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Wrap the filled part of the arrays in an OHLCV DataFrame (only the index is copied)."""
+        n = self.size
+        index = pd.DatetimeIndex(self.timestamps[:n].view("datetime64[us]").astype("datetime64[ns]"))
+        return pd.DataFrame(
+            {
+                "open": self.open[:n],
+                "high": self.high[:n],
+                "low": self.low[:n],
+                "close": self.close[:n],
+                "volume": self.volume[:n],
+            },
+            index=index,
+            copy=False,
+        )
+
+
 class MarketDataGrpcClient:
     """gRPC client matching OHLCVRepository interface for market data operations."""
 
-    def __init__(self, channel: grpc.Channel):
+    def __init__(self, channel: grpc.Channel, columnar_bars: bool = True):
+        """Initialize the client.
+
+        Args:
+            channel: gRPC channel to the data-service
+            columnar_bars: Fetch bars with GetBarsColumnar, falling back to
+                the row-based GetBars if the server does not implement it
+        """
         self.stub = service_pb2_grpc.MarketDataServiceStub(channel)
+        self._columnar_bars = columnar_bars
 
     # -------------------------------------------------------------------------
     # Ticker Operations
@@ -113,6 +237,34 @@ class MarketDataGrpcClient:
         ))
         return _pb_to_dt(resp.timestamp)
 
+    def get_latest_timestamps(self, symbols: list[str], timeframe: str) -> dict[str, Optional[datetime]]:
+        """Get the most recent bar timestamp for many symbols at once.
+
+        Ticker IDs are resolved with a single ListTickers call and the
+        GetLatestTimestamp calls are issued concurrently over the channel,
+        instead of two sequential round trips per symbol.
+
+        Args:
+            symbols: Stock symbols
+            timeframe: Bar timeframe
+
+        Returns:
+            Mapping of upper-cased symbol to latest timestamp (None if no data)
+        """
+        symbols = [s.upper() for s in symbols]
+        ticker_ids = {t.symbol: t.id for t in self.list_tickers(active_only=False)}
+        calls = {
+            symbol: self.stub.GetLatestTimestamp.future(bar_pb2.GetLatestTimestampRequest(
+                ticker_id=ticker_ids[symbol], timeframe=timeframe,
+            ))
+            for symbol in symbols
+            if symbol in ticker_ids
+        }
+        return {
+            symbol: _pb_to_dt(calls[symbol].result().timestamp) if symbol in calls else None
+            for symbol in symbols
+        }
+
     def get_earliest_timestamp(self, symbol: str, timeframe: str) -> Optional[datetime]:
         """Get the earliest bar timestamp for a symbol/timeframe."""
         ticker = self.get_ticker(symbol)
@@ -134,13 +286,7 @@ class MarketDataGrpcClient:
         ticker = self.get_ticker(symbol)
         if ticker is None:
             return 0
-        req = bar_pb2.GetBarCountRequest(ticker_id=ticker.id, timeframe=timeframe)
-        if start:
-            req.start.CopyFrom(_dt_to_pb(start))
-        if end:
-            req.end.CopyFrom(_dt_to_pb(end))
-        resp = self.stub.GetBarCount(req)
-        return resp.count
+        return self._count_bars(ticker.id, timeframe, start, end)
 
     def get_bars(
         self,
@@ -154,26 +300,261 @@ class MarketDataGrpcClient:
         ticker = self.get_ticker(symbol)
         if ticker is None:
             logger.debug("No ticker found for %s", symbol)
-            return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+            return pd.DataFrame(columns=_BAR_COLUMNS)
+
+        df = None
+        if self._columnar_bars:
+            try:
+                df = self._get_bars_columnar(ticker.id, timeframe, start, end, limit)
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                logger.info("data-service does not implement GetBarsColumnar, using GetBars")
+                self._columnar_bars = False
+        if df is None:
+            expected = None
+            if limit is None or limit > _STREAM_THRESHOLD:
+                expected = self._count_bars(ticker.id, timeframe, start, end)
+            if expected is not None and expected > _STREAM_THRESHOLD:
+                df = self._stream_bars(ticker.id, timeframe, start, end, expected, limit)
+            else:
+                df = self._get_bars_rows(ticker.id, timeframe, start, end, limit)
 
-        all_bars = []
-        page_token = ""
-        page_size = min(limit, 2000) if limit else 2000
+        if df.empty:
+            logger.debug("No bars found for %s/%s", symbol, timeframe)
+            return pd.DataFrame(columns=_BAR_COLUMNS)
+
+        if limit and len(df) > limit:
+            df = df.iloc[:limit]
+
+        logger.debug("Retrieved %d bars for %s/%s", len(df), symbol, timeframe)
+        return df
+
+    def iter_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        chunk_rows: int = _STREAM_CHUNK_ROWS,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield bars in timestamp order as DataFrames of at most ``chunk_rows`` rows.
+
+        Only one chunk is held by the client at a time, so callers can walk
+        years of 1Min history in bounded memory.  Chunks come from
+        GetBarsColumnar pages when available, otherwise from the StreamBars
+        stream assembled into preallocated arrays.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Bar timeframe
+            start: Start of the range (inclusive)
+            end: End of the range (inclusive)
+            chunk_rows: Maximum number of bars per yielded DataFrame
+
+        Yields:
+            DataFrames with a naive-UTC DatetimeIndex and OHLCV columns
+        """
+        if chunk_rows <= 0:
+            raise ValueError(f"chunk_rows must be positive, got {chunk_rows}")
+
+        ticker = self.get_ticker(symbol)
+        if ticker is None:
+            logger.debug("No ticker found for %s", symbol)
+            return
+
+        if self._columnar_bars:
+            try:
+                yield from self._iter_bars_columnar(ticker.id, timeframe, start, end, chunk_rows)
+                return
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                logger.info("data-service does not implement GetBarsColumnar, using StreamBars")
+                self._columnar_bars = False
+
+        yield from self._iter_bars_stream(ticker.id, timeframe, start, end, chunk_rows)
+
+    @staticmethod
+    def _bars_request(
+        ticker_id: int,
+        timeframe: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        page_size: int,
+        page_token: str,
+    ) -> bar_pb2.GetBarsRequest:
+        """Build a GetBarsRequest for one page."""
+        req = bar_pb2.GetBarsRequest(
+            ticker_id=ticker_id,
+            timeframe=timeframe,
+            page_size=page_size,
+            page_token=page_token,
+        )
+        if start:
+            req.start.CopyFrom(_dt_to_pb(start))
+        if end:
+            req.end.CopyFrom(_dt_to_pb(end))
+        return req
+
+    def _get_bars_columnar(
+        self,
+        ticker_id: int,
+        timeframe: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: Optional[int],
+    ) -> pd.DataFrame:
+        """Fetch bars page by page as column buffers."""
+        pages = []
+        page_size = min(limit, _COLUMNAR_PAGE_SIZE) if limit else _COLUMNAR_PAGE_SIZE
         remaining = limit
 
+        page_token = ""
         while True:
-            req = bar_pb2.GetBarsRequest(
-                ticker_id=ticker.id,
-                timeframe=timeframe,
-                page_size=page_size,
-                page_token=page_token,
+            resp = self.stub.GetBarsColumnar(
+                self._bars_request(ticker_id, timeframe, start, end, page_size, page_token)
             )
-            if start:
-                req.start.CopyFrom(_dt_to_pb(start))
-            if end:
-                req.end.CopyFrom(_dt_to_pb(end))
+            if resp.columns.count:
+                pages.append(resp.columns)
+
+            if remaining is not None:
+                remaining -= resp.columns.count
+                if remaining <= 0:
+                    break
+
+            if not resp.next_page_token:
+                break
+            page_token = resp.next_page_token
+
+        if not pages:
+            return pd.DataFrame(columns=_BAR_COLUMNS)
+        return columns_to_bars(pages)
+
+    def _iter_bars_columnar(
+        self,
+        ticker_id: int,
+        timeframe: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        chunk_rows: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield one DataFrame per GetBarsColumnar page of ``chunk_rows`` bars."""
+        page_token = ""
+        while True:
+            resp = self.stub.GetBarsColumnar(
+                self._bars_request(ticker_id, timeframe, start, end, chunk_rows, page_token)
+            )
+            if resp.columns.count:
+                yield columns_to_bars([resp.columns])
+            if not resp.next_page_token:
+                return
+            page_token = resp.next_page_token
 
-            resp = self.stub.GetBars(req)
+    def _iter_bars_stream(
+        self,
+        ticker_id: int,
+        timeframe: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        chunk_rows: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield StreamBars bars in DataFrames of ``chunk_rows`` bars.
+
+        Each chunk gets freshly allocated arrays so a yielded DataFrame
+        stays valid after the caller moves on.  The call is cancelled if
+        the caller stops iterating early.
+        """
+        stream = self.stub.StreamBars(self._stream_request(ticker_id, timeframe, start, end))
+        try:
+            buffer = _BarBuffer(chunk_rows)
+            for bar in stream:
+                buffer.append(bar)
+                if buffer.size == chunk_rows:
+                    yield buffer.to_frame()
+                    buffer = _BarBuffer(chunk_rows)
+            if buffer.size:
+                yield buffer.to_frame()
+        finally:
+            stream.cancel()
+
+    def _count_bars(
+        self,
+        ticker_id: int,
+        timeframe: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> int:
+        """Count bars in a range for a resolved ticker id."""
+        req = bar_pb2.GetBarCountRequest(ticker_id=ticker_id, timeframe=timeframe)
+        if start:
+            req.start.CopyFrom(_dt_to_pb(start))
+        if end:
+            req.end.CopyFrom(_dt_to_pb(end))
+        return self.stub.GetBarCount(req).count
+
+    @staticmethod
+    def _stream_request(
+        ticker_id: int,
+        timeframe: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> bar_pb2.StreamBarsRequest:
+        """Build a StreamBarsRequest for a range."""
+        req = bar_pb2.StreamBarsRequest(ticker_id=ticker_id, timeframe=timeframe)
+        if start:
+            req.start.CopyFrom(_dt_to_pb(start))
+        if end:
+            req.end.CopyFrom(_dt_to_pb(end))
+        return req
+
+    def _stream_bars(
+        self,
+        ticker_id: int,
+        timeframe: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        expected: int,
+        limit: Optional[int],
+    ) -> pd.DataFrame:
+        """Fetch a large range over StreamBars into arrays sized by ``expected``.
+
+        Bars inserted between the count and the read only make the arrays
+        grow; the stream is cancelled once ``limit`` bars have arrived.
+        """
+        capacity = min(expected, limit) if limit else expected
+        buffer = _BarBuffer(capacity)
+        stream = self.stub.StreamBars(self._stream_request(ticker_id, timeframe, start, end))
+        try:
+            for bar in stream:
+                buffer.append(bar)
+                if limit and buffer.size >= limit:
+                    break
+        finally:
+            stream.cancel()
+
+        if not buffer.size:
+            return pd.DataFrame(columns=_BAR_COLUMNS)
+        return buffer.to_frame()
+
+    def _get_bars_rows(
+        self,
+        ticker_id: int,
+        timeframe: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: Optional[int],
+    ) -> pd.DataFrame:
+        """Fetch bars page by page as OHLCVBar messages."""
+        all_bars = []
+        page_size = min(limit, _ROW_PAGE_SIZE) if limit else _ROW_PAGE_SIZE
+        remaining = limit
+
+        page_token = ""
+        while True:
+            resp = self.stub.GetBars(
+                self._bars_request(ticker_id, timeframe, start, end, page_size, page_token)
+            )
             all_bars.extend(resp.bars)
 
             if remaining is not None:
@@ -186,8 +567,7 @@ class MarketDataGrpcClient:
             page_token = resp.next_page_token
 
         if not all_bars:
-            logger.debug("No bars found for %s/%s", symbol, timeframe)
-            return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+            return pd.DataFrame(columns=_BAR_COLUMNS)
 
         data = []
         for b in all_bars:
@@ -203,11 +583,6 @@ class MarketDataGrpcClient:
         df = pd.DataFrame(data)
         df.set_index("timestamp", inplace=True)
         df.index.name = None
-
-        if limit and len(df) > limit:
-            df = df.iloc[:limit]
-
-        logger.debug("Retrieved %d bars for %s/%s", len(df), symbol, timeframe)
         return df
 
     @staticmethod
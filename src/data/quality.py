@@ -3,10 +3,13 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Any
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
+from src.data.session_calendar import SessionCalendar
+
 logger = logging.getLogger(__name__)
 
 
@@ -165,6 +168,7 @@ class DataQualityValidator:
         expected_frequency: str = "1min",
         outlier_threshold: float = 0.10,
         max_gap_bars: int = 5,
+        calendar: Optional[SessionCalendar] = None,
     ):
         """Initialize the validator.
 
@@ -172,10 +176,14 @@ class DataQualityValidator:
             expected_frequency: Expected bar frequency (pandas offset alias)
             outlier_threshold: Price change threshold for outlier detection (0.10 = 10%)
             max_gap_bars: Maximum allowed gap before flagging as issue
+            calendar: Exchange session calendar; when given, only bars the
+                calendar expects count as missing (overnight, weekend and
+                holiday breaks are not gaps).  Timestamps must be UTC.
         """
         self.expected_frequency = expected_frequency
         self.outlier_threshold = outlier_threshold
         self.max_gap_bars = max_gap_bars
+        self.calendar = calendar
 
     def validate(
         self,
@@ -312,40 +320,29 @@ class DataQualityValidator:
             return
 
         logger.debug("Detecting gaps with expected frequency: %s", self.expected_frequency)
-        # Calculate expected interval
-        expected_delta = pd.Timedelta(self.expected_frequency)
-
-        # Get time differences
-        time_diffs = df.index.to_series().diff()
-
-        # Find gaps larger than expected
-        gap_mask = time_diffs > expected_delta * 1.5
-        gap_indices = df.index[gap_mask]
-
-        for i, gap_end in enumerate(gap_indices):
-            # Get the index position
-            pos = df.index.get_loc(gap_end)
-            if pos == 0:
-                continue
-
-            gap_start = df.index[pos - 1]
-            actual_gap = gap_end - gap_start
-
-            # Calculate expected vs actual bars
-            expected_bars = int(actual_gap / expected_delta)
-            actual_bars = 1  # We only have start and end
-            missing_bars = expected_bars - actual_bars
-
-            if missing_bars > 0:
-                gap = GapInfo(
-                    start=gap_start,
-                    end=gap_end,
-                    expected_bars=expected_bars,
-                    actual_bars=actual_bars,
-                    missing_bars=missing_bars,
-                )
-                report.gaps.append(gap)
-                report.total_gap_bars += missing_bars
+        index = df.index
+        if self.calendar is not None:
+            # Count only the session bars the calendar expects between neighbours
+            if not index.is_monotonic_increasing:
+                index = index.sort_values()
+            missing = self.calendar.missing_between(index, self.expected_frequency)
+        else:
+            # Any interval longer than 1.5 bars is a gap
+            expected_ns = pd.Timedelta(self.expected_frequency).value
+            diffs = np.diff(index.asi8)
+            missing = np.zeros(len(index), dtype=np.int64)
+            missing[1:] = np.where(diffs > expected_ns * 1.5, diffs // expected_ns - 1, 0)
+
+        for pos in np.flatnonzero(missing > 0):
+            gap = GapInfo(
+                start=index[pos - 1],
+                end=index[pos],
+                expected_bars=int(missing[pos]) + 1,
+                actual_bars=1,  # We only have start and end
+                missing_bars=int(missing[pos]),
+            )
+            report.gaps.append(gap)
+            report.total_gap_bars += gap.missing_bars
 
         if report.gaps:
             report.issues.append(
@@ -400,17 +397,19 @@ class DataQualityValidator:
 def detect_gaps(
     df: pd.DataFrame,
     expected_frequency: str = "1min",
+    calendar: Optional[SessionCalendar] = None,
 ) -> list[GapInfo]:
     """Detect gaps in timestamps.
 
     Args:
         df: DataFrame with datetime index
         expected_frequency: Expected bar frequency
+        calendar: Exchange session calendar for session-aware detection
 
     Returns:
         List of detected gaps
     """
-    validator = DataQualityValidator(expected_frequency=expected_frequency)
+    validator = DataQualityValidator(expected_frequency=expected_frequency, calendar=calendar)
     report = validator.validate(df)
     return report.gaps
 
@@ -438,6 +437,7 @@ def generate_quality_report(
     symbol: str = "UNKNOWN",
     expected_frequency: str = "1min",
     outlier_threshold: float = 0.10,
+    calendar: Optional[SessionCalendar] = None,
 ) -> DataQualityReport:
     """Generate a comprehensive data quality report.
 
@@ -446,6 +446,7 @@ def generate_quality_report(
         symbol: Symbol name for the report
         expected_frequency: Expected bar frequency
         outlier_threshold: Price change threshold for outlier detection
+        calendar: Exchange session calendar for session-aware gap detection
 
     Returns:
         DataQualityReport with all validation results
@@ -453,5 +454,6 @@ def generate_quality_report(
     validator = DataQualityValidator(
         expected_frequency=expected_frequency,
         outlier_threshold=outlier_threshold,
+        calendar=calendar,
     )
     return validator.validate(df, symbol)
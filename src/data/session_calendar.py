@@ -0,0 +1,595 @@
+"""Exchange session calendar and vectorized expected-bar index.
+
+Gap detection that only looks at the spacing between stored bars treats
+every overnight break, weekend and exchange holiday as missing data.
+``SessionCalendar`` precomputes the US equity (NYSE) trading sessions --
+weekends, full-day holidays, early closes and optional pre/post market --
+as compact arrays of per-session open/close epoch nanoseconds, and
+answers "which bars should exist in this range" and "which of them are
+missing" with array operations instead of per-bar Python loops.
+
+Bars are identified by the start of their UTC bucket (naive UTC, the way
+the database stores them), floored on the UTC epoch like the aggregator
+does, so ``5Min``/``15Min``/``1Hour`` buckets line up with the bars that
+``TimeframeAggregator`` writes.  ``1Day`` bars are compared by session
+date.
+
+Holiday rules are built in (no calendar dependency) and cover
+``FIRST_YEAR``..``LAST_YEAR``; ranges outside that raise ``ValueError``.
+
+Usage::
+
+    from src.data.session_calendar import get_session_calendar
+
+    calendar = get_session_calendar()
+    missing = calendar.missing(df.index, "1Min", start, end)
+    gaps = calendar.missing_ranges(df.index, "1Min", start, end)
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+EXCHANGE_TIMEZONE = "America/New_York"
+
+# Years covered by the precomputed session arrays
+FIRST_YEAR = 2000
+LAST_YEAR = 2050
+
+# Session boundaries in exchange-local time
+REGULAR_OPEN = timedelta(hours=9, minutes=30)
+REGULAR_CLOSE = timedelta(hours=16)
+EARLY_CLOSE = timedelta(hours=13)
+PRE_MARKET_OPEN = timedelta(hours=4)
+POST_MARKET_CLOSE = timedelta(hours=20)
+EARLY_POST_MARKET_CLOSE = timedelta(hours=17)
+
+# Unscheduled full-day closures (national days of mourning, weather, 9/11)
+SPECIAL_CLOSURES = frozenset({
+    date(2001, 9, 11), date(2001, 9, 12), date(2001, 9, 13), date(2001, 9, 14),
+    date(2004, 6, 11),
+    date(2007, 1, 2),
+    date(2012, 10, 29), date(2012, 10, 30),
+    date(2018, 12, 5),
+    date(2025, 1, 9),
+})
+
+# Bar width of each repository timeframe, in minutes
+TIMEFRAME_MINUTES = {"1Min": 1, "5Min": 5, "15Min": 15, "1Hour": 60, "1Day": 1440}
+
+_NS_PER_MINUTE = 60 * 1_000_000_000
+_NS_PER_DAY = 1440 * _NS_PER_MINUTE
+
+# Largest dense slot grid (bars) used for expected-vs-actual lookups;
+# longer spans fall back to binary search
+_MAX_GRID_SLOTS = 50_000_000
+
+TimestampLike = Union[datetime, pd.Timestamp, str]
+
+
+@dataclass
+class MissingRange:
+    """A run of consecutive expected bars with no stored data."""
+
+    start: pd.Timestamp
+    end: pd.Timestamp
+    missing_bars: int
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The ``n``-th ``weekday`` (Mon=0) of a month; ``n=-1`` for the last."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday ones on Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year: int) -> set[date]:
+    """Full-day NYSE closures for a year.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Set of weekday dates on which the exchange is closed
+    """
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),   # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),   # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),   # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),
+    }
+    # New Year's Day falling on a Saturday is not observed on the prior Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    holidays.update(d for d in SPECIAL_CLOSURES if d.year == year)
+    return holidays
+
+
+def nyse_early_closes(year: int) -> set[date]:
+    """Sessions that close at 13:00 exchange time.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Set of dates with an early close
+    """
+    early = {_nth_weekday(year, 11, 3, 4) + timedelta(days=1)}  # day after Thanksgiving
+    for day in (date(year, 7, 3), date(year, 12, 24)):
+        # Only when the holiday itself falls on a weekday after it
+        if day.weekday() <= 3:
+            early.add(day)
+    return early - nyse_holidays(year)
+
+
+def _to_ns(value: TimestampLike) -> int:
+    """Epoch nanoseconds of a naive-UTC or tz-aware timestamp."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.as_unit("ns").value
+
+
+def _index_ns(index) -> np.ndarray:
+    """Sorted epoch nanoseconds of a (naive-UTC or tz-aware) DatetimeIndex."""
+    index = pd.DatetimeIndex(index)
+    ns = index.as_unit("ns").asi8
+    if not index.is_monotonic_increasing:
+        ns = np.sort(ns)
+    return ns
+
+
+def _ns_to_index(ns: np.ndarray) -> pd.DatetimeIndex:
+    """Naive-UTC DatetimeIndex from epoch nanoseconds."""
+    return pd.DatetimeIndex(ns.astype("datetime64[ns]"))
+
+
+def timeframe_step_ns(timeframe: str) -> int:
+    """Bar width in nanoseconds for a timeframe or pandas frequency alias.
+
+    Args:
+        timeframe: Repository timeframe (``1Min``, ``1Hour`` ...) or a
+            pandas offset alias (``1min``, ``5min`` ...)
+
+    Returns:
+        Bar width in nanoseconds
+    """
+    if timeframe in TIMEFRAME_MINUTES:
+        return TIMEFRAME_MINUTES[timeframe] * _NS_PER_MINUTE
+    return pd.Timedelta(pd.tseries.frequencies.to_offset(timeframe)).value
+
+
+class SessionCalendar:
+    """Precomputed exchange sessions with vectorized expected-bar queries.
+
+    Sessions are stored as sorted ``int64`` arrays of UTC open and close
+    epoch nanoseconds (one entry per trading day), so expected bars for
+    any range are materialized with ``np.repeat``/``np.arange`` and
+    compared against stored bars on a dense per-bar slot grid.
+    """
+
+    def __init__(
+        self,
+        extended_hours: bool = False,
+        first_year: int = FIRST_YEAR,
+        last_year: int = LAST_YEAR,
+    ):
+        """Initialize the calendar.
+
+        Args:
+            extended_hours: Include pre-market (04:00) and post-market
+                (until 20:00, 17:00 on early-close days) in each session
+            first_year: First calendar year covered
+            last_year: Last calendar year covered
+        """
+        self.extended_hours = extended_hours
+        self.first_year = first_year
+        self.last_year = last_year
+
+        days = pd.date_range(date(first_year, 1, 1), date(last_year, 12, 31), freq="D")
+        days = days[days.dayofweek < 5]
+        holidays, early = set(), set()
+        for year in range(first_year, last_year + 1):
+            holidays |= nyse_holidays(year)
+            early |= nyse_early_closes(year)
+        days = days[~days.isin(pd.DatetimeIndex(sorted(holidays)))]
+        is_early = days.isin(pd.DatetimeIndex(sorted(early)))
+
+        if extended_hours:
+            open_offset = pd.Timedelta(PRE_MARKET_OPEN)
+            close_offset, early_offset = POST_MARKET_CLOSE, EARLY_POST_MARKET_CLOSE
+        else:
+            open_offset = pd.Timedelta(REGULAR_OPEN)
+            close_offset, early_offset = REGULAR_CLOSE, EARLY_CLOSE
+        close_offsets = np.where(is_early, pd.Timedelta(early_offset).value, pd.Timedelta(close_offset).value)
+
+        self.session_dates = days.as_unit("ns").asi8
+        self.opens = self._local_to_utc_ns(days + open_offset)
+        self.closes = self._local_to_utc_ns(days + pd.to_timedelta(close_offsets))
+        self.early_close = np.asarray(is_early)
+        self._coverage = (
+            _to_ns(datetime(first_year, 1, 1)),
+            _to_ns(datetime(last_year + 1, 1, 1)),
+        )
+        logger.debug(
+            "SessionCalendar built: %d sessions %d-%d (extended_hours=%s)",
+            len(self.opens), first_year, last_year, extended_hours,
+        )
+
+    @staticmethod
+    def _local_to_utc_ns(local: pd.DatetimeIndex) -> np.ndarray:
+        """Exchange wall-clock times to UTC epoch nanoseconds."""
+        return local.tz_localize(EXCHANGE_TIMEZONE).tz_convert("UTC").as_unit("ns").asi8
+
+    def covers(self, start: TimestampLike, end: TimestampLike) -> bool:
+        """Whether ``[start, end]`` lies within the precomputed years.
+
+        Args:
+            start: Range start
+            end: Range end
+
+        Returns:
+            True if queries over the range will not raise
+        """
+        return self._coverage[0] <= _to_ns(start) and _to_ns(end) <= self._coverage[1]
+
+    def _check_range(self, start_ns: int, end_ns: int) -> None:
+        if start_ns < self._coverage[0] or end_ns > self._coverage[1]:
+            raise ValueError(
+                f"Range outside session calendar coverage "
+                f"({self.first_year}-{self.last_year})"
+            )
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def is_session(self, day: Union[date, TimestampLike]) -> bool:
+        """Whether the exchange trades on a date.
+
+        Args:
+            day: Date (or timestamp whose date is used)
+
+        Returns:
+            True for trading days
+        """
+        ns = pd.Timestamp(day).normalize().as_unit("ns").value
+        pos = np.searchsorted(self.session_dates, ns)
+        return bool(pos < len(self.session_dates) and self.session_dates[pos] == ns)
+
+    def sessions(self, start: TimestampLike, end: TimestampLike) -> pd.DataFrame:
+        """Sessions that overlap ``[start, end]``.
+
+        Args:
+            start: Range start (naive UTC or tz-aware)
+            end: Range end (inclusive)
+
+        Returns:
+            DataFrame indexed by session date with naive-UTC ``open`` and
+            ``close`` columns and an ``early_close`` flag
+        """
+        lo, hi = self._session_slice(_to_ns(start), _to_ns(end))
+        return pd.DataFrame(
+            {
+                "open": _ns_to_index(self.opens[lo:hi]),
+                "close": _ns_to_index(self.closes[lo:hi]),
+                "early_close": self.early_close[lo:hi],
+            },
+            index=_ns_to_index(self.session_dates[lo:hi]),
+        )
+
+    def _session_slice(self, start_ns: int, end_ns: int) -> tuple[int, int]:
+        """Positions of the sessions overlapping ``[start_ns, end_ns]``."""
+        self._check_range(start_ns, end_ns)
+        lo = int(np.searchsorted(self.closes, start_ns, side="right"))
+        hi = int(np.searchsorted(self.opens, end_ns, side="right"))
+        return lo, max(lo, hi)
+
+    # ------------------------------------------------------------------
+    # Expected bars
+    # ------------------------------------------------------------------
+
+    def expected_ns(self, timeframe: str, start: TimestampLike, end: TimestampLike) -> np.ndarray:
+        """Sorted epoch nanoseconds of every bar expected in ``[start, end]``.
+
+        Args:
+            timeframe: Bar timeframe (``1Min`` ... ``1Day``) or pandas alias
+            start: Range start (naive UTC or tz-aware)
+            end: Range end (inclusive)
+
+        Returns:
+            ``int64`` array of bar start times (session dates for ``1Day``)
+        """
+        start_ns, end_ns = _to_ns(start), _to_ns(end)
+        if end_ns < start_ns:
+            return np.empty(0, dtype=np.int64)
+        step = timeframe_step_ns(timeframe)
+
+        if step >= _NS_PER_DAY:
+            self._check_range(start_ns, end_ns)
+            dates = self.session_dates
+            lo = np.searchsorted(dates, start_ns - start_ns % _NS_PER_DAY, side="left")
+            hi = np.searchsorted(dates, end_ns, side="right")
+            return dates[lo:hi]
+
+        lo, hi = self._session_slice(start_ns, end_ns)
+        opens, closes = self.opens[lo:hi], self.closes[lo:hi]
+        first = opens - opens % step
+        last = (closes - 1) - (closes - 1) % step
+        counts = (last - first) // step + 1
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Bucket k of session s is first[s] + k * step
+        offsets = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+        expected = np.repeat(first, counts) + offsets * step
+        lo_bar = start_ns - start_ns % step
+        return expected[(expected >= lo_bar) & (expected <= end_ns)]
+
+    def expected_index(self, timeframe: str, start: TimestampLike, end: TimestampLike) -> pd.DatetimeIndex:
+        """Naive-UTC DatetimeIndex of every bar expected in ``[start, end]``.
+
+        Args:
+            timeframe: Bar timeframe or pandas alias
+            start: Range start
+            end: Range end (inclusive)
+
+        Returns:
+            Expected bar timestamps
+        """
+        return _ns_to_index(self.expected_ns(timeframe, start, end))
+
+    def expected_count(self, timeframe: str, start: TimestampLike, end: TimestampLike) -> int:
+        """Number of bars expected in ``[start, end]``.
+
+        Args:
+            timeframe: Bar timeframe or pandas alias
+            start: Range start
+            end: Range end (inclusive)
+
+        Returns:
+            Expected bar count
+        """
+        return len(self.expected_ns(timeframe, start, end))
+
+    def first_expected(
+        self, timeframe: str, start: TimestampLike, end: TimestampLike,
+    ) -> Optional[pd.Timestamp]:
+        """Earliest expected bar in ``[start, end]``, or None if there is none.
+
+        Args:
+            timeframe: Bar timeframe or pandas alias
+            start: Range start
+            end: Range end (inclusive)
+
+        Returns:
+            Naive-UTC timestamp of the first expected bar
+        """
+        start_ns, end_ns = _to_ns(start), _to_ns(end)
+        if end_ns < start_ns:
+            return None
+        step = timeframe_step_ns(timeframe)
+        if step >= _NS_PER_DAY:
+            expected = self.expected_ns(timeframe, start, end)
+            return pd.Timestamp(expected[0]) if len(expected) else None
+        lo, hi = self._session_slice(start_ns, end_ns)
+        if lo == hi:
+            return None
+        first_ns = max(int(self.opens[lo]), start_ns)
+        first_ns -= first_ns % step
+        return pd.Timestamp(first_ns) if first_ns <= end_ns else None
+
+    # ------------------------------------------------------------------
+    # Expected vs actual
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _bucket_ns(ns: np.ndarray, step: int) -> np.ndarray:
+        """Bucket keys of sorted stored-bar times, comparable to ``expected_ns``."""
+        if step >= _NS_PER_DAY:
+            # Daily bars are stamped at UTC midnight or at the exchange's
+            # local midnight (04:00/05:00 UTC); both floor to the session date
+            step = _NS_PER_DAY
+        return ns - ns % step
+
+    def missing_ns(
+        self,
+        index,
+        timeframe: str,
+        start: Optional[TimestampLike] = None,
+        end: Optional[TimestampLike] = None,
+    ) -> np.ndarray:
+        """Expected bars in ``[start, end]`` that are absent from ``index``.
+
+        Args:
+            index: Stored bar timestamps (naive UTC or tz-aware)
+            timeframe: Bar timeframe or pandas alias
+            start: Range start (default: first stored bar)
+            end: Range end, inclusive (default: last stored bar)
+
+        Returns:
+            Sorted ``int64`` epoch nanoseconds of the missing bars
+        """
+        step = timeframe_step_ns(timeframe)
+        ns = _index_ns(index)
+        if start is None or end is None:
+            if len(ns) == 0:
+                return np.empty(0, dtype=np.int64)
+            start = ns[0] if start is None else start
+            end = ns[-1] if end is None else end
+        expected = self.expected_ns(timeframe, pd.Timestamp(start), pd.Timestamp(end))
+        if len(ns) == 0 or len(expected) == 0:
+            return expected
+        actual = self._bucket_ns(ns, step)
+        step = min(step, _NS_PER_DAY)
+        lo = int(expected[0])
+        slots = (int(expected[-1]) - lo) // step + 1
+        if slots > _MAX_GRID_SLOTS:
+            pos = np.searchsorted(actual, expected)
+            present = actual[np.minimum(pos, len(actual) - 1)] == expected
+            return expected[~present]
+
+        # Mark stored bars on a dense slot grid, then look expected bars up in it
+        grid = np.zeros(slots, dtype=bool)
+        k = (actual - lo) // step
+        grid[k[(k >= 0) & (k < slots)]] = True
+        return expected[~grid[(expected - lo) // step]]
+
+    def missing(
+        self,
+        index,
+        timeframe: str,
+        start: Optional[TimestampLike] = None,
+        end: Optional[TimestampLike] = None,
+    ) -> pd.DatetimeIndex:
+        """Expected bars in ``[start, end]`` that are absent from ``index``.
+
+        Args:
+            index: Stored bar timestamps
+            timeframe: Bar timeframe or pandas alias
+            start: Range start (default: first stored bar)
+            end: Range end, inclusive (default: last stored bar)
+
+        Returns:
+            Naive-UTC DatetimeIndex of missing bars
+        """
+        return _ns_to_index(self.missing_ns(index, timeframe, start, end))
+
+    def missing_ranges(
+        self,
+        index,
+        timeframe: str,
+        start: Optional[TimestampLike] = None,
+        end: Optional[TimestampLike] = None,
+    ) -> list[MissingRange]:
+        """Group missing bars into runs of consecutive expected bars.
+
+        A run never spans a stored bar, but does span session breaks: the
+        last bars of one session and the first bars of the next form a
+        single run when nothing is stored in between.
+
+        Args:
+            index: Stored bar timestamps
+            timeframe: Bar timeframe or pandas alias
+            start: Range start (default: first stored bar)
+            end: Range end, inclusive (default: last stored bar)
+
+        Returns:
+            List of MissingRange, oldest first
+        """
+        step = timeframe_step_ns(timeframe)
+        actual = self._bucket_ns(_index_ns(index), step)
+        missing = self.missing_ns(index, timeframe, start, end)
+        if len(missing) == 0:
+            return []
+
+        # Consecutive missing bars belong to one run unless a stored bar sits between them
+        between = np.searchsorted(actual, missing, side="right")
+        breaks = np.flatnonzero(np.diff(between) != 0) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [len(missing)])) - 1
+        return [
+            MissingRange(
+                start=pd.Timestamp(missing[s]),
+                end=pd.Timestamp(missing[e]),
+                missing_bars=int(e - s + 1),
+            )
+            for s, e in zip(starts, ends)
+        ]
+
+    def missing_between(self, index, timeframe: str) -> np.ndarray:
+        """Expected bars strictly between each stored bar and the one before it.
+
+        Args:
+            index: Sorted stored bar timestamps
+            timeframe: Bar timeframe or pandas alias
+
+        Returns:
+            ``int64`` array aligned with ``index`` (0 for the first bar);
+            overnight and weekend breaks count 0, a missing session counts
+            all of its bars
+        """
+        step = timeframe_step_ns(timeframe)
+        actual = self._bucket_ns(_index_ns(index), step)
+        result = np.zeros(len(actual), dtype=np.int64)
+        if len(actual) < 2:
+            return result
+        expected = self.expected_ns(timeframe, pd.Timestamp(actual[0]), pd.Timestamp(actual[-1]))
+        step = min(step, _NS_PER_DAY)
+        lo = int(actual[0])
+        slots = (int(actual[-1]) - lo) // step + 1
+        if slots > _MAX_GRID_SLOTS:
+            after_prev = np.searchsorted(expected, actual[:-1], side="right")
+            before_cur = np.searchsorted(expected, actual[1:], side="left")
+            result[1:] = np.maximum(before_cur - after_prev, 0)
+            return result
+
+        # Running count of expected slots; the difference between neighbours'
+        # positions (excluding both ends) is what the stored data skips
+        grid = np.zeros(slots, dtype=np.int32)
+        grid[(expected - lo) // step] = 1
+        seen = np.cumsum(grid, dtype=np.int32)
+        k = (actual - lo) // step
+        result[1:] = np.maximum(seen[k[1:]] - grid[k[1:]] - seen[k[:-1]], 0)
+        return result
+
+
+_calendars: dict[bool, SessionCalendar] = {}
+_calendars_lock = threading.Lock()
+
+
+def get_session_calendar(extended_hours: bool = False) -> SessionCalendar:
+    """Shared SessionCalendar instance (built once per process).
+
+    Args:
+        extended_hours: Whether sessions include pre/post market
+
+    Returns:
+        SessionCalendar
+    """
+    with _calendars_lock:
+        calendar = _calendars.get(extended_hours)
+        if calendar is None:
+            calendar = _calendars[extended_hours] = SessionCalendar(extended_hours=extended_hours)
+        return calendar
@@ -20,9 +20,10 @@ Usage (CLI)::
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Optional
 
+import numpy as np
 import pandas as pd
 
 from src.data.database.connection import DatabaseManager, get_db_manager
@@ -40,6 +41,227 @@ INTRADAY_AGGREGATABLE = ["15Min", "1Hour"]
 # Default list of target timeframes to fill
 DEFAULT_TARGET_TIMEFRAMES = ["15Min", "1Hour", "1Day"]
 
+# Bucket width of each intraday target, in minutes
+TIMEFRAME_MINUTES = {"5Min": 5, "15Min": 15, "1Hour": 60}
+
+_OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+_NS_PER_MINUTE = 60 * 1_000_000_000
+
+
+def _utc_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    """Epoch nanoseconds of a (naive-UTC or tz-aware) DatetimeIndex."""
+    return index.as_unit("ns").asi8
+
+
+def _to_index(ns: np.ndarray, tz) -> pd.DatetimeIndex:
+    """Rebuild a DatetimeIndex from epoch nanoseconds in the source timezone."""
+    if tz is None:
+        return pd.DatetimeIndex(ns.astype("datetime64[ns]"))
+    return pd.DatetimeIndex(ns, tz="UTC").tz_convert(tz)
+
+
+def _reduce_buckets(bars: dict[str, np.ndarray], step_ns: int) -> dict[str, np.ndarray]:
+    """Reduce time-sorted bars into ``step_ns`` buckets with OHLCV rules."""
+    bucket = bars["ts"] // step_ns
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(bucket)] - 1
+    return {
+        "ts": bucket[starts] * step_ns,
+        "open": bars["open"][starts],
+        "high": np.maximum.reduceat(bars["high"], starts),
+        "low": np.minimum.reduceat(bars["low"], starts),
+        "close": bars["close"][ends],
+        "volume": np.add.reduceat(bars["volume"], starts),
+    }
+
+
+def aggregate_ohlcv_multi(
+    df_1min: pd.DataFrame,
+    target_timeframes: list[str],
+) -> dict[str, pd.DataFrame]:
+    """Aggregate 1Min bars into several intraday timeframes in one pass.
+
+    Produces the same bars as :func:`aggregate_ohlcv` for each target,
+    but sorts the input once and builds each target from the finest
+    already-computed timeframe that divides it (1Min -> 5Min -> 15Min ->
+    1Hour), so each level only touches the bars of the one below.
+
+    Buckets are floored on UTC epoch time, which matches the naive-UTC
+    timestamps stored in the database.  A DST change therefore never
+    moves bucket edges or folds two local hours into one bar, and a
+    bucket can never span an overnight or weekend gap.
+
+    Args:
+        df_1min: 1-minute OHLCV bars with a datetime index.  Rows with a
+            missing price are ignored; duplicate timestamps keep the first.
+        target_timeframes: Targets from ``TIMEFRAME_MINUTES``.
+
+    Returns:
+        Mapping of ``timeframe -> aggregated DataFrame``.
+
+    Raises:
+        ValueError: If a target is not an intraday aggregatable timeframe.
+    """
+    unknown = [tf for tf in target_timeframes if tf not in TIMEFRAME_MINUTES]
+    if unknown:
+        raise ValueError(f"Cannot aggregate to {unknown}")
+
+    df = df_1min[_OHLCV_COLUMNS].dropna(subset=["open", "high", "low", "close"])
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind="stable")
+    if df.index.has_duplicates:
+        df = df[~df.index.duplicated(keep="first")]
+    if df.empty:
+        return {tf: pd.DataFrame(columns=_OHLCV_COLUMNS) for tf in target_timeframes}
+
+    levels = {1: {"ts": _utc_ns(df.index), **{col: df[col].to_numpy() for col in _OHLCV_COLUMNS}}}
+    for minutes in sorted({TIMEFRAME_MINUTES[tf] for tf in target_timeframes}):
+        source = max(m for m in levels if minutes % m == 0)
+        levels[minutes] = _reduce_buckets(levels[source], minutes * _NS_PER_MINUTE)
+
+    result = {}
+    for tf in target_timeframes:
+        bars = levels[TIMEFRAME_MINUTES[tf]]
+        result[tf] = pd.DataFrame(
+            {col: bars[col] for col in _OHLCV_COLUMNS},
+            index=_to_index(bars["ts"], df.index.tz),
+        )
+    return result
+
+
+class StreamingBarAggregator:
+    """Incrementally build higher-timeframe bars from streaming 1Min bars.
+
+    Keeps one open (partial) bar per target timeframe.  Each new 1Min bar
+    updates every open bar in O(1); when a bar arrives in a later bucket
+    the open bar is emitted as complete and a new one starts.  Buckets
+    follow :func:`aggregate_ohlcv_multi`, so streaming a day and flushing
+    gives the same bars as aggregating it in one batch.
+
+    Usage::
+
+        agg = StreamingBarAggregator(["5Min", "1Hour"])
+        for ts, bar in feed:
+            for timeframe, completed in agg.update(ts, *bar).items():
+                ...
+        remaining = agg.flush()
+    """
+
+    def __init__(self, target_timeframes: Optional[list[str]] = None):
+        """Initialize the aggregator.
+
+        Args:
+            target_timeframes: Targets from ``TIMEFRAME_MINUTES``.
+                Defaults to every intraday aggregatable timeframe.
+        """
+        self.target_timeframes = list(target_timeframes or AGGREGATABLE_TIMEFRAMES)
+        unknown = [tf for tf in self.target_timeframes if tf not in TIMEFRAME_MINUTES]
+        if unknown:
+            raise ValueError(f"Cannot aggregate to {unknown}")
+        self._steps = {tf: TIMEFRAME_MINUTES[tf] * _NS_PER_MINUTE for tf in self.target_timeframes}
+        # Open bar per timeframe: [bucket_ns, open, high, low, close, volume]
+        self._open: dict[str, list] = {}
+        self._last_ns: Optional[int] = None
+        self._tz = None
+
+    def update(
+        self,
+        timestamp,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> dict[str, pd.DataFrame]:
+        """Apply one 1Min bar.
+
+        Bars at or before the last applied timestamp are ignored (an open
+        bar cannot be un-applied).
+
+        Args:
+            timestamp: Bar start (naive UTC or tz-aware)
+            open: Open price
+            high: High price
+            low: Low price
+            close: Close price
+            volume: Volume
+
+        Returns:
+            Bars completed by this update, keyed by timeframe (only
+            timeframes with a completed bar are present).
+        """
+        ts = pd.Timestamp(timestamp)
+        ns = ts.value
+        if self._last_ns is not None and ns <= self._last_ns:
+            logger.debug("Ignoring out-of-order 1Min bar at %s", ts)
+            return {}
+        self._last_ns = ns
+        self._tz = ts.tz
+
+        completed = {}
+        for tf, step in self._steps.items():
+            bucket = ns // step * step
+            bar = self._open.get(tf)
+            if bar is not None and bar[0] == bucket:
+                bar[2] = max(bar[2], high)
+                bar[3] = min(bar[3], low)
+                bar[4] = close
+                bar[5] += volume
+                continue
+            if bar is not None:
+                completed[tf] = self._frame([bar])
+            self._open[tf] = [bucket, open, high, low, close, volume]
+        return completed
+
+    def update_frame(self, df_1min: pd.DataFrame) -> dict[str, pd.DataFrame]:
+        """Apply a block of 1Min bars with one vectorized pass.
+
+        Equivalent to calling :meth:`update` for every row.
+
+        Returns:
+            Completed bars per target timeframe (possibly empty frames).
+        """
+        df = df_1min[_OHLCV_COLUMNS].dropna(subset=["open", "high", "low", "close"]).sort_index(kind="stable")
+        if self._last_ns is not None:
+            df = df[_utc_ns(df.index) > self._last_ns]
+        if df.empty:
+            return {tf: pd.DataFrame(columns=_OHLCV_COLUMNS) for tf in self.target_timeframes}
+        self._last_ns = int(_utc_ns(df.index)[-1])
+        self._tz = df.index.tz
+
+        fresh = aggregate_ohlcv_multi(df, self.target_timeframes)
+        completed = {}
+        for tf, agg in fresh.items():
+            rows = [[int(ns), *row] for ns, row in zip(_utc_ns(agg.index), agg.itertuples(index=False))]
+            bar = self._open.get(tf)
+            if bar is not None and bar[0] == rows[0][0]:
+                first = rows[0]
+                rows[0] = [bar[0], bar[1], max(bar[2], first[2]), min(bar[3], first[3]), first[4], bar[5] + first[5]]
+            elif bar is not None:
+                rows.insert(0, bar)
+            self._open[tf] = rows[-1]
+            completed[tf] = self._frame(rows[:-1])
+        return completed
+
+    def partial_bars(self) -> dict[str, pd.DataFrame]:
+        """Return the open (still forming) bar of each timeframe."""
+        return {tf: self._frame([bar]) for tf, bar in self._open.items()}
+
+    def flush(self) -> dict[str, pd.DataFrame]:
+        """Emit and clear the open bars (e.g. at the session close)."""
+        partial = self.partial_bars()
+        self._open.clear()
+        return partial
+
+    def _frame(self, rows: list[list]) -> pd.DataFrame:
+        if not rows:
+            return pd.DataFrame(columns=_OHLCV_COLUMNS)
+        arr = list(zip(*rows))
+        return pd.DataFrame(
+            dict(zip(_OHLCV_COLUMNS, arr[1:])),
+            index=_to_index(np.asarray(arr[0], dtype=np.int64), self._tz),
+        )
+
 
 class TimeframeAggregator:
     """Build higher-timeframe OHLCV bars from existing 1Min data.
@@ -102,11 +324,17 @@ class TimeframeAggregator:
         results: dict[str, int] = {}
 
         with grpc_market_client() as repo:
+            # All intraday targets share one read of the 1Min range
+            intraday = [tf for tf in target_timeframes if tf in AGGREGATABLE_TIMEFRAMES]
+            intraday_counts = (
+                self._aggregate_intraday_targets(repo, symbol, intraday) if intraday else {}
+            )
+
             for timeframe in target_timeframes:
                 if timeframe == "1Day":
                     count = self._aggregate_daily(repo, symbol)
                 elif timeframe in AGGREGATABLE_TIMEFRAMES:
-                    count = self._aggregate_intraday(repo, symbol, timeframe)
+                    count = intraday_counts[timeframe]
                 else:
                     logger.warning(
                         "Timeframe %s is not aggregatable, skipping", timeframe
@@ -130,9 +358,6 @@ class TimeframeAggregator:
     ) -> int:
         """Aggregate 1Min bars into *target_timeframe* bars.
 
-        Only processes 1Min bars that are newer than the latest existing
-        bar of the target timeframe so that repeated runs are cheap.
-
         Args:
             repo: Repository bound to the current session.
             symbol: Normalized stock symbol.
@@ -141,63 +366,33 @@ class TimeframeAggregator:
         Returns:
             Number of new bars inserted.
         """
-        logger.debug(
-            "Aggregating 1Min -> %s for %s", target_timeframe, symbol
-        )
-
-        # Determine the starting point: only aggregate 1Min bars that
-        # are newer than the latest bar we already have for the target.
-        max_target_ts = repo.get_latest_timestamp(symbol, target_timeframe)
-        start_ts = self._normalize_ts(max_target_ts)
-
-        if start_ts is not None:
-            logger.debug(
-                "Latest %s bar for %s is at %s, fetching 1Min ticks after that",
-                target_timeframe, symbol, start_ts,
-            )
-
-        # Fetch 1Min bars from *start_ts* onward
-        df_1min = repo.get_bars(symbol, "1Min", start=start_ts)
-
-        if df_1min.empty:
-            logger.info(
-                "No new 1Min bars available for %s after %s, skipping %s aggregation",
-                symbol, start_ts, target_timeframe,
-            )
-            return 0
+        return self._aggregate_intraday_targets(repo, symbol, [target_timeframe])[target_timeframe]
 
-        # Resample
-        df_agg = aggregate_ohlcv(df_1min, target_timeframe)
-
-        if df_agg.empty:
-            logger.info(
-                "Aggregation produced no %s bars for %s", target_timeframe, symbol
-            )
-            return 0
+    def _aggregate_intraday_targets(
+        self,
+        repo,
+        symbol: str,
+        target_timeframes: list[str],
+    ) -> dict[str, int]:
+        """Aggregate new 1Min bars into several intraday timeframes.
 
-        # Persist (upsert / ON CONFLICT DO NOTHING)
-        ticker_obj = repo.get_or_create_ticker(symbol)
-        rows_inserted = repo.bulk_insert_bars(
-            df=df_agg,
-            ticker_id=ticker_obj.id,
-            timeframe=target_timeframe,
-            source="aggregated",
-        )
+        Reads the 1Min bars once, starting at the oldest of the targets'
+        latest bars, and rebuilds each target's latest (possibly partial)
+        bar along with any new ones.
 
-        if rows_inserted > 0:
-            repo.update_sync_log(
-                ticker_id=ticker_obj.id,
-                timeframe=target_timeframe,
-                last_synced_timestamp=df_agg.index.max(),
-                first_synced_timestamp=df_agg.index.min(),
-                bars_fetched=rows_inserted,
-                status="success",
-            )
+        Args:
+            repo: Repository bound to the current session.
+            symbol: Normalized stock symbol.
+            target_timeframes: Intraday targets to fill.
 
-        logger.info(
-            "Aggregated %d new %s bars for %s", rows_inserted, target_timeframe, symbol
+        Returns:
+            Mapping of ``{timeframe: new_bars_inserted}``.
+        """
+        logger.debug(
+            "Aggregating 1Min -> %s for %s", target_timeframes, symbol
         )
-        return rows_inserted
+        ticker_obj = repo.get_or_create_ticker(symbol)
+        return self.aggregate_intraday_incremental(repo, ticker_obj, symbol, target_timeframes)
 
     # ------------------------------------------------------------------
     # Daily bar fetching
@@ -351,6 +546,120 @@ class TimeframeAggregator:
             logger.warning("Aggregation produced no %s bars", target_timeframe)
             return 0
 
+        return TimeframeAggregator._insert_aggregated(repo, ticker, df_agg, target_timeframe)
+
+    @staticmethod
+    def aggregate_intraday_incremental(
+        repo,
+        ticker,
+        symbol: str,
+        target_timeframes: list[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        latest: Optional[dict[str, Optional[datetime]]] = None,
+    ) -> dict[str, int]:
+        """Bring several intraday timeframes up to date from one streamed 1Min read.
+
+        Without *start*, only 1Min bars from the oldest of the targets'
+        latest bars onward are read, so repeated runs cost one bucket of
+        re-read per target rather than the whole history.  With *start*,
+        the range from *start* (floored to the hour so the first bucket is
+        complete) is re-aggregated, filling any holes.
+
+        Each target's latest stored bar may have been built from a
+        partial bucket; when the read covers that whole bucket it is
+        replaced with the recomputed bar (bulk inserts never overwrite).
+
+        Args:
+            repo: Repository bound to the current session.
+            ticker: Ticker database object (must have ``.id``).
+            symbol: Normalized stock symbol.
+            target_timeframes: Intraday targets from ``TIMEFRAME_MINUTES``.
+            start: Start of a range to re-aggregate (``None`` = incremental).
+            end: End of the 1Min range to read (inclusive).
+            latest: Pre-fetched latest bar timestamp per target (looked up
+                per target when omitted).
+
+        Returns:
+            Mapping of ``{timeframe: new_bars_inserted}``.
+        """
+        if latest is None:
+            latest = {tf: repo.get_latest_timestamp(symbol, tf) for tf in target_timeframes}
+        latest = {tf: TimeframeAggregator._normalize_ts(latest.get(tf)) for tf in target_timeframes}
+
+        if start is not None:
+            read_from = pd.Timestamp(TimeframeAggregator._normalize_ts(start)).floor("1h").to_pydatetime()
+        elif any(ts is None for ts in latest.values()):
+            read_from = None
+        else:
+            read_from = min(latest.values())
+
+        kwargs = {"start": read_from}
+        if end is not None:
+            kwargs["end"] = end
+
+        # Stream the 1Min range so only one chunk is held in memory
+        streamer = StreamingBarAggregator(target_timeframes)
+        parts: dict[str, list[pd.DataFrame]] = {tf: [] for tf in target_timeframes}
+        n_source = 0
+        for chunk in repo.iter_bars(symbol, "1Min", **kwargs):
+            if chunk.empty:
+                continue
+            n_source += len(chunk)
+            for tf, completed in streamer.update_frame(chunk).items():
+                parts[tf].append(completed)
+
+        if n_source == 0:
+            logger.info(
+                "No new 1Min bars available for %s after %s, skipping %s aggregation",
+                symbol, read_from, target_timeframes,
+            )
+            return {tf: 0 for tf in target_timeframes}
+
+        for tf, partial in streamer.flush().items():
+            parts[tf].append(partial)
+        aggregated = {
+            tf: pd.concat([p for p in parts[tf] if not p.empty] or [pd.DataFrame(columns=_OHLCV_COLUMNS)])
+            for tf in target_timeframes
+        }
+
+        result = {}
+        for tf in target_timeframes:
+            df_agg = aggregated[tf]
+            last = latest[tf]
+            replaced = False
+            if last is not None:
+                if start is None:
+                    df_agg = df_agg[df_agg.index >= last]
+                bucket_end = last + timedelta(minutes=TIMEFRAME_MINUTES[tf])
+                if last in df_agg.index and (end is None or end >= bucket_end):
+                    repo.delete_bars(symbol, tf, last, last)
+                    replaced = True
+
+            if df_agg.empty:
+                logger.info("Aggregation produced no %s bars for %s", tf, symbol)
+                result[tf] = 0
+                continue
+
+            rows_inserted = TimeframeAggregator._insert_aggregated(repo, ticker, df_agg, tf)
+            result[tf] = max(rows_inserted - 1, 0) if replaced else rows_inserted
+            logger.info(
+                "Aggregated %d new %s bars for %s", result[tf], tf, symbol
+            )
+        return result
+
+    @staticmethod
+    def _insert_aggregated(
+        repo,
+        ticker,
+        df_agg: pd.DataFrame,
+        target_timeframe: str,
+    ) -> int:
+        """Insert aggregated bars and record the sync.
+
+        Returns:
+            Number of rows inserted.
+        """
         rows_inserted = repo.bulk_insert_bars(
             df=df_agg,
             ticker_id=ticker.id,
@@ -10,12 +10,16 @@ delegates to the Go data-service via gRPC.
 
 import logging
 import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, Protocol, runtime_checkable
+from functools import partial
+from typing import Any, Callable, Optional, Protocol, runtime_checkable
 
 import pandas as pd
 
+from src.evaluators.context_cache import ContextCache
 from src.features.state.hmm.contracts import VALID_TIMEFRAMES
 
 logger = logging.getLogger(__name__)
@@ -102,18 +106,26 @@ class RepositoryMarketDataReader:
     """Default ``MarketDataReader`` backed by the Go data-service via gRPC.
 
     Creates a single gRPC channel that is reused across all method calls.
-    The channel is created lazily on first use.
+    The channel is created lazily on first use and is safe to share
+    between the builder's fetch threads.
     """
 
     def __init__(self, session=None):
         self._client = None
         self._channel = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self):
         """Get or create the gRPC market data client."""
         if self._client is not None:
             return self._client
+        with self._client_lock:
+            if self._client is None:
+                self._connect()
+        return self._client
 
+    def _connect(self) -> None:
+        """Open the gRPC channel and client."""
         import grpc
         from config.settings import get_settings
         from src.data.grpc_client import MarketDataGrpcClient
@@ -124,7 +136,6 @@ class RepositoryMarketDataReader:
             options=[("grpc.max_receive_message_length", 20 * 1024 * 1024)],
         )
         self._client = MarketDataGrpcClient(self._channel)
-        return self._client
 
     def get_bars(
         self,
@@ -423,6 +434,10 @@ class ContextPackBuilder:
 
     # Cache TTL in seconds
     CACHE_TTL = 60
+    # Maximum entries per cache (bars, features, regimes each get their own)
+    DEFAULT_CACHE_SIZE = 512
+    # Concurrent reader calls per builder (bars/features and regimes per timeframe)
+    DEFAULT_FETCH_WORKERS = 8
 
     def __init__(
         self,
@@ -432,6 +447,9 @@ class ContextPackBuilder:
         include_key_levels: bool = True,
         cache_enabled: bool = True,
         ensure_fresh_data: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float = CACHE_TTL,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
     ):
         """Initialize builder.
 
@@ -441,10 +459,15 @@ class ContextPackBuilder:
             include_features: Whether to include technical indicators
             include_regimes: Whether to include regime data
             include_key_levels: Whether to compute key levels
-            cache_enabled: Whether to cache context packs
+            cache_enabled: Whether to cache bars, features, and regimes
             ensure_fresh_data: If True, publish a MARKET_DATA_REQUEST via
                 the messaging bus before reading from the DB so that stale
                 data is refreshed.
+            cache_size: Maximum entries held by each of the bars,
+                features, and regimes caches
+            cache_ttl: Seconds a cached entry stays valid
+            fetch_workers: Threads used to issue reader calls
+                concurrently; 1 reads sequentially
         """
         self._reader = reader or RepositoryMarketDataReader()
         self.include_features = include_features
@@ -452,7 +475,13 @@ class ContextPackBuilder:
         self.include_key_levels = include_key_levels
         self.cache_enabled = cache_enabled
         self.ensure_fresh_data = ensure_fresh_data
-        self._cache: dict[str, tuple[datetime, ContextPack]] = {}
+        self._caches = {
+            kind: ContextCache(maxsize=cache_size, ttl=cache_ttl)
+            for kind in ("bars", "features", "regimes")
+        }
+        self.fetch_workers = fetch_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
     def build(
         self,
@@ -478,14 +507,8 @@ class ContextPackBuilder:
         point_in_time = as_of is not None
         as_of = as_of or datetime.utcnow()
 
-        # Check cache — include as_of in key for point-in-time queries
+        # Point-in-time reads are keyed by as_of; live reads share one key
         as_of_key = as_of.isoformat() if point_in_time else "live"
-        cache_key = f"{symbol}_{timeframe}_{lookback_bars}_{as_of_key}"
-        if self.cache_enabled and cache_key in self._cache:
-            cached_time, cached_pack = self._cache[cache_key]
-            if (datetime.utcnow() - cached_time).total_seconds() < self.CACHE_TTL:
-                logger.debug(f"Using cached ContextPack for {cache_key}")
-                return cached_pack
 
         # Request fresh data via messaging before reading from DB
         if self.ensure_fresh_data:
@@ -506,43 +529,30 @@ class ContextPackBuilder:
         # Use as_of as end bound for point-in-time queries
         end_filter = as_of if point_in_time else None
 
-        for tf in timeframes:
-            # Get OHLCV bars
-            df = self._reader.get_bars(symbol, tf, end=end_filter, limit=lookback_bars)
-            if not df.empty:
-                bars[tf] = df
-
-            # Get features
-            if self.include_features:
-                features_df = self._reader.get_features(symbol, tf, end=end_filter)
-                if not features_df.empty:
-                    # Align with bars
-                    if tf in bars:
-                        features_df = features_df[features_df.index.isin(bars[tf].index)]
-                    features[tf] = features_df.tail(lookback_bars)
-
-            # Get regime states
-            if self.include_regimes:
-                states_df = self._reader.get_latest_states(symbol, tf)
-                if not states_df.empty:
-                    latest = states_df.iloc[0]
-                    state_id = int(latest.get("state_id", -1))
-                    state_prob = float(latest.get("state_prob", 0.0))
-                    model_id = latest.get("model_id")
-
-                    state_label, transition_risk, entropy = self._load_regime_enrichment(
-                        symbol, tf, state_id, state_prob, model_id
-                    )
-
-                    regimes[tf] = RegimeContext(
-                        timeframe=tf,
-                        state_id=state_id,
-                        state_prob=state_prob,
-                        state_label=state_label,
-                        entropy=entropy,
-                        transition_risk=transition_risk,
-                        is_ood=state_id == -1,
-                    )
+        # Bars+features for each timeframe and each latest regime are
+        # independent round trips, so issue them all at once
+        timeframe_calls = [
+            partial(self._load_timeframe, symbol, tf, as_of_key, end_filter, lookback_bars)
+            for tf in timeframes
+        ]
+        regime_calls = [
+            partial(self._cached, "regimes", (symbol, tf), partial(self._load_regime, symbol, tf))
+            for tf in timeframes
+        ] if self.include_regimes else []
+        results = self._fetch_all(timeframe_calls + regime_calls)
+
+        for tf, (bars_df, features_df) in zip(timeframes, results[:len(timeframes)]):
+            if not bars_df.empty:
+                bars[tf] = bars_df
+            if features_df is not None and not features_df.empty:
+                # Align with bars
+                if tf in bars:
+                    features_df = features_df[features_df.index.isin(bars[tf].index)]
+                features[tf] = features_df.tail(lookback_bars)
+
+        for tf, regime in zip(timeframes, results[len(timeframes):]):
+            if regime is not None:
+                regimes[tf] = regime
 
         # Compute key levels
         key_levels = None
@@ -594,10 +604,6 @@ class ContextPackBuilder:
             mtfa=mtfa,
         )
 
-        # Cache result
-        if self.cache_enabled:
-            self._cache[cache_key] = (datetime.utcnow(), context)
-
         logger.debug(
             f"Built ContextPack for {symbol}/{timeframe}: "
             f"bars={len(bars)}, features={len(features)}, regimes={len(regimes)}"
@@ -605,6 +611,125 @@ class ContextPackBuilder:
 
         return context
 
+    def cache_stats(self) -> dict[str, dict]:
+        """Return hit/miss/eviction counters for each cache.
+
+        Returns:
+            Mapping of cache name (``bars``, ``features``, ``regimes``)
+            to ``CacheStats.to_dict()``
+        """
+        return {kind: cache.stats().to_dict() for kind, cache in self._caches.items()}
+
+    def clear_cache(self) -> None:
+        """Drop all cached bars, features, and regimes."""
+        for cache in self._caches.values():
+            cache.clear()
+
+    def close(self) -> None:
+        """Shut down the fetch thread pool, if one was started."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _fetch_all(self, calls: list[Callable[[], Any]]) -> list[Any]:
+        """Run independent reader calls concurrently, preserving order.
+
+        Args:
+            calls: Zero-argument callables
+
+        Returns:
+            Results in the same order as ``calls``
+        """
+        if self.fetch_workers <= 1 or len(calls) <= 1:
+            return [call() for call in calls]
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.fetch_workers, thread_name_prefix="context-fetch",
+                )
+            executor = self._executor
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+    def _load_timeframe(
+        self,
+        symbol: str,
+        timeframe: str,
+        as_of_key: str,
+        end: Optional[datetime],
+        lookback_bars: int,
+    ) -> tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+        """Read bars, then features bounded to the bars' time range.
+
+        Features are only ever aligned to the returned bars, so the first
+        bar timestamp is pushed down as the feature ``start`` bound instead
+        of pulling the full feature history.
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Bar timeframe
+            as_of_key: Cache key component for the point in time
+            end: Optional end bound for point-in-time queries
+            lookback_bars: Number of bars to read
+
+        Returns:
+            Tuple of (bars, features); features is None when disabled
+        """
+        bars_df = self._cached(
+            "bars", (symbol, timeframe, as_of_key, lookback_bars),
+            lambda: self._reader.get_bars(symbol, timeframe, end=end, limit=lookback_bars),
+        )
+        if not self.include_features:
+            return bars_df, None
+
+        start = pd.Timestamp(bars_df.index[0]).to_pydatetime() if not bars_df.empty else None
+        features_df = self._cached(
+            "features", (symbol, timeframe, as_of_key, start),
+            lambda: self._reader.get_features(symbol, timeframe, start=start, end=end),
+        )
+        return bars_df, features_df
+
+    def _cached(self, kind: str, key: tuple, loader: Callable[[], Any]) -> Any:
+        """Load through the ``kind`` cache, or directly when caching is off."""
+        if not self.cache_enabled:
+            return loader()
+        return self._caches[kind].get_or_load(key, loader)
+
+    def _load_regime(self, symbol: str, timeframe: str) -> Optional[RegimeContext]:
+        """Read the latest state row and enrich it into a RegimeContext.
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Bar timeframe
+
+        Returns:
+            RegimeContext, or None when no state is stored
+        """
+        states_df = self._reader.get_latest_states(symbol, timeframe)
+        if states_df.empty:
+            return None
+
+        latest = states_df.iloc[0]
+        state_id = int(latest.get("state_id", -1))
+        state_prob = float(latest.get("state_prob", 0.0))
+        model_id = latest.get("model_id")
+
+        state_label, transition_risk, entropy = self._load_regime_enrichment(
+            symbol, timeframe, state_id, state_prob, model_id
+        )
+
+        return RegimeContext(
+            timeframe=timeframe,
+            state_id=state_id,
+            state_prob=state_prob,
+            state_label=state_label,
+            entropy=entropy,
+            transition_risk=transition_risk,
+            is_ood=state_id == -1,
+        )
+
     def _request_fresh_data(self, symbol: str, timeframes: list[str]) -> None:
         """Publish a ``MARKET_DATA_REQUEST`` so the orchestrator fetches
         any missing bars *before* the builder reads from the DB.
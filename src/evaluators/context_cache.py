@@ -0,0 +1,171 @@
+"""Bounded, thread-safe cache used by ``ContextPackBuilder``.
+
+``ContextCache`` combines an LRU size bound with a TTL (via
+``cachetools.TTLCache``) and coalesces concurrent loads of the same key:
+the first caller runs the loader, later callers for that key block on
+its result instead of hitting the data service again.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Hashable, Optional
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Counters for a single ``ContextCache``.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that ran the loader
+        coalesced: Lookups that waited on another caller's in-flight load
+        evictions: Entries dropped to respect ``maxsize`` (least recently used)
+        expirations: Entries dropped because their TTL elapsed
+        size: Entries currently held
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that did not run the loader."""
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class _CountingTTLCache(TTLCache):
+    """``TTLCache`` that counts LRU evictions and TTL expirations."""
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float], stats: CacheStats):
+        super().__init__(maxsize=maxsize, ttl=ttl, timer=timer)
+        self._stats = stats
+
+    def popitem(self):
+        item = super().popitem()
+        self._stats.evictions += 1
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self._stats.expirations += len(expired)
+        return expired
+
+
+class ContextCache:
+    """Size-bounded LRU+TTL cache with per-key single-flight loading.
+
+    Usage:
+        cache = ContextCache(maxsize=256, ttl=60)
+        df = cache.get_or_load(("AAPL", "5Min"), lambda: reader.get_bars("AAPL", "5Min"))
+
+    Loader exceptions propagate to every waiting caller and are not cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 60.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries before LRU eviction
+            ttl: Seconds an entry stays valid after it is stored
+            timer: Clock used for TTL bookkeeping (injectable for tests)
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._entries = self._new_entries()
+        self._in_flight: dict[Hashable, Future] = {}
+
+    def _new_entries(self) -> _CountingTTLCache:
+        return _CountingTTLCache(self.maxsize, self.ttl, self._timer, self._stats)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, loading it at most once.
+
+        Args:
+            key: Hashable cache key
+            loader: Zero-argument callable producing the value on a miss
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        with self._lock:
+            self._entries.expire()
+            try:
+                value = self._entries[key]
+            except KeyError:
+                pending = self._in_flight.get(key)
+                if pending is None:
+                    pending = Future()
+                    self._in_flight[key] = pending
+                    self._stats.misses += 1
+                    owner = True
+                else:
+                    self._stats.coalesced += 1
+                    owner = False
+            else:
+                self._stats.hits += 1
+                return value
+
+        if not owner:
+            return pending.result()
+
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._entries[key] = value
+            del self._in_flight[key]
+        pending.set_result(value)
+        return value
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key`` without loading, or None."""
+        with self._lock:
+            self._entries.expire()
+            return self._entries.get(key)
+
+    def clear(self) -> None:
+        """Drop all entries (in-flight loads still complete normally)."""
+        with self._lock:
+            self._entries = self._new_entries()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            self._entries.expire()
+            return CacheStats(**{**asdict(self._stats), "size": len(self._entries)})
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._entries.expire()
+            return len(self._entries)
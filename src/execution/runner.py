@@ -21,7 +21,7 @@ from src.execution.orders import Order, OrderStatus
 from src.execution.order_manager import OrderManager, Signal
 from src.execution.order_tracker import OrderTracker, OrderUpdate, PositionTracker
 from src.execution.risk_manager import RiskManager, RiskConfig, RiskViolation
-from src.features.pipeline import FeaturePipeline
+from src.features.pipeline import FeaturePipeline, FeaturePipelineStream
 from src.utils.logging import get_logger, TradeLogger
 
 
@@ -123,7 +123,7 @@ class TradingRunner:
 
         # Initialize components
         self._data_loader = AlpacaLoader(use_cache=False)
-        self._feature_pipeline = FeaturePipeline()
+        self._feature_pipeline = FeaturePipeline.default()
         self._order_manager = OrderManager(self._client)
         self._risk_manager = RiskManager(self._client, config.risk_config)
         self._order_tracker = OrderTracker(self._client)
@@ -139,6 +139,7 @@ class TradingRunner:
         self._last_bar_time: dict[str, datetime] = {}
         self._data_cache: dict[str, pd.DataFrame] = {}
         self._features_cache: dict[str, pd.DataFrame] = {}
+        self._feature_streams: dict[str, FeaturePipelineStream] = {}
 
         # Circuit breaker state
         self._consecutive_failures = 0
@@ -242,8 +243,10 @@ class TradingRunner:
                 df = df.tail(self._config.warmup_bars)
                 self._data_cache[symbol] = df
 
-                # Compute features
-                features = self._feature_pipeline.compute(df)
+                # Seed the per-symbol feature stream with the warmup bars
+                stream = self._feature_pipeline.create_stream()
+                features = stream.update_many(df)
+                self._feature_streams[symbol] = stream
                 self._features_cache[symbol] = features.dropna()
 
                 self._last_bar_time[symbol] = df.index[-1]
@@ -393,6 +396,11 @@ class TradingRunner:
                     logger.debug("No new bars returned for %s", symbol)
                     continue
 
+                # Ignore bars the stream has already consumed
+                df = df.loc[df.index > last_time]
+                if df.empty:
+                    continue
+
                 # Append to cache
                 if symbol in self._data_cache:
                     self._data_cache[symbol] = pd.concat([
@@ -402,15 +410,38 @@ class TradingRunner:
                 else:
                     self._data_cache[symbol] = df
 
-                # Recompute features
-                features = self._feature_pipeline.compute(self._data_cache[symbol])
-                self._features_cache[symbol] = features.dropna()
+                # Update features with the new bars only
+                self._update_features(symbol, df)
 
                 self._last_bar_time[symbol] = self._data_cache[symbol].index[-1]
 
             except Exception as e:
                 logger.error(f"Failed to fetch bars for {symbol}", extra={"error": str(e)})
 
+    def _update_features(self, symbol: str, new_bars: pd.DataFrame) -> None:
+        """Stream new bars through the symbol's feature state.
+
+        Each bar updates the rolling feature state in constant time, so a
+        cycle costs the same no matter how long the runner has been up.
+
+        Args:
+            symbol: Asset symbol
+            new_bars: Bars after the last streamed bar, in time order
+        """
+        stream = self._feature_streams.get(symbol)
+        if stream is None:
+            stream = self._feature_pipeline.create_stream()
+            self._feature_streams[symbol] = stream
+
+        features = stream.update_many(new_bars).dropna()
+        if features.empty:
+            return
+
+        cached = self._features_cache.get(symbol)
+        if cached is not None and not cached.empty:
+            features = pd.concat([cached, features])
+        self._features_cache[symbol] = features.tail(self._config.warmup_bars)
+
     def _generate_signal(self, symbol: str) -> Signal | None:
         """Generate trading signal for a symbol.
 
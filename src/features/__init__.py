@@ -9,6 +9,11 @@ Quick Start:
     >>> pipeline = FeaturePipeline.default()
     >>> features = pipeline.compute(ohlcv_df)
 
+For live per-bar updates (constant time per bar for built-in calculators):
+    >>> stream = FeaturePipeline.default().create_stream()
+    >>> stream.update_many(warmup_df)
+    >>> row = stream.update(bar_time, bar)
+
 For minimal feature set:
     >>> from src.features import FeaturePipeline, get_minimal_features
     >>> pipeline = FeaturePipeline.default()
@@ -29,7 +34,12 @@ from .base import (
 )
 from .intrabar import IntrabarFeatureCalculator
 from .market_context import MarketContextFeatureCalculator
-from .pipeline import FeaturePipeline, PipelineConfig, get_minimal_features
+from .pipeline import (
+    FeaturePipeline,
+    FeaturePipelineStream,
+    PipelineConfig,
+    get_minimal_features,
+)
 from .registry import (
     create_calculators_from_config,
     get_calculator,
@@ -39,6 +49,7 @@ from .registry import (
     register_calculator,
 )
 from .returns import ReturnFeatureCalculator
+from .streaming import FeatureStream, WindowedFeatureStream
 from .time_of_day import TimeOfDayFeatureCalculator
 from .volatility import VolatilityFeatureCalculator
 from .volume import VolumeFeatureCalculator
@@ -78,8 +89,12 @@ __all__ = [
     "AnchorFeatureCalculator",
     "TimeOfDayFeatureCalculator",
     "MarketContextFeatureCalculator",
+    # Streaming
+    "FeatureStream",
+    "WindowedFeatureStream",
     # Pipeline
     "FeaturePipeline",
+    "FeaturePipelineStream",
     "PipelineConfig",
     "get_minimal_features",
     # Registry
@@ -1,11 +1,13 @@
 """Anchor and location features (context for continuation)."""
 
 import logging
-from typing import Any
+from datetime import datetime
+from typing import Any, Mapping
 
 import pandas as pd
 
 from .base import EPS, BaseFeatureCalculator, FeatureSpec, ema, safe_divide
+from .streaming import EWMState, FeatureStream, RollingMax, RollingSum
 
 logger = logging.getLogger(__name__)
 
@@ -123,3 +125,62 @@ class AnchorFeatureCalculator(BaseFeatureCalculator):
             result["breakout_20"].min(), result["breakout_20"].max()
         )
         return result
+
+    def create_stream(self, lookback_buffer: int = 100) -> FeatureStream:
+        """Create a constant-time per-bar stream of anchor features.
+
+        Args:
+            lookback_buffer: Unused; anchor features need no fallback window
+
+        Returns:
+            New AnchorFeatureStream
+        """
+        return AnchorFeatureStream(self)
+
+
+class AnchorFeatureStream(FeatureStream):
+    """Per-bar stream of :class:`AnchorFeatureCalculator` features."""
+
+    def __init__(self, calculator: AnchorFeatureCalculator):
+        """Initialize AnchorFeatureStream.
+
+        Args:
+            calculator: Calculator whose windows this stream follows
+        """
+        self._pv_sum = RollingSum(calculator.vwap_window)
+        self._vol_sum = RollingSum(calculator.vwap_window)
+        self._ema = EWMState(calculator.ema_period)
+        self._high = RollingMax(calculator.breakout_window)
+
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Consume one bar and return its anchor features.
+
+        Args:
+            timestamp: Bar timestamp
+            bar: Mapping with keys high, low, close, volume
+
+        Returns:
+            Values for vwap_60, dist_vwap_60, dist_ema_48, breakout_20,
+            pullback_depth
+        """
+        high = float(bar["high"])
+        close = float(bar["close"])
+        volume = float(bar["volume"])
+        typical_price = (high + float(bar["low"]) + close) / 3
+
+        vwap = self._pv_sum.update(typical_price * volume) / (self._vol_sum.update(volume) + EPS)
+        ema_value = self._ema.update(close)
+        rolling_high = self._high.update(high)
+
+        return {
+            "vwap_60": vwap,
+            "dist_vwap_60": (close - vwap) / (close + EPS),
+            "dist_ema_48": (close - ema_value) / (close + EPS),
+            "breakout_20": (close - rolling_high) / (close + EPS),
+            "pullback_depth": (rolling_high - close) / (rolling_high + EPS),
+        }
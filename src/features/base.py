@@ -3,16 +3,24 @@
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+if TYPE_CHECKING:
+    from .streaming import FeatureStream
 
 logger = logging.getLogger(__name__)
 
 # Numerical stability constant
 EPS = 1e-9
 
+# Windows processed per block by the strided rolling kernels (bounds the
+# temporary (rows, window) arrays to a few tens of MB)
+_WINDOW_BLOCK_ROWS = 65536
+
 
 @dataclass
 class FeatureSpec:
@@ -35,7 +43,8 @@ class BaseFeatureCalculator(ABC):
     """Abstract base class for feature calculators.
 
     Each calculator is responsible for computing a group of related features.
-    Subclasses must implement the compute() method and feature_specs property.
+    Subclasses must implement the compute() method and feature_specs property,
+    and may override create_stream() with a constant-time per-bar update.
     """
 
     @property
@@ -62,6 +71,28 @@ class BaseFeatureCalculator(ABC):
         """Maximum lookback period required by this calculator."""
         return max(spec.lookback for spec in self.feature_specs) if self.feature_specs else 0
 
+    def create_stream(self, lookback_buffer: int = 100) -> "FeatureStream":
+        """Create a stateful stream that computes these features bar by bar.
+
+        The default stream recomputes ``compute()`` over the trailing
+        ``max_lookback + lookback_buffer`` bars on every update, i.e.
+        O(window) per bar.  Calculators built from rolling statistics
+        (returns, volatility, volume, intrabar, anchor, time of day and
+        market context) override this with a stream that updates each
+        feature in O(1); the TA-Lib and pandas-ta indicator calculators
+        still use the windowed default.
+
+        Args:
+            lookback_buffer: Extra bars kept beyond ``max_lookback`` by the
+                windowed fallback
+
+        Returns:
+            New FeatureStream with empty state
+        """
+        from .streaming import WindowedFeatureStream
+
+        return WindowedFeatureStream(self, window=self.max_lookback + lookback_buffer)
+
 
 def safe_divide(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
     """Safely divide two series, avoiding division by zero.
@@ -104,11 +135,26 @@ def log_return(prices: pd.Series, periods: int = 1) -> pd.Series:
     return np.log(safe_divide(prices, prices.shift(periods)))
 
 
+def _nan_free_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """Flag each full window of ``values`` that contains no NaN.
+
+    Returns:
+        Boolean array of length ``len(values) - window + 1``
+    """
+    nan_count = np.concatenate(([0], np.cumsum(np.isnan(values))))
+    return nan_count[window:] - nan_count[:-window] == 0
+
+
 def rolling_regression_slope(series: pd.Series, window: int) -> pd.Series:
     """Compute rolling linear regression slope.
 
     Fits y = a + b*x where x is time index (0, 1, ..., window-1).
 
+    The slope of every window is a dot product of the (shifted) window with
+    the centered time index, evaluated on strided views of the series in
+    blocks.  Windows containing NaN, and the first ``window - 1`` rows,
+    are NaN.
+
     Args:
         series: Input series (e.g., log prices)
         window: Rolling window size
@@ -116,19 +162,28 @@ def rolling_regression_slope(series: pd.Series, window: int) -> pd.Series:
     Returns:
         Series of regression slopes
     """
-    def _slope(y: np.ndarray) -> float:
-        if len(y) < window or np.any(np.isnan(y)):
-            return np.nan
-        x = np.arange(len(y))
-        x_mean = x.mean()
-        y_mean = y.mean()
-        numerator = np.sum((x - x_mean) * (y - y_mean))
-        denominator = np.sum((x - x_mean) ** 2)
-        if denominator < EPS:
-            return 0.0
-        return numerator / denominator
+    values = series.to_numpy(dtype=np.float64)
+    result = np.full(len(values), np.nan)
+
+    if len(values) >= window:
+        x = np.arange(window, dtype=np.float64)
+        x_centered = x - x.mean()
+        denominator = np.sum(x_centered ** 2)
+
+        windows = sliding_window_view(values, window)
+        slopes = np.zeros(len(windows))
+        if denominator >= EPS:
+            for start in range(0, len(windows), _WINDOW_BLOCK_ROWS):
+                block = windows[start:start + _WINDOW_BLOCK_ROWS]
+                # sum(x_c * y) == sum(x_c * (y - c)) for any c; shifting by
+                # the first value keeps flat windows exactly zero
+                shifted = block - block[:, :1]
+                slopes[start:start + len(block)] = shifted @ x_centered / denominator
 
-    return series.rolling(window=window, min_periods=window).apply(_slope, raw=True)
+        slopes[~_nan_free_windows(values, window)] = np.nan
+        result[window - 1:] = slopes
+
+    return pd.Series(result, index=series.index, name=series.name)
 
 
 def ema(series: pd.Series, span: int) -> pd.Series:
@@ -151,6 +206,12 @@ def rolling_beta(
 
     Fits: asset_return = alpha + beta * market_return + residual
 
+    Series are aligned by position.  Moments of each window are computed
+    from strided views in blocks; windows containing NaN in either series
+    are NaN.  When the market variance of a window is below EPS, beta is 0
+    and the residual volatility is the standard deviation of the asset
+    returns.
+
     Args:
         asset_returns: Asset return series
         market_returns: Market return series
@@ -158,40 +219,53 @@ def rolling_beta(
 
     Returns:
         Tuple of (beta series, residual volatility series)
+
+    Raises:
+        ValueError: If market_returns is shorter than asset_returns
     """
-    betas = []
-    resid_stds = []
-
-    for i in range(len(asset_returns)):
-        if i < window - 1:
-            betas.append(np.nan)
-            resid_stds.append(np.nan)
-        else:
-            y = asset_returns.iloc[i - window + 1 : i + 1].values
-            x = market_returns.iloc[i - window + 1 : i + 1].values
-
-            if np.any(np.isnan(y)) or np.any(np.isnan(x)):
-                betas.append(np.nan)
-                resid_stds.append(np.nan)
-            else:
-                x_mean = x.mean()
-                y_mean = y.mean()
-                cov = np.sum((x - x_mean) * (y - y_mean))
-                var = np.sum((x - x_mean) ** 2)
-
-                if var < EPS:
-                    betas.append(0.0)
-                    resid_stds.append(np.std(y))
-                else:
-                    beta = cov / var
-                    alpha = y_mean - beta * x_mean
-                    residuals = y - (alpha + beta * x)
-                    betas.append(beta)
-                    resid_stds.append(np.std(residuals))
+    y_values = asset_returns.to_numpy(dtype=np.float64)
+    n = len(y_values)
+    x_values = market_returns.to_numpy(dtype=np.float64)
+    if len(x_values) < n:
+        raise ValueError(
+            f"market_returns has {len(x_values)} rows, expected at least {n}"
+        )
+    x_values = x_values[:n]
+
+    betas = np.full(n, np.nan)
+    resid_stds = np.full(n, np.nan)
+
+    if n >= window:
+        x_windows = sliding_window_view(x_values, window)
+        y_windows = sliding_window_view(y_values, window)
+        beta = np.empty(len(x_windows))
+        resid = np.empty(len(x_windows))
+
+        for start in range(0, len(x_windows), _WINDOW_BLOCK_ROWS):
+            stop = start + _WINDOW_BLOCK_ROWS
+            x = x_windows[start:stop]
+            y = y_windows[start:stop]
+            x_centered = x - x.mean(axis=1, keepdims=True)
+            y_centered = y - y.mean(axis=1, keepdims=True)
+            var = np.einsum("ij,ij->i", x_centered, x_centered)
+            cov = np.einsum("ij,ij->i", x_centered, y_centered)
+
+            # Flat market windows get beta 0, leaving the residuals equal
+            # to the centered asset returns
+            flat = var < EPS
+            block_beta = np.where(flat, 0.0, cov / np.where(flat, 1.0, var))
+            residuals = y_centered - block_beta[:, None] * x_centered
+            residuals -= residuals.mean(axis=1, keepdims=True)
+            beta[start:stop] = block_beta
+            resid[start:stop] = np.sqrt(np.einsum("ij,ij->i", residuals, residuals) / window)
+
+        valid = _nan_free_windows(x_values, window) & _nan_free_windows(y_values, window)
+        beta[~valid] = np.nan
+        resid[~valid] = np.nan
+        betas[window - 1:] = beta
+        resid_stds[window - 1:] = resid
 
     beta_series = pd.Series(betas, index=asset_returns.index)
     resid_series = pd.Series(resid_stds, index=asset_returns.index)
 
     return beta_series, resid_series
-
-
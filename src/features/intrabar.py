@@ -1,11 +1,13 @@
 """Intrabar structure features (microstructure-lite)."""
 
 import logging
-from typing import Any
+from datetime import datetime
+from typing import Any, Mapping
 
 import pandas as pd
 
 from .base import EPS, BaseFeatureCalculator, FeatureSpec
+from .streaming import FeatureStream
 
 logger = logging.getLogger(__name__)
 
@@ -89,3 +91,46 @@ class IntrabarFeatureCalculator(BaseFeatureCalculator):
             result["body_ratio"].min(), result["body_ratio"].max()
         )
         return result
+
+    def create_stream(self, lookback_buffer: int = 100) -> FeatureStream:
+        """Create a per-bar stream of intrabar features.
+
+        Args:
+            lookback_buffer: Unused; intrabar features depend on one bar
+
+        Returns:
+            New IntrabarFeatureStream
+        """
+        return IntrabarFeatureStream()
+
+
+class IntrabarFeatureStream(FeatureStream):
+    """Per-bar stream of :class:`IntrabarFeatureCalculator` features."""
+
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Compute intrabar features of one bar.
+
+        Args:
+            timestamp: Bar timestamp
+            bar: Mapping with keys open, high, low, close
+
+        Returns:
+            Values for clv, body_ratio, upper_wick, lower_wick
+        """
+        o = float(bar["open"])
+        h = float(bar["high"])
+        l = float(bar["low"])
+        c = float(bar["close"])
+        bar_range = h - l + EPS
+
+        return {
+            "clv": (c - l) / bar_range,
+            "body_ratio": abs(c - o) / bar_range,
+            "upper_wick": (h - max(o, c)) / bar_range,
+            "lower_wick": (min(o, c) - l) / bar_range,
+        }
@@ -1,11 +1,13 @@
 """Market context features."""
 
 import logging
-from typing import Any
+from datetime import datetime
+from typing import Any, Mapping
 
 import pandas as pd
 
 from .base import BaseFeatureCalculator, FeatureSpec, log_return, rolling_beta
+from .streaming import FeatureStream, History, RollingRegression, RollingStd, stream_log_return
 
 logger = logging.getLogger(__name__)
 
@@ -130,3 +132,81 @@ class MarketContextFeatureCalculator(BaseFeatureCalculator):
             result["mkt_rv_60"].min(), result["mkt_rv_60"].max()
         )
         return result
+
+    def create_stream(self, lookback_buffer: int = 100) -> FeatureStream:
+        """Create a constant-time per-bar stream of market context features.
+
+        Args:
+            lookback_buffer: Unused; market features need no fallback window
+
+        Returns:
+            New MarketContextFeatureStream
+        """
+        return MarketContextFeatureStream(self)
+
+
+class MarketContextFeatureStream(FeatureStream):
+    """Per-bar stream of :class:`MarketContextFeatureCalculator` features.
+
+    Each asset bar must be accompanied by the market bar with the same
+    timestamp.
+    """
+
+    def __init__(self, calculator: MarketContextFeatureCalculator):
+        """Initialize MarketContextFeatureStream.
+
+        Args:
+            calculator: Calculator whose windows this stream follows
+        """
+        self._short = calculator.short_window
+        self._medium = calculator.medium_window
+        self._closes = History(2)
+        self._mkt_closes = History(max(calculator.short_window, calculator.medium_window, 1) + 1)
+        self._mkt_rv = RollingStd(calculator.long_window)
+        self._regression = RollingRegression(calculator.long_window)
+
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Consume one asset/market bar pair and return market features.
+
+        Args:
+            timestamp: Bar timestamp
+            bar: Asset bar with key close
+            **kwargs:
+                market_bar: Required. Market bar with key close.
+                r1: Optional r1 of this bar from the returns stream
+
+        Returns:
+            Values for mkt_r5, mkt_r15, mkt_rv_60, beta_60, resid_rv_60
+
+        Raises:
+            ValueError: If market_bar is not provided
+        """
+        market_bar = kwargs.get("market_bar")
+        if market_bar is None:
+            raise ValueError("market_bar is required for MarketContextFeatureStream")
+
+        close = float(bar["close"])
+        self._closes.append(close)
+        mkt_closes = self._mkt_closes
+        mkt_close = float(market_bar["close"])
+        mkt_closes.append(mkt_close)
+        mkt_r1 = stream_log_return(mkt_close, mkt_closes.ago(1))
+
+        asset_r1 = kwargs.get("r1")
+        if asset_r1 is None:
+            asset_r1 = stream_log_return(close, self._closes.ago(1))
+
+        beta, resid_rv = self._regression.update(mkt_r1, asset_r1)
+
+        return {
+            "mkt_r5": stream_log_return(mkt_close, mkt_closes.ago(self._short)),
+            "mkt_r15": stream_log_return(mkt_close, mkt_closes.ago(self._medium)),
+            "mkt_rv_60": self._mkt_rv.update(mkt_r1),
+            "beta_60": beta,
+            "resid_rv_60": resid_rv,
+        }
@@ -35,6 +35,9 @@ class PandasTAIndicatorCalculator(BaseFeatureCalculator):
     - Volatility: Bollinger Bands, ATR
     - Volume: OBV, VWAP
     - Support/Resistance: Pivot Points
+
+    Like TALibIndicatorCalculator, this streams through the windowed
+    fallback (one ``compute()`` over the trailing window per bar).
     """
 
     def __init__(
@@ -2,13 +2,16 @@
 
 import logging
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Container, Mapping
 
+import numpy as np
 import pandas as pd
 
 from config.settings import get_settings
 from .base import BaseFeatureCalculator, FeatureSpec
+from .streaming import OHLCV_COLUMNS, FeatureStream, WindowedFeatureStream
 from .registry import (
     create_calculators_from_config,
     get_default_calculators,
@@ -222,6 +225,9 @@ class FeaturePipeline:
         exceeds the DataFrame length), this falls through to a full
         ``compute()`` call with no trimming.
 
+        For live per-bar updates prefer :meth:`create_stream`, which keeps
+        rolling state between calls instead of recomputing the context.
+
         Args:
             df: Full DataFrame with datetime index and OHLCV columns.
             new_bars: Number of new (most recent) bars that need features.
@@ -286,6 +292,33 @@ class FeaturePipeline:
 
         return trimmed
 
+    def create_stream(self, lookback_buffer: int | None = None) -> "FeaturePipelineStream":
+        """Create a stateful stream that computes all features bar by bar.
+
+        Each calculator contributes its own stream (see
+        ``BaseFeatureCalculator.create_stream``), so a new bar updates
+        every rolling window in constant time instead of recomputing the
+        whole history as ``compute()`` and ``compute_incremental()`` do.
+
+        Args:
+            lookback_buffer: Extra bars kept beyond ``max_lookback`` by
+                calculators without a native stream.  Defaults to
+                ``FeatureConfig.lookback_buffer`` from settings.
+
+        Returns:
+            New FeaturePipelineStream with empty state
+        """
+        if lookback_buffer is None:
+            try:
+                lookback_buffer = get_settings().features.lookback_buffer
+            except Exception:
+                lookback_buffer = 100  # default from FeatureConfig
+                logger.debug(
+                    "Could not load settings for lookback_buffer, using default=%d",
+                    lookback_buffer,
+                )
+        return FeaturePipelineStream(self, lookback_buffer=lookback_buffer)
+
     def compute_subset(
         self,
         df: pd.DataFrame,
@@ -317,6 +350,196 @@ class FeaturePipeline:
         return all_features[available]
 
 
+class FeaturePipelineStream:
+    """Per-bar counterpart of :meth:`FeaturePipeline.compute`.
+
+    Runs one stream per calculator and passes the same intermediates
+    (r1, rv_60) between them as the batch pipeline.  Feeding the bars of
+    a DataFrame in order yields the rows of ``compute()`` on that frame,
+    including the leading NaN rows while windows fill.
+
+    Example:
+        >>> stream = pipeline.create_stream()
+        >>> warmup = stream.update_many(history_df)
+        >>> row = stream.update(bar_time, {"open": o, "high": h, "low": l, "close": c, "volume": v})
+    """
+
+    def __init__(self, pipeline: FeaturePipeline, lookback_buffer: int = 100):
+        """Initialize FeaturePipelineStream.
+
+        Args:
+            pipeline: Pipeline whose calculators to stream
+            lookback_buffer: Extra bars for calculators without a native stream
+        """
+        self._config = pipeline.config
+        self._streams: list[tuple[str, FeatureStream]] = [
+            (calc.__class__.__name__, calc.create_stream(lookback_buffer=lookback_buffer))
+            for calc in pipeline.calculators
+        ]
+        self._last_timestamp: datetime | None = None
+        # Output columns of each stream, recorded on its first update
+        self._stream_columns: dict[int, list[str]] = {}
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        """Timestamp of the most recent bar consumed, if any."""
+        return self._last_timestamp
+
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        market_bar: Mapping[str, float] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Consume one bar and return all of its features.
+
+        Args:
+            timestamp: Bar timestamp; must be later than the previous bar
+            bar: Mapping with keys open, high, low, close, volume
+            market_bar: Market benchmark bar at the same timestamp
+                (required for market context features)
+            **kwargs: Additional arguments passed to calculator streams
+
+        Returns:
+            Feature name to value, in the column order of ``compute()``
+
+        Raises:
+            ValueError: If bars arrive out of order, or market_bar is
+                required but not provided
+        """
+        if self._last_timestamp is not None and timestamp <= self._last_timestamp:
+            raise ValueError(
+                f"Bar at {timestamp} is not after the last streamed bar {self._last_timestamp}"
+            )
+
+        row = self._update_row(timestamp, bar, market_bar, kwargs)
+        self._last_timestamp = timestamp
+        return row
+
+    def update_many(
+        self,
+        df: pd.DataFrame,
+        market_df: pd.DataFrame | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """Consume a block of bars (e.g. warmup history) in order.
+
+        Native streams are updated bar by bar; windowed fallback streams
+        consume the whole block with a single batch computation.
+
+        Args:
+            df: DataFrame with datetime index and OHLCV columns
+            market_df: Optional market benchmark data, aligned to ``df`` by index
+            **kwargs: Additional arguments passed to calculator streams
+
+        Returns:
+            DataFrame with one feature row per input bar, in the column
+            order of ``compute()``
+
+        Raises:
+            ValueError: If bars are not strictly after the last streamed bar
+                and in increasing order, or market data is required but
+                not provided
+        """
+        if df.empty:
+            return pd.DataFrame(index=df.index)
+        if not (df.index.is_monotonic_increasing and df.index.is_unique):
+            raise ValueError("Bars must be in strictly increasing timestamp order")
+        if self._last_timestamp is not None and df.index[0] <= self._last_timestamp:
+            raise ValueError(
+                f"Bar at {df.index[0]} is not after the last streamed bar {self._last_timestamp}"
+            )
+        has_market = market_df is not None
+        self._market_context_enabled(has_market)
+
+        bars = df[list(OHLCV_COLUMNS)]
+        windowed = {
+            i: stream.update_frame(bars)
+            for i, (_, stream) in enumerate(self._streams)
+            if isinstance(stream, WindowedFeatureStream)
+        }
+
+        market_closes = None
+        if has_market:
+            market_closes = market_df["close"].reindex(df.index).to_numpy(dtype=float).tolist()
+
+        rows = []
+        for i, (timestamp, values) in enumerate(zip(df.index, bars.to_numpy(dtype=float).tolist())):
+            market_bar = None if market_closes is None else {"close": market_closes[i]}
+            rows.append(self._update_row(
+                timestamp, dict(zip(OHLCV_COLUMNS, values)), market_bar, kwargs, skip=windowed,
+            ))
+        self._last_timestamp = df.index[-1]
+
+        # Rows share one key order; building from a 2-D array avoids
+        # per-column dict handling, which dominates small blocks
+        names = list(rows[0])
+        result = pd.DataFrame(
+            np.array([list(row.values()) for row in rows], dtype=float).reshape(len(rows), len(names)),
+            index=df.index,
+            columns=names,
+        )
+        if not windowed:
+            return result
+
+        columns = {col: result[col] for col in result.columns}
+        ordered: dict[str, None] = {}
+        for i, names in sorted(self._stream_columns.items()):
+            if i in windowed:
+                frame = windowed[i]
+                names = list(frame.columns)
+                for col in names:
+                    columns[col] = frame[col]
+            ordered.update(dict.fromkeys(names))
+        return pd.DataFrame({col: columns[col] for col in ordered}, index=df.index)
+
+    def _update_row(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        market_bar: Mapping[str, float] | None,
+        kwargs: dict[str, Any],
+        skip: Container[int] = (),
+    ) -> dict[str, float]:
+        """Run every calculator stream on one bar, threading intermediates."""
+        row: dict[str, float] = {}
+        for i, (calc_name, stream) in enumerate(self._streams):
+            if i in skip:
+                self._stream_columns.setdefault(i, [])
+                continue
+
+            calc_kwargs = dict(kwargs)
+
+            if calc_name == "MarketContextFeatureCalculator":
+                if not self._market_context_enabled(market_bar is not None):
+                    continue
+                calc_kwargs["market_bar"] = market_bar
+
+            if "r1" in row:
+                calc_kwargs["r1"] = row["r1"]
+            if "rv_60" in row:
+                calc_kwargs["rv_60"] = row["rv_60"]
+
+            features = stream.update(timestamp, bar, **calc_kwargs)
+            if i not in self._stream_columns:
+                self._stream_columns[i] = list(features)
+            row.update(features)
+        return row
+
+    def _market_context_enabled(self, has_market_data: bool) -> bool:
+        """Whether market context features can be computed for this input.
+
+        Raises:
+            ValueError: If market context is required but no data was given
+        """
+        if has_market_data:
+            return True
+        if self._config.include_market_context:
+            raise ValueError("market data is required for MarketContextFeatureCalculator")
+        return False
+
+
 def get_minimal_features() -> list[str]:
     """Get the minimal starter set of features recommended in FEATURE.md.
 
@@ -1,7 +1,9 @@
 """Returns and trend features (momentum backbone)."""
 
 import logging
-from typing import Any
+import math
+from datetime import datetime
+from typing import Any, Mapping
 
 import numpy as np
 import pandas as pd
@@ -15,6 +17,15 @@ from .base import (
     rolling_regression_slope,
     safe_divide,
 )
+from .streaming import (
+    EWMState,
+    FeatureStream,
+    History,
+    RollingSlope,
+    RollingStd,
+    RollingSum,
+    stream_log_return,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -165,3 +176,78 @@ class ReturnFeatureCalculator(BaseFeatureCalculator):
             result["trend_strength"].min(), result["trend_strength"].max()
         )
         return result
+
+    def create_stream(self, lookback_buffer: int = 100) -> FeatureStream:
+        """Create a constant-time per-bar stream of return features.
+
+        Args:
+            lookback_buffer: Unused; return features need no fallback window
+
+        Returns:
+            New ReturnFeatureStream
+        """
+        return ReturnFeatureStream(self)
+
+
+class ReturnFeatureStream(FeatureStream):
+    """Per-bar stream of :class:`ReturnFeatureCalculator` features."""
+
+    def __init__(self, calculator: ReturnFeatureCalculator):
+        """Initialize ReturnFeatureStream.
+
+        Args:
+            calculator: Calculator whose windows this stream follows
+        """
+        self._windows = (
+            calculator.short_window, calculator.medium_window, calculator.long_window,
+        )
+        self._closes = History(max(self._windows) + 1)
+        self._cumret = RollingSum(calculator.long_window)
+        self._ema_fast = EWMState(calculator.ema_fast)
+        self._ema_slow = EWMState(calculator.ema_slow)
+        self._slope = RollingSlope(calculator.long_window)
+        self._rv = RollingStd(calculator.long_window)
+
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Consume one bar and return its return features.
+
+        Args:
+            timestamp: Bar timestamp
+            bar: Mapping with key close
+            **kwargs:
+                rv_60: Optional rv_60 of this bar from the volatility stream
+
+        Returns:
+            Values for r1, r5, r15, r60, cumret_60, ema_diff, slope_60,
+            trend_strength
+        """
+        close = float(bar["close"])
+        closes = self._closes
+        closes.append(close)
+
+        short, medium, long = self._windows
+        r1 = stream_log_return(close, closes.ago(1))
+        slope = self._slope.update(math.log(close) if close > 0 else math.nan)
+
+        rv_60 = kwargs.get("rv_60")
+        own_rv = self._rv.update(r1)
+        if rv_60 is None:
+            rv_60 = own_rv
+
+        return {
+            "r1": r1,
+            "r5": stream_log_return(close, closes.ago(short)),
+            "r15": stream_log_return(close, closes.ago(medium)),
+            "r60": stream_log_return(close, closes.ago(long)),
+            "cumret_60": self._cumret.update(r1),
+            "ema_diff": (
+                self._ema_fast.update(close) - self._ema_slow.update(close)
+            ) / (close + EPS),
+            "slope_60": slope,
+            "trend_strength": abs(slope) / (rv_60 + EPS),
+        }
@@ -34,18 +34,24 @@ from src.features.state.hmm.scalers import (
 from src.features.state.hmm.encoders import (
     BaseEncoder,
     PCAEncoder,
+    StreamingTemporalEncoder,
     TemporalPCAEncoder,
     create_encoder,
     create_windows,
+    iter_flat_windows,
     select_latent_dim,
 )
 from src.features.state.hmm.hmm_model import (
     GaussianHMMWrapper,
+    ModelSearch,
+    ModelSearchCandidate,
+    ModelSearchResult,
     select_n_states,
     match_states_hungarian,
 )
 from src.features.state.hmm.inference import (
     InferenceEngine,
+    MultiSymbolInferenceEngine,
     create_inference_engine,
 )
 from src.features.state.hmm.data_pipeline import (
@@ -65,6 +71,14 @@ from src.features.state.hmm.training import (
     HyperparameterGrid,
     train_model,
 )
+from src.features.state.hmm.batch_training import (
+    BatchTrainer,
+    BatchTrainingConfig,
+    BatchRunSummary,
+    JobResult,
+    TrainingJob,
+    data_fingerprint,
+)
 from src.features.state.hmm.storage import (
     StateWriter,
     StateReader,
@@ -118,16 +132,22 @@ __all__ = [
     # Encoders
     "BaseEncoder",
     "PCAEncoder",
+    "StreamingTemporalEncoder",
     "TemporalPCAEncoder",
     "create_encoder",
     "create_windows",
+    "iter_flat_windows",
     "select_latent_dim",
     # HMM
     "GaussianHMMWrapper",
+    "ModelSearch",
+    "ModelSearchCandidate",
+    "ModelSearchResult",
     "select_n_states",
     "match_states_hungarian",
     # Inference
     "InferenceEngine",
+    "MultiSymbolInferenceEngine",
     "create_inference_engine",
     # Data Pipeline
     "FeatureLoader",
@@ -144,6 +164,13 @@ __all__ = [
     "HyperparameterTuner",
     "HyperparameterGrid",
     "train_model",
+    # Batch training
+    "BatchTrainer",
+    "BatchTrainingConfig",
+    "BatchRunSummary",
+    "JobResult",
+    "TrainingJob",
+    "data_fingerprint",
     # Storage
     "StateWriter",
     "StateReader",
@@ -0,0 +1,504 @@
+"""Batch training of state vector models across a symbol universe.
+
+Handles:
+- Scheduling one training job per (symbol, timeframe) on a worker pool
+- Prefetching the next job's features while earlier jobs train
+- Skipping jobs whose inputs match the fingerprint of the latest model
+- Per-job timing/memory accounting and a JSON run summary
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import time
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Literal, Optional
+
+import pandas as pd
+
+from src.data.database.connection import get_db_manager
+from src.data.session_calendar import get_session_calendar
+from src.features.state.hmm.artifacts import get_latest_model, list_models
+from src.features.state.hmm.contracts import ModelMetadata
+from src.features.state.hmm.data_pipeline import FeatureLoader, GapHandler
+from src.features.state.hmm.training import TrainingConfig, TrainingPipeline
+
+logger = logging.getLogger(__name__)
+
+
+FeatureLoadFn = Callable[[str, str, datetime, datetime, list[str]], pd.DataFrame]
+
+
+@dataclass(frozen=True)
+class TrainingJob:
+    """One (symbol, timeframe) model to train.
+
+    Attributes:
+        symbol: Ticker symbol
+        timeframe: Model timeframe
+    """
+
+    symbol: str
+    timeframe: str
+
+
+@dataclass
+class BatchTrainingConfig:
+    """Configuration shared by every job in a batch.
+
+    Attributes:
+        symbols: Symbol universe
+        timeframes: Timeframes to train for each symbol
+        start: Start of the data window
+        end: End of the data window (clamped to the latest loaded bar)
+        feature_names: Features to load, per timeframe
+        val_days: Validation window in days
+        n_states: HMM states per timeframe (missing or None for auto)
+        latent_dim: Latent dimension per timeframe (missing or None for auto)
+        scaler_type: Type of scaler
+        covariance_type: HMM covariance type
+        random_seed: Random seed for every job
+        min_train_rows: Minimum clean training rows
+        min_val_rows: Minimum clean validation rows
+        force: Retrain even when the fingerprint is unchanged
+    """
+
+    symbols: list[str]
+    timeframes: list[str]
+    start: datetime
+    end: datetime
+    feature_names: dict[str, list[str]]
+    val_days: int = 30
+    n_states: dict[str, Optional[int]] = field(default_factory=dict)
+    latent_dim: dict[str, Optional[int]] = field(default_factory=dict)
+    scaler_type: Literal["robust", "standard", "yeo_johnson"] = "robust"
+    covariance_type: Literal["full", "diag", "tied", "spherical"] = "diag"
+    random_seed: int = 42
+    min_train_rows: int = 100
+    min_val_rows: int = 20
+    force: bool = False
+
+
+@dataclass
+class PreparedJob:
+    """A job with its cleaned data, ready to train.
+
+    Attributes:
+        job: The job
+        config: Training configuration (carries the data fingerprint)
+        train_df: Clean training features
+        val_df: Clean validation features
+        model_version: Version number for the new model
+        load_seconds: Time spent loading and cleaning features
+    """
+
+    job: TrainingJob
+    config: TrainingConfig
+    train_df: pd.DataFrame
+    val_df: pd.DataFrame
+    model_version: int
+    load_seconds: float
+
+
+@dataclass
+class JobResult:
+    """Outcome of one job.
+
+    Attributes:
+        symbol: Ticker symbol
+        timeframe: Model timeframe
+        status: 'trained', 'skipped' or 'failed'
+        model_id: New model ID, or the reused one when skipped
+        fingerprint: Data fingerprint of the job's inputs
+        error: Error message when the job failed
+        n_train_rows: Clean training rows
+        n_val_rows: Clean validation rows
+        load_seconds: Time spent loading and cleaning features
+        train_seconds: Wall time spent training
+        cpu_seconds: CPU time spent training
+        peak_traced_mb: Peak Python/NumPy allocation during training
+        max_rss_mb: High-water resident set size of the training process
+        metrics: Training metrics
+    """
+
+    symbol: str
+    timeframe: str
+    status: Literal["trained", "skipped", "failed"]
+    model_id: Optional[str] = None
+    fingerprint: Optional[str] = None
+    error: Optional[str] = None
+    n_train_rows: int = 0
+    n_val_rows: int = 0
+    load_seconds: float = 0.0
+    train_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_traced_mb: float = 0.0
+    max_rss_mb: float = 0.0
+    metrics: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class BatchRunSummary:
+    """Summary of a batch training run.
+
+    Attributes:
+        started_at: Run start (UTC)
+        finished_at: Run end (UTC)
+        max_workers: Training workers used
+        results: Per-job results in job order
+    """
+
+    started_at: datetime
+    finished_at: datetime
+    max_workers: int
+    results: list[JobResult]
+
+    def count(self, status: str) -> int:
+        """Return the number of jobs with the given status."""
+        return sum(1 for r in self.results if r.status == status)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        trained = [r for r in self.results if r.status == "trained"]
+        return {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat(),
+            "elapsed_seconds": (self.finished_at - self.started_at).total_seconds(),
+            "max_workers": self.max_workers,
+            "n_jobs": len(self.results),
+            "n_trained": len(trained),
+            "n_skipped": self.count("skipped"),
+            "n_failed": self.count("failed"),
+            "train_seconds_total": sum(r.train_seconds for r in trained),
+            "peak_traced_mb_max": max((r.peak_traced_mb for r in trained), default=0.0),
+            "jobs": [asdict(r) for r in self.results],
+        }
+
+    def save(self, path: Path | str) -> None:
+        """Write the summary as JSON.
+
+        Args:
+            path: Output file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=float)
+        logger.info("Batch summary written to %s", path)
+
+
+def data_fingerprint(
+    train_df: pd.DataFrame,
+    val_df: pd.DataFrame,
+    config: TrainingConfig,
+) -> str:
+    """Hash the training inputs of a job.
+
+    Covers the clean train/validation frames (index and values) and every
+    config field that changes the fitted model, so an unchanged fingerprint
+    means retraining would reproduce the existing model.
+
+    Args:
+        train_df: Clean training features
+        val_df: Clean validation features
+        config: Training configuration
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for df in (train_df, val_df):
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        digest.update(",".join(map(str, df.columns)).encode())
+
+    params = {
+        "timeframe": config.timeframe,
+        "feature_names": config.feature_names,
+        "scaler_type": config.scaler_type,
+        "encoder_type": config.encoder_type,
+        "latent_dim": config.latent_dim,
+        "n_states": config.n_states,
+        "covariance_type": config.covariance_type,
+        "window_size": config.window_size,
+        "random_seed": config.random_seed,
+    }
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _load_from_db(
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    feature_names: list[str],
+) -> pd.DataFrame:
+    """Load features through FeatureLoader on a session of its own."""
+    with get_db_manager().get_session() as session:
+        return FeatureLoader(session).load_features(symbol, timeframe, start, end, feature_names)
+
+
+class BatchTrainer:
+    """Train state vector models for a symbol universe on a worker pool.
+
+    Features are loaded on a single background thread one job ahead of
+    the scheduler, so DB reads overlap training.  At most ``max_workers``
+    jobs train at once and at most one extra job's features are held in
+    memory waiting for a worker.
+    """
+
+    def __init__(
+        self,
+        config: BatchTrainingConfig,
+        models_root: Path = Path("models"),
+        max_workers: Optional[int] = 1,
+        load_features: Optional[FeatureLoadFn] = None,
+    ):
+        """Initialize batch trainer.
+
+        Args:
+            config: Batch configuration
+            models_root: Root directory for model artifacts
+            max_workers: Training processes (1 trains in-process, None uses all CPUs)
+            load_features: Feature loading function with the signature of
+                ``FeatureLoader.load_features``; defaults to the database
+        """
+        self.config = config
+        self.models_root = Path(models_root)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.load_features = load_features or _load_from_db
+
+    def jobs(self) -> list[TrainingJob]:
+        """Return the jobs in scheduling order (timeframe-major)."""
+        return [
+            TrainingJob(symbol=symbol, timeframe=timeframe)
+            for timeframe in self.config.timeframes
+            for symbol in self.config.symbols
+        ]
+
+    def run(self) -> BatchRunSummary:
+        """Run every job and return the summary.
+
+        Returns:
+            BatchRunSummary with one result per job, in job order
+        """
+        jobs = self.jobs()
+        started_at = datetime.now(timezone.utc)
+        logger.info("Batch training %d jobs on %d workers", len(jobs), self.max_workers)
+
+        results: dict[TrainingJob, JobResult] = {}
+        running: dict[Future, TrainingJob] = {}
+
+        def collect(done) -> None:
+            for future in done:
+                job = running.pop(future)
+                results[job] = future.result()
+                self._log_result(results[job], len(results), len(jobs))
+
+        executor = None
+        if self.max_workers > 1:
+            # spawn avoids forking a parent that may hold DB connections
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="feature-prefetch") as loader:
+            try:
+                next_load = loader.submit(self._prepare, jobs[0]) if jobs else None
+                for i, job in enumerate(jobs):
+                    prepared = next_load.result()
+                    next_load = loader.submit(self._prepare, jobs[i + 1]) if i + 1 < len(jobs) else None
+
+                    if isinstance(prepared, JobResult):
+                        results[job] = prepared
+                        self._log_result(prepared, len(results), len(jobs))
+                        continue
+
+                    if executor is None:
+                        results[job] = train_prepared_job(prepared, self.models_root)
+                        self._log_result(results[job], len(results), len(jobs))
+                        continue
+
+                    while len(running) >= self.max_workers:
+                        done, _ = wait(running, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    running[executor.submit(train_prepared_job, prepared, self.models_root)] = job
+
+                collect(wait(running).done)
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+
+        return BatchRunSummary(
+            started_at=started_at,
+            finished_at=datetime.now(timezone.utc),
+            max_workers=self.max_workers,
+            results=[results[job] for job in jobs],
+        )
+
+    def _prepare(self, job: TrainingJob) -> PreparedJob | JobResult:
+        """Load, clean and fingerprint a job's features.
+
+        Returns:
+            PreparedJob to train, or a final JobResult when the job is
+            skipped or cannot be trained
+        """
+        t0 = time.perf_counter()
+        try:
+            prepared = self._load_and_clean(job)
+        except Exception as e:
+            logger.warning("Could not prepare %s/%s: %s", job.symbol, job.timeframe, e)
+            return JobResult(job.symbol, job.timeframe, "failed", error=str(e))
+
+        prepared.load_seconds = time.perf_counter() - t0
+        fingerprint = prepared.config.data_fingerprint
+
+        latest = None if self.config.force else self._latest_metadata(job)
+        if latest is not None and latest.data_fingerprint == fingerprint:
+            return JobResult(
+                job.symbol, job.timeframe, "skipped",
+                model_id=latest.model_id,
+                fingerprint=fingerprint,
+                n_train_rows=len(prepared.train_df),
+                n_val_rows=len(prepared.val_df),
+                load_seconds=prepared.load_seconds,
+            )
+
+        return prepared
+
+    def _latest_metadata(self, job: TrainingJob) -> ModelMetadata | None:
+        """Metadata of the job's latest model.
+
+        Returns:
+            ModelMetadata, or None when there is no prior model or its
+            metadata cannot be read (the job is then retrained)
+        """
+        latest = get_latest_model(job.symbol, job.timeframe, self.models_root)
+        if latest is None or not latest.metadata_path.exists():
+            return None
+        try:
+            return latest.load_metadata()
+        except Exception as e:
+            logger.warning("Ignoring unreadable metadata %s: %s", latest.metadata_path, e)
+            return None
+
+    def _load_and_clean(self, job: TrainingJob) -> PreparedJob:
+        """Load a job's features, split them and drop unusable rows."""
+        cfg = self.config
+        requested = cfg.feature_names[job.timeframe]
+        df = self.load_features(job.symbol, job.timeframe, cfg.start, cfg.end, requested)
+        if df.empty:
+            raise ValueError("no features found")
+
+        feature_names = [f for f in requested if f in df.columns and df[f].notna().any()]
+        if len(feature_names) < 3:
+            raise ValueError(f"too few features available ({len(feature_names)})")
+
+        val_start = df.index.max() - timedelta(days=cfg.val_days)
+        train_end = val_start - timedelta(days=1)
+        gap_handler = GapHandler(job.timeframe, calendar=get_session_calendar())
+        train_df = gap_handler.handle_gaps(df[df.index <= train_end])[feature_names].dropna()
+        val_df = gap_handler.handle_gaps(df[df.index >= val_start])[feature_names].dropna()
+
+        if len(train_df) < cfg.min_train_rows:
+            raise ValueError(f"insufficient training data ({len(train_df)} rows)")
+        if len(val_df) < cfg.min_val_rows:
+            raise ValueError(f"insufficient validation data ({len(val_df)} rows)")
+
+        config = TrainingConfig(
+            timeframe=job.timeframe,
+            symbols=[job.symbol],
+            train_start=train_df.index.min(),
+            train_end=train_df.index.max(),
+            val_start=val_df.index.min(),
+            val_end=val_df.index.max(),
+            feature_names=feature_names,
+            scaler_type=cfg.scaler_type,
+            encoder_type="pca",
+            latent_dim=cfg.latent_dim.get(job.timeframe),
+            n_states=cfg.n_states.get(job.timeframe),
+            covariance_type=cfg.covariance_type,
+            random_seed=cfg.random_seed,
+        )
+        config.data_fingerprint = data_fingerprint(train_df, val_df, config)
+
+        return PreparedJob(
+            job=job,
+            config=config,
+            train_df=train_df,
+            val_df=val_df,
+            model_version=len(list_models(job.symbol, job.timeframe, self.models_root)) + 1,
+            load_seconds=0.0,
+        )
+
+    @staticmethod
+    def _log_result(result: JobResult, n_done: int, n_jobs: int) -> None:
+        """Log one finished job."""
+        if result.status == "failed":
+            logger.error(
+                "[%d/%d] %s/%s failed: %s",
+                n_done, n_jobs, result.symbol, result.timeframe, result.error,
+            )
+        else:
+            logger.info(
+                "[%d/%d] %s/%s %s (%s, train %.1fs, peak %.0f MB)",
+                n_done, n_jobs, result.symbol, result.timeframe, result.status,
+                result.model_id, result.train_seconds, result.peak_traced_mb,
+            )
+
+
+def train_prepared_job(prepared: PreparedJob, models_root: Path) -> JobResult:
+    """Train one prepared job, measuring time and memory.
+
+    Module-level so it can run in a process pool.  Failures are returned
+    as a failed JobResult rather than raised.
+
+    Args:
+        prepared: Job with cleaned data and config
+        models_root: Root directory for model artifacts
+
+    Returns:
+        JobResult for the job
+    """
+    job = prepared.job
+    result = JobResult(
+        job.symbol, job.timeframe, "failed",
+        fingerprint=prepared.config.data_fingerprint,
+        n_train_rows=len(prepared.train_df),
+        n_val_rows=len(prepared.val_df),
+        load_seconds=prepared.load_seconds,
+    )
+
+    tracemalloc.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        pipeline = TrainingPipeline(models_root=models_root, random_seed=prepared.config.random_seed)
+        trained = pipeline.train(
+            prepared.config,
+            prepared.train_df,
+            prepared.val_df,
+            model_version=prepared.model_version,
+        )
+        result.status = "trained"
+        result.model_id = trained.model_id
+        result.metrics = {k: float(v) for k, v in trained.metrics.items()}
+    except Exception as e:
+        result.error = str(e)
+    finally:
+        result.train_seconds = time.perf_counter() - wall_start
+        result.cpu_seconds = time.process_time() - cpu_start
+        result.peak_traced_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+        # ru_maxrss is reported in kilobytes on Linux
+        result.max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+    return result
@@ -225,6 +225,8 @@ class ModelMetadata:
         ood_threshold: Log-likelihood threshold for OOD detection
         state_mapping: Optional semantic labels for states (str(state_id) -> label dict)
         metrics: Training/validation metrics
+        data_fingerprint: Hash of the training inputs, used to skip
+            retraining when nothing changed
     """
 
     model_id: str
@@ -244,6 +246,7 @@ class ModelMetadata:
     ood_threshold: float = -50.0
     state_mapping: Optional[dict[str, dict]] = None
     metrics: dict[str, float] = field(default_factory=dict)
+    data_fingerprint: Optional[str] = None
 
     def __post_init__(self):
         if self.timeframe not in VALID_TIMEFRAMES:
@@ -291,6 +294,7 @@ class ModelMetadata:
             "ood_threshold": self.ood_threshold,
             "state_mapping": self.state_mapping,
             "metrics": self.metrics,
+            "data_fingerprint": self.data_fingerprint,
         })
 
     @classmethod
@@ -314,4 +318,5 @@ class ModelMetadata:
             ood_threshold=data.get("ood_threshold", -50.0),
             state_mapping=data.get("state_mapping"),
             metrics=data.get("metrics", {}),
+            data_fingerprint=data.get("data_fingerprint"),
         )
@@ -18,6 +18,8 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.data.database.models import ComputedFeature, OHLCVBar, Ticker
+from src.data.feature_store import ColumnarFeatureStore, get_feature_store
+from src.data.session_calendar import SessionCalendar
 from src.features.state.hmm.contracts import FeatureVector, VALID_TIMEFRAMES
 
 logger = logging.getLogger(__name__)
@@ -59,13 +61,20 @@ class DataSplit:
 class FeatureLoader:
     """Load pre-computed features from database."""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        feature_store: Optional[ColumnarFeatureStore] = None,
+    ):
         """Initialize feature loader.
 
         Args:
             session: SQLAlchemy database session
+            feature_store: Columnar feature store; defaults to the store
+                configured in settings
         """
         self.session = session
+        self.feature_store = feature_store if feature_store is not None else get_feature_store()
 
     def load_features(
         self,
@@ -75,7 +84,7 @@ class FeatureLoader:
         end: datetime,
         feature_names: list[str],
     ) -> pd.DataFrame:
-        """Load features from computed_features table.
+        """Load features from the feature store or computed_features table.
 
         Args:
             symbol: Ticker symbol
@@ -103,6 +112,16 @@ class FeatureLoader:
         if ticker is None:
             raise ValueError(f"Symbol not found: {symbol}")
 
+        if self.feature_store is not None and self.feature_store.has_features(symbol, timeframe):
+            df = self.feature_store.read(
+                symbol, timeframe, start=start, end=end, columns=feature_names,
+            )
+            logger.debug(
+                "Loaded %d feature rows for %s/%s from the feature store",
+                len(df), symbol, timeframe,
+            )
+            return df
+
         stmt = (
             select(ComputedFeature)
             .where(
@@ -148,6 +167,7 @@ class GapHandler:
         timeframe: str,
         max_gap_bars: int = 5,
         forward_fill_non_price: bool = True,
+        calendar: Optional[SessionCalendar] = None,
     ):
         """Initialize gap handler.
 
@@ -155,6 +175,9 @@ class GapHandler:
             timeframe: Expected bar timeframe
             max_gap_bars: Maximum gap size to forward-fill
             forward_fill_non_price: Whether to forward-fill non-price features
+            calendar: Exchange session calendar; when given, gaps are bars the
+                calendar expects but the index lacks, so overnight, weekend
+                and holiday breaks are not gaps (index must be UTC)
         """
         if timeframe not in VALID_TIMEFRAMES:
             raise ValueError(f"Invalid timeframe '{timeframe}'")
@@ -162,6 +185,7 @@ class GapHandler:
         self.timeframe = timeframe
         self.max_gap_bars = max_gap_bars
         self.forward_fill_non_price = forward_fill_non_price
+        self.calendar = calendar
 
         self.bar_duration = self._get_bar_duration(timeframe)
 
@@ -189,6 +213,10 @@ class GapHandler:
         if df.empty or len(df) < 2:
             return pd.Series(False, index=df.index)
 
+        if self.calendar is not None:
+            missing = self.calendar.missing_between(df.index, self.timeframe)
+            return pd.Series(missing > 0, index=df.index)
+
         time_diffs = df.index.to_series().diff()
         expected = self.bar_duration
 
@@ -208,6 +236,9 @@ class GapHandler:
         if len(index) < 2:
             return pd.Series(0, index=index)
 
+        if self.calendar is not None:
+            return pd.Series(self.calendar.missing_between(index, self.timeframe) + 1, index=index)
+
         time_diffs = index.to_series().diff()
         gap_bars = (time_diffs / self.bar_duration).fillna(1).astype(int)
         gap_bars = gap_bars.clip(lower=1)
@@ -4,17 +4,21 @@ Implements:
 - BaseEncoder: Abstract interface
 - PCAEncoder: PCA-based dimensionality reduction
 - TemporalPCAEncoder: PCA with temporal window input
+- StreamingTemporalEncoder: Bar-by-bar TemporalPCAEncoder transform
 """
 
 import pickle
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterable, Iterator, Literal, Optional
 
 import numpy as np
 from sklearn.decomposition import PCA
 
+# Windows flattened per chunk when fitting/encoding temporal windows
+WINDOW_CHUNK_SIZE = 65536
+
 
 @dataclass
 class EncoderMetrics:
@@ -208,6 +212,80 @@ class PCAEncoder(BaseEncoder):
 
         return self
 
+    def fit_chunks(self, chunks: Iterable[np.ndarray]) -> "PCAEncoder":
+        """Fit PCA from row chunks without materializing the full matrix.
+
+        Accumulates the mean and scatter matrix chunk by chunk and takes
+        their eigendecomposition (the ``covariance_eigh`` solver sklearn
+        picks for tall data), so memory is O(n_features^2) plus one chunk.
+        Rows with NaNs are skipped, as in :meth:`fit`.
+
+        Args:
+            chunks: Iterable of arrays of shape (n_rows, n_features)
+
+        Returns:
+            Self
+        """
+        n_samples = 0
+        shift = total = scatter = None
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=np.float64)
+            if chunk.ndim != 2:
+                raise ValueError(f"Expected 2D chunks, got shape {chunk.shape}")
+            chunk = chunk[~np.any(np.isnan(chunk), axis=1)]
+            if shift is None:
+                self._input_dim = chunk.shape[1]
+                # Shifting by an early mean avoids cancellation in the scatter matrix
+                shift = chunk.mean(axis=0) if len(chunk) else np.zeros(chunk.shape[1])
+                total = np.zeros(chunk.shape[1])
+                scatter = np.zeros((chunk.shape[1], chunk.shape[1]))
+            centered = chunk - shift
+            n_samples += len(chunk)
+            total += centered.sum(axis=0)
+            scatter += centered.T @ centered
+
+        if n_samples < max(self._latent_dim, 2):
+            raise ValueError(
+                f"Need at least {self._latent_dim} valid samples, got {n_samples}"
+            )
+
+        offset = total / n_samples
+        cov = (scatter - n_samples * np.outer(offset, offset)) / (n_samples - 1)
+        eigvals, eigvecs = np.linalg.eigh(cov)
+        eigvals = np.clip(eigvals[::-1], 0.0, None)[:min(n_samples, self._input_dim)]
+        eigvecs = eigvecs[:, ::-1]
+
+        n_components = min(self._latent_dim, n_samples, self._input_dim)
+        components = eigvecs[:, :n_components].T
+        # Same sign convention as sklearn (largest loading of each component positive)
+        signs = np.sign(components[np.arange(n_components), np.argmax(np.abs(components), axis=1)])
+        components *= signs[:, None]
+
+        pca = PCA(n_components=n_components, whiten=self.whiten)
+        pca.n_components_ = n_components
+        pca.n_samples_ = n_samples
+        pca.n_features_in_ = self._input_dim
+        pca.mean_ = shift + offset
+        pca.components_ = components
+        pca.explained_variance_ = eigvals[:n_components]
+        pca.explained_variance_ratio_ = eigvals[:n_components] / eigvals.sum()
+        pca.singular_values_ = np.sqrt(eigvals[:n_components] * (n_samples - 1))
+        pca.noise_variance_ = eigvals[n_components:].mean() if n_components < len(eigvals) else 0.0
+        self.pca_ = pca
+        self._latent_dim = n_components
+
+        # Mean squared reconstruction error is the discarded variance per feature
+        cumsum = np.cumsum(pca.explained_variance_ratio_)
+        n_for_95 = np.searchsorted(cumsum, 0.95) + 1
+        self.metrics_ = EncoderMetrics(
+            explained_variance_ratio=pca.explained_variance_ratio_,
+            total_variance_explained=cumsum[-1] if len(cumsum) > 0 else 0.0,
+            reconstruction_error=eigvals[n_components:].sum() * (n_samples - 1) / n_samples / self._input_dim,
+            n_components_for_95=min(n_for_95, len(cumsum)),
+        )
+
+        return self
+
     def _compute_metrics(self, X: np.ndarray) -> None:
         """Compute training metrics."""
         Z = self.pca_.transform(X)
@@ -244,10 +322,27 @@ class PCAEncoder(BaseEncoder):
 
         mask = ~np.any(np.isnan(X), axis=1)
         if mask.sum() > 0:
-            result[mask] = self.pca_.transform(X[mask])
+            result[mask] = self._project(X[mask])
 
         return result
 
+    def _project(self, X: np.ndarray) -> np.ndarray:
+        """Project rows onto the principal components.
+
+        Same computation as ``PCA.transform`` without sklearn's per-call
+        input validation (which dominates single-bar latency).  The einsum
+        reduces each row independently, so a row projects to the same bits
+        alone or inside a batch.
+        """
+        pca = self.pca_
+        Z = np.einsum("nf,lf->nl", X, pca.components_)
+        Z -= np.einsum("f,lf->l", pca.mean_, pca.components_)
+        if pca.whiten:
+            scale = np.sqrt(pca.explained_variance_)
+            scale[scale < np.finfo(scale.dtype).eps] = np.finfo(scale.dtype).eps
+            Z /= scale
+        return Z
+
     def inverse_transform(self, Z: np.ndarray) -> np.ndarray:
         """Decode latent vectors back to feature space.
 
@@ -292,13 +387,21 @@ class TemporalPCAEncoder(BaseEncoder):
     Input: X_t = [x_{t-L+1}, ..., x_t] of shape (L, D)
     Flattened: [x_{t-L+1}^1, ..., x_{t-L+1}^D, ..., x_t^1, ..., x_t^D]
     Output: z_t of shape (d,)
+
+    Windows are flattened ``chunk_size`` at a time, so fitting on the
+    strided view returned by :func:`create_windows` costs O(n * D) memory
+    for the series plus one chunk, not O(n * L * D).
     """
 
+    # Class-level default keeps encoders pickled before chunking loadable
+    chunk_size: int = WINDOW_CHUNK_SIZE
+
     def __init__(
         self,
         latent_dim: int = 8,
         window_size: int = 5,
         whiten: bool = False,
+        chunk_size: int = WINDOW_CHUNK_SIZE,
     ):
         """Initialize temporal PCA encoder.
 
@@ -306,10 +409,12 @@ class TemporalPCAEncoder(BaseEncoder):
             latent_dim: Latent dimensionality
             window_size: Number of time steps in window
             whiten: Whether to whiten output
+            chunk_size: Windows flattened per chunk in fit/transform
         """
         self._latent_dim = latent_dim
         self.window_size = window_size
         self.whiten = whiten
+        self.chunk_size = chunk_size
         self.pca_encoder_: Optional[PCAEncoder] = None
         self._feature_dim: Optional[int] = None
 
@@ -335,6 +440,10 @@ class TemporalPCAEncoder(BaseEncoder):
     def fit(self, X: np.ndarray) -> "TemporalPCAEncoder":
         """Fit encoder to windowed training data.
 
+        Inputs larger than ``chunk_size`` windows are fitted with
+        :meth:`PCAEncoder.fit_chunks`, so the flattened matrix is never
+        materialized.
+
         Args:
             X: Training data of shape (n_samples, window_size, n_features)
 
@@ -352,18 +461,30 @@ class TemporalPCAEncoder(BaseEncoder):
 
         self._feature_dim = X.shape[2]
 
-        X_flat = X.reshape(X.shape[0], -1)
-
         self.pca_encoder_ = PCAEncoder(
             latent_dim=self._latent_dim,
             whiten=self.whiten,
         )
-        self.pca_encoder_.fit(X_flat)
+        if X.shape[0] <= self.chunk_size:
+            self.pca_encoder_.fit(X.reshape(X.shape[0], -1))
+        else:
+            self.pca_encoder_.fit_chunks(iter_flat_windows(X, self.chunk_size))
 
         self._latent_dim = self.pca_encoder_.latent_dim
 
         return self
 
+    def fit_series(self, X: np.ndarray) -> "TemporalPCAEncoder":
+        """Fit encoder on every sliding window of a time series.
+
+        Args:
+            X: Time series of shape (n_timesteps, n_features)
+
+        Returns:
+            Self
+        """
+        return self.fit(create_windows(X, self.window_size))
+
     def transform(self, X: np.ndarray) -> np.ndarray:
         """Encode windowed data to latent space.
 
@@ -380,8 +501,32 @@ class TemporalPCAEncoder(BaseEncoder):
         if X.ndim == 2:
             X = X.reshape(1, X.shape[0], X.shape[1])
 
-        X_flat = X.reshape(X.shape[0], -1)
-        return self.pca_encoder_.transform(X_flat)
+        if X.shape[0] <= self.chunk_size:
+            return self.pca_encoder_.transform(X.reshape(X.shape[0], -1))
+
+        Z = np.empty((X.shape[0], self._latent_dim))
+        start = 0
+        for X_flat in iter_flat_windows(X, self.chunk_size):
+            Z[start : start + len(X_flat)] = self.pca_encoder_.transform(X_flat)
+            start += len(X_flat)
+        return Z
+
+    def transform_series(self, X: np.ndarray) -> np.ndarray:
+        """Encode every sliding window of a time series.
+
+        Args:
+            X: Time series of shape (n_timesteps, n_features)
+
+        Returns:
+            Latent vectors of shape (n_timesteps - window_size + 1, latent_dim)
+        """
+        return self.transform(create_windows(X, self.window_size))
+
+    def streaming(self) -> "StreamingTemporalEncoder":
+        """Return a bar-by-bar encoder backed by a ring buffer."""
+        if self.pca_encoder_ is None:
+            raise ValueError("Encoder not fitted. Call fit() first.")
+        return StreamingTemporalEncoder(self)
 
     def inverse_transform(self, Z: np.ndarray) -> np.ndarray:
         """Decode latent vectors back to windowed feature space.
@@ -406,6 +551,60 @@ class TemporalPCAEncoder(BaseEncoder):
         return self.pca_encoder_.metrics_
 
 
+class StreamingTemporalEncoder:
+    """Incremental TemporalPCAEncoder transform for live bars.
+
+    Keeps the last ``window_size`` feature vectors in a ring buffer that is
+    written twice (at ``i`` and ``i + window_size``), so the current window
+    is always the contiguous slice ending at the newest row and no window
+    is ever copied or re-stacked.
+    """
+
+    def __init__(self, encoder: TemporalPCAEncoder):
+        """Initialize StreamingTemporalEncoder.
+
+        Args:
+            encoder: Fitted temporal encoder
+        """
+        self.encoder = encoder
+        self.window_size = encoder.window_size
+        self._buffer = np.full((2 * self.window_size, encoder.feature_dim), np.nan)
+        self._count = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """Return whether a full window has been observed."""
+        return self._count >= self.window_size
+
+    def reset(self) -> None:
+        """Forget all buffered bars."""
+        self._buffer.fill(np.nan)
+        self._count = 0
+
+    def window(self) -> np.ndarray:
+        """Return a view of the current window, oldest row first."""
+        pos = (self._count - 1) % self.window_size
+        return self._buffer[pos + 1 : pos + 1 + self.window_size]
+
+    def update(self, x: np.ndarray) -> np.ndarray:
+        """Push one bar of features and encode the window ending at it.
+
+        Args:
+            x: Feature vector of shape (n_features,)
+
+        Returns:
+            Latent vector of shape (latent_dim,), NaN until the window fills
+        """
+        pos = self._count % self.window_size
+        self._buffer[pos] = x
+        self._buffer[pos + self.window_size] = x
+        self._count += 1
+
+        if not self.is_ready:
+            return np.full(self.encoder.latent_dim, np.nan)
+        return self.encoder.pca_encoder_.transform(self.window().reshape(1, -1))[0]
+
+
 def create_windows(
     X: np.ndarray,
     window_size: int,
@@ -413,6 +612,8 @@ def create_windows(
 ) -> np.ndarray:
     """Create sliding windows from time series data.
 
+    Returns a read-only strided view of ``X``; no window data is copied.
+
     Args:
         X: Data of shape (n_timesteps, n_features)
         window_size: Size of sliding window
@@ -425,22 +626,34 @@ def create_windows(
     if X.ndim != 2:
         raise ValueError(f"Expected 2D input, got shape {X.shape}")
 
-    n_timesteps, n_features = X.shape
+    n_timesteps = X.shape[0]
 
     if window_size > n_timesteps:
         raise ValueError(
             f"Window size {window_size} > n_timesteps {n_timesteps}"
         )
 
-    n_windows = (n_timesteps - window_size) // stride + 1
+    windows = np.lib.stride_tricks.sliding_window_view(X, window_size, axis=0)
+    # sliding_window_view puts the window axis last: (n, features, window)
+    return windows[::stride].transpose(0, 2, 1)
+
 
-    windows = np.zeros((n_windows, window_size, n_features))
+def iter_flat_windows(X: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    """Yield flattened windows in chunks of at most ``chunk_size`` rows.
 
-    for i in range(n_windows):
-        start = i * stride
-        windows[i] = X[start : start + window_size]
+    Only one chunk is materialized at a time, so this is the bounded-memory
+    way to feed a :func:`create_windows` view to row-wise consumers.
 
-    return windows
+    Args:
+        X: Windowed data of shape (n_windows, window_size, n_features)
+        chunk_size: Maximum windows per chunk
+
+    Yields:
+        Arrays of shape (n_chunk, window_size * n_features)
+    """
+    for start in range(0, X.shape[0], chunk_size):
+        chunk = X[start : start + chunk_size]
+        yield chunk.reshape(chunk.shape[0], -1)
 
 
 def select_latent_dim(
@@ -452,7 +665,9 @@ def select_latent_dim(
     """Select latent dimension based on explained variance.
 
     Args:
-        X: Training data of shape (n_samples, n_features)
+        X: Training data of shape (n_samples, n_features), or windows of
+           shape (n_samples, window_size, n_features) which are flattened
+           in chunks
         variance_threshold: Target cumulative explained variance
         max_dim: Maximum latent dimension
         min_dim: Minimum latent dimension
@@ -461,6 +676,16 @@ def select_latent_dim(
         Recommended latent dimension
     """
     X = np.asarray(X)
+    if X.ndim == 3 and X.shape[0] > WINDOW_CHUNK_SIZE:
+        max_possible = min(X.shape[0], X.shape[1] * X.shape[2], max_dim)
+        encoder = PCAEncoder(latent_dim=max_possible)
+        encoder.fit_chunks(iter_flat_windows(X, WINDOW_CHUNK_SIZE))
+        cumsum = np.cumsum(encoder.explained_variance_ratio)
+        n_for_threshold = np.searchsorted(cumsum, variance_threshold) + 1
+        return max(min_dim, min(n_for_threshold, max_dim))
+    if X.ndim == 3:
+        X = X.reshape(X.shape[0], -1)
+
     mask = ~np.any(np.isnan(X), axis=1)
     X_clean = X[mask]
 
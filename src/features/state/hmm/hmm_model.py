@@ -5,21 +5,26 @@ Implements:
 - State inference (filtering, Viterbi)
 - Covariance regularization
 - Model selection (AIC/BIC)
+- ModelSearch: Parallel candidate fitting with shared-memory inputs
 """
 
 import logging
+import multiprocessing
 import pickle
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Callable, Hashable, Literal, Optional
 
 import numpy as np
 from sklearn.cluster import KMeans
 
+from src.utils.shared_memory import SharedArrayHandle, SharedMemoryStore
+
 logger = logging.getLogger(__name__)
 
 try:
-    from hmmlearn import hmm
+    from hmmlearn import _hmmc, hmm
     HAS_HMMLEARN = True
 except ImportError:
     HAS_HMMLEARN = False
@@ -49,6 +54,30 @@ class HMMMetrics:
     state_occupancy: np.ndarray
 
 
+@dataclass
+class _EmissionCache:
+    """Per-state Gaussian terms precomputed from fitted HMM parameters.
+
+    Attributes:
+        means: State means of shape (K, d)
+        prec_chol: Inverse Cholesky factors of shape (K, d, d), or None
+            for diag/spherical models
+        prec_mean: prec_chol applied to the means, shape (K, d), or None
+        prec_diag: Inverse variances of shape (K, d) for diag/spherical models
+        log_norm: Gaussian normalizer -0.5 * (d log 2pi + log|cov|) per state
+        log_startprob: Log of the initial state distribution
+        log_weights: Log mixture weights used for the emission likelihood
+    """
+
+    means: np.ndarray
+    prec_chol: Optional[np.ndarray]
+    prec_mean: Optional[np.ndarray]
+    prec_diag: Optional[np.ndarray]
+    log_norm: np.ndarray
+    log_startprob: np.ndarray
+    log_weights: np.ndarray
+
+
 class GaussianHMMWrapper:
     """Wrapper around hmmlearn GaussianHMM with custom initialization.
 
@@ -58,6 +87,7 @@ class GaussianHMMWrapper:
     - Transition matrix initialization with diagonal bias
     - Filtering (forward algorithm) for online inference
     - Viterbi decoding for offline analysis
+    - Cached Cholesky factors so per-bar emission terms cost one einsum
     """
 
     def __init__(
@@ -95,6 +125,13 @@ class GaussianHMMWrapper:
         self.model_: Optional[hmm.GaussianHMM] = None
         self.metrics_: Optional[HMMMetrics] = None
         self._latent_dim: Optional[int] = None
+        self._emission_cache: Optional[_EmissionCache] = None
+
+    def __getstate__(self) -> dict:
+        # The cache is derived from model_; rebuild it on load instead of pickling it
+        state = self.__dict__.copy()
+        state["_emission_cache"] = None
+        return state
 
     @property
     def latent_dim(self) -> int:
@@ -188,6 +225,7 @@ class GaussianHMMWrapper:
             )
 
         self._latent_dim = Z_clean.shape[1]
+        self._emission_cache = None
 
         logger.info(
             "Fitting HMM: n_states=%d, n_samples=%d, latent_dim=%d",
@@ -218,6 +256,7 @@ class GaussianHMMWrapper:
         self.model_.fit(Z_clean, lengths=clean_lengths)
 
         self._regularize_covariances()
+        self._build_emission_cache()
 
         self._compute_metrics(Z_clean, lengths=clean_lengths)
 
@@ -269,6 +308,62 @@ class GaussianHMMWrapper:
             covars = np.maximum(covars, self.cov_reg)
             self.model_.covars_ = covars
 
+    def _build_emission_cache(self) -> None:
+        """Precompute per-state Cholesky factors and log-determinants.
+
+        Called after fitting and loading; must be called again whenever
+        the parameters of ``model_`` are changed in place.
+        """
+        d = self._latent_dim
+        means = np.asarray(self.model_.means_, dtype=np.float64)
+        prec_chol = prec_mean = prec_diag = None
+
+        if self.covariance_type in ("diag", "spherical"):
+            variances = np.diagonal(self.model_.covars_, axis1=1, axis2=2)
+            prec_diag = 1.0 / variances
+            log_det = np.log(variances).sum(axis=1)
+        else:
+            covars = self.model_.covars_
+            prec_chol = np.empty_like(covars)
+            log_det = np.empty(self.n_states)
+            for k in range(self.n_states):
+                try:
+                    chol = np.linalg.cholesky(covars[k])
+                except np.linalg.LinAlgError:
+                    logger.warning("Covariance of state %d is not positive definite, using identity", k)
+                    chol = np.eye(d)
+                prec_chol[k] = np.linalg.inv(chol)
+                log_det[k] = 2.0 * np.log(np.diag(chol)).sum()
+            prec_mean = np.einsum("kij,kj->ki", prec_chol, means)
+
+        with np.errstate(divide="ignore"):
+            log_startprob = np.log(self.model_.startprob_)
+
+        self._emission_cache = _EmissionCache(
+            means=means,
+            prec_chol=prec_chol,
+            prec_mean=prec_mean,
+            prec_diag=prec_diag,
+            log_norm=-0.5 * (d * np.log(2 * np.pi) + log_det),
+            log_startprob=log_startprob,
+            log_weights=np.log(self.model_.startprob_ + EPS),
+        )
+
+    def _state_log_likelihood(self, Z: np.ndarray) -> np.ndarray:
+        """Log-density of each NaN-free row under each state's Gaussian."""
+        if getattr(self, "_emission_cache", None) is None:
+            self._build_emission_cache()
+        cache = self._emission_cache
+
+        if cache.prec_diag is not None:
+            diff = Z[:, np.newaxis, :] - cache.means
+            mahal = np.einsum("nkd,nkd,kd->nk", diff, diff, cache.prec_diag)
+        else:
+            y = np.einsum("kij,nj->nki", cache.prec_chol, Z) - cache.prec_mean
+            mahal = np.einsum("nki,nki->nk", y, y)
+
+        return cache.log_norm - 0.5 * mahal
+
     def _compute_metrics(
         self,
         Z: np.ndarray,
@@ -350,20 +445,7 @@ class GaussianHMMWrapper:
         Returns:
             Posterior probabilities of shape (n_samples, n_states)
         """
-        if self.model_ is None:
-            raise ValueError("Model not fitted. Call fit() first.")
-
-        Z = np.asarray(Z)
-        if Z.ndim == 1:
-            Z = Z.reshape(1, -1)
-
-        result = np.full((len(Z), self.n_states), np.nan)
-        mask = ~np.any(np.isnan(Z), axis=1)
-
-        if mask.sum() > 0:
-            result[mask] = self.model_.predict_proba(Z[mask])
-
-        return result
+        return self.predict_proba_and_log_likelihood(Z)[0]
 
     def score_samples(self, Z: np.ndarray) -> np.ndarray:
         """Compute per-sample log-likelihood.
@@ -402,53 +484,101 @@ class GaussianHMMWrapper:
         Returns:
             Log-likelihoods of shape (n_samples,)
         """
+        return self.predict_proba_and_log_likelihood(Z)[1]
+
+    def state_log_likelihood(self, Z: np.ndarray) -> np.ndarray:
+        """Compute per-state emission log-densities log p(z_t | s_t = k).
+
+        Rows are evaluated independently with the cached Cholesky factors,
+        so a row gives bit-identical results alone or inside a batch.
+
+        Args:
+            Z: Latent vectors of shape (n_samples, latent_dim)
+
+        Returns:
+            Log-densities of shape (n_samples, n_states); rows with NaNs are NaN
+        """
         if self.model_ is None:
             raise ValueError("Model not fitted. Call fit() first.")
 
-        Z = np.asarray(Z)
+        Z = np.asarray(Z, dtype=np.float64)
         if Z.ndim == 1:
             Z = Z.reshape(1, -1)
 
-        result = np.full(len(Z), np.nan)
+        result = np.full((len(Z), self.n_states), np.nan)
         mask = ~np.any(np.isnan(Z), axis=1)
+        if mask.any():
+            result[mask] = self._state_log_likelihood(Z[mask])
+        return result
 
-        if mask.sum() == 0:
-            return result
+    def mixture_log_likelihood(self, log_frameprob: np.ndarray) -> np.ndarray:
+        """Combine per-state log-densities into the mixture log-likelihood.
 
-        Z_clean = Z[mask]
+        Args:
+            log_frameprob: Output of :meth:`state_log_likelihood`
+
+        Returns:
+            Emission log-likelihoods of shape (n_samples,)
+        """
+        if getattr(self, "_emission_cache", None) is None:
+            self._build_emission_cache()
+        with np.errstate(invalid="ignore"):
+            return np.logaddexp.reduce(self._emission_cache.log_weights + log_frameprob, axis=1)
+
+    @property
+    def log_startprob(self) -> np.ndarray:
+        """Return log of the initial state distribution."""
+        if self.model_ is None:
+            raise ValueError("Model not fitted")
+        if getattr(self, "_emission_cache", None) is None:
+            self._build_emission_cache()
+        return self._emission_cache.log_startprob
+
+    def predict_proba_and_log_likelihood(self, Z: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Compute posteriors and emission log-likelihoods in one pass.
+
+        The per-state Gaussian log-densities are evaluated once and shared
+        by the forward-backward posteriors and the mixture log-likelihood.
+
+        Args:
+            Z: Latent vectors of shape (n_samples, latent_dim)
+
+        Returns:
+            Tuple of (posteriors of shape (n_samples, n_states),
+            log-likelihoods of shape (n_samples,)); rows with NaNs are NaN
+        """
+        if self.model_ is None:
+            raise ValueError("Model not fitted. Call fit() first.")
+
+        Z = np.asarray(Z, dtype=np.float64)
+        if Z.ndim == 1:
+            Z = Z.reshape(1, -1)
+
+        posteriors = np.full((len(Z), self.n_states), np.nan)
+        log_liks = np.full(len(Z), np.nan)
+        mask = ~np.any(np.isnan(Z), axis=1)
+
+        if not mask.any():
+            return posteriors, log_liks
 
-        log_probs = np.zeros((len(Z_clean), self.n_states))
-
-        for k in range(self.n_states):
-            mean = self.model_.means_[k]
-
-            if self.covariance_type == "full":
-                cov = self.model_.covars_[k]
-            elif self.covariance_type == "diag":
-                cov = np.diag(self.model_.covars_[k])
-            elif self.covariance_type == "tied":
-                cov = self.model_.covars_
-            elif self.covariance_type == "spherical":
-                cov = self.model_.covars_[k] * np.eye(self._latent_dim)
-
-            diff = Z_clean - mean
-            try:
-                inv_cov = np.linalg.inv(cov)
-                log_det = np.log(np.linalg.det(cov) + EPS)
-            except np.linalg.LinAlgError:
-                inv_cov = np.eye(self._latent_dim)
-                log_det = 0.0
-
-            mahal = np.sum(diff @ inv_cov * diff, axis=1)
-            log_probs[:, k] = -0.5 * (
-                self._latent_dim * np.log(2 * np.pi) + log_det + mahal
+        log_frameprob = self._state_log_likelihood(Z[mask])
+
+        if len(log_frameprob) == 1:
+            log_gamma = self._emission_cache.log_startprob + log_frameprob
+        else:
+            _, fwdlattice = _hmmc.forward_log(
+                self.model_.startprob_, self.model_.transmat_, log_frameprob,
+            )
+            bwdlattice = _hmmc.backward_log(
+                self.model_.startprob_, self.model_.transmat_, log_frameprob,
             )
+            log_gamma = fwdlattice + bwdlattice
 
-        weights = self.model_.startprob_
-        log_mixture = np.log(weights + EPS) + log_probs
-        result[mask] = np.logaddexp.reduce(log_mixture, axis=1)
+        log_gamma -= np.logaddexp.reduce(log_gamma, axis=1, keepdims=True)
+        posteriors[mask] = np.exp(log_gamma)
+        log_liks[mask] = self.mixture_log_likelihood(log_frameprob)
 
-        return result
+        return posteriors, log_liks
 
     @property
     def transition_matrix(self) -> np.ndarray:
@@ -494,7 +624,262 @@ class GaussianHMMWrapper:
             Loaded model instance
         """
         with open(path, "rb") as f:
-            return pickle.load(f)
+            model = pickle.load(f)
+        if model.model_ is not None:
+            model._build_emission_cache()
+        return model
+
+
+def hmm_fit_metrics(
+    hmm: GaussianHMMWrapper,
+    Z_val: Optional[np.ndarray] = None,
+) -> dict[str, float]:
+    """Summarize a fitted HMM as the flat metrics dict used by training.
+
+    Args:
+        hmm: Fitted model
+        Z_val: Optional validation latents (NaN rows are ignored)
+
+    Returns:
+        Dictionary with train log-likelihood/AIC/BIC, mean dwell time and,
+        when validation data is given, val_log_likelihood
+    """
+    metrics = {}
+
+    if hmm.metrics_:
+        metrics["train_log_likelihood"] = hmm.metrics_.log_likelihood
+        metrics["train_aic"] = hmm.metrics_.aic
+        metrics["train_bic"] = hmm.metrics_.bic
+        metrics["mean_dwell_time"] = float(np.mean(hmm.metrics_.mean_dwell_time))
+
+    if Z_val is not None:
+        mask_val = ~np.any(np.isnan(Z_val), axis=1)
+        if mask_val.sum() > 0:
+            metrics["val_log_likelihood"] = hmm.model_.score(Z_val[mask_val])
+
+    return metrics
+
+
+@dataclass(frozen=True)
+class ModelSearchCandidate:
+    """One HMM configuration to fit during model search.
+
+    The seed is part of the candidate, so a candidate fits identically
+    whichever worker runs it and in whatever order.
+
+    Attributes:
+        n_states: Number of hidden states
+        covariance_type: HMM covariance type
+        random_state: Seed for k-means initialization and EM
+        data_key: Key of the latent matrix to fit on (e.g. latent_dim)
+    """
+
+    n_states: int
+    covariance_type: str = "diag"
+    random_state: Optional[int] = None
+    data_key: Hashable = None
+
+
+@dataclass
+class ModelSearchResult:
+    """Outcome of fitting one candidate.
+
+    Attributes:
+        candidate: The candidate that was fitted
+        metrics: Metrics from :func:`hmm_fit_metrics`
+        pruned: True if the candidate was dropped after the probe fit;
+            metrics then come from the shortened probe
+        error: Error message if fitting failed
+    """
+
+    candidate: ModelSearchCandidate
+    metrics: dict[str, float] = field(default_factory=dict)
+    pruned: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the candidate was fully fitted."""
+        return self.error is None and not self.pruned
+
+
+class ModelSearch:
+    """Fit many independent HMM candidates, optionally on a process pool.
+
+    With ``max_workers != 1`` the latent matrices are copied into shared
+    memory once and workers attach to them read-only, so each task only
+    pickles a candidate and a handle.  Every candidate carries its own
+    seed, so the serial and parallel paths return identical results in
+    candidate order.
+
+    Early stopping is opt-in: when ``probe_iter`` and ``prune_margin`` are
+    set, every candidate is first fitted with ``probe_iter`` EM iterations,
+    and candidates whose probe score trails the best probe score by more
+    than ``prune_margin * |best|`` are dropped before the full fit.
+    Survivors are refitted from scratch, so their results do not depend on
+    the probe.
+    """
+
+    def __init__(
+        self,
+        n_iter: int = 100,
+        max_workers: Optional[int] = 1,
+        metric: str = "train_bic",
+        maximize: bool = False,
+        probe_iter: Optional[int] = None,
+        prune_margin: Optional[float] = None,
+    ):
+        """Initialize ModelSearch.
+
+        Args:
+            n_iter: EM iterations for the full fit
+            max_workers: Worker processes (1 runs in-process, None uses all CPUs)
+            metric: Metric used to rank candidates for pruning
+            maximize: Whether higher metric values are better
+            probe_iter: EM iterations for the pruning probe (None disables)
+            prune_margin: Relative score margin beyond which a probed
+                candidate is considered dominated (None disables)
+        """
+        self.n_iter = n_iter
+        self.max_workers = max_workers
+        self.metric = metric
+        self.maximize = maximize
+        self.probe_iter = probe_iter
+        self.prune_margin = prune_margin
+
+    def run(
+        self,
+        candidates: list[ModelSearchCandidate],
+        Z_train: np.ndarray | dict[Hashable, np.ndarray],
+        Z_val: Optional[np.ndarray | dict[Hashable, np.ndarray]] = None,
+    ) -> list[ModelSearchResult]:
+        """Fit all candidates.
+
+        Args:
+            candidates: Candidates to fit
+            Z_train: Training latents, or a dict keyed by candidate data_key
+            Z_val: Optional validation latents in the same layout
+
+        Returns:
+            One result per candidate, in candidate order
+        """
+        candidates = list(candidates)
+        train = Z_train if isinstance(Z_train, dict) else {None: Z_train}
+        val = Z_val if isinstance(Z_val, dict) else ({None: Z_val} if Z_val is not None else {})
+
+        if self.max_workers == 1 or len(candidates) <= 1:
+            def fit_all(batch: list[ModelSearchCandidate], n_iter: int) -> list[ModelSearchResult]:
+                return [
+                    _fit_candidate(c, train[c.data_key], val.get(c.data_key), n_iter)
+                    for c in batch
+                ]
+            return self._search(candidates, fit_all)
+
+        with SharedMemoryStore() as store:
+            train_handles = {key: store.share_array(Z) for key, Z in train.items()}
+            val_handles = {key: store.share_array(Z) for key, Z in val.items()}
+            logger.info(
+                "Fitting %d HMM candidates on %s workers (%.1f MB shared)",
+                len(candidates), self.max_workers or "all", store.nbytes / 1e6,
+            )
+
+            # spawn avoids forking a parent that may hold gRPC/DB threads
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                def fit_all(batch: list[ModelSearchCandidate], n_iter: int) -> list[ModelSearchResult]:
+                    futures = [
+                        executor.submit(
+                            _fit_candidate_worker,
+                            c,
+                            train_handles[c.data_key],
+                            val_handles.get(c.data_key),
+                            n_iter,
+                        )
+                        for c in batch
+                    ]
+                    return [future.result() for future in futures]
+                return self._search(candidates, fit_all)
+
+    def _search(
+        self,
+        candidates: list[ModelSearchCandidate],
+        fit_all: Callable[[list[ModelSearchCandidate], int], list[ModelSearchResult]],
+    ) -> list[ModelSearchResult]:
+        """Run the optional probe/prune round, then the full fit."""
+        if self.probe_iter is None or self.prune_margin is None or self.probe_iter >= self.n_iter:
+            return fit_all(candidates, self.n_iter)
+
+        probes = fit_all(candidates, self.probe_iter)
+        dominated = self._dominated(probes)
+        survivors = [
+            c for c, probe, drop in zip(candidates, probes, dominated)
+            if probe.error is None and not drop
+        ]
+        logger.info(
+            "Model search probe pruned %d of %d candidates", sum(dominated), len(candidates),
+        )
+
+        finals = iter(fit_all(survivors, self.n_iter))
+        results = []
+        for probe, drop in zip(probes, dominated):
+            if probe.error is not None:
+                results.append(probe)
+            elif drop:
+                results.append(replace(probe, pruned=True))
+            else:
+                results.append(next(finals))
+        return results
+
+    def _dominated(self, probes: list[ModelSearchResult]) -> list[bool]:
+        """Flag probes whose score trails the best by more than the margin."""
+        scores = [
+            p.metrics.get(self.metric) if p.error is None else None for p in probes
+        ]
+        valid = [s for s in scores if s is not None and np.isfinite(s)]
+        if not valid:
+            return [False] * len(probes)
+
+        best = max(valid) if self.maximize else min(valid)
+        slack = self.prune_margin * abs(best)
+        if self.maximize:
+            return [s is not None and s < best - slack for s in scores]
+        return [s is not None and s > best + slack for s in scores]
+
+
+def _fit_candidate(
+    candidate: ModelSearchCandidate,
+    Z_train: np.ndarray,
+    Z_val: Optional[np.ndarray],
+    n_iter: int,
+) -> ModelSearchResult:
+    """Fit one candidate and summarize it; failures are returned, not raised."""
+    try:
+        wrapper = GaussianHMMWrapper(
+            n_states=candidate.n_states,
+            covariance_type=candidate.covariance_type,
+            n_iter=n_iter,
+            random_state=candidate.random_state,
+        )
+        wrapper.fit(Z_train)
+        return ModelSearchResult(candidate, hmm_fit_metrics(wrapper, Z_val))
+    except Exception as e:
+        return ModelSearchResult(candidate, error=str(e))
+
+
+def _fit_candidate_worker(
+    candidate: ModelSearchCandidate,
+    train_handle: SharedArrayHandle,
+    val_handle: Optional[SharedArrayHandle],
+    n_iter: int,
+) -> ModelSearchResult:
+    """Process-pool entry point for a single model search candidate."""
+    with train_handle.open() as Z_train:
+        if val_handle is None:
+            return _fit_candidate(candidate, Z_train, None, n_iter)
+        with val_handle.open() as Z_val:
+            return _fit_candidate(candidate, Z_train, Z_val, n_iter)
 
 
 def select_n_states(
@@ -504,6 +889,9 @@ def select_n_states(
     covariance_type: str = "diag",
     n_iter: int = 50,
     random_state: Optional[int] = None,
+    max_workers: Optional[int] = 1,
+    probe_iter: Optional[int] = None,
+    prune_margin: Optional[float] = None,
 ) -> tuple[int, dict[int, float]]:
     """Select optimal number of states using AIC or BIC.
 
@@ -514,37 +902,47 @@ def select_n_states(
         covariance_type: HMM covariance type
         n_iter: Max EM iterations per model
         random_state: Random seed
+        max_workers: Worker processes for fitting candidates (1 is serial)
+        probe_iter: EM iterations for the early-stopping probe
+        prune_margin: Relative criterion margin for dropping dominated K
 
     Returns:
         Tuple of (optimal K, dict mapping K -> criterion value)
     """
-    scores = {}
-
-    for n_states in state_range:
-        try:
-            wrapper = GaussianHMMWrapper(
-                n_states=n_states,
-                covariance_type=covariance_type,
-                n_iter=n_iter,
-                random_state=random_state,
-            )
-            wrapper.fit(Z)
-
-            if criterion == "aic":
-                scores[n_states] = wrapper.metrics_.aic
-            else:
-                scores[n_states] = wrapper.metrics_.bic
-
-            logger.debug(
-                "Model selection: n_states=%d, %s=%.2f",
-                n_states, criterion, scores[n_states],
-            )
+    candidates = [
+        ModelSearchCandidate(
+            n_states=n_states,
+            covariance_type=covariance_type,
+            random_state=random_state,
+        )
+        for n_states in state_range
+    ]
+    search = ModelSearch(
+        n_iter=n_iter,
+        max_workers=max_workers,
+        metric=f"train_{criterion}",
+        maximize=False,
+        probe_iter=probe_iter,
+        prune_margin=prune_margin,
+    )
 
-        except Exception:
+    scores = {}
+    for result in search.run(candidates, Z):
+        n_states = result.candidate.n_states
+        if result.error is not None:
             logger.debug(
                 "Model selection: n_states=%d failed to fit", n_states
             )
             continue
+        if result.pruned:
+            logger.debug("Model selection: n_states=%d pruned after probe", n_states)
+            continue
+
+        scores[n_states] = result.metrics[f"train_{criterion}"]
+        logger.debug(
+            "Model selection: n_states=%d, %s=%.2f",
+            n_states, criterion, scores[n_states],
+        )
 
     if not scores:
         raise ValueError("Failed to fit any models")
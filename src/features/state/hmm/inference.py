@@ -3,6 +3,7 @@
 Handles:
 - Loading trained model artifacts
 - Processing new bars in real-time
+- Forward filtering across bars (reset on gaps and OOD bars)
 - Anti-chatter controls (min dwell, switch threshold)
 - OOD detection
 """
@@ -10,12 +11,14 @@ Handles:
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
+import pandas as pd
 
 from src.features.state.hmm.artifacts import ArtifactPaths
 from src.features.state.hmm.contracts import HMMOutput, LatentStateVector, ModelMetadata
+from src.features.state.hmm.data_pipeline import GapHandler
 from src.features.state.hmm.encoders import BaseEncoder
 from src.features.state.hmm.hmm_model import GaussianHMMWrapper
 from src.features.state.hmm.scalers import BaseScaler
@@ -23,11 +26,48 @@ from src.features.state.hmm.scalers import BaseScaler
 logger = logging.getLogger(__name__)
 
 
+def _forward_update(
+    log_alpha: Optional[np.ndarray],
+    has_prior: np.ndarray,
+    log_frameprob: np.ndarray,
+    log_startprob: np.ndarray,
+    transmat: np.ndarray,
+) -> np.ndarray:
+    """Advance normalized log forward vectors by one bar.
+
+    Rows without a prior start from the initial distribution.  The
+    transition product uses einsum rather than BLAS so each row gives the
+    same bits whether it is updated alone or with other rows.
+
+    Args:
+        log_alpha: Previous normalized log forward vectors, shape (n, K);
+            ignored where ``has_prior`` is False (may be None if none has one)
+        has_prior: Boolean mask of rows with a previous forward vector
+        log_frameprob: Per-state emission log-densities, shape (n, K)
+        log_startprob: Log initial state distribution, shape (K,)
+        transmat: Transition matrix, shape (K, K)
+
+    Returns:
+        Normalized log forward vectors of shape (n, K)
+    """
+    log_prior = np.broadcast_to(log_startprob, log_frameprob.shape).copy()
+    if has_prior.any():
+        previous = log_alpha[has_prior]
+        shift = previous.max(axis=1, keepdims=True)
+        with np.errstate(divide="ignore"):
+            log_prior[has_prior] = np.log(np.einsum("nk,kj->nj", np.exp(previous - shift), transmat)) + shift
+
+    log_alpha = log_prior + log_frameprob
+    return log_alpha - np.logaddexp.reduce(log_alpha, axis=1, keepdims=True)
+
+
 @dataclass
 class InferenceState:
     """Internal state for online inference.
 
-    Tracks information needed for anti-chatter logic.
+    Tracks information needed for anti-chatter logic and the forward
+    filter.  ``log_alpha`` is the previous bar's normalized log forward
+    vector, or None when the next bar starts from the initial distribution.
     """
 
     current_state: int
@@ -35,6 +75,103 @@ class InferenceState:
     dwell_count: int
     last_timestamp: Optional[datetime]
     recent_states: list[int]
+    log_alpha: Optional[np.ndarray] = None
+
+
+@dataclass
+class BatchInferenceResult:
+    """Columnar regime inference results for a sequence of bars.
+
+    Row ``i`` holds exactly what :meth:`InferenceEngine.process` returns
+    for the ``i``-th bar when the bars are processed one by one.
+
+    Attributes:
+        state_id: Final state after anti-chatter, -1 for OOD bars, shape (n,)
+        state_prob: Posterior probability of the final state, shape (n,)
+        posterior: Filtered posterior over states (uniform for OOD bars), shape (n, K)
+        log_likelihood: Emission log-likelihood (-inf when undefined), shape (n,)
+        is_ood: Out-of-distribution flags, shape (n,)
+        z: Latent vectors, shape (n, d)
+        timestamps: Bar timestamps, if provided
+    """
+
+    state_id: np.ndarray
+    state_prob: np.ndarray
+    posterior: np.ndarray
+    log_likelihood: np.ndarray
+    is_ood: np.ndarray
+    z: np.ndarray
+    timestamps: Optional[pd.Index] = None
+
+    def __len__(self) -> int:
+        return len(self.state_id)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return results as a DataFrame with one ``p_k`` column per state."""
+        df = pd.DataFrame(
+            {
+                "state_id": self.state_id,
+                "state_prob": self.state_prob,
+                "log_likelihood": self.log_likelihood,
+                "is_ood": self.is_ood,
+            },
+            index=self.timestamps,
+        )
+        posterior = pd.DataFrame(
+            self.posterior,
+            index=df.index,
+            columns=[f"p_{k}" for k in range(self.posterior.shape[1])],
+        )
+        return pd.concat([df, posterior], axis=1)
+
+
+@dataclass
+class MultiSymbolInferenceResult:
+    """Regime inference results for many symbols at one bar close.
+
+    Row ``i`` holds what a per-symbol :class:`InferenceEngine` would return
+    from :meth:`InferenceEngine.process` for ``symbols[i]`` at this bar.
+
+    Attributes:
+        symbols: Symbols in row order
+        timestamp: Bar close timestamp
+        state_id: Final state after anti-chatter, -1 for OOD rows, shape (n,)
+        state_prob: Posterior probability of the final state, shape (n,)
+        posterior: Filtered posterior over states (uniform for OOD rows), shape (n, K)
+        log_likelihood: Emission log-likelihood (-inf when undefined), shape (n,)
+        is_ood: Out-of-distribution flags, shape (n,)
+        z: Latent vectors, shape (n, d)
+    """
+
+    symbols: list[str]
+    timestamp: datetime
+    state_id: np.ndarray
+    state_prob: np.ndarray
+    posterior: np.ndarray
+    log_likelihood: np.ndarray
+    is_ood: np.ndarray
+    z: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return results as a symbol-indexed DataFrame with ``p_k`` columns."""
+        df = pd.DataFrame(
+            {
+                "state_id": self.state_id,
+                "state_prob": self.state_prob,
+                "log_likelihood": self.log_likelihood,
+                "is_ood": self.is_ood,
+            },
+            index=pd.Index(self.symbols, name="symbol"),
+        )
+        posterior = pd.DataFrame(
+            self.posterior,
+            index=df.index,
+            columns=[f"p_{k}" for k in range(self.posterior.shape[1])],
+        )
+        return pd.concat([df, posterior], axis=1)
 
 
 class InferenceEngine:
@@ -57,6 +194,7 @@ class InferenceEngine:
         min_dwell_bars: int = 3,
         ood_threshold: Optional[float] = None,
         majority_vote_window: int = 3,
+        max_gap_bars: int = 5,
     ):
         """Initialize inference engine.
 
@@ -69,6 +207,8 @@ class InferenceEngine:
             min_dwell_bars: Min bars to stay in a state before switching
             ood_threshold: Log-likelihood threshold for OOD (None uses metadata)
             majority_vote_window: Window size for majority vote smoothing
+            max_gap_bars: Restart the forward filter when more than this many
+                bar durations pass between consecutive bars
         """
         self.scaler = scaler
         self.encoder = encoder
@@ -79,6 +219,7 @@ class InferenceEngine:
         self.min_dwell_bars = min_dwell_bars
         self.ood_threshold = ood_threshold or metadata.ood_threshold
         self.majority_vote_window = majority_vote_window
+        self.max_gap = max_gap_bars * GapHandler._get_bar_duration(metadata.timeframe)
 
         self._state = InferenceState(
             current_state=-1,
@@ -157,15 +298,15 @@ class InferenceEngine:
         x = np.array([features.get(name, np.nan) for name in self.metadata.feature_names])
         x = x.reshape(1, -1)
 
-        x_scaled = self.scaler.transform(x)
-
-        z = self.encoder.transform(x_scaled)
+        z, log_frameprob, log_liks = self._infer(x)
+        log_lik = log_liks[0]
 
-        posterior = self.hmm.predict_proba(z)[0]
-        log_lik = self.hmm.emission_log_likelihood(z)[0]
+        if self._is_gap(timestamp):
+            logger.debug("[%s] Gap before %s, restarting forward filter", symbol, timestamp)
+            self._state.log_alpha = None
 
         if np.isnan(log_lik) or log_lik < self.ood_threshold:
-            self._state.dwell_count += 1
+            self._step_ood()
             logger.info("[%s] OOD detected at %s: log_lik=%.2f < threshold=%s", symbol, timestamp, log_lik, self.ood_threshold)
             return HMMOutput.unknown(
                 symbol=symbol,
@@ -177,19 +318,16 @@ class InferenceEngine:
                 z=z[0],
             )
 
+        posterior = self._filter(log_frameprob[0])
         raw_state = np.argmax(posterior)
         raw_prob = posterior[raw_state]
+        previous_state = self._state.current_state
 
-        final_state = self._apply_anti_chatter(raw_state, raw_prob)
+        final_state = self._step(raw_state, raw_prob, timestamp)
 
         # Log state transitions
-        if final_state != self._state.current_state and self._state.current_state != -1:
-            logger.debug(f"[{symbol}] State transition at {timestamp}: {self._state.current_state} -> {final_state} (prob={raw_prob:.3f})")
-
-        self._state.last_timestamp = timestamp
-        self._state.recent_states.append(raw_state)
-        if len(self._state.recent_states) > self.majority_vote_window:
-            self._state.recent_states.pop(0)
+        if final_state != previous_state and previous_state != -1:
+            logger.debug(f"[{symbol}] State transition at {timestamp}: {previous_state} -> {final_state} (prob={raw_prob:.3f})")
 
         return HMMOutput(
             symbol=symbol,
@@ -204,6 +342,79 @@ class InferenceEngine:
             z=z[0],
         )
 
+    def _infer(self, X: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run scaler, encoder and HMM emission terms over feature rows.
+
+        Every step works row by row, so a bar gives the same bits whether
+        it is processed alone or as part of a batch.
+
+        Args:
+            X: Features of shape (n_bars, n_features) in metadata order
+
+        Returns:
+            Tuple of (latent vectors, per-state emission log-densities,
+            emission log-likelihoods)
+        """
+        x_scaled = self.scaler.transform(X)
+        z = self.encoder.transform(x_scaled)
+
+        log_frameprob = self.hmm.state_log_likelihood(z)
+        return z, log_frameprob, self.hmm.mixture_log_likelihood(log_frameprob)
+
+    def _filter(self, log_frameprob: np.ndarray) -> np.ndarray:
+        """Advance the forward filter by one bar.
+
+        Computes p(s_t | z_{1:t}) from the previous bar's filtered posterior
+        with a single O(K^2) update against the transition matrix.
+
+        Args:
+            log_frameprob: Per-state emission log-densities for the bar
+
+        Returns:
+            Filtered posterior of shape (n_states,)
+        """
+        log_alpha = self._state.log_alpha
+        has_prior = np.array([log_alpha is not None])
+        log_alpha = _forward_update(
+            log_alpha.reshape(1, -1) if log_alpha is not None else None,
+            has_prior,
+            log_frameprob.reshape(1, -1),
+            self.hmm.log_startprob,
+            self.hmm.transition_matrix,
+        )[0]
+        self._state.log_alpha = log_alpha
+        return np.exp(log_alpha)
+
+    def _is_gap(self, timestamp: Optional[datetime]) -> bool:
+        """Whether too much time passed since the last in-distribution bar."""
+        last = self._state.last_timestamp
+        return last is not None and timestamp is not None and timestamp - last > self.max_gap
+
+    def _step_ood(self) -> None:
+        """Advance the online state over an OOD bar."""
+        self._state.dwell_count += 1
+        self._state.log_alpha = None
+
+    def _step(self, raw_state: int, raw_prob: float, timestamp: Optional[datetime]) -> int:
+        """Advance the anti-chatter state over an in-distribution bar.
+
+        Args:
+            raw_state: Argmax state of the posterior
+            raw_prob: Posterior probability of raw_state
+            timestamp: Bar timestamp
+
+        Returns:
+            Final state after anti-chatter
+        """
+        final_state = self._apply_anti_chatter(raw_state, raw_prob)
+
+        self._state.last_timestamp = timestamp
+        self._state.recent_states.append(raw_state)
+        if len(self._state.recent_states) > self.majority_vote_window:
+            self._state.recent_states.pop(0)
+
+        return final_state
+
     def _apply_anti_chatter(self, raw_state: int, raw_prob: float) -> int:
         """Apply anti-chatter logic to state transition.
 
@@ -256,7 +467,8 @@ class InferenceEngine:
     ) -> list[HMMOutput]:
         """Process multiple bars (for backtest/batch inference).
 
-        Note: This processes sequentially to maintain state.
+        Runs :meth:`infer_batch` and wraps each row in an HMMOutput.  Prefer
+        :meth:`infer_batch` for long histories to avoid per-bar objects.
 
         Args:
             features_list: List of feature dictionaries
@@ -266,12 +478,103 @@ class InferenceEngine:
         Returns:
             List of HMMOutput objects
         """
-        self.reset()
-        outputs = []
-        for features, ts in zip(features_list, timestamps):
-            output = self.process(features, symbol, ts)
-            outputs.append(output)
-        return outputs
+        X = np.array(
+            [[features.get(name, np.nan) for name in self.metadata.feature_names] for features in features_list],
+            dtype=np.float64,
+        ).reshape(len(features_list), len(self.metadata.feature_names))
+        result = self.infer_batch(X, timestamps=timestamps)
+
+        return [
+            HMMOutput(
+                symbol=symbol,
+                timestamp=ts,
+                timeframe=self.metadata.timeframe,
+                model_id=self.metadata.model_id,
+                state_id=int(result.state_id[i]),
+                state_prob=result.state_prob[i],
+                posterior=result.posterior[i],
+                log_likelihood=result.log_likelihood[i],
+                is_ood=bool(result.is_ood[i]),
+                z=result.z[i],
+            )
+            for i, ts in enumerate(timestamps)
+        ]
+
+    def infer_batch(
+        self,
+        features: pd.DataFrame | np.ndarray,
+        timestamps: Optional[Sequence[datetime]] = None,
+        reset: bool = True,
+    ) -> BatchInferenceResult:
+        """Run regime inference over a sequence of bars in array operations.
+
+        Scaling, encoding and the HMM emission terms run once over the whole
+        matrix; only the O(K^2) forward update and the anti-chatter state
+        machine step bar by bar.  Results are bit-identical to calling
+        :meth:`process` on each bar in order.
+
+        Args:
+            features: DataFrame with feature columns (reordered to the model's
+                feature names; missing columns are NaN), or an array of shape
+                (n_bars, n_features) already in that order
+            timestamps: Bar timestamps; defaults to the DataFrame index
+            reset: Reset the online state first (as :meth:`process_batch`
+                does); pass False to continue from the previous call
+
+        Returns:
+            BatchInferenceResult with one row per bar
+        """
+        if isinstance(features, pd.DataFrame):
+            if timestamps is None:
+                timestamps = features.index
+            X = features.reindex(columns=self.metadata.feature_names).to_numpy(dtype=np.float64)
+        else:
+            X = np.asarray(features, dtype=np.float64)
+            if X.ndim == 1:
+                X = X.reshape(1, -1)
+
+        if reset:
+            self.reset()
+
+        n = len(X)
+        n_states = self.metadata.n_states
+        z, log_frameprob, log_lik = self._infer(X)
+
+        is_ood = np.isnan(log_lik) | (log_lik < self.ood_threshold)
+        ts_list = list(timestamps) if timestamps is not None else [None] * n
+
+        posterior = np.empty((n, n_states))
+        state_id = np.empty(n, dtype=np.int64)
+        for i, ood in enumerate(is_ood.tolist()):
+            if self._is_gap(ts_list[i]):
+                self._state.log_alpha = None
+            if ood:
+                self._step_ood()
+                state_id[i] = HMMOutput.UNKNOWN_STATE
+                continue
+            posterior[i] = self._filter(log_frameprob[i])
+            raw_state = int(np.argmax(posterior[i]))
+            state_id[i] = self._step(raw_state, float(posterior[i, raw_state]), ts_list[i])
+
+        posterior[is_ood] = np.ones(n_states) / n_states
+        state_prob = np.where(
+            is_ood, 1.0 / n_states, posterior[np.arange(n), np.maximum(state_id, 0)],
+        )
+        log_lik = np.where(np.isnan(log_lik), -np.inf, log_lik)
+
+        n_ood = int(is_ood.sum())
+        if n_ood:
+            logger.info("OOD detected on %d of %d bars (threshold=%s)", n_ood, n, self.ood_threshold)
+
+        return BatchInferenceResult(
+            state_id=state_id,
+            state_prob=state_prob,
+            posterior=posterior,
+            log_likelihood=log_lik,
+            is_ood=is_ood,
+            z=z,
+            timestamps=pd.Index(timestamps) if timestamps is not None else None,
+        )
 
     def get_latent_vector(
         self,
@@ -301,6 +604,346 @@ class InferenceEngine:
         )
 
 
+class MultiSymbolInferenceEngine:
+    """Online regime inference for many symbols sharing one model artifact.
+
+    Each bar close is processed as one matrix with a row per symbol: the
+    scaler, encoder, emission terms, forward update and anti-chatter rules
+    all run as array operations, and the per-symbol online state lives in
+    preallocated arrays indexed by symbol row.  For every symbol the results
+    are bit-identical to a dedicated :class:`InferenceEngine` fed the same
+    bars.
+
+    Symbols are registered on first use; a bar may cover any subset of them.
+    """
+
+    def __init__(
+        self,
+        scaler: BaseScaler,
+        encoder: BaseEncoder,
+        hmm: GaussianHMMWrapper,
+        metadata: ModelMetadata,
+        symbols: Sequence[str] = (),
+        p_switch_threshold: float = 0.6,
+        min_dwell_bars: int = 3,
+        ood_threshold: Optional[float] = None,
+        majority_vote_window: int = 3,
+        max_gap_bars: int = 5,
+    ):
+        """Initialize multi-symbol inference engine.
+
+        Args:
+            scaler: Fitted scaler
+            encoder: Fitted encoder
+            hmm: Fitted HMM
+            metadata: Model metadata
+            symbols: Symbols to register up front
+            p_switch_threshold: Min probability to switch states
+            min_dwell_bars: Min bars to stay in a state before switching
+            ood_threshold: Log-likelihood threshold for OOD (None uses metadata)
+            majority_vote_window: Window size for majority vote smoothing
+            max_gap_bars: Restart a symbol's forward filter when more than
+                this many bar durations pass between its bars
+        """
+        if majority_vote_window < 1:
+            raise ValueError("majority_vote_window must be at least 1")
+
+        self.scaler = scaler
+        self.encoder = encoder
+        self.hmm = hmm
+        self.metadata = metadata
+
+        self.p_switch_threshold = p_switch_threshold
+        self.min_dwell_bars = min_dwell_bars
+        self.ood_threshold = ood_threshold or metadata.ood_threshold
+        self.majority_vote_window = majority_vote_window
+        self.max_gap = max_gap_bars * GapHandler._get_bar_duration(metadata.timeframe)
+
+        self._index: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._allocate(max(len(symbols), 16))
+        self._rows(list(symbols))
+
+    @classmethod
+    def from_artifacts(
+        cls,
+        paths: ArtifactPaths,
+        symbols: Sequence[str] = (),
+        **kwargs,
+    ) -> "MultiSymbolInferenceEngine":
+        """Load a multi-symbol inference engine from saved artifacts.
+
+        Args:
+            paths: ArtifactPaths pointing to model directory
+            symbols: Symbols to register up front
+            **kwargs: Additional MultiSymbolInferenceEngine arguments
+
+        Returns:
+            Initialized MultiSymbolInferenceEngine
+        """
+        if not paths.exists():
+            logger.error(f"Model artifacts not found at {paths.model_dir}")
+            raise FileNotFoundError(f"Model artifacts not found at {paths.model_dir}")
+
+        logger.info(f"Loading model artifacts from {paths.model_dir}")
+        return cls(
+            scaler=BaseScaler.load(paths.scaler_path),
+            encoder=BaseEncoder.load(paths.encoder_path),
+            hmm=GaussianHMMWrapper.load(paths.hmm_path),
+            metadata=paths.load_metadata(),
+            symbols=symbols,
+            **kwargs,
+        )
+
+    @property
+    def symbols(self) -> list[str]:
+        """Registered symbols in row order."""
+        return list(self._symbols)
+
+    def _allocate(self, capacity: int) -> None:
+        """Create (or grow) the per-symbol state arrays to ``capacity`` rows."""
+        n_states = self.metadata.n_states
+
+        def grow(old: Optional[np.ndarray], fill, dtype, shape=()) -> np.ndarray:
+            new = np.full((capacity, *shape), fill, dtype=dtype)
+            if old is not None:
+                new[:len(old)] = old
+            return new
+
+        self._current_state = grow(getattr(self, "_current_state", None), -1, np.int64)
+        self._current_prob = grow(getattr(self, "_current_prob", None), 0.0, np.float64)
+        self._dwell_count = grow(getattr(self, "_dwell_count", None), 0, np.int64)
+        self._last_timestamp = grow(getattr(self, "_last_timestamp", None), np.datetime64("NaT", "ns"), "datetime64[ns]")
+        self._recent_states = grow(getattr(self, "_recent_states", None), -1, np.int64, (self.majority_vote_window,))
+        self._recent_count = grow(getattr(self, "_recent_count", None), 0, np.int64)
+        self._log_alpha = grow(getattr(self, "_log_alpha", None), 0.0, np.float64, (n_states,))
+        self._has_alpha = grow(getattr(self, "_has_alpha", None), False, bool)
+
+    def _rows(self, symbols: list[str]) -> np.ndarray:
+        """Map symbols to state rows, registering unseen symbols."""
+        for symbol in symbols:
+            if symbol not in self._index:
+                self._index[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+
+        capacity = len(self._current_state)
+        if len(self._symbols) > capacity:
+            while capacity < len(self._symbols):
+                capacity *= 2
+            self._allocate(capacity)
+
+        return np.array([self._index[s] for s in symbols], dtype=np.int64)
+
+    def reset(self, symbols: Optional[Sequence[str]] = None) -> None:
+        """Reset online state for the given symbols (all symbols if None)."""
+        if symbols is None:
+            rows = slice(None)
+        else:
+            rows = np.array([self._index[s] for s in symbols if s in self._index], dtype=np.int64)
+
+        self._current_state[rows] = -1
+        self._current_prob[rows] = 0.0
+        self._dwell_count[rows] = 0
+        self._last_timestamp[rows] = np.datetime64("NaT", "ns")
+        self._recent_states[rows] = -1
+        self._recent_count[rows] = 0
+        self._has_alpha[rows] = False
+
+    def get_state(self, symbol: str) -> InferenceState:
+        """Return a symbol's online state in :class:`InferenceState` form.
+
+        Raises:
+            KeyError: If the symbol has not been registered
+        """
+        row = self._index[symbol]
+        window = self.majority_vote_window
+        count = int(self._recent_count[row])
+        if count <= window:
+            recent = self._recent_states[row, :count]
+        else:
+            recent = np.roll(self._recent_states[row], -(count % window))
+        last = self._last_timestamp[row]
+
+        return InferenceState(
+            current_state=int(self._current_state[row]),
+            current_prob=float(self._current_prob[row]),
+            dwell_count=int(self._dwell_count[row]),
+            last_timestamp=None if np.isnat(last) else pd.Timestamp(last).to_pydatetime(),
+            recent_states=recent.tolist(),
+            log_alpha=self._log_alpha[row].copy() if self._has_alpha[row] else None,
+        )
+
+    def update(
+        self,
+        features: pd.DataFrame | np.ndarray,
+        timestamp: datetime,
+        symbols: Optional[Sequence[str]] = None,
+    ) -> MultiSymbolInferenceResult:
+        """Process one bar close for many symbols.
+
+        Args:
+            features: DataFrame indexed by symbol with feature columns
+                (reordered to the model's feature names; missing columns are
+                NaN), or an array of shape (n_symbols, n_features) in that order
+            timestamp: Bar close timestamp shared by all rows
+            symbols: Row symbols; required for array input, defaults to the
+                DataFrame index
+
+        Returns:
+            MultiSymbolInferenceResult with one row per symbol
+
+        Raises:
+            ValueError: If symbols are missing, repeated or mismatched
+        """
+        if isinstance(features, pd.DataFrame):
+            symbols = list(features.index) if symbols is None else list(symbols)
+            X = features.reindex(columns=self.metadata.feature_names).to_numpy(dtype=np.float64)
+        else:
+            if symbols is None:
+                raise ValueError("symbols are required for array features")
+            symbols = list(symbols)
+            X = np.asarray(features, dtype=np.float64).reshape(len(symbols), -1)
+        if len(X) != len(symbols):
+            raise ValueError(f"Got {len(X)} feature rows for {len(symbols)} symbols")
+        if len(set(symbols)) != len(symbols):
+            raise ValueError("Each symbol may appear only once per bar")
+
+        rows = self._rows(symbols)
+        n = len(rows)
+        n_states = self.metadata.n_states
+
+        z = self.encoder.transform(self.scaler.transform(X))
+        log_frameprob = self.hmm.state_log_likelihood(z)
+        log_lik = self.hmm.mixture_log_likelihood(log_frameprob)
+        is_ood = np.isnan(log_lik) | (log_lik < self.ood_threshold)
+
+        # Gaps are measured from each symbol's last in-distribution bar
+        now = _to_datetime64(timestamp)
+        gap = (now - self._last_timestamp[rows]) > np.timedelta64(self.max_gap)
+        self._has_alpha[rows[gap]] = False
+
+        ood_rows = rows[is_ood]
+        self._dwell_count[ood_rows] += 1
+        self._has_alpha[ood_rows] = False
+
+        active = ~is_ood
+        rows = rows[active]
+        log_alpha = _forward_update(
+            self._log_alpha[rows],
+            self._has_alpha[rows],
+            log_frameprob[active],
+            self.hmm.log_startprob,
+            self.hmm.transition_matrix,
+        )
+        self._log_alpha[rows] = log_alpha
+        self._has_alpha[rows] = True
+
+        posterior = np.full((n, n_states), 1.0 / n_states)
+        posterior[active] = np.exp(log_alpha)
+        raw_state = np.argmax(posterior[active], axis=1)
+        raw_prob = posterior[active][np.arange(len(rows)), raw_state]
+
+        state_id = np.full(n, HMMOutput.UNKNOWN_STATE, dtype=np.int64)
+        state_id[active] = self._apply_anti_chatter(rows, raw_state, raw_prob)
+
+        self._last_timestamp[rows] = now
+        window = self.majority_vote_window
+        self._recent_states[rows, self._recent_count[rows] % window] = raw_state
+        self._recent_count[rows] += 1
+
+        state_prob = np.where(
+            is_ood, 1.0 / n_states, posterior[np.arange(n), np.maximum(state_id, 0)],
+        )
+
+        n_ood = int(is_ood.sum())
+        if n_ood:
+            logger.info("OOD detected for %d of %d symbols at %s (threshold=%s)", n_ood, n, timestamp, self.ood_threshold)
+
+        return MultiSymbolInferenceResult(
+            symbols=symbols,
+            timestamp=timestamp,
+            state_id=state_id,
+            state_prob=state_prob,
+            posterior=posterior,
+            log_likelihood=np.where(np.isnan(log_lik), -np.inf, log_lik),
+            is_ood=is_ood,
+            z=z,
+        )
+
+    def _apply_anti_chatter(self, rows: np.ndarray, raw_state: np.ndarray, raw_prob: np.ndarray) -> np.ndarray:
+        """Apply the anti-chatter rules of :class:`InferenceEngine` row-wise.
+
+        Args:
+            rows: State rows of the in-distribution symbols
+            raw_state: Argmax states of their posteriors
+            raw_prob: Posterior probabilities of raw_state
+
+        Returns:
+            Final states after anti-chatter
+        """
+        current = self._current_state[rows]
+        dwell = self._dwell_count[rows]
+
+        # Majority over the recent raw states, ties to the lowest state as in np.argmax
+        window = self.majority_vote_window
+        votes = (self._recent_states[rows][:, :, None] == np.arange(self.metadata.n_states)).sum(axis=1)
+        outvoted = (self._recent_count[rows] >= window) & (np.argmax(votes, axis=1) != raw_state)
+
+        same = raw_state == current
+        blocked = (dwell < self.min_dwell_bars) | (raw_prob < self.p_switch_threshold) | outvoted
+        switch = (current == -1) | (~same & ~blocked)
+
+        self._current_state[rows] = np.where(switch, raw_state, current)
+        self._dwell_count[rows] = np.where(switch, 1, dwell + 1)
+        self._current_prob[rows] = np.where(switch | same, raw_prob, self._current_prob[rows])
+        return self._current_state[rows]
+
+    def process(
+        self,
+        features: dict[str, dict[str, float]],
+        timestamp: datetime,
+    ) -> dict[str, HMMOutput]:
+        """Process one bar close given per-symbol feature dictionaries.
+
+        Args:
+            features: Symbol -> (feature name -> value)
+            timestamp: Bar close timestamp
+
+        Returns:
+            Symbol -> HMMOutput
+        """
+        symbols = list(features)
+        X = np.array(
+            [[features[s].get(name, np.nan) for name in self.metadata.feature_names] for s in symbols],
+            dtype=np.float64,
+        ).reshape(len(symbols), len(self.metadata.feature_names))
+        result = self.update(X, timestamp, symbols=symbols)
+
+        return {
+            symbol: HMMOutput(
+                symbol=symbol,
+                timestamp=timestamp,
+                timeframe=self.metadata.timeframe,
+                model_id=self.metadata.model_id,
+                state_id=int(result.state_id[i]),
+                state_prob=result.state_prob[i],
+                posterior=result.posterior[i],
+                log_likelihood=result.log_likelihood[i],
+                is_ood=bool(result.is_ood[i]),
+                z=result.z[i],
+            )
+            for i, symbol in enumerate(symbols)
+        }
+
+
+def _to_datetime64(timestamp: datetime) -> np.datetime64:
+    """Convert a timestamp to naive UTC datetime64[ns]."""
+    ts = pd.Timestamp(timestamp)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.as_unit("ns").to_datetime64()
+
+
 def create_inference_engine(
     paths: ArtifactPaths,
     **kwargs,
@@ -10,7 +10,7 @@ Implements end-to-end training workflow:
 
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal, Optional
@@ -40,6 +40,9 @@ from src.features.state.hmm.encoders import (
 )
 from src.features.state.hmm.hmm_model import (
     GaussianHMMWrapper,
+    ModelSearch,
+    ModelSearchCandidate,
+    hmm_fit_metrics,
     match_states_hungarian,
     select_n_states,
 )
@@ -74,6 +77,8 @@ class TrainingConfig:
         covariance_type: HMM covariance type
         window_size: Window size for temporal encoder
         random_seed: Random seed for reproducibility
+        data_fingerprint: Optional hash of the training inputs, stored in
+            the model metadata
     """
 
     timeframe: str
@@ -90,6 +95,7 @@ class TrainingConfig:
     covariance_type: Literal["full", "diag", "tied", "spherical"] = "diag"
     window_size: int = 1
     random_seed: int = 42
+    data_fingerprint: Optional[str] = None
 
     def __post_init__(self):
         if self.timeframe not in VALID_TIMEFRAMES:
@@ -143,15 +149,19 @@ class TrainingPipeline:
         self,
         models_root: Path = Path("models"),
         random_seed: int = 42,
+        max_workers: Optional[int] = 1,
     ):
         """Initialize training pipeline.
 
         Args:
             models_root: Root directory for model artifacts
             random_seed: Random seed for reproducibility
+            max_workers: Worker processes for n_states auto-selection
+                (1 is serial, None uses all CPUs)
         """
         self.models_root = models_root
         self.random_seed = random_seed
+        self.max_workers = max_workers
         np.random.seed(random_seed)
 
     def train(
@@ -188,18 +198,7 @@ class TrainingPipeline:
         X_train_scaled = scaler.transform(X_train)
         X_val_scaled = scaler.transform(X_val)
 
-        if config.encoder_type == "temporal_pca" and config.window_size > 1:
-            X_train_windowed = create_windows(X_train_scaled, config.window_size)
-            X_val_windowed = create_windows(X_val_scaled, config.window_size)
-            encoder = self._fit_encoder(
-                X_train_windowed, config, is_windowed=True
-            )
-            Z_train = encoder.transform(X_train_windowed)
-            Z_val = encoder.transform(X_val_windowed)
-        else:
-            encoder = self._fit_encoder(X_train_scaled, config, is_windowed=False)
-            Z_train = encoder.transform(X_train_scaled)
-            Z_val = encoder.transform(X_val_scaled)
+        encoder, Z_train, Z_val = self._encode(X_train_scaled, X_val_scaled, config)
 
         hmm = self._fit_hmm(Z_train, config)
 
@@ -227,6 +226,7 @@ class TrainingPipeline:
             encoder_type=config.encoder_type,
             covariance_type=config.covariance_type,
             metrics=metrics,
+            data_fingerprint=config.data_fingerprint,
         )
 
         self._save_artifacts(paths, scaler, encoder, hmm, metadata, config)
@@ -257,6 +257,28 @@ class TrainingPipeline:
 
         return scaler
 
+    def _encode(
+        self,
+        X_train_scaled: np.ndarray,
+        X_val_scaled: np.ndarray,
+        config: TrainingConfig,
+    ) -> tuple[BaseEncoder, np.ndarray, np.ndarray]:
+        """Fit the encoder on scaled training data and encode both splits."""
+        if config.encoder_type == "temporal_pca" and config.window_size > 1:
+            X_train_windowed = create_windows(X_train_scaled, config.window_size)
+            X_val_windowed = create_windows(X_val_scaled, config.window_size)
+            encoder = self._fit_encoder(
+                X_train_windowed, config, is_windowed=True
+            )
+            Z_train = encoder.transform(X_train_windowed)
+            Z_val = encoder.transform(X_val_windowed)
+        else:
+            encoder = self._fit_encoder(X_train_scaled, config, is_windowed=False)
+            Z_train = encoder.transform(X_train_scaled)
+            Z_val = encoder.transform(X_val_scaled)
+
+        return encoder, Z_train, Z_val
+
     def _fit_encoder(
         self,
         X: np.ndarray,
@@ -267,11 +289,7 @@ class TrainingPipeline:
         latent_dim = config.latent_dim
 
         if latent_dim is None:
-            if is_windowed:
-                X_flat = X.reshape(X.shape[0], -1)
-                latent_dim = select_latent_dim(X_flat, max_dim=16)
-            else:
-                latent_dim = select_latent_dim(X, max_dim=16)
+            latent_dim = select_latent_dim(X, max_dim=16)
             logger.info(f"Auto-selected latent_dim={latent_dim}")
 
         if is_windowed:
@@ -304,6 +322,7 @@ class TrainingPipeline:
                 criterion="bic",
                 covariance_type=config.covariance_type,
                 random_state=self.random_seed,
+                max_workers=self.max_workers,
             )
             logger.info(f"Auto-selected n_states={n_states} (BIC scores: {scores})")
 
@@ -339,19 +358,7 @@ class TrainingPipeline:
         encoder: BaseEncoder,
     ) -> dict[str, float]:
         """Compute training and validation metrics."""
-        metrics = {}
-
-        if hmm.metrics_:
-            metrics["train_log_likelihood"] = hmm.metrics_.log_likelihood
-            metrics["train_aic"] = hmm.metrics_.aic
-            metrics["train_bic"] = hmm.metrics_.bic
-            metrics["mean_dwell_time"] = float(np.mean(hmm.metrics_.mean_dwell_time))
-
-        mask_val = ~np.any(np.isnan(Z_val), axis=1)
-        if mask_val.sum() > 0:
-            Z_val_clean = Z_val[mask_val]
-            val_ll = hmm.model_.score(Z_val_clean)
-            metrics["val_log_likelihood"] = val_ll
+        metrics = hmm_fit_metrics(hmm, Z_val)
 
         if hasattr(encoder, "metrics_") and encoder.metrics_:
             metrics["explained_variance"] = encoder.metrics_.total_variance_explained
@@ -512,21 +519,37 @@ class CrossValidator:
 
 
 class HyperparameterTuner:
-    """Grid search for hyperparameter tuning."""
+    """Grid search for hyperparameter tuning.
+
+    The scaler is fitted once and the encoder once per latent dimension;
+    the HMM fits for every (latent_dim, n_states, covariance_type)
+    candidate then run through :class:`ModelSearch`, optionally on a
+    process pool with early stopping of dominated candidates.  Candidate
+    models are scored but not saved as artifacts.
+    """
 
     def __init__(
         self,
         pipeline: TrainingPipeline,
         grid: Optional[HyperparameterGrid] = None,
+        max_workers: Optional[int] = 1,
+        probe_iter: Optional[int] = None,
+        prune_margin: Optional[float] = None,
     ):
         """Initialize tuner.
 
         Args:
             pipeline: Training pipeline
             grid: Hyperparameter grid to search
+            max_workers: Worker processes for HMM fits (1 is serial, None uses all CPUs)
+            probe_iter: EM iterations for the early-stopping probe
+            prune_margin: Relative score margin for dropping dominated candidates
         """
         self.pipeline = pipeline
         self.grid = grid or HyperparameterGrid()
+        self.max_workers = max_workers
+        self.probe_iter = probe_iter
+        self.prune_margin = prune_margin
 
     def tune(
         self,
@@ -548,50 +571,74 @@ class HyperparameterTuner:
         Returns:
             Dictionary with best params and all results
         """
-        results = []
+        validate_no_leakage(train_data, val_data)
+
+        X_train = train_data[base_config.feature_names].values
+        X_val = val_data[base_config.feature_names].values
+
+        scaler = self.pipeline._fit_scaler(X_train, base_config.scaler_type)
+        X_train_scaled = scaler.transform(X_train)
+        X_val_scaled = scaler.transform(X_val)
 
+        encoders = {}
+        Z_train = {}
+        Z_val = {}
         for latent_dim in self.grid.latent_dims:
-            for n_states in self.grid.n_states_range:
-                for cov_type in self.grid.covariance_types:
-                    logger.info(
-                        f"Trying latent_dim={latent_dim}, "
-                        f"n_states={n_states}, cov_type={cov_type}"
-                    )
-
-                    config = TrainingConfig(
-                        timeframe=base_config.timeframe,
-                        symbols=base_config.symbols,
-                        train_start=base_config.train_start,
-                        train_end=base_config.train_end,
-                        val_start=base_config.val_start,
-                        val_end=base_config.val_end,
-                        feature_names=base_config.feature_names,
-                        scaler_type=base_config.scaler_type,
-                        encoder_type=base_config.encoder_type,
-                        latent_dim=latent_dim,
-                        n_states=n_states,
-                        covariance_type=cov_type,
-                        window_size=base_config.window_size,
-                        random_seed=base_config.random_seed,
-                    )
-
-                    try:
-                        result = self.pipeline.train(config, train_data, val_data)
-                        score = result.metrics.get(metric, float("-inf") if maximize else float("inf"))
-
-                        results.append({
-                            "latent_dim": latent_dim,
-                            "n_states": n_states,
-                            "covariance_type": cov_type,
-                            "score": score,
-                            "metrics": result.metrics,
-                        })
-                    except Exception as e:
-                        logger.error(
-                            "Training failed for latent_dim=%d, n_states=%d, cov=%s: %s",
-                            latent_dim, n_states, cov_type, e,
-                        )
-                        continue
+            config = replace(base_config, latent_dim=latent_dim)
+            try:
+                encoders[latent_dim], Z_train[latent_dim], Z_val[latent_dim] = (
+                    self.pipeline._encode(X_train_scaled, X_val_scaled, config)
+                )
+            except Exception as e:
+                logger.error("Encoder failed for latent_dim=%d: %s", latent_dim, e)
+
+        candidates = [
+            ModelSearchCandidate(
+                n_states=n_states,
+                covariance_type=cov_type,
+                random_state=self.pipeline.random_seed,
+                data_key=latent_dim,
+            )
+            for latent_dim in self.grid.latent_dims
+            if latent_dim in encoders
+            for n_states in self.grid.n_states_range
+            for cov_type in self.grid.covariance_types
+        ]
+        logger.info("Tuning %d hyperparameter combinations", len(candidates))
+
+        search = ModelSearch(
+            max_workers=self.max_workers,
+            metric=metric,
+            maximize=maximize,
+            probe_iter=self.probe_iter,
+            prune_margin=self.prune_margin,
+        )
+
+        results = []
+        for outcome in search.run(candidates, Z_train, Z_val):
+            candidate = outcome.candidate
+            if outcome.error is not None:
+                logger.error(
+                    "Training failed for latent_dim=%d, n_states=%d, cov=%s: %s",
+                    candidate.data_key, candidate.n_states, candidate.covariance_type, outcome.error,
+                )
+                continue
+            if outcome.pruned:
+                continue
+
+            metrics = dict(outcome.metrics)
+            encoder = encoders[candidate.data_key]
+            if hasattr(encoder, "metrics_") and encoder.metrics_:
+                metrics["explained_variance"] = encoder.metrics_.total_variance_explained
+                metrics["reconstruction_error"] = encoder.metrics_.reconstruction_error
+
+            results.append({
+                "latent_dim": candidate.data_key,
+                "n_states": candidate.n_states,
+                "covariance_type": candidate.covariance_type,
+                "score": metrics.get(metric, float("-inf") if maximize else float("inf")),
+                "metrics": metrics,
+            })
 
         if not results:
             raise ValueError("All hyperparameter combinations failed")
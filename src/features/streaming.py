@@ -0,0 +1,663 @@
+"""Streaming (per-bar) feature computation.
+
+Batch calculators recompute every rolling window over the whole frame they
+are given.  In live trading only one bar arrives per symbol per cycle, so
+the streaming API keeps the state of each window instead and updates it in
+constant time per bar:
+
+- :class:`RollingSum` / :class:`RollingMean` keep compensated running sums
+- :class:`RollingStd` keeps Welford moments with add/remove updates
+- :class:`RollingMax` keeps a monotonic deque of window extremes
+- :class:`EWMState` keeps the recursive ``ewm(adjust=False)`` average
+- :class:`RollingSlope` / :class:`RollingRegression` keep regression sums
+
+The update rules follow pandas' own rolling and ewm kernels (including
+NaN handling and ``min_periods`` semantics), so a stream fed the bars of
+a DataFrame reproduces ``compute()`` on that DataFrame to floating point
+round-off.
+
+Calculators expose a stream through
+:meth:`BaseFeatureCalculator.create_stream`.  Calculators without a native
+stream fall back to :class:`WindowedFeatureStream`, which recomputes the
+batch features over a bounded trailing window.  Currently that is the
+TA-Lib and pandas-ta indicator calculators (RSI, MACD, ADX, ATR, KAMA,
+Hilbert trendline, candlestick patterns, ...): their library
+implementations are seeded from the first bars of the input, and they
+remain O(window) per bar and dominate streaming latency when enabled.
+
+Usage:
+    >>> stream = FeaturePipeline.default().create_stream()
+    >>> history = stream.update_many(warmup_df)
+    >>> row = stream.update(timestamp, {"open": o, "high": h, "low": l, "close": c, "volume": v})
+"""
+
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
+
+import pandas as pd
+
+from .base import EPS
+
+if TYPE_CHECKING:
+    from .base import BaseFeatureCalculator
+
+logger = logging.getLogger(__name__)
+
+NAN = float("nan")
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Relative size below which a difference of running sums has lost most of
+# its significant digits and is recomputed from the window instead
+_CANCELLATION = 1e-9
+
+
+class FeatureStream(ABC):
+    """Incremental counterpart of a feature calculator.
+
+    A stream consumes bars one at a time, in timestamp order, and returns
+    the feature values of each bar as soon as it arrives.  Values before a
+    window has filled are NaN, exactly as in the batch output.
+    """
+
+    @abstractmethod
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Consume one bar and return its features.
+
+        Args:
+            timestamp: Bar timestamp
+            bar: Mapping with keys open, high, low, close, volume
+            **kwargs: Per-bar extras (e.g. ``market_bar``, or ``r1``/``rv_60``
+                intermediates from earlier calculators)
+
+        Returns:
+            Feature name to value for this bar
+        """
+        pass
+
+    def update_frame(self, df: pd.DataFrame, **kwargs: Sequence[Any]) -> pd.DataFrame:
+        """Consume a block of bars in order.
+
+        Args:
+            df: Bars with datetime index and OHLCV columns
+            **kwargs: Per-bar extras as sequences aligned with the rows of
+                ``df`` (row ``i`` receives element ``i`` of each)
+
+        Returns:
+            DataFrame with one feature row per input bar
+        """
+        columns = list(df.columns)
+        values = df.to_numpy(dtype=float).tolist()
+        rows = []
+        for i, timestamp in enumerate(df.index):
+            extras = {name: seq[i] for name, seq in kwargs.items()}
+            rows.append(self.update(timestamp, dict(zip(columns, values[i])), **extras))
+        return pd.DataFrame(rows, index=df.index)
+
+
+class RollingSum:
+    """Fixed-window rolling sum matching ``Series.rolling(window).sum()``.
+
+    Uses Kahan-compensated add/remove updates and pandas' run-of-equal-values
+    correction, so results agree with the batch kernel to round-off.
+    """
+
+    __slots__ = (
+        "window", "min_periods", "_values", "_nobs", "_sum",
+        "_comp_add", "_comp_remove", "_same_count", "_prev",
+    )
+
+    def __init__(self, window: int, min_periods: int | None = None):
+        """Initialize RollingSum.
+
+        Args:
+            window: Window size in bars
+            min_periods: Non-NaN observations required (defaults to window)
+        """
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._values: deque[float] = deque()
+        self._nobs = 0
+        self._sum = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._same_count = 0
+        self._prev = NAN
+
+    def update(self, value: float) -> float:
+        """Push a value and return the sum of the current window."""
+        self._values.append(value)
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            if old == old:
+                self._nobs -= 1
+                y = -old - self._comp_remove
+                t = self._sum + y
+                self._comp_remove = t - self._sum - y
+                self._sum = t
+
+        if value == value:
+            self._nobs += 1
+            y = value - self._comp_add
+            t = self._sum + y
+            self._comp_add = t - self._sum - y
+            self._sum = t
+            if value == self._prev:
+                self._same_count += 1
+            else:
+                self._same_count = 1
+            self._prev = value
+
+        if self._nobs == 0 == self.min_periods:
+            return 0.0
+        if self._nobs < self.min_periods:
+            return NAN
+        if self._same_count >= self._nobs:
+            return self._prev * self._nobs
+        return self._sum
+
+
+class RollingMean(RollingSum):
+    """Fixed-window rolling mean matching ``Series.rolling(window).mean()``."""
+
+    __slots__ = ("_neg_count",)
+
+    def __init__(self, window: int, min_periods: int | None = None):
+        """Initialize RollingMean.
+
+        Args:
+            window: Window size in bars
+            min_periods: Non-NaN observations required (defaults to window)
+        """
+        super().__init__(window, min_periods)
+        self._neg_count = 0
+
+    def update(self, value: float) -> float:
+        """Push a value and return the mean of the current window."""
+        if len(self._values) == self.window and self._values[0] < 0:
+            self._neg_count -= 1
+        if value < 0:
+            self._neg_count += 1
+        super().update(value)
+
+        nobs = self._nobs
+        if nobs < self.min_periods or nobs == 0:
+            return NAN
+        if self._same_count >= nobs:
+            return self._prev
+        result = self._sum / nobs
+        if self._neg_count == 0 and result < 0:
+            return 0.0
+        if self._neg_count == nobs and result > 0:
+            return 0.0
+        return result
+
+
+class RollingStd:
+    """Fixed-window sample standard deviation (``ddof=1``).
+
+    Matches ``Series.rolling(window).std()`` by applying pandas' Welford
+    add/remove recurrences to the running mean and sum of squared
+    deviations.
+    """
+
+    __slots__ = (
+        "window", "min_periods", "ddof", "_values", "_nobs", "_mean", "_ssqdm",
+        "_comp_add", "_comp_remove", "_same_count", "_prev",
+    )
+
+    def __init__(self, window: int, min_periods: int | None = None, ddof: int = 1):
+        """Initialize RollingStd.
+
+        Args:
+            window: Window size in bars
+            min_periods: Non-NaN observations required (defaults to window)
+            ddof: Delta degrees of freedom
+        """
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.ddof = ddof
+        self._values: deque[float] = deque()
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._same_count = 0
+        self._prev = NAN
+
+    def update(self, value: float) -> float:
+        """Push a value and return the standard deviation of the window."""
+        self._values.append(value)
+
+        if value == value:
+            if value == self._prev:
+                self._same_count += 1
+            else:
+                self._same_count = 1
+            self._prev = value
+
+            self._nobs += 1
+            prev_mean = self._mean - self._comp_add
+            y = value - self._comp_add
+            t = y - self._mean
+            self._comp_add = t + self._mean - y
+            self._mean += t / self._nobs
+            self._ssqdm += (value - prev_mean) * (value - self._mean)
+
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            if old == old:
+                self._nobs -= 1
+                if self._nobs:
+                    prev_mean = self._mean - self._comp_remove
+                    y = old - self._comp_remove
+                    t = y - self._mean
+                    self._comp_remove = t + self._mean - y
+                    self._mean -= t / self._nobs
+                    self._ssqdm -= (old - prev_mean) * (old - self._mean)
+                else:
+                    self._mean = 0.0
+                    self._ssqdm = 0.0
+
+        nobs = self._nobs
+        if nobs < self.min_periods or nobs <= self.ddof:
+            return NAN
+        if nobs == 1 or self._same_count >= nobs:
+            return 0.0
+        variance = self._ssqdm / (nobs - self.ddof)
+        return math.sqrt(variance) if variance > 0 else 0.0
+
+
+class RollingMax:
+    """Fixed-window rolling maximum using a monotonic deque.
+
+    Set ``minimum=True`` for a rolling minimum.
+    """
+
+    __slots__ = ("window", "min_periods", "_sign", "_count", "_nan_flags", "_nobs", "_candidates")
+
+    def __init__(self, window: int, min_periods: int | None = None, minimum: bool = False):
+        """Initialize RollingMax.
+
+        Args:
+            window: Window size in bars
+            min_periods: Non-NaN observations required (defaults to window)
+            minimum: Track the minimum instead of the maximum
+        """
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._sign = -1.0 if minimum else 1.0
+        self._count = 0
+        self._nan_flags: deque[bool] = deque()
+        self._nobs = 0
+        # (position, signed value) pairs with strictly decreasing values
+        self._candidates: deque[tuple[int, float]] = deque()
+
+    def update(self, value: float) -> float:
+        """Push a value and return the window extreme."""
+        position = self._count
+        self._count += 1
+
+        is_obs = value == value
+        self._nan_flags.append(is_obs)
+        self._nobs += is_obs
+        if len(self._nan_flags) > self.window:
+            self._nobs -= self._nan_flags.popleft()
+
+        candidates = self._candidates
+        if is_obs:
+            signed = self._sign * value
+            while candidates and candidates[-1][1] <= signed:
+                candidates.pop()
+            candidates.append((position, signed))
+        while candidates and candidates[0][0] <= position - self.window:
+            candidates.popleft()
+
+        if self._nobs < self.min_periods or not candidates:
+            return NAN
+        return self._sign * candidates[0][1]
+
+
+class EWMState:
+    """Recursive exponential average matching ``ewm(span, adjust=False).mean()``.
+
+    NaN inputs decay the weight of the previous average without resetting
+    it, as pandas does with ``ignore_na=False``.
+    """
+
+    __slots__ = ("alpha", "_weighted", "_old_wt", "_nobs")
+
+    def __init__(self, span: int):
+        """Initialize EWMState.
+
+        Args:
+            span: EMA span (number of periods)
+        """
+        com = (span - 1) / 2.0
+        self.alpha = 1.0 / (1.0 + com)
+        self._weighted = NAN
+        self._old_wt = 1.0
+        self._nobs = 0
+
+    def update(self, value: float) -> float:
+        """Push a value and return the current average."""
+        is_obs = value == value
+        self._nobs += is_obs
+        weighted = self._weighted
+
+        if weighted == weighted:
+            self._old_wt *= 1.0 - self.alpha
+            if is_obs:
+                if weighted != value:
+                    weighted = self._old_wt * weighted + self.alpha * value
+                    weighted /= self._old_wt + self.alpha
+                self._old_wt = 1.0
+        elif is_obs:
+            weighted = value
+
+        self._weighted = weighted
+        return weighted if self._nobs >= 1 else NAN
+
+
+class RollingSlope:
+    """Rolling least-squares slope of a series against bar position.
+
+    Matches :func:`rolling_regression_slope`.  The sums ``sum(y)`` and
+    ``sum(i * y)`` slide in O(1) per bar; they are rebuilt from the window
+    once per ``window`` bars (and after any NaN leaves the window) so
+    round-off does not accumulate.  Values are stored relative to a
+    reference taken at each rebuild, which keeps the sums small.
+    """
+
+    __slots__ = ("window", "_values", "_nan_count", "_ref", "_sum_y", "_sum_xy", "_steps", "_valid")
+
+    def __init__(self, window: int):
+        """Initialize RollingSlope.
+
+        Args:
+            window: Regression window in bars
+        """
+        self.window = window
+        self._values: deque[float] = deque()
+        self._nan_count = 0
+        self._ref = 0.0
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._steps = 0
+        self._valid = False
+
+    def _rebuild(self) -> None:
+        """Recompute the sums directly from the window."""
+        self._ref = self._values[0]
+        sum_y = 0.0
+        sum_xy = 0.0
+        for i, y in enumerate(self._values):
+            y -= self._ref
+            sum_y += y
+            sum_xy += i * y
+        self._sum_y = sum_y
+        self._sum_xy = sum_xy
+        self._steps = 0
+        self._valid = True
+
+    def update(self, value: float) -> float:
+        """Push a value and return the slope over the current window."""
+        w = self.window
+        old = NAN
+        self._values.append(value)
+        if value != value:
+            self._nan_count += 1
+        if len(self._values) > w:
+            old = self._values.popleft()
+            if old != old:
+                self._nan_count -= 1
+
+        if len(self._values) < w or self._nan_count:
+            self._valid = False
+            return NAN
+
+        self._steps += 1
+        if not self._valid or self._steps >= w:
+            self._rebuild()
+        else:
+            # Every remaining point shifts one position left
+            old -= self._ref
+            new = value - self._ref
+            self._sum_y -= old
+            self._sum_xy += (w - 1) * new - self._sum_y
+            self._sum_y += new
+
+        denominator = w * (w * w - 1) / 12.0
+        if denominator < EPS:
+            return 0.0
+        x_mean = (w - 1) / 2.0
+        numerator = self._sum_xy - x_mean * self._sum_y
+        if abs(numerator) <= _CANCELLATION * abs(self._sum_xy):
+            # Near-flat window: the running sums cancel, use the two-pass form
+            y_mean = math.fsum(self._values) / w
+            numerator = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(self._values))
+        return numerator / denominator
+
+
+class RollingRegression:
+    """Rolling simple regression of ``y`` on ``x``.
+
+    Produces the beta and residual (population) standard deviation computed
+    by :func:`rolling_beta`, from sliding sums of ``x``, ``y``, ``x*x``,
+    ``x*y`` and ``y*y``.  Sums are rebuilt from the window periodically, as
+    in :class:`RollingSlope`.
+    """
+
+    __slots__ = ("window", "_pairs", "_nan_count", "_sums", "_steps", "_valid")
+
+    def __init__(self, window: int):
+        """Initialize RollingRegression.
+
+        Args:
+            window: Regression window in bars
+        """
+        self.window = window
+        self._pairs: deque[tuple[float, float]] = deque()
+        self._nan_count = 0
+        self._sums = [0.0] * 5
+        self._steps = 0
+        self._valid = False
+
+    def _rebuild(self) -> None:
+        """Recompute the sums directly from the window."""
+        sx = sy = sxx = sxy = syy = 0.0
+        for x, y in self._pairs:
+            sx += x
+            sy += y
+            sxx += x * x
+            sxy += x * y
+            syy += y * y
+        self._sums = [sx, sy, sxx, sxy, syy]
+        self._steps = 0
+        self._valid = True
+
+    def update(self, x: float, y: float) -> tuple[float, float]:
+        """Push an observation and return ``(beta, residual_std)``."""
+        w = self.window
+        self._pairs.append((x, y))
+        if x != x or y != y:
+            self._nan_count += 1
+        old = None
+        if len(self._pairs) > w:
+            old = self._pairs.popleft()
+            if old[0] != old[0] or old[1] != old[1]:
+                self._nan_count -= 1
+
+        if len(self._pairs) < w or self._nan_count:
+            self._valid = False
+            return NAN, NAN
+
+        self._steps += 1
+        if not self._valid or self._steps >= w:
+            self._rebuild()
+        else:
+            sums = self._sums
+            ox, oy = old
+            sums[0] += x - ox
+            sums[1] += y - oy
+            sums[2] += x * x - ox * ox
+            sums[3] += x * y - ox * oy
+            sums[4] += y * y - oy * oy
+
+        sx, sy, sxx, sxy, syy = self._sums
+        mean_x = sx / w
+        mean_y = sy / w
+        var = sxx - w * mean_x * mean_x
+        syy_c = syy - w * mean_y * mean_y
+        if var <= _CANCELLATION * sxx or syy_c <= _CANCELLATION * syy:
+            return self._two_pass()
+
+        if var < EPS:
+            return 0.0, math.sqrt(syy_c / w)
+
+        cov = sxy - w * mean_x * mean_y
+        beta = cov / var
+        resid = syy_c - beta * cov
+        if resid <= _CANCELLATION * syy_c:
+            return self._two_pass()
+        return beta, math.sqrt(resid / w)
+
+    def _two_pass(self) -> tuple[float, float]:
+        """Exact centered computation for windows where the sums cancel."""
+        w = self.window
+        mean_x = sum(x for x, _ in self._pairs) / w
+        mean_y = sum(y for _, y in self._pairs) / w
+        var = sum((x - mean_x) ** 2 for x, _ in self._pairs)
+        if var < EPS:
+            return 0.0, math.sqrt(sum((y - mean_y) ** 2 for _, y in self._pairs) / w)
+        cov = sum((x - mean_x) * (y - mean_y) for x, y in self._pairs)
+        beta = cov / var
+        alpha = mean_y - beta * mean_x
+        residuals = [y - (alpha + beta * x) for x, y in self._pairs]
+        resid_mean = sum(residuals) / w
+        return beta, math.sqrt(sum((r - resid_mean) ** 2 for r in residuals) / w)
+
+
+class History:
+    """Ring buffer of the most recent values of a series."""
+
+    __slots__ = ("size", "_values")
+
+    def __init__(self, size: int):
+        """Initialize History.
+
+        Args:
+            size: Number of values retained
+        """
+        self.size = size
+        self._values: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def append(self, value: float) -> None:
+        """Push the newest value, evicting the oldest when full."""
+        self._values.append(value)
+
+    def ago(self, periods: int) -> float:
+        """Return the value ``periods`` bars before the newest (NaN if unseen)."""
+        if periods >= len(self._values):
+            return NAN
+        return self._values[-1 - periods]
+
+
+def stream_log_return(price: float, previous: float) -> float:
+    """Scalar counterpart of :func:`log_return`."""
+    ratio = price / (previous + EPS)
+    if ratio != ratio:
+        return NAN
+    if ratio <= 0:
+        return NAN if ratio < 0 else -math.inf
+    return math.log(ratio)
+
+
+class WindowedFeatureStream(FeatureStream):
+    """Fallback stream that recomputes a calculator over a trailing window.
+
+    Used for calculators whose indicators have no constant-time update
+    (e.g. library indicators seeded from their first bars).  Each update
+    costs one ``compute()`` over at most ``window`` bars, so latency is
+    bounded regardless of how long the stream runs.  Output equals
+    ``compute()`` on the same trailing window.
+    """
+
+    def __init__(self, calculator: "BaseFeatureCalculator", window: int):
+        """Initialize WindowedFeatureStream.
+
+        Args:
+            calculator: Batch calculator to evaluate
+            window: Number of trailing bars passed to ``compute()``
+        """
+        self._calculator = calculator
+        self.window = window
+        self._timestamps: deque[datetime] = deque(maxlen=window)
+        self._rows: deque[tuple[float, ...]] = deque(maxlen=window)
+
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Consume one bar and return its features.
+
+        Args:
+            timestamp: Bar timestamp
+            bar: Mapping with keys open, high, low, close, volume
+            **kwargs: Ignored; per-bar intermediates have no windowed form
+
+        Returns:
+            Feature name to value for this bar
+        """
+        self._timestamps.append(timestamp)
+        self._rows.append(tuple(float(bar[col]) for col in OHLCV_COLUMNS))
+        df = pd.DataFrame(
+            list(self._rows),
+            index=pd.Index(list(self._timestamps)),
+            columns=list(OHLCV_COLUMNS),
+        )
+        features = self._calculator.compute(df)
+        if features.empty:
+            return {}
+        return features.iloc[-1].to_dict()
+
+    def update_frame(self, df: pd.DataFrame, **kwargs: Sequence[Any]) -> pd.DataFrame:
+        """Consume a block of bars with a single ``compute()`` call.
+
+        Rows of the block are computed with the retained window plus the
+        earlier rows of the block as context, so large blocks (e.g. warmup
+        history) cost one batch computation rather than one per bar.
+
+        Args:
+            df: Bars with datetime index and OHLCV columns
+            **kwargs: Ignored; per-bar intermediates have no windowed form
+
+        Returns:
+            DataFrame with one feature row per input bar
+        """
+        rows = df[list(OHLCV_COLUMNS)].to_numpy(dtype=float).tolist()
+        context = pd.DataFrame(
+            list(self._rows) + rows,
+            index=pd.Index(list(self._timestamps) + list(df.index)),
+            columns=list(OHLCV_COLUMNS),
+        )
+        self._timestamps.extend(df.index)
+        self._rows.extend(tuple(row) for row in rows)
+
+        features = self._calculator.compute(context)
+        return features.iloc[len(features) - len(df):].set_axis(df.index)
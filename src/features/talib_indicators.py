@@ -38,6 +38,10 @@ class TALibIndicatorCalculator(BaseFeatureCalculator):
     - Support/Resistance: Pivot Points
 
     Requires TA-Lib system library and Python wrapper to be installed.
+
+    There is no native stream: ``create_stream()`` returns the windowed
+    fallback, so each streamed bar recomputes every indicator over the
+    trailing ``max_lookback + lookback_buffer`` bars.
     """
 
     def __init__(
@@ -248,8 +252,6 @@ class TALibIndicatorCalculator(BaseFeatureCalculator):
         if df.empty:
             return pd.DataFrame(index=df.index)
 
-        result = pd.DataFrame(index=df.index)
-
         # Compute each indicator group
         momentum_df = self._compute_momentum(df)
         trend_df = self._compute_trend(df)
@@ -262,20 +264,19 @@ class TALibIndicatorCalculator(BaseFeatureCalculator):
         extra_trend_df = self._compute_additional_trend(df)
         candle_df = self._compute_candle_patterns(df)
 
-        # Combine all results
-        for features_df in [
-            momentum_df, trend_df, volatility_df, volume_df, ichimoku_df, pivot_df,
-            directional_df, extra_osc_df, extra_trend_df, candle_df,
-        ]:
-            for col in features_df.columns:
-                result[col] = features_df[col]
+        # Combine all results in one concat; inserting ~70 columns one at a
+        # time dominates the cost of compute() on short frames
+        result = pd.concat(
+            [
+                momentum_df, trend_df, volatility_df, volume_df, ichimoku_df, pivot_df,
+                directional_df, extra_osc_df, extra_trend_df, candle_df,
+            ],
+            axis=1,
+        )
 
         # Derived composites (depend on primary indicators already in result)
         derived_df = self._compute_derived(df, result)
-        for col in derived_df.columns:
-            result[col] = derived_df[col]
-
-        return result
+        return pd.concat([result, derived_df], axis=1)
 
     def _compute_momentum(self, df: pd.DataFrame) -> pd.DataFrame:
         """Compute momentum indicators."""
@@ -1,12 +1,15 @@
 """Time-of-day encoding features."""
 
 import logging
-from typing import Any
+import math
+from datetime import datetime
+from typing import Any, Mapping
 
 import numpy as np
 import pandas as pd
 
 from .base import BaseFeatureCalculator, FeatureSpec
+from .streaming import FeatureStream
 
 logger = logging.getLogger(__name__)
 
@@ -148,3 +151,55 @@ class TimeOfDayFeatureCalculator(BaseFeatureCalculator):
             result["is_open_window"].sum(), result["is_close_window"].sum(), result["is_midday"].sum()
         )
         return result
+
+    def create_stream(self, lookback_buffer: int = 100) -> FeatureStream:
+        """Create a per-bar stream of time-of-day features.
+
+        Args:
+            lookback_buffer: Unused; time-of-day features depend on one bar
+
+        Returns:
+            New TimeOfDayFeatureStream
+        """
+        return TimeOfDayFeatureStream(self)
+
+
+class TimeOfDayFeatureStream(FeatureStream):
+    """Per-bar stream of :class:`TimeOfDayFeatureCalculator` features."""
+
+    def __init__(self, calculator: TimeOfDayFeatureCalculator):
+        """Initialize TimeOfDayFeatureStream.
+
+        Args:
+            calculator: Calculator whose session settings this stream follows
+        """
+        self._calc = calculator
+        self._open_minutes = calculator.market_open_hour * 60 + calculator.market_open_minute
+
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Compute time-of-day features of one bar.
+
+        Args:
+            timestamp: Bar timestamp
+            bar: Unused
+
+        Returns:
+            Values for tod_sin, tod_cos, is_open_window, is_close_window,
+            is_midday
+        """
+        calc = self._calc
+        tod = timestamp.hour * 60 + timestamp.minute - self._open_minutes
+        angle = 2 * math.pi * (tod / calc.trading_minutes)
+
+        return {
+            "tod_sin": math.sin(angle),
+            "tod_cos": math.cos(angle),
+            "is_open_window": int(tod < calc.open_window_minutes),
+            "is_close_window": int(tod > calc.trading_minutes - calc.close_window_minutes),
+            "is_midday": int(calc.midday_start_minutes <= tod <= calc.midday_end_minutes),
+        }
@@ -1,11 +1,13 @@
 """Volatility and range features (regime + risk context)."""
 
 import logging
-from typing import Any
+from datetime import datetime
+from typing import Any, Mapping
 
 import pandas as pd
 
 from .base import EPS, BaseFeatureCalculator, FeatureSpec, log_return, safe_divide, zscore
+from .streaming import FeatureStream, History, RollingMean, RollingStd, stream_log_return
 
 logger = logging.getLogger(__name__)
 
@@ -130,3 +132,69 @@ class VolatilityFeatureCalculator(BaseFeatureCalculator):
             result["atr_60"].min(), result["atr_60"].max()
         )
         return result
+
+    def create_stream(self, lookback_buffer: int = 100) -> FeatureStream:
+        """Create a constant-time per-bar stream of volatility features.
+
+        Args:
+            lookback_buffer: Unused; volatility features need no fallback window
+
+        Returns:
+            New VolatilityFeatureStream
+        """
+        return VolatilityFeatureStream(self)
+
+
+class VolatilityFeatureStream(FeatureStream):
+    """Per-bar stream of :class:`VolatilityFeatureCalculator` features."""
+
+    def __init__(self, calculator: VolatilityFeatureCalculator):
+        """Initialize VolatilityFeatureStream.
+
+        Args:
+            calculator: Calculator whose windows this stream follows
+        """
+        self._closes = History(2)
+        self._rv_short = RollingStd(calculator.short_window)
+        self._rv_long = RollingStd(calculator.long_window)
+        self._atr = RollingMean(calculator.long_window)
+        self._range_mean = RollingMean(calculator.long_window)
+        self._range_std = RollingStd(calculator.long_window)
+        self._vol_of_vol = RollingStd(calculator.long_window)
+
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Consume one bar and return its volatility features.
+
+        Args:
+            timestamp: Bar timestamp
+            bar: Mapping with keys high, low, close
+            **kwargs:
+                r1: Optional r1 of this bar from the returns stream
+
+        Returns:
+            Values for rv_15, rv_60, range_1, atr_60, range_z_60, vol_of_vol
+        """
+        close = float(bar["close"])
+        self._closes.append(close)
+        r1 = kwargs.get("r1")
+        if r1 is None:
+            r1 = stream_log_return(close, self._closes.ago(1))
+
+        rv_short = self._rv_short.update(r1)
+        range_1 = (float(bar["high"]) - float(bar["low"])) / (close + EPS)
+        range_mean = self._range_mean.update(range_1)
+        range_std = self._range_std.update(range_1)
+
+        return {
+            "rv_15": rv_short,
+            "rv_60": self._rv_long.update(r1),
+            "range_1": range_1,
+            "atr_60": self._atr.update(range_1),
+            "range_z_60": (range_1 - range_mean) / (range_std + EPS),
+            "vol_of_vol": self._vol_of_vol.update(rv_short),
+        }
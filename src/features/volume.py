@@ -1,11 +1,13 @@
 """Volume and participation features."""
 
 import logging
-from typing import Any
+from datetime import datetime
+from typing import Any, Mapping
 
 import pandas as pd
 
 from .base import EPS, BaseFeatureCalculator, FeatureSpec, safe_divide, zscore
+from .streaming import FeatureStream, RollingMean, RollingStd
 
 logger = logging.getLogger(__name__)
 
@@ -100,3 +102,57 @@ class VolumeFeatureCalculator(BaseFeatureCalculator):
             result["vol_z_60"].min(), result["vol_z_60"].max()
         )
         return result
+
+    def create_stream(self, lookback_buffer: int = 100) -> FeatureStream:
+        """Create a constant-time per-bar stream of volume features.
+
+        Args:
+            lookback_buffer: Unused; volume features need no fallback window
+
+        Returns:
+            New VolumeFeatureStream
+        """
+        return VolumeFeatureStream(self)
+
+
+class VolumeFeatureStream(FeatureStream):
+    """Per-bar stream of :class:`VolumeFeatureCalculator` features."""
+
+    def __init__(self, calculator: VolumeFeatureCalculator):
+        """Initialize VolumeFeatureStream.
+
+        Args:
+            calculator: Calculator whose window this stream follows
+        """
+        self._vol_mean = RollingMean(calculator.window)
+        self._vol_std = RollingStd(calculator.window)
+        self._dvol_mean = RollingMean(calculator.window)
+        self._dvol_std = RollingStd(calculator.window)
+
+    def update(
+        self,
+        timestamp: datetime,
+        bar: Mapping[str, float],
+        **kwargs: Any,
+    ) -> dict[str, float]:
+        """Consume one bar and return its volume features.
+
+        Args:
+            timestamp: Bar timestamp
+            bar: Mapping with keys close, volume
+
+        Returns:
+            Values for vol1, dvol1, relvol_60, vol_z_60, dvol_z_60
+        """
+        volume = float(bar["volume"])
+        dvol = float(bar["close"]) * volume
+        vol_mean = self._vol_mean.update(volume)
+        dvol_mean = self._dvol_mean.update(dvol)
+
+        return {
+            "vol1": volume,
+            "dvol1": dvol,
+            "relvol_60": volume / (vol_mean + EPS),
+            "vol_z_60": (volume - vol_mean) / (self._vol_std.update(volume) + EPS),
+            "dvol_z_60": (dvol - dvol_mean) / (self._dvol_std.update(dvol) + EPS),
+        }
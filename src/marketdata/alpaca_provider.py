@@ -2,6 +2,7 @@
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import pandas as pd
@@ -10,6 +11,7 @@ from alpaca.data.enums import DataFeed
 from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 
+from src.data.session_calendar import get_session_calendar
 from src.marketdata.base import MarketDataProvider
 from src.marketdata.utils import (
     RateLimiter,
@@ -26,14 +28,76 @@ RESOLUTION_MAP = {
     "1Day": TimeFrame.Day,
 }
 
-MAX_DAYS_PER_CHUNK = 25
+# Bars per page of the bars endpoint.  The SDK follows ``next_page_token``
+# inside one ``get_stock_bars`` call, so every page is an HTTP call the
+# rate limiter does not see; requests are sized to fit a single page.
+PAGE_LIMIT = 10_000
+
+# Upper bound on bars per symbol per calendar day (04:00-20:00 ET for 1Min),
+# used when a range is outside the session calendar
+MAX_BARS_PER_DAY = {
+    "1Min": 960,
+    "1Day": 1,
+}
+
+# Date-range chunk per request, by resolution.  A 1Min chunk touches at
+# most nine sessions (under 9,000 bars), so one symbol always fits in a page.
+MAX_DAYS_PER_CHUNK = {
+    "1Min": 10,
+    "1Day": 365,
+}
+
+# Cap on symbols per StockBarsRequest (keeps the query string short); the
+# actual batch size is the largest that keeps a chunk within one page.
+MAX_SYMBOLS_PER_REQUEST = {
+    "1Min": 100,
+    "1Day": 200,
+}
+
+
+def max_bars_per_symbol(resolution: str, start: datetime, end: datetime) -> int:
+    """Most bars one symbol can have in ``[start, end]``, extended hours included.
+
+    Args:
+        resolution: ``"1Min"`` or ``"1Day"``.
+        start: Range start.
+        end: Range end (inclusive).
+
+    Returns:
+        Upper bound on the bars returned per symbol.
+    """
+    # Daily bars are stamped during the session date, so count from its start
+    day_start = pd.Timestamp(start).floor("D")
+    calendar = get_session_calendar(extended_hours=True)
+    if calendar.covers(day_start, end):
+        return calendar.expected_count(resolution, day_start, end)
+    days = -(-(pd.Timestamp(end) - day_start) // timedelta(days=1))
+    return max(days, 1) * MAX_BARS_PER_DAY[resolution]
+
+
+def symbols_per_request(resolution: str, start: datetime, end: datetime) -> int:
+    """Largest symbol batch whose bars for ``[start, end]`` fit in one page.
+
+    Args:
+        resolution: ``"1Min"`` or ``"1Day"``.
+        start: Chunk start.
+        end: Chunk end (inclusive).
+
+    Returns:
+        Symbols per request, at least 1.
+    """
+    per_symbol = max_bars_per_symbol(resolution, start, end)
+    return max(1, min(MAX_SYMBOLS_PER_REQUEST[resolution], PAGE_LIMIT // max(per_symbol, 1)))
 
 
 class AlpacaProvider(MarketDataProvider):
     """Fetch OHLCV bars from the Alpaca Markets API.
 
     Uses the ``alpaca-py`` SDK with shared rate-limiting, retry, and
-    pagination utilities.
+    pagination utilities.  Multi-symbol fetches batch symbols into one
+    ``StockBarsRequest`` and issue the (batch, date chunk) requests
+    concurrently under a single token-bucket limiter.  Batches are sized
+    so each request is a single page, i.e. one HTTP call per token.
     """
 
     source_name = "alpaca"
@@ -44,7 +108,22 @@ class AlpacaProvider(MarketDataProvider):
         secret_key: str | None = None,
         rate_limit: int = 200,
         max_retries: int = 3,
+        burst: int = 10,
+        max_workers: int = 8,
+        rate_limiter: RateLimiter | None = None,
     ):
+        """Initialize provider.
+
+        Args:
+            api_key: Alpaca API key (defaults to ``ALPACA_API_KEY``).
+            secret_key: Alpaca secret (defaults to ``ALPACA_SECRET_KEY``).
+            rate_limit: Sustained requests per minute.
+            max_retries: Attempts per request.
+            burst: Requests allowed back-to-back after an idle period.
+            max_workers: Concurrent requests per fetch.
+            rate_limiter: Limiter to share with other providers/workers
+                (overrides ``rate_limit`` and ``burst``).
+        """
         self.api_key = api_key or os.environ.get("ALPACA_API_KEY")
         self.secret_key = secret_key or os.environ.get("ALPACA_SECRET_KEY")
 
@@ -55,8 +134,9 @@ class AlpacaProvider(MarketDataProvider):
             )
 
         self.client = StockHistoricalDataClient(self.api_key, self.secret_key)
-        self.rate_limiter = RateLimiter(rate_limit)
+        self.rate_limiter = rate_limiter or RateLimiter(rate_limit, burst=burst)
         self.max_retries = max_retries
+        self.max_workers = max_workers
 
     def fetch_bars(
         self,
@@ -66,6 +146,49 @@ class AlpacaProvider(MarketDataProvider):
         resolution: str = "1Min",
     ) -> pd.DataFrame:
         symbol = symbol.upper()
+        frames, _ = self._fetch([symbol], start, end, resolution, raise_errors=True)
+        df = frames[symbol]
+        if df.empty:
+            logger.warning("Alpaca returned no data for %s (%s to %s)", symbol, start, end)
+        return df
+
+    def fetch_bars_multi(
+        self,
+        symbols: list[str],
+        start: datetime,
+        end: datetime,
+        resolution: str = "1Min",
+    ) -> dict[str, pd.DataFrame]:
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        frames, failed = self._fetch(symbols, start, end, resolution, raise_errors=False)
+        if failed:
+            logger.warning(
+                "Alpaca fetch failed for %d/%d symbols (%s to %s)",
+                len(failed), len(symbols), start, end,
+            )
+        return {s: df for s, df in frames.items() if s not in failed}
+
+    def _fetch(
+        self,
+        symbols: list[str],
+        start: datetime,
+        end: datetime,
+        resolution: str,
+        raise_errors: bool,
+    ) -> tuple[dict[str, pd.DataFrame], set[str]]:
+        """Fetch every (symbol batch, date chunk) request concurrently.
+
+        Args:
+            symbols: Upper-cased, de-duplicated symbols.
+            start: Range start.
+            end: Range end.
+            resolution: ``"1Min"`` or ``"1Day"``.
+            raise_errors: Re-raise the first failed request instead of
+                marking its symbols as failed.
+
+        Returns:
+            Tuple of (normalised bars per symbol, symbols with a failed request).
+        """
         timeframe = RESOLUTION_MAP.get(resolution)
         if timeframe is None:
             raise ValueError(
@@ -73,55 +196,95 @@ class AlpacaProvider(MarketDataProvider):
                 f"Supported: {list(RESOLUTION_MAP)}"
             )
 
-        chunks = generate_date_chunks(start, end, MAX_DAYS_PER_CHUNK)
-        all_data: list[pd.DataFrame] = []
-
-        for chunk_start, chunk_end in chunks:
-            chunk_df = self._fetch_chunk(symbol, chunk_start, chunk_end, timeframe)
-            if not chunk_df.empty:
-                all_data.append(chunk_df)
-                # Advance past last received bar for 1Min to avoid duplication
-                if resolution == "1Min":
-                    last_ts = chunk_df.index.max()
-                    next_start = last_ts + timedelta(minutes=1)
-                    if next_start > chunk_end:
-                        continue
-
-        if not all_data:
-            logger.warning("Alpaca returned no data for %s (%s to %s)", symbol, start, end)
-            return pd.DataFrame()
+        # One limiter token per request, so each request must be one page
+        chunks = generate_date_chunks(start, end, MAX_DAYS_PER_CHUNK[resolution])
+        tasks = []
+        for chunk in chunks:
+            batch_size = symbols_per_request(resolution, *chunk)
+            tasks.extend(
+                (symbols[i:i + batch_size], chunk) for i in range(0, len(symbols), batch_size)
+            )
+        logger.debug(
+            "Alpaca %s fetch: %d symbols in %d requests over %d chunks",
+            resolution, len(symbols), len(tasks), len(chunks),
+        )
 
-        df = pd.concat(all_data)
-        df = df[~df.index.duplicated(keep="first")]
-        df = df.sort_index()
-        return normalize_ohlcv(df)
+        def run(task) -> dict[str, pd.DataFrame]:
+            batch, (chunk_start, chunk_end) = task
+            return self._fetch_chunk(batch, chunk_start, chunk_end, timeframe)
+
+        parts: dict[str, list[pd.DataFrame]] = {s: [] for s in symbols}
+        failed: set[str] = set()
+        workers = min(self.max_workers, len(tasks)) if tasks else 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="alpaca-fetch") as executor:
+            futures = [(task, executor.submit(run, task)) for task in tasks]
+            for (batch, _), future in futures:
+                try:
+                    chunk_frames = future.result()
+                except Exception:
+                    if raise_errors:
+                        for _, pending in futures:
+                            pending.cancel()
+                        raise
+                    failed.update(batch)
+                    continue
+                for symbol, df in chunk_frames.items():
+                    if symbol in parts and not df.empty:
+                        parts[symbol].append(df)
+
+        frames: dict[str, pd.DataFrame] = {}
+        for symbol, dfs in parts.items():
+            if not dfs:
+                frames[symbol] = pd.DataFrame()
+                continue
+            df = pd.concat(dfs)
+            df = df[~df.index.duplicated(keep="first")]
+            frames[symbol] = normalize_ohlcv(df.sort_index())
+        return frames, failed
 
     def _fetch_chunk(
         self,
-        symbol: str,
+        symbols: list[str],
         start: datetime,
         end: datetime,
         timeframe: TimeFrame,
-    ) -> pd.DataFrame:
-        """Fetch a single chunk with retry."""
-
-        def _call() -> pd.DataFrame:
-            request = StockBarsRequest(
-                symbol_or_symbols=symbol,
-                timeframe=timeframe,
-                start=start,
-                end=end,
-                feed=DataFeed.IEX,
-            )
-            bars = self.client.get_stock_bars(request)
-
-            if symbol not in bars.data or not bars.data[symbol]:
-                logger.debug("No bars in Alpaca response for %s chunk", symbol)
-                return pd.DataFrame()
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch one date chunk for a batch of symbols with retry."""
 
-            df = bars.df
-            if isinstance(df.index, pd.MultiIndex):
-                df = df.xs(symbol, level="symbol")
-            return ensure_timezone_naive(df)
+        def _call() -> dict[str, pd.DataFrame]:
+            df = self._request_bars(symbols, start, end, timeframe)
+            if df.empty:
+                logger.debug("No bars in Alpaca response for %s chunk", symbols)
+                return {}
+            if not isinstance(df.index, pd.MultiIndex):
+                return {symbols[0]: ensure_timezone_naive(df)}
+            return {
+                symbol: ensure_timezone_naive(group.droplevel("symbol"))
+                for symbol, group in df.groupby(level="symbol", sort=False)
+            }
 
         return fetch_with_retry(_call, self.max_retries, self.rate_limiter)
+
+    def _request_bars(
+        self,
+        symbols: list[str],
+        start: datetime,
+        end: datetime,
+        timeframe: TimeFrame,
+    ) -> pd.DataFrame:
+        """Issue one ``StockBarsRequest``.
+
+        Returns:
+            Bars indexed by (symbol, timestamp), or an empty DataFrame.
+        """
+        request = StockBarsRequest(
+            symbol_or_symbols=symbols,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+            feed=DataFeed.IEX,
+        )
+        bars = self.client.get_stock_bars(request)
+        if not any(bars.data.get(s) for s in symbols):
+            return pd.DataFrame()
+        return bars.df
@@ -42,6 +42,38 @@ class MarketDataProvider(ABC):
             available for the requested range.
         """
 
+    def fetch_bars_multi(
+        self,
+        symbols: list[str],
+        start: datetime,
+        end: datetime,
+        resolution: str = "1Min",
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch OHLCV bars for several symbols over the same range.
+
+        The default implementation calls :meth:`fetch_bars` once per
+        symbol.  Vendors whose API accepts many symbols per request
+        should override this to batch them.
+
+        Args:
+            symbols: Ticker symbols.
+            start: Start of the date range (inclusive).
+            end: End of the date range (inclusive).
+            resolution: Bar resolution — ``"1Min"`` or ``"1Day"``.
+
+        Returns:
+            Mapping of upper-cased symbol to its bars (empty DataFrame when
+            the vendor has no data).  Symbols whose fetch failed are
+            omitted and logged.
+        """
+        results: dict[str, pd.DataFrame] = {}
+        for symbol in dict.fromkeys(s.upper() for s in symbols):
+            try:
+                results[symbol] = self.fetch_bars(symbol, start, end, resolution)
+            except Exception as e:
+                logger.warning("Failed to fetch %s bars for %s: %s", resolution, symbol, e)
+        return results
+
     def fetch_1min_bars(
         self,
         symbol: str,
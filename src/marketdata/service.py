@@ -2,6 +2,8 @@
 
 import logging
 import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -11,18 +13,57 @@ import pandas as pd
 from src.data.database.connection import DatabaseManager, get_db_manager
 from src.data.database.dependencies import grpc_market_client
 from src.data.loaders.database_loader import AGGREGATABLE_TIMEFRAMES
+from src.data.session_calendar import SessionCalendar, get_session_calendar
 from src.marketdata.base import MarketDataProvider
 
 logger = logging.getLogger(__name__)
 
+# Timeframes fetched from the provider (the rest are aggregated from 1Min)
+PROVIDER_TIMEFRAMES = ("1Min", "1Day")
+
+# Data ending within this much of the requested end counts as up to date
+FRESHNESS_BUFFER = {
+    "1Min": timedelta(minutes=1),
+    "1Day": timedelta(days=1),
+}
+_DEFAULT_FRESHNESS_BUFFER = timedelta(minutes=1)
+
 
 @dataclass
 class _PendingRequest:
-    """Tracks an in-flight ensure_data request for request coalescing."""
+    """Tracks an in-flight (symbol, timeframe, range) fetch for request coalescing."""
+    start: Optional[datetime]
+    end: datetime
     event: threading.Event = field(default_factory=threading.Event)
-    result: Optional[dict[str, int]] = None
+    result: Optional[int] = None
     error: Optional[Exception] = None
-    waiter_count: int = 0
+
+    def covers(self, start: Optional[datetime], end: datetime, timeframe: str) -> bool:
+        """Whether this request's range contains ``[start, end]``.
+
+        ``start=None`` means "from the earliest available", so it only
+        contains other open-ended requests.
+        """
+        starts_before = self.start is None or (start is not None and self.start <= start)
+        buffer = FRESHNESS_BUFFER.get(timeframe, _DEFAULT_FRESHNESS_BUFFER)
+        return starts_before and end <= self.end + buffer
+
+    def wait(self) -> int:
+        """Block until the owning request finishes and return its bar count."""
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result or 0
+
+
+@dataclass
+class _FetchBatch:
+    """One multi-symbol provider request planned by ``ensure_universe``."""
+    timeframe: str
+    start: Optional[datetime]
+    end: datetime
+    # Per-symbol fetch start; rows before it are already in the DB
+    symbol_starts: dict[str, Optional[datetime]]
 
 
 class MarketDataService:
@@ -38,15 +79,22 @@ class MarketDataService:
     canonical implementation of gap detection and data persistence.
     """
 
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_FETCH_WORKERS = 2
+    DEFAULT_STORE_WORKERS = 8
+
     def __init__(
         self,
         provider: MarketDataProvider,
         db_manager: Optional[DatabaseManager] = None,
+        calendar: Optional[SessionCalendar] = None,
     ) -> None:
         self.provider = provider
         self.db_manager = db_manager or get_db_manager()
-        # Request coalescing: track in-flight requests to avoid duplicate API calls
-        self._pending_requests: dict[str, _PendingRequest] = {}
+        # Extended hours: the provider returns pre/post-market 1Min bars too
+        self.calendar = calendar or get_session_calendar(extended_hours=True)
+        # Request coalescing: in-flight ranges per (symbol, timeframe)
+        self._pending_requests: dict[tuple[str, str], list[_PendingRequest]] = {}
         self._pending_lock = threading.Lock()
 
     def ensure_data(
@@ -65,10 +113,11 @@ class MarketDataService:
         4. Fetches 1Day data directly from the provider.
 
         Request Coalescing:
-            If multiple concurrent requests arrive for the same symbol,
-            only the first one fetches from the provider. Subsequent
-            requests wait for the first to complete and share its result.
-            This prevents duplicate API calls to the data provider.
+            Work is tracked per (symbol, timeframe, range).  If an
+            in-flight request for the same symbol and timeframe already
+            covers the requested range, this call waits for it and shares
+            its result instead of fetching again.  Timeframes that are not
+            covered are fetched by this call.
 
         Args:
             symbol: Ticker symbol (e.g. ``"AAPL"``).
@@ -81,67 +130,192 @@ class MarketDataService:
             Mapping of ``timeframe -> new_bars_inserted``.
         """
         symbol = symbol.upper()
-        # Normalize to naive datetimes (UTC assumed) for consistent comparison with DB
+        start, end = self._normalize_range(start, end)
+        work = self._work_timeframes(timeframes)
+
+        owned, borrowed = self._claim([symbol], work, start, end)
+        for (_, tf) in borrowed:
+            logger.info(
+                "Request coalescing: waiting for in-flight %s request for %s", tf, symbol,
+            )
+
+        result: dict[str, int] = {}
+        try:
+            # Earlier requests first: our aggregation may depend on their 1Min
+            for (_, tf), pending in borrowed.items():
+                result[tf] = pending.wait()
+            if owned:
+                logger.debug("Processing ensure_data request for %s, timeframes=%s", symbol, timeframes)
+                result.update(self._do_ensure_data(symbol, [tf for (_, tf) in owned], start, end))
+        except Exception as e:
+            self._release(owned, {}, error=e)
+            raise
+        self._release(owned, {(symbol, tf): n for tf, n in result.items()})
+        if borrowed:
+            logger.info("Request coalescing: reused results for %s, result=%s", symbol, result)
+        return {tf: result[tf] for tf in work if tf in result}
+
+    def ensure_universe(
+        self,
+        symbols: list[str],
+        timeframes: list[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
+        store_workers: int = DEFAULT_STORE_WORKERS,
+    ) -> dict[str, dict[str, int]]:
+        """Ensure data for many symbols with batched lookups and fetches.
+
+        Gaps for every symbol are planned in one pass: latest timestamps
+        come from one batched repository lookup per provider timeframe,
+        and symbols needing the same range are fetched together with
+        ``provider.fetch_bars_multi``.  Fetched frames flow into a bounded
+        pool of insert/aggregate workers while later batches are still
+        downloading, so a large catch-up is limited by provider bandwidth
+        rather than per-symbol round trips.
+
+        Coalescing is shared with :meth:`ensure_data`: (symbol, timeframe)
+        pairs already covered by an in-flight request are not fetched
+        again.  Failures are isolated per symbol (logged, recorded in the
+        sync log, and reported as 0 bars).
+
+        Args:
+            symbols: Ticker symbols.
+            timeframes: Timeframes to ensure for every symbol.
+            start: Start of the desired range (``None`` = provider default).
+            end: End of the desired range.  Defaults to *now* (UTC).
+            batch_size: Symbols per provider request.
+            fetch_workers: Provider requests in flight.
+            store_workers: Concurrent insert/aggregate tasks.
+
+        Returns:
+            Mapping of ``symbol -> {timeframe -> new_bars_inserted}``.
+        """
+        symbols = list(dict.fromkeys(s.upper() for s in symbols))
+        start, end = self._normalize_range(start, end)
+        work = self._work_timeframes(timeframes)
+
+        owned, borrowed = self._claim(symbols, work, start, end)
+        logger.info(
+            "MarketDataService.ensure_universe: %d symbols, timeframes=%s, start=%s, end=%s "
+            "(%d pairs owned, %d coalesced)",
+            len(symbols), work, start, end, len(owned), len(borrowed),
+        )
+
+        counts: dict[tuple[str, str], int] = {}
+        try:
+            if owned:
+                counts = self._do_ensure_universe(
+                    list(owned), borrowed, start, end, batch_size, fetch_workers, store_workers,
+                )
+        except Exception as e:
+            self._release(owned, {}, error=e)
+            raise
+        self._release(owned, counts)
+
+        for key, pending in borrowed.items():
+            try:
+                counts[key] = pending.wait()
+            except Exception as e:
+                logger.warning("Coalesced %s request for %s failed: %s", key[1], key[0], e)
+                counts[key] = 0
+
+        result = {
+            symbol: {tf: counts.get((symbol, tf), 0) for tf in work}
+            for symbol in symbols
+        }
+        logger.info(
+            "MarketDataService.ensure_universe complete: %d symbols, %d new bars",
+            len(symbols), sum(counts.values()),
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # Request coalescing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _normalize_range(
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> tuple[Optional[datetime], datetime]:
+        """Normalize to naive datetimes (UTC assumed) for comparison with DB."""
         if end is None:
             end = datetime.now(timezone.utc)
         if end.tzinfo is not None:
             end = end.replace(tzinfo=None)
         if start is not None and start.tzinfo is not None:
             start = start.replace(tzinfo=None)
+        return start, end
 
-        # Request coalescing key: symbol is sufficient since we always fetch
-        # all requested timeframes together
-        request_key = symbol
+    @staticmethod
+    def _work_timeframes(timeframes: list[str]) -> list[str]:
+        """Timeframes actually processed, in dependency order.
 
-        # Check for existing in-flight request
-        with self._pending_lock:
-            pending = self._pending_requests.get(request_key)
-            if pending is not None:
-                # Another request is in progress - wait for it
-                pending.waiter_count += 1
-                logger.info(
-                    "Request coalescing: waiting for in-flight request for %s (waiters=%d)",
-                    symbol, pending.waiter_count,
-                )
+        Intraday aggregates are built from 1Min, so requesting any of
+        them implies ensuring 1Min first.
+        """
+        work = []
+        if "1Min" in timeframes or any(tf in AGGREGATABLE_TIMEFRAMES for tf in timeframes):
+            work.append("1Min")
+        work.extend(tf for tf in AGGREGATABLE_TIMEFRAMES if tf in timeframes)
+        if "1Day" in timeframes:
+            work.append("1Day")
+        return work
+
+    def _claim(
+        self,
+        symbols: list[str],
+        timeframes: list[str],
+        start: Optional[datetime],
+        end: datetime,
+    ) -> tuple[dict[tuple[str, str], _PendingRequest], dict[tuple[str, str], _PendingRequest]]:
+        """Register (symbol, timeframe) work, reusing in-flight requests that cover it.
 
-        if pending is not None:
-            # Wait outside the lock to avoid blocking other symbols
-            pending.event.wait()
-            with self._pending_lock:
-                pending.waiter_count -= 1
-                # Clean up if we're the last waiter
-                if pending.waiter_count == 0 and request_key in self._pending_requests:
-                    del self._pending_requests[request_key]
-
-            if pending.error is not None:
-                raise pending.error
-            logger.info(
-                "Request coalescing: reusing result for %s, result=%s",
-                symbol, pending.result,
-            )
-            return pending.result or {}
+        All pairs are claimed under one lock acquisition, so a request only
+        ever waits on requests that claimed before it.
 
-        # We are the first request - create pending entry
-        pending = _PendingRequest()
+        Returns:
+            Tuple of (pairs this call must process, pairs to wait on).
+        """
+        owned: dict[tuple[str, str], _PendingRequest] = {}
+        borrowed: dict[tuple[str, str], _PendingRequest] = {}
         with self._pending_lock:
-            self._pending_requests[request_key] = pending
-
-        # Do the actual work
-        logger.debug("Processing ensure_data request for %s, timeframes=%s", symbol, timeframes)
-        try:
-            result = self._do_ensure_data(symbol, timeframes, start, end)
-            pending.result = result
-            return result
-        except Exception as e:
-            pending.error = e
-            raise
-        finally:
-            # Signal all waiters
+            for symbol in symbols:
+                for tf in timeframes:
+                    key = (symbol, tf)
+                    in_flight = self._pending_requests.setdefault(key, [])
+                    covering = next((p for p in in_flight if p.covers(start, end, tf)), None)
+                    if covering is not None:
+                        borrowed[key] = covering
+                    else:
+                        owned[key] = _PendingRequest(start=start, end=end)
+                        in_flight.append(owned[key])
+        return owned, borrowed
+
+    def _release(
+        self,
+        owned: dict[tuple[str, str], _PendingRequest],
+        counts: dict[tuple[str, str], int],
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Publish results for claimed pairs and wake their waiters."""
+        with self._pending_lock:
+            for key, pending in owned.items():
+                pending.result = counts.get(key, 0)
+                pending.error = error
+                in_flight = self._pending_requests.get(key, [])
+                if pending in in_flight:
+                    in_flight.remove(pending)
+                if not in_flight:
+                    self._pending_requests.pop(key, None)
+        for pending in owned.values():
             pending.event.set()
-            # Clean up if no waiters
-            with self._pending_lock:
-                if pending.waiter_count == 0 and request_key in self._pending_requests:
-                    del self._pending_requests[request_key]
+
+    # ------------------------------------------------------------------
+    # Single-symbol path
+    # ------------------------------------------------------------------
 
     def _do_ensure_data(
         self,
@@ -150,7 +324,7 @@ class MarketDataService:
         start: Optional[datetime],
         end: datetime,
     ) -> dict[str, int]:
-        """Internal implementation of ensure_data (called by first request only)."""
+        """Process the (already expanded) timeframes this request owns."""
         result: dict[str, int] = {}
 
         logger.info(
@@ -162,15 +336,14 @@ class MarketDataService:
             ticker = repo.get_or_create_ticker(symbol)
 
             # Always ensure 1Min first (other intraday TFs aggregate from it)
-            if "1Min" in timeframes or any(tf in AGGREGATABLE_TIMEFRAMES for tf in timeframes):
+            if "1Min" in timeframes:
                 bars = self._ensure_1min(repo, ticker, symbol, start, end)
                 result["1Min"] = bars
 
-            # Aggregate intraday timeframes from 1Min
-            for tf in timeframes:
-                if tf in AGGREGATABLE_TIMEFRAMES:
-                    bars = self._aggregate_timeframe(repo, ticker, symbol, tf, start, end)
-                    result[tf] = bars
+            # Aggregate intraday timeframes from one read of 1Min
+            aggregates = [tf for tf in timeframes if tf in AGGREGATABLE_TIMEFRAMES]
+            if aggregates:
+                result.update(self._aggregate_symbol(repo, ticker, symbol, aggregates, start, end))
 
             # Ensure 1Day (fetched directly, not aggregated)
             if "1Day" in timeframes:
@@ -184,38 +357,296 @@ class MarketDataService:
         return result
 
     # ------------------------------------------------------------------
-    # Internal helpers
+    # Universe path
     # ------------------------------------------------------------------
 
-    def _ensure_1min(
+    def _do_ensure_universe(
+        self,
+        owned: list[tuple[str, str]],
+        borrowed: dict[tuple[str, str], _PendingRequest],
+        start: Optional[datetime],
+        end: datetime,
+        batch_size: int,
+        fetch_workers: int,
+        store_workers: int,
+    ) -> dict[tuple[str, str], int]:
+        """Plan, fetch, insert and aggregate the owned (symbol, timeframe) pairs."""
+        by_tf: dict[str, list[str]] = defaultdict(list)
+        for symbol, tf in owned:
+            by_tf[tf].append(symbol)
+        aggregates: dict[str, list[str]] = defaultdict(list)
+        for tf in AGGREGATABLE_TIMEFRAMES:
+            for symbol in by_tf.get(tf, []):
+                aggregates[symbol].append(tf)
+
+        counts: dict[tuple[str, str], int] = {}
+        with grpc_market_client() as repo:
+            tickers = self._resolve_tickers(repo, list(dict.fromkeys(s for s, _ in owned)))
+
+            batches: list[_FetchBatch] = []
+            for tf in PROVIDER_TIMEFRAMES:
+                if not by_tf.get(tf):
+                    continue
+                latest = repo.get_latest_timestamps(by_tf[tf], tf)
+                ranges = {}
+                for symbol in by_tf[tf]:
+                    fetch_range = self._plan_fetch(tf, latest.get(symbol), start, end)
+                    if fetch_range is None:
+                        counts[(symbol, tf)] = 0
+                    else:
+                        ranges[symbol] = fetch_range
+                batches.extend(self._plan_batches(tf, ranges, batch_size))
+                logger.info(
+                    "%s: %d/%d symbols up to date, %d to fetch in %d requests",
+                    tf, len(by_tf[tf]) - len(ranges), len(by_tf[tf]), len(ranges),
+                    sum(1 for b in batches if b.timeframe == tf),
+                )
+
+            # Latest aggregated bar per symbol, so aggregation reads only new 1Min rows
+            latest_agg: dict[str, dict[str, Optional[datetime]]] = defaultdict(dict)
+            for tf in AGGREGATABLE_TIMEFRAMES:
+                if by_tf.get(tf):
+                    for symbol, ts in repo.get_latest_timestamps(by_tf[tf], tf).items():
+                        latest_agg[symbol][tf] = ts
+
+            # Symbols whose 1Min is not being fetched here aggregate right away
+            # (after waiting for any in-flight request that owns their 1Min)
+            fetching_1min = {s for b in batches if b.timeframe == "1Min" for s in b.symbol_starts}
+            aggregate_now = [s for s in aggregates if s not in fetching_1min]
+
+            counts.update(self._run_pipeline(
+                repo, tickers, batches, aggregates, latest_agg, aggregate_now, borrowed,
+                start, end, fetch_workers, store_workers,
+            ))
+        return counts
+
+    def _resolve_tickers(self, repo, symbols: list[str]) -> dict[str, object]:
+        """Look up ticker rows with one listing, creating only missing ones."""
+        known = {t.symbol: t for t in repo.list_tickers(active_only=False)}
+        tickers = {}
+        for symbol in symbols:
+            ticker = known.get(symbol)
+            tickers[symbol] = ticker if ticker is not None else repo.get_or_create_ticker(symbol)
+        return tickers
+
+    @staticmethod
+    def _plan_batches(
+        timeframe: str,
+        ranges: dict[str, tuple[Optional[datetime], datetime]],
+        batch_size: int,
+    ) -> list[_FetchBatch]:
+        """Group symbols needing similar ranges into multi-symbol requests.
+
+        Symbols whose fetch starts on the same day share a request that
+        starts at the earliest of them; each symbol's rows are trimmed to
+        its own start afterwards.  New symbols (no start) are grouped
+        together.
+        """
+        groups: dict[tuple, dict[str, Optional[datetime]]] = defaultdict(dict)
+        for symbol, (fetch_start, fetch_end) in ranges.items():
+            day = fetch_start.date() if fetch_start is not None else None
+            groups[(day, fetch_end)][symbol] = fetch_start
+
+        batches = []
+        for (_, fetch_end), starts in groups.items():
+            members = sorted(starts)
+            for i in range(0, len(members), batch_size):
+                chunk = {s: starts[s] for s in members[i:i + batch_size]}
+                known = [s for s in chunk.values() if s is not None]
+                batches.append(_FetchBatch(
+                    timeframe=timeframe,
+                    start=min(known) if known else None,
+                    end=fetch_end,
+                    symbol_starts=chunk,
+                ))
+        return batches
+
+    def _run_pipeline(
+        self,
+        repo,
+        tickers: dict[str, object],
+        batches: list[_FetchBatch],
+        aggregates: dict[str, list[str]],
+        latest_agg: dict[str, dict[str, Optional[datetime]]],
+        aggregate_now: list[str],
+        borrowed: dict[tuple[str, str], _PendingRequest],
+        start: Optional[datetime],
+        end: datetime,
+        fetch_workers: int,
+        store_workers: int,
+    ) -> dict[tuple[str, str], int]:
+        """Run provider fetches into a bounded pool of insert/aggregate tasks.
+
+        At most ``fetch_workers`` requests are in flight, and a fetched
+        batch is only accepted once its symbols fit in the store backlog
+        (``2 * store_workers`` tasks), which bounds the frames held in
+        memory.
+        """
+        counts: dict[tuple[str, str], int] = {}
+        slots = threading.BoundedSemaphore(2 * store_workers)
+        store_futures: list[Future] = []
+
+        def submit_store(fn, *args) -> None:
+            slots.acquire()
+            future = store_pool.submit(fn, *args)
+            future.add_done_callback(lambda _: slots.release())
+            store_futures.append(future)
+
+        def store(batch: _FetchBatch, symbol: str, df: Optional[pd.DataFrame]) -> dict:
+            tf = batch.timeframe
+            ticker = tickers[symbol]
+            if df is None:
+                self._record_failure(repo, ticker, symbol, tf, "provider fetch failed")
+                rows = 0
+            else:
+                symbol_start = batch.symbol_starts[symbol]
+                if symbol_start is not None and symbol_start != batch.start and not df.empty:
+                    df = df[df.index >= symbol_start]
+                rows = self._insert_bars(repo, ticker, symbol, tf, df)
+            result = {(symbol, tf): rows}
+            if tf == "1Min" and aggregates.get(symbol):
+                result.update(aggregate(symbol))
+            return result
+
+        def aggregate(symbol: str) -> dict:
+            pending = borrowed.get((symbol, "1Min"))
+            if pending is not None:
+                try:
+                    pending.wait()
+                except Exception as e:
+                    logger.warning("In-flight 1Min request for %s failed: %s", symbol, e)
+            return {
+                (symbol, tf): rows
+                for tf, rows in self._aggregate_symbol(
+                    repo, tickers[symbol], symbol, aggregates[symbol], start, end,
+                    latest=latest_agg.get(symbol),
+                ).items()
+            }
+
+        with ThreadPoolExecutor(store_workers, thread_name_prefix="ensure-store") as store_pool, \
+                ThreadPoolExecutor(fetch_workers, thread_name_prefix="ensure-fetch") as fetch_pool:
+            for symbol in aggregate_now:
+                submit_store(aggregate, symbol)
+
+            queued = iter(batches)
+            in_flight: dict[Future, _FetchBatch] = {}
+
+            def fill() -> None:
+                while len(in_flight) < fetch_workers:
+                    batch = next(queued, None)
+                    if batch is None:
+                        return
+                    in_flight[fetch_pool.submit(self._fetch_batch, batch)] = batch
+
+            fill()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = in_flight.pop(future)
+                    frames = future.result()
+                    for symbol in batch.symbol_starts:
+                        submit_store(store, batch, symbol, frames.get(symbol))
+                fill()
+
+            for future in store_futures:
+                counts.update(future.result())
+        return counts
+
+    def _fetch_batch(self, batch: _FetchBatch) -> dict[str, pd.DataFrame]:
+        """Fetch one planned batch; a failed request yields no frames."""
+        symbols = list(batch.symbol_starts)
+        logger.info(
+            "Fetching %s bars for %d symbols from %s to %s",
+            batch.timeframe, len(symbols), batch.start, batch.end,
+        )
+        try:
+            return self.provider.fetch_bars_multi(symbols, batch.start, batch.end, batch.timeframe)
+        except Exception as e:
+            logger.error("Failed to fetch %s bars for %d symbols: %s", batch.timeframe, len(symbols), e)
+            return {}
+
+    def _aggregate_symbol(
         self,
         repo,
         ticker,
         symbol: str,
+        target_tfs: list[str],
         start: Optional[datetime],
         end: datetime,
-    ) -> int:
-        """Fetch missing 1-minute bars from the provider."""
-        logger.debug("Ensuring 1Min data for %s: start=%s, end=%s", symbol, start, end)
-        db_latest = repo.get_latest_timestamp(symbol, "1Min")
+        latest: Optional[dict[str, Optional[datetime]]] = None,
+    ) -> dict[str, int]:
+        """Aggregate one symbol's new 1Min bars into several timeframes with a single read.
 
+        Delegates to :class:`TimeframeAggregator` which is the canonical
+        aggregation path.
+        """
+        from src.data.timeframe_aggregator import TimeframeAggregator
+
+        logger.debug("Aggregating %s for %s from %s to %s", target_tfs, symbol, start, end)
+        try:
+            return TimeframeAggregator.aggregate_intraday_incremental(
+                repo, ticker, symbol, target_tfs, start, end, latest=latest,
+            )
+        except Exception as e:
+            logger.error("Failed to aggregate %s for %s: %s", target_tfs, symbol, e)
+            return {tf: 0 for tf in target_tfs}
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _plan_fetch(
+        self,
+        timeframe: str,
+        db_latest: Optional[datetime],
+        start: Optional[datetime],
+        end: datetime,
+    ) -> Optional[tuple[Optional[datetime], datetime]]:
+        """Work out the range to fetch given the latest stored bar.
+
+        The fetch start is moved forward to the first bar the session
+        calendar expects, so ranges that only span closed-market time
+        (overnight, weekends, holidays) are not requested at all.
+
+        Returns:
+            ``(fetch_start, fetch_end)``, or None when already up to date.
+        """
         if db_latest is None:
             # Brand-new symbol — fetch everything
             fetch_start = start
-            fetch_end = end
         else:
             if db_latest.tzinfo is not None:
                 db_latest = db_latest.replace(tzinfo=None)
-            buffer = timedelta(minutes=1)
+            buffer = FRESHNESS_BUFFER[timeframe]
             if end <= db_latest + buffer:
-                logger.info("1Min data is up-to-date for %s", symbol)
-                return 0
+                return None
             fetch_start = db_latest + buffer
-            fetch_end = end
 
-        return self._fetch_and_insert(
-            repo, ticker, symbol, "1Min", fetch_start, fetch_end,
-        )
+        if fetch_start is None or not self.calendar.covers(fetch_start, end):
+            return fetch_start, end
+        first = self.calendar.first_expected(timeframe, fetch_start, end)
+        if first is None:
+            return None
+        return max(fetch_start, first.to_pydatetime()), end
+
+    def _ensure_1min(
+        self,
+        repo,
+        ticker,
+        symbol: str,
+        start: Optional[datetime],
+        end: datetime,
+    ) -> int:
+        """Fetch missing 1-minute bars from the provider."""
+        logger.debug("Ensuring 1Min data for %s: start=%s, end=%s", symbol, start, end)
+        db_latest = repo.get_latest_timestamp(symbol, "1Min")
+
+        fetch_range = self._plan_fetch("1Min", db_latest, start, end)
+        if fetch_range is None:
+            logger.info("1Min data is up-to-date for %s", symbol)
+            return 0
+
+        return self._fetch_and_insert(repo, ticker, symbol, "1Min", *fetch_range)
 
     def _ensure_daily(
         self,
@@ -229,22 +660,12 @@ class MarketDataService:
         logger.debug("Ensuring 1Day data for %s: start=%s, end=%s", symbol, start, end)
         db_latest = repo.get_latest_timestamp(symbol, "1Day")
 
-        if db_latest is None:
-            fetch_start = start
-            fetch_end = end
-        else:
-            if db_latest.tzinfo is not None:
-                db_latest = db_latest.replace(tzinfo=None)
-            buffer = timedelta(days=1)
-            if end <= db_latest + buffer:
-                logger.info("1Day data is up-to-date for %s", symbol)
-                return 0
-            fetch_start = db_latest + buffer
-            fetch_end = end
+        fetch_range = self._plan_fetch("1Day", db_latest, start, end)
+        if fetch_range is None:
+            logger.info("1Day data is up-to-date for %s", symbol)
+            return 0
 
-        return self._fetch_and_insert(
-            repo, ticker, symbol, "1Day", fetch_start, fetch_end,
-        )
+        return self._fetch_and_insert(repo, ticker, symbol, "1Day", *fetch_range)
 
     def _fetch_and_insert(
         self,
@@ -265,11 +686,27 @@ class MarketDataService:
                 df = self.provider.fetch_daily_bars(symbol, start, end)
             else:
                 df = self.provider.fetch_1min_bars(symbol, start, end)
+        except Exception as e:
+            logger.error("Failed to fetch %s bars for %s: %s", timeframe, symbol, e)
+            self._record_failure(repo, ticker, symbol, timeframe, str(e))
+            return 0
 
-            if df.empty:
-                logger.warning("Provider returned 0 %s bars for %s", timeframe, symbol)
-                return 0
+        return self._insert_bars(repo, ticker, symbol, timeframe, df)
 
+    def _insert_bars(
+        self,
+        repo,
+        ticker,
+        symbol: str,
+        timeframe: str,
+        df: pd.DataFrame,
+    ) -> int:
+        """Bulk-insert fetched bars and record the sync."""
+        if df.empty:
+            logger.warning("Provider returned 0 %s bars for %s", timeframe, symbol)
+            return 0
+
+        try:
             rows = repo.bulk_insert_bars(
                 df=df,
                 ticker_id=ticker.id,
@@ -285,45 +722,27 @@ class MarketDataService:
                 bars_fetched=rows,
                 status="success",
             )
+        except Exception as e:
+            logger.error("Failed to insert %s bars for %s: %s", timeframe, symbol, e)
+            self._record_failure(repo, ticker, symbol, timeframe, str(e))
+            return 0
 
-            logger.info("Inserted %d %s bars for %s", rows, timeframe, symbol)
-            return rows
+        logger.info("Inserted %d %s bars for %s", rows, timeframe, symbol)
+        return rows
 
-        except Exception as e:
-            logger.error("Failed to fetch %s bars for %s: %s", timeframe, symbol, e)
+    @staticmethod
+    def _record_failure(repo, ticker, symbol: str, timeframe: str, message: str) -> None:
+        """Mark a failed sync in the sync log (best effort)."""
+        try:
             repo.update_sync_log(
                 ticker_id=ticker.id,
                 timeframe=timeframe,
                 bars_fetched=0,
                 status="failed",
-                error_message=str(e),
-            )
-            return 0
-
-    def _aggregate_timeframe(
-        self,
-        repo,
-        ticker,
-        symbol: str,
-        target_tf: str,
-        start: Optional[datetime],
-        end: datetime,
-    ) -> int:
-        """Aggregate 1Min data to a higher intraday timeframe and insert.
-
-        Delegates to :class:`TimeframeAggregator` which is the canonical
-        aggregation path.
-        """
-        from src.data.timeframe_aggregator import TimeframeAggregator
-
-        logger.debug("Aggregating %s for %s from %s to %s", target_tf, symbol, start, end)
-        try:
-            return TimeframeAggregator.aggregate_intraday_range(
-                repo, ticker, symbol, target_tf, start, end,
+                error_message=message,
             )
         except Exception as e:
-            logger.error("Failed to aggregate %s for %s: %s", target_tf, symbol, e)
-            return 0
+            logger.error("Failed to record sync failure for %s/%s: %s", symbol, timeframe, e)
 
 
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """Shared utilities for market data providers."""
 
 import logging
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Callable, TypeVar
@@ -13,19 +14,86 @@ T = TypeVar("T")
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls."""
+    """Thread-safe token-bucket rate limiter for API calls.
 
-    def __init__(self, calls_per_minute: int = 200):
+    Tokens refill continuously at ``calls_per_minute / 60`` per second up
+    to ``burst``.  A caller that finds the bucket empty reserves the next
+    token and sleeps outside the lock, so one limiter can be shared by
+    many worker threads and they are released in order at the sustained
+    rate.  With the default ``burst=1`` calls are evenly spaced.
+    """
+
+    def __init__(
+        self,
+        calls_per_minute: int = 200,
+        burst: int = 1,
+        metrics_hook: Callable[[float], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize limiter.
+
+        Args:
+            calls_per_minute: Sustained call rate.
+            burst: Calls allowed back-to-back after an idle period.
+            metrics_hook: Called after every acquire with the seconds the
+                caller was held back (0.0 when not throttled).
+            clock: Monotonic clock (injectable for tests).
+            sleep: Sleep function (injectable for tests).
+        """
+        if calls_per_minute <= 0:
+            raise ValueError(f"calls_per_minute must be positive, got {calls_per_minute}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
         self.calls_per_minute = calls_per_minute
+        self.burst = burst
         self.min_interval = 60.0 / calls_per_minute
-        self.last_call_time = 0.0
+        self.metrics_hook = metrics_hook
+        self._rate = calls_per_minute / 60.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+        self.calls = 0
+        self.throttled_calls = 0
+        self.total_wait_seconds = 0.0
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds the caller was held back.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            self.calls += 1
+            if delay > 0:
+                self.throttled_calls += 1
+                self.total_wait_seconds += delay
+
+        if delay > 0:
+            self._sleep(delay)
+        if self.metrics_hook is not None:
+            self.metrics_hook(delay)
+        return delay
 
     def wait(self) -> None:
         """Wait if necessary to respect rate limits."""
-        elapsed = time.time() - self.last_call_time
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_call_time = time.time()
+        self.acquire()
+
+    def stats(self) -> dict:
+        """Return call and throttling counters."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "throttled_calls": self.throttled_calls,
+                "total_wait_seconds": self.total_wait_seconds,
+            }
 
 
 def fetch_with_retry(
@@ -8,7 +8,7 @@ import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 from src.trade.intent import TradeIntent
 from src.trade.evaluation import (
@@ -151,6 +151,128 @@ class EvaluatorOrchestrator:
             logger.debug("Running %d evaluators sequentially", len(self._evaluators))
             all_items = self._run_sequential(intent, context)
 
+        return self._aggregate(intent, all_items, start_time)
+
+    def evaluate_many(
+        self,
+        intents: Sequence[TradeIntent],
+        max_workers: Optional[int] = None,
+    ) -> list[EvaluationResult]:
+        """Evaluate many trade intents, sharing context per symbol/timeframe.
+
+        Intents are grouped by ``(symbol, timeframe)`` and each group's
+        context is built once. As each context becomes available, its
+        intents are evaluated on a shared thread pool (one task per
+        intent, evaluators run in order so ``fail_fast`` still applies).
+
+        If a group's context cannot be built, its intents are evaluated
+        against an empty context and carry an ``ERR002`` warning.
+
+        Args:
+            intents: Trade intents to evaluate
+            max_workers: Pool size (defaults to ``config.max_workers``)
+
+        Returns:
+            Evaluation results in the same order as ``intents``
+        """
+        if not intents:
+            return []
+        if not self._evaluators:
+            self.load_evaluators()
+
+        groups: dict[tuple[str, str], list[int]] = {}
+        for i, intent in enumerate(intents):
+            groups.setdefault((intent.symbol.upper(), intent.timeframe), []).append(i)
+
+        logger.info(
+            "Evaluating %d intents across %d symbol/timeframe groups",
+            len(intents), len(groups),
+        )
+        results: list[Optional[EvaluationResult]] = [None] * len(intents)
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.config.max_workers) as executor:
+            context_futures = {
+                executor.submit(self._build_group_context, intents[indices[0]]): indices
+                for indices in groups.values()
+            }
+            eval_futures = {}
+            for future in as_completed(context_futures):
+                context, error_item = future.result()
+                for i in context_futures[future]:
+                    eval_futures[executor.submit(self._evaluate_in_batch, intents[i], context, error_item)] = i
+
+            for future, i in eval_futures.items():
+                results[i] = future.result()
+
+        return results
+
+    def _build_group_context(
+        self,
+        intent: TradeIntent,
+    ) -> tuple[ContextPack, Optional[EvaluationItem]]:
+        """Build the shared context for an ``evaluate_many`` group.
+
+        Args:
+            intent: Any intent from the group
+
+        Returns:
+            Tuple of (context, error item if the build failed)
+        """
+        try:
+            return self._build_context(intent), None
+        except Exception as e:
+            logger.exception(f"Context build failed for {intent.symbol}/{intent.timeframe}: {e}")
+            context = ContextPack(
+                symbol=intent.symbol,
+                timestamp=datetime.utcnow(),
+                primary_timeframe=intent.timeframe,
+            )
+            return context, EvaluationItem(
+                evaluator="orchestrator",
+                code="ERR002",
+                severity=Severity.WARNING,
+                title="Context Unavailable",
+                message=f"Market context for {intent.symbol}/{intent.timeframe} could not be loaded: {str(e)}",
+            )
+
+    def _evaluate_in_batch(
+        self,
+        intent: TradeIntent,
+        context: ContextPack,
+        error_item: Optional[EvaluationItem],
+    ) -> EvaluationResult:
+        """Evaluate one intent of an ``evaluate_many`` batch.
+
+        Args:
+            intent: Trade intent
+            context: Shared group context
+            error_item: Context error to report alongside the findings
+
+        Returns:
+            Aggregated evaluation result
+        """
+        start_time = datetime.utcnow()
+        all_items = self._run_sequential(intent, context)
+        if error_item is not None:
+            all_items.append(error_item)
+        return self._aggregate(intent, all_items, start_time)
+
+    def _aggregate(
+        self,
+        intent: TradeIntent,
+        all_items: list[EvaluationItem],
+        start_time: datetime,
+    ) -> EvaluationResult:
+        """Filter, deduplicate, score, and summarize evaluator findings.
+
+        Args:
+            intent: Trade intent
+            all_items: Items from all evaluators
+            start_time: When the evaluation started
+
+        Returns:
+            Aggregated evaluation result
+        """
         # Filter INFO items if configured
         if not self.config.include_info:
             all_items = [i for i in all_items if i.severity != Severity.INFO]
@@ -131,6 +131,7 @@ class ReviewerApiClient:
         timeframe: str,
         end: Optional[str] = None,
         last_n_bars: Optional[int] = None,
+        start: Optional[str] = None,
     ) -> list[dict]:
         """Fetch OHLCV bars from the market data API.
 
@@ -139,6 +140,7 @@ class ReviewerApiClient:
             timeframe: Bar timeframe (e.g. "15Min", "1Day")
             end: Optional end timestamp (ISO-8601)
             last_n_bars: Optional number of most recent bars
+            start: Optional start timestamp (ISO-8601) for a ``start``..``end`` range
 
         Returns:
             List of bar dicts with timestamp, open, high, low, close, volume
@@ -147,6 +149,8 @@ class ReviewerApiClient:
             "symbol": symbol,
             "timeframe": timeframe,
         }
+        if start:
+            params["start"] = start
         if end:
             params["end"] = end
         if last_n_bars:
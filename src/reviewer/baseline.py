@@ -13,11 +13,14 @@ Results are persisted in user_profiles.stats JSONB via the internal API.
 
 import logging
 import statistics
-from datetime import datetime, timezone
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+from src.data.session_calendar import TIMEFRAME_MINUTES, get_session_calendar
 from src.reviewer.api_client import ReviewerApiClient
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,10 @@ logger = logging.getLogger(__name__)
 # Default timeframe when none is specified in decision context
 _DEFAULT_TIMEFRAME = "15Min"
 
+# Bars of history behind each fill's indicator snapshot, and the minimum required
+_SNAPSHOT_BARS = 250
+_MIN_SNAPSHOT_BARS = 30
+
 
 def compute_baseline_stats(
     account_id: int,
@@ -37,7 +44,8 @@ def compute_baseline_stats(
     Flow:
     1. Fetch fills + decision contexts via API
     2. Skip if too few fills
-    3. For each fill, fetch OHLCV bars and compute indicators locally
+    3. Fetch OHLCV bars once per (symbol, timeframe) and compute
+       indicators locally; each fill's snapshot is the row at its bar
     4. Aggregate all BASELINE.md metrics across fills
     5. Save to user_profiles.stats via API
 
@@ -72,12 +80,13 @@ def compute_baseline_stats(
         logger.warning("Could not fetch profile for account_id=%s", account_id, exc_info=True)
         account_balance = 0.0
 
-    # 3. For each fill, compute indicator snapshot
-    fill_snapshots = []
-    for fill in fills:
-        snapshot = _compute_fill_indicators(fill, api_client)
-        if snapshot is not None:
-            fill_snapshots.append({"fill": fill, "snapshot": snapshot})
+    # 3. Compute indicator snapshots, one bar fetch per (symbol, timeframe)
+    snapshots = _compute_fill_snapshots(fills, api_client)
+    fill_snapshots = [
+        {"fill": fill, "snapshot": snapshot}
+        for fill, snapshot in zip(fills, snapshots)
+        if snapshot is not None
+    ]
 
     if len(fill_snapshots) < min_fills:
         logger.info(
@@ -102,48 +111,130 @@ def compute_baseline_stats(
     return stats
 
 
-def _compute_fill_indicators(fill: dict, api_client: ReviewerApiClient) -> Optional[dict]:
-    """Fetch OHLCV bars around a fill and compute indicator snapshot.
+def _compute_fill_snapshots(
+    fills: list[dict],
+    api_client: ReviewerApiClient,
+) -> list[Optional[dict]]:
+    """Compute an indicator snapshot for every fill.
+
+    Fills are grouped by (symbol, timeframe).  Each group fetches one bar
+    range covering ``_SNAPSHOT_BARS`` of history before its earliest fill
+    up to its latest fill, computes indicators once over it, and reads
+    each fill's snapshot from the row of the last bar at or before the
+    fill time.
 
     Args:
-        fill: Fill dict from API
+        fills: Fill dicts from API
         api_client: HTTP client
 
     Returns:
-        Dict of indicator values at the fill bar, or None if unavailable
+        Snapshot per fill (same order), None where unavailable
     """
-    symbol = fill.get("symbol")
-    executed_at = fill.get("executed_at")
-    timeframe = fill.get("timeframe") or _DEFAULT_TIMEFRAME
+    snapshots: list[Optional[dict]] = [None] * len(fills)
+    groups: dict[tuple[str, str], list[tuple[int, pd.Timestamp]]] = defaultdict(list)
+    for i, fill in enumerate(fills):
+        symbol = fill.get("symbol")
+        executed_at = fill.get("executed_at")
+        if not symbol or not executed_at:
+            continue
+        try:
+            ts = _to_utc_naive(pd.Timestamp(executed_at))
+        except (TypeError, ValueError):
+            logger.debug("Unparseable executed_at %r for %s", executed_at, symbol)
+            continue
+        groups[(symbol, fill.get("timeframe") or _DEFAULT_TIMEFRAME)].append((i, ts))
+
+    logger.debug("Computing snapshots for %d fills in %d symbol/timeframe groups", len(fills), len(groups))
+    for (symbol, timeframe), members in groups.items():
+        for i, snapshot in _compute_group_snapshots(symbol, timeframe, members, api_client):
+            snapshots[i] = snapshot
+    return snapshots
+
+
+def _compute_group_snapshots(
+    symbol: str,
+    timeframe: str,
+    members: list[tuple[int, pd.Timestamp]],
+    api_client: ReviewerApiClient,
+) -> list[tuple[int, dict]]:
+    """Fetch one covering bar range and snapshot every fill in a group.
 
-    if not symbol or not executed_at:
-        return None
+    Args:
+        symbol: Ticker symbol
+        timeframe: Bar timeframe
+        members: ``(fill position, executed_at as naive UTC)`` pairs
+        api_client: HTTP client
 
+    Returns:
+        ``(fill position, snapshot)`` pairs for fills with enough history
+    """
+    times = [ts for _, ts in members]
+    start = _window_start(timeframe, min(times), _SNAPSHOT_BARS)
+    end = max(times)
     try:
         bars = api_client.get_ohlcv_bars(
             symbol=symbol,
             timeframe=timeframe,
-            end=executed_at,
-            last_n_bars=250,
+            start=start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            end=end.strftime("%Y-%m-%dT%H:%M:%SZ"),
         )
-
-        if not bars or len(bars) < 30:
+        if not bars or len(bars) < _MIN_SNAPSHOT_BARS:
             logger.debug(
-                "Insufficient bars for %s/%s at %s (%d bars)",
-                symbol, timeframe, executed_at, len(bars) if bars else 0,
+                "Insufficient bars for %s/%s from %s to %s (%d bars)",
+                symbol, timeframe, start, end, len(bars) if bars else 0,
             )
-            return None
+            return []
 
         df = _bars_to_dataframe(bars)
-        snapshot = _compute_indicator_snapshot(df)
-        return snapshot
-
+        df.index = _to_utc_naive(df.index)
+        frame = _compute_indicator_frame(df)
     except Exception:
         logger.debug(
-            "Failed to compute indicators for fill %s/%s at %s",
-            symbol, timeframe, executed_at, exc_info=True,
+            "Failed to compute indicators for %s/%s from %s to %s",
+            symbol, timeframe, start, end, exc_info=True,
         )
-        return None
+        return []
+    if frame is None:
+        return []
+
+    # Last bar at or before each fill
+    positions = np.searchsorted(df.index.asi8, pd.DatetimeIndex(times).as_unit(df.index.unit).asi8, side="right") - 1
+    results = []
+    for (i, _), pos in zip(members, positions):
+        if pos + 1 < _MIN_SNAPSHOT_BARS:
+            continue
+        snapshot = _snapshot_at(frame, pos)
+        if snapshot is not None:
+            results.append((i, snapshot))
+    return results
+
+
+def _window_start(timeframe: str, end: pd.Timestamp, n_bars: int) -> pd.Timestamp:
+    """Start of a range holding ``n_bars`` regular-session bars before ``end``.
+
+    Args:
+        timeframe: Bar timeframe
+        end: Range end (naive UTC)
+        n_bars: Bars of history wanted
+
+    Returns:
+        Range start (naive UTC)
+    """
+    # Sessions cover well under a sixth of wall-clock time, plus a margin for holidays
+    span = timedelta(minutes=TIMEFRAME_MINUTES.get(timeframe, 1440) * n_bars * 6) + timedelta(days=10)
+    calendar = get_session_calendar()
+    if calendar.covers(end - span, end):
+        expected = calendar.expected_index(timeframe, end - span, end)
+        if len(expected) >= n_bars:
+            return expected[-n_bars]
+    return end - span
+
+
+def _to_utc_naive(value):
+    """Convert a timestamp or DatetimeIndex to naive UTC."""
+    if value.tz is not None:
+        return value.tz_convert("UTC").tz_localize(None)
+    return value
 
 
 def _bars_to_dataframe(bars: list[dict]) -> pd.DataFrame:
@@ -166,67 +257,61 @@ def _bars_to_dataframe(bars: list[dict]) -> pd.DataFrame:
 def _compute_indicator_snapshot(df: pd.DataFrame) -> Optional[dict]:
     """Compute indicators on OHLCV DataFrame and extract last row values.
 
+    Returns:
+        Dict of indicator name → value at the last bar, or None on error
+    """
+    frame = _compute_indicator_frame(df)
+    if frame is None or frame.empty:
+        return None
+    return _snapshot_at(frame, len(frame) - 1)
+
+
+def _compute_indicator_frame(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """Compute indicators on OHLCV DataFrame for every bar.
+
     Uses TALibIndicatorCalculator, VolatilityFeatureCalculator, and
-    AnchorFeatureCalculator from the features package.
+    AnchorFeatureCalculator from the features package.  Later sources
+    win on duplicate column names.
 
     Returns:
-        Dict of indicator name → value at the last bar, or None on error
+        DataFrame of indicator columns aligned to ``df``, or None on error
     """
     try:
         from src.features.talib_indicators import TALibIndicatorCalculator, TALIB_AVAILABLE
         from src.features.volatility import VolatilityFeatureCalculator
         from src.features.anchor import AnchorFeatureCalculator
 
-        snapshot = {}
+        columns: dict[str, pd.Series] = {}
 
         # TA-Lib indicators
         if TALIB_AVAILABLE:
-            talib_calc = TALibIndicatorCalculator()
-            talib_df = talib_calc.compute(df)
-            if not talib_df.empty:
-                last_row = talib_df.iloc[-1]
-                for col in talib_df.columns:
-                    val = last_row[col]
-                    if pd.notna(val):
-                        snapshot[col] = float(val)
-
-                # Also capture previous MACD hist for exhaustion detection
-                if len(talib_df) >= 2 and "macd_hist" in talib_df.columns:
-                    prev_val = talib_df["macd_hist"].iloc[-2]
-                    if pd.notna(prev_val):
-                        snapshot["macd_hist_prev"] = float(prev_val)
-
-        # Volatility features
-        vol_calc = VolatilityFeatureCalculator()
-        vol_df = vol_calc.compute(df)
-        if not vol_df.empty:
-            last_row = vol_df.iloc[-1]
-            for col in vol_df.columns:
-                val = last_row[col]
-                if pd.notna(val):
-                    snapshot[col] = float(val)
-
-        # Anchor features
-        anchor_calc = AnchorFeatureCalculator()
-        anchor_df = anchor_calc.compute(df)
-        if not anchor_df.empty:
-            last_row = anchor_df.iloc[-1]
-            for col in anchor_df.columns:
-                val = last_row[col]
-                if pd.notna(val):
-                    snapshot[col] = float(val)
+            talib_df = TALibIndicatorCalculator().compute(df)
+            columns.update(talib_df.items())
+            # Also capture previous MACD hist for exhaustion detection
+            if "macd_hist" in talib_df.columns:
+                columns["macd_hist_prev"] = talib_df["macd_hist"].shift(1)
+
+        # Volatility and anchor features
+        columns.update(VolatilityFeatureCalculator().compute(df).items())
+        columns.update(AnchorFeatureCalculator().compute(df).items())
 
         # Add volume from original df
-        if not df.empty:
-            snapshot["volume"] = float(df["volume"].iloc[-1])
+        columns["volume"] = df["volume"]
 
-        return snapshot if snapshot else None
+        return pd.DataFrame(columns, index=df.index).astype(float)
 
     except Exception:
-        logger.debug("Failed to compute indicator snapshot", exc_info=True)
+        logger.debug("Failed to compute indicator frame", exc_info=True)
         return None
 
 
+def _snapshot_at(frame: pd.DataFrame, pos: int) -> Optional[dict]:
+    """Non-NaN indicator values at row ``pos`` of an indicator frame."""
+    row = frame.iloc[pos]
+    snapshot = {col: float(val) for col, val in row.items() if pd.notna(val)}
+    return snapshot if snapshot else None
+
+
 def _aggregate_metrics(
     fill_snapshots: list[dict],
     account_balance: float,
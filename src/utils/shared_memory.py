@@ -0,0 +1,220 @@
+"""Share NumPy arrays and numeric DataFrames with worker processes.
+
+Process pools normally pickle every argument, which copies large frames
+into each worker.  The helpers here place the column buffers in
+``multiprocessing.shared_memory`` blocks once and hand workers small,
+picklable handles that re-attach to the same memory without copying.
+
+Usage:
+    with SharedMemoryStore() as store:
+        handle = store.share_frame(df)
+        pool.submit(work, handle)
+
+    # In the worker
+    with handle.open() as df:
+        ...
+"""
+
+import logging
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_SHAREABLE_KINDS = "biufcmM"
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without taking ownership of it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def release_blocks(blocks: list[shared_memory.SharedMemory]) -> None:
+    """Close attached blocks, tolerating views that are still alive."""
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            logger.debug("Shared block %s still referenced; leaving it mapped", block.name)
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """Picklable reference to an array stored in shared memory.
+
+    Attributes:
+        name: Shared memory block name
+        shape: Array shape
+        dtype: NumPy dtype string
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    def attach(self) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+        """Map the block and return it with a zero-copy array view.
+
+        The caller must keep the block alive while the view is used and
+        close it afterwards.
+        """
+        block = _attach_block(self.name)
+        array = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=block.buf)
+        return block, array
+
+    @contextmanager
+    def open(self) -> Iterator[np.ndarray]:
+        """Context manager yielding a read-only view of the array."""
+        block, array = self.attach()
+        array.flags.writeable = False
+        try:
+            yield array
+        finally:
+            del array
+            release_blocks([block])
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """Picklable reference to a numeric DataFrame in shared memory.
+
+    Attributes:
+        index: Handle for the index values
+        index_name: Index name
+        index_tz: Timezone of a DatetimeIndex, if any
+        columns: (column name, handle) pairs in frame order
+    """
+
+    index: SharedArrayHandle
+    index_name: str | None
+    index_tz: str | None
+    columns: tuple[tuple[Any, SharedArrayHandle], ...]
+
+    def attach(self) -> tuple[list[shared_memory.SharedMemory], pd.DataFrame]:
+        """Rebuild the DataFrame over the shared column buffers.
+
+        Column data is not copied; the index is copied because pandas
+        index construction takes ownership of its values.
+        """
+        blocks = []
+        block, values = self.index.attach()
+        blocks.append(block)
+        index = pd.Index(values.copy(), name=self.index_name)
+        del values
+        if self.index_tz is not None:
+            index = pd.DatetimeIndex(index).tz_localize("UTC").tz_convert(self.index_tz)
+
+        data = {}
+        for column, handle in self.columns:
+            block, values = handle.attach()
+            values.flags.writeable = False
+            blocks.append(block)
+            data[column] = values
+
+        frame = pd.DataFrame(data, index=index, copy=False)
+        return blocks, frame
+
+    @contextmanager
+    def open(self) -> Iterator[pd.DataFrame]:
+        """Context manager yielding the shared DataFrame."""
+        blocks, frame = self.attach()
+        try:
+            yield frame
+        finally:
+            del frame
+            release_blocks(blocks)
+
+
+class SharedMemoryStore:
+    """Owner of shared memory blocks created for a batch of work.
+
+    Blocks live until :meth:`close` (or the end of the ``with`` block),
+    after which they are unlinked.  Only the creating process should own
+    a store; workers use the handles it returns.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._blocks: list[shared_memory.SharedMemory] = []
+
+    def __enter__(self) -> "SharedMemoryStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held in shared memory."""
+        return sum(block.size for block in self._blocks)
+
+    def share_array(self, array: np.ndarray) -> SharedArrayHandle:
+        """Copy an array into a new shared block.
+
+        Args:
+            array: Array with a fixed-size numeric, boolean or datetime dtype
+
+        Returns:
+            Handle that re-attaches to the shared copy
+
+        Raises:
+            TypeError: If the dtype cannot live in shared memory
+        """
+        array = np.ascontiguousarray(array)
+        if array.dtype.kind not in _SHAREABLE_KINDS:
+            raise TypeError(f"Cannot share array of dtype {array.dtype}")
+
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(block)
+        target = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        target[...] = array
+        del target
+        return SharedArrayHandle(name=block.name, shape=array.shape, dtype=array.dtype.str)
+
+    def share_frame(self, df: pd.DataFrame) -> SharedFrameHandle:
+        """Copy a numeric DataFrame into shared memory column by column.
+
+        Args:
+            df: DataFrame whose columns and index are numeric or datetime
+
+        Returns:
+            Handle that rebuilds the frame in another process
+
+        Raises:
+            TypeError: If a column or the index has an unshareable dtype
+        """
+        index_tz = None
+        index = df.index
+        if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+            index_tz = str(index.tz)
+            index = index.tz_convert("UTC").tz_localize(None)
+        index_values = index.to_numpy()
+
+        columns = tuple(
+            (column, self.share_array(df[column].to_numpy()))
+            for column in df.columns
+        )
+        return SharedFrameHandle(
+            index=self.share_array(index_values),
+            index_name=df.index.name,
+            index_tz=index_tz,
+            columns=columns,
+        )
+
+    def close(self) -> None:
+        """Close and unlink every block owned by this store."""
+        for block in self._blocks:
+            try:
+                block.close()
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
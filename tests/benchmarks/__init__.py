@@ -0,0 +1,5 @@
+"""Performance benchmarks.
+
+Modules here are named ``bench_*.py`` so pytest does not collect them.
+Run one directly, e.g. ``python -m tests.benchmarks.bench_backtest_engine``.
+"""
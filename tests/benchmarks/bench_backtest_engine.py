@@ -0,0 +1,93 @@
+"""Benchmark the event-driven and array-backed backtest engines.
+
+Usage:
+    python -m tests.benchmarks.bench_backtest_engine
+    python -m tests.benchmarks.bench_backtest_engine --bars 20000 --symbols 20
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.backtest.array_engine import ArrayBacktestEngine
+from src.backtest.engine import BacktestEngine, Signal, SignalDirection
+
+
+class CadenceStrategy:
+    """Enter every 60 bars, exit 30 bars later."""
+
+    def generate_signals(self, features, timestamp, state=None, **kwargs):
+        n = len(features)
+        if n % 60 == 1:
+            return [Signal(timestamp, "default", SignalDirection.LONG, strength=0.05)]
+        if n % 60 == 31:
+            return [Signal(timestamp, "default", SignalDirection.FLAT)]
+        return []
+
+
+class PositionalCadenceStrategy(CadenceStrategy):
+    """Same signals via the positional ArrayStrategy protocol."""
+
+    def generate_signals_at(self, features, position, timestamp, state=None):
+        n = position + 1
+        if n % 60 == 1:
+            return [Signal(timestamp, "default", SignalDirection.LONG, strength=0.05)]
+        if n % 60 == 31:
+            return [Signal(timestamp, "default", SignalDirection.FLAT)]
+        return []
+
+
+def make_data(n_bars: int, n_symbols: int, seed: int = 0) -> dict[str, pd.DataFrame]:
+    """Generate random-walk 1Min OHLCV frames."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-02 09:30", periods=n_bars, freq="1min")
+    data = {}
+    for k in range(n_symbols):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+        data[f"SYM{k:03d}"] = pd.DataFrame({
+            "open": np.r_[close[0], close[:-1]],
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": rng.integers(1000, 5000, n_bars),
+        }, index=index)
+    return data
+
+
+def _time(engine, data, strategy) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = engine.run(data, strategy)
+    return time.perf_counter() - start, len(result.trades)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, default=5000, help="Bars per symbol")
+    parser.add_argument("--symbols", type=int, default=20, help="Number of symbols")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    data = make_data(args.bars, args.symbols)
+    total_bars = args.bars * args.symbols
+
+    runs = [
+        ("event", BacktestEngine(), CadenceStrategy()),
+        ("array", ArrayBacktestEngine(), CadenceStrategy()),
+        ("array+positions", ArrayBacktestEngine(), PositionalCadenceStrategy()),
+    ]
+    baseline = None
+    print(f"{args.symbols} symbols x {args.bars} bars = {total_bars:,} bars")
+    for name, engine, strategy in runs:
+        elapsed, n_trades = _time(engine, data, strategy)
+        baseline = baseline or elapsed
+        print(
+            f"{name:>16}: {elapsed:8.2f}s  {total_bars / elapsed:>12,.0f} bars/s  "
+            f"x{baseline / elapsed:5.1f}  trades={n_trades}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark baseline indicator snapshots: one fetch per fill vs per (symbol, timeframe).
+
+The stub API client sleeps a fixed round-trip time per bar request, so
+the numbers show both the HTTP round trips and the repeated indicator
+computation over overlapping 250-bar windows that batching removes.
+
+Usage:
+    python -m tests.benchmarks.bench_baseline_snapshots
+    python -m tests.benchmarks.bench_baseline_snapshots --fills 2000 --symbols 20 --rtt-ms 10
+"""
+
+import argparse
+import logging
+import time
+
+from src.reviewer.baseline import _compute_fill_snapshots
+from tests.unit.reviewer.test_baseline import StubApiClient, make_fills, per_fill_snapshot
+
+
+class LatencyApiClient(StubApiClient):
+    """StubApiClient that sleeps ``rtt`` seconds per bar request."""
+
+    def __init__(self, rtt: float, symbols: list[str]):
+        super().__init__(symbols=symbols, start="2024-01-02", end="2024-05-01")
+        self.rtt = rtt
+
+    def get_ohlcv_bars(self, *args, **kwargs):
+        time.sleep(self.rtt)
+        return super().get_ohlcv_bars(*args, **kwargs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fills", type=int, default=2000, help="Fills in the lookback window")
+    parser.add_argument("--symbols", type=int, default=20, help="Distinct symbols traded")
+    parser.add_argument("--rtt-ms", type=float, default=5.0, help="Simulated round trip per bar request")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    client = LatencyApiClient(args.rtt_ms / 1000, [f"S{i:03d}" for i in range(args.symbols)])
+    fills = make_fills(client, args.fills)
+    print(
+        f"{len(fills)} fills over {args.symbols} symbols (15Min, ~90 days), "
+        f"rtt={args.rtt_ms:.1f}ms per bar request"
+    )
+
+    runs = [
+        ("per fill", lambda: [per_fill_snapshot(client, fill) for fill in fills]),
+        ("batched", lambda: _compute_fill_snapshots(fills, client)),
+    ]
+    baseline = None
+    for name, run in runs:
+        client.bar_requests.clear()
+        start = time.perf_counter()
+        snapshots = run()
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        found = sum(s is not None for s in snapshots)
+        print(
+            f"{name:>10}: {elapsed:8.2f}s  x{baseline / elapsed:6.1f}  "
+            f"requests={len(client.bar_requests):>5}  snapshots={found}"
+        )
+
+
+if __name__ == "__main__":
+    main()
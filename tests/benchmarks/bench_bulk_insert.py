@@ -0,0 +1,122 @@
+"""Benchmark bulk_insert_bars payload preparation on a million-bar backfill.
+
+By default only client-side encoding is timed: the per-row ``iterrows``
+dict building the old path did against the binary COPY encoding.  No SQL
+is executed, so these numbers say nothing about insert throughput, which
+is dominated by the server-side COPY, merge and index maintenance.
+
+With ``--db-url`` the full ``bulk_insert_bars`` call is also timed against
+PostgreSQL, loading the bars into a scratch ticker through both the COPY
+path and chunked INSERTs and rolling the transaction back afterwards.
+
+Usage:
+    python -m tests.benchmarks.bench_bulk_insert
+    python -m tests.benchmarks.bench_bulk_insert --rows 1000000 --db-url postgresql://user:pw@localhost/algomatic
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data.database.market_repository import OHLCVRepository, encode_bars_copy_binary
+
+
+def _make_bars(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.0005, n)))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": rng.integers(100, 10_000, n),
+        },
+        index=pd.date_range("2015-01-02 14:30", periods=n, freq="1min"),
+    )
+
+
+def _iterrows_records(df: pd.DataFrame) -> list[dict]:
+    """Record building of the previous bulk_insert_bars."""
+    records = []
+    for timestamp, row in df.iterrows():
+        records.append({
+            "ticker_id": 1,
+            "timeframe": "1Min",
+            "timestamp": timestamp,
+            "open": float(row["open"]),
+            "high": float(row["high"]),
+            "low": float(row["low"]),
+            "close": float(row["close"]),
+            "volume": int(row["volume"]),
+            "source": "alpaca",
+        })
+    return records
+
+
+def _report(name: str, rows: int, elapsed: float) -> None:
+    print(f"  {name:>28}: {elapsed:8.2f}s  {rows / elapsed:>12,.0f} rows/s")
+
+
+def _bench_database(df: pd.DataFrame, db_url: str) -> None:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from src.data.database.models import Ticker
+
+    engine = create_engine(db_url)
+    for name, force_insert in (("COPY + staging merge", False), ("chunked INSERT", True)):
+        with Session(engine) as session:
+            ticker = Ticker(symbol="ZZBENCH", name="bulk insert benchmark")
+            session.add(ticker)
+            session.flush()
+
+            repo = OHLCVRepository(session)
+            if force_insert:
+                repo._supports_copy = lambda: False
+
+            start = time.perf_counter()
+            inserted = repo.bulk_insert_bars(df, ticker.id, "1Min", "alpaca")
+            elapsed = time.perf_counter() - start
+            session.rollback()
+
+        assert inserted == len(df), f"{name}: inserted {inserted} of {len(df)}"
+        _report(name, len(df), elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Bars to insert")
+    parser.add_argument(
+        "--reference-rows", type=int, default=100_000,
+        help="Sample length for the iterrows reference (extrapolated)",
+    )
+    parser.add_argument("--db-url", help="PostgreSQL URL for the end-to-end benchmark")
+    args = parser.parse_args()
+
+    df = _make_bars(args.rows)
+    print(f"{args.rows:,} bars, payload encoding only (no database)")
+
+    sample = df.iloc[:args.reference_rows]
+    start = time.perf_counter()
+    _iterrows_records(sample)
+    reference = (time.perf_counter() - start) * args.rows / len(sample)
+    _report("iterrows dicts (extrapolated)", args.rows, reference)
+
+    start = time.perf_counter()
+    payload = encode_bars_copy_binary(df)
+    encode = time.perf_counter() - start
+    _report("binary COPY encoding", args.rows, encode)
+    print(f"  payload {len(payload) / 1e6:.1f} MB, x{reference / encode:.0f} faster to encode")
+
+    if args.db_url:
+        print("end-to-end bulk_insert_bars")
+        _bench_database(df, args.db_url)
+    else:
+        print("pass --db-url to time bulk_insert_bars end to end")
+
+
+if __name__ == "__main__":
+    main()
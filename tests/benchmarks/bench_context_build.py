@@ -0,0 +1,84 @@
+"""Benchmark ContextPackBuilder.build latency with sequential vs concurrent reads.
+
+Each reader call sleeps for a fixed round-trip time to stand in for the
+data-service, so the numbers reflect how many round trips are serialized.
+
+Usage:
+    python -m tests.benchmarks.bench_context_build
+    python -m tests.benchmarks.bench_context_build --rtt-ms 5 --builds 50
+"""
+
+import argparse
+import logging
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.evaluators.context import ContextPackBuilder
+
+TIMEFRAMES = ["5Min", "15Min", "1Hour", "1Day"]
+
+
+class LatencyReader:
+    """In-memory reader that sleeps ``rtt`` seconds per call."""
+
+    def __init__(self, rtt: float, n_bars: int = 2000):
+        self.rtt = rtt
+        index = pd.date_range("2024-01-02 09:30", periods=n_bars, freq="5min")
+        close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 0.1, n_bars))
+        self.bars = pd.DataFrame({
+            "open": close, "high": close + 0.1, "low": close - 0.1, "close": close, "volume": 1000,
+        }, index=index)
+        self.features = pd.DataFrame({"atr_14": 0.5, "vwap_60": close}, index=index)
+        self.states = pd.DataFrame({
+            "state_id": [1], "state_prob": [0.9], "log_likelihood": [-1.0], "model_id": ["bench"],
+        })
+
+    def get_bars(self, symbol, timeframe, start=None, end=None, limit=None):
+        time.sleep(self.rtt)
+        return self.bars.tail(limit) if limit else self.bars
+
+    def get_features(self, symbol, timeframe, start=None, end=None):
+        time.sleep(self.rtt)
+        return self.features.loc[start:] if start is not None else self.features
+
+    def get_latest_states(self, symbol, timeframe):
+        time.sleep(self.rtt)
+        return self.states
+
+
+def _p50(builder: ContextPackBuilder, n_builds: int) -> float:
+    timings = []
+    for _ in range(n_builds):
+        start = time.perf_counter()
+        builder.build("AAPL", TIMEFRAMES[0], additional_timeframes=TIMEFRAMES[1:])
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rtt-ms", type=float, default=10.0, help="Simulated round trip per reader call")
+    parser.add_argument("--builds", type=int, default=20, help="Builds per configuration")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    reader = LatencyReader(args.rtt_ms / 1000)
+    runs = [("sequential", 1), ("concurrent", ContextPackBuilder.DEFAULT_FETCH_WORKERS)]
+
+    print(f"{len(TIMEFRAMES)} timeframes, rtt={args.rtt_ms:.1f}ms, {args.builds} builds (cache disabled)")
+    baseline = None
+    for name, workers in runs:
+        builder = ContextPackBuilder(
+            reader=reader, include_key_levels=True, cache_enabled=False, fetch_workers=workers,
+        )
+        p50 = _p50(builder, args.builds)
+        builder.close()
+        baseline = baseline or p50
+        print(f"{name:>12}: p50 {p50 * 1000:8.1f}ms  x{baseline / p50:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark a morning catch-up: per-symbol ensure_data vs ensure_universe.
+
+The repository sleeps a fixed round-trip time per call and the provider
+sleeps per request plus per returned bar, so the numbers show how much
+of the catch-up is per-symbol overhead rather than provider bandwidth.
+
+Usage:
+    python -m tests.benchmarks.bench_ensure_universe
+    python -m tests.benchmarks.bench_ensure_universe --symbols 2000 --rtt-ms 1
+"""
+
+import argparse
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+
+from src.marketdata.base import MarketDataProvider
+from src.marketdata.service import MarketDataService
+
+END = datetime(2024, 1, 3, 0, 0)
+LAST_CLOSE = datetime(2024, 1, 1, 20, 59)
+
+
+class LatencyRepo:
+    """In-memory repository that sleeps ``rtt`` seconds per call."""
+
+    def __init__(self, symbols: list[str], rtt: float):
+        self.rtt = rtt
+        self.tickers = {s: SimpleNamespace(symbol=s, id=i) for i, s in enumerate(symbols)}
+
+    def get_or_create_ticker(self, symbol):
+        time.sleep(self.rtt)
+        return self.tickers[symbol]
+
+    def list_tickers(self, active_only=True):
+        time.sleep(self.rtt)
+        return list(self.tickers.values())
+
+    def get_latest_timestamp(self, symbol, timeframe):
+        time.sleep(self.rtt)
+        return LAST_CLOSE
+
+    def get_latest_timestamps(self, symbols, timeframe):
+        time.sleep(self.rtt)
+        return {s: LAST_CLOSE for s in symbols}
+
+    def bulk_insert_bars(self, df, ticker_id, timeframe, source):
+        time.sleep(self.rtt)
+        return len(df)
+
+    def update_sync_log(self, **kwargs):
+        time.sleep(self.rtt)
+
+
+class LatencyProvider(MarketDataProvider):
+    """Provider with a fixed per-request latency and per-bar transfer time."""
+
+    source_name = "alpaca"
+
+    def __init__(self, request_latency: float, bar_cost: float, bars_per_symbol: int = 390):
+        self.request_latency = request_latency
+        self.bar_cost = bar_cost
+        index = pd.date_range("2024-01-02 14:30", periods=bars_per_symbol, freq="1min")
+        self.bars = pd.DataFrame(
+            {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 1000}, index=index,
+        )
+
+    def fetch_bars(self, symbol, start, end, resolution="1Min"):
+        time.sleep(self.request_latency + self.bar_cost * len(self.bars))
+        return self.bars
+
+    def fetch_bars_multi(self, symbols, start, end, resolution="1Min"):
+        time.sleep(self.request_latency + self.bar_cost * len(self.bars) * len(symbols))
+        return {s: self.bars for s in symbols}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=500, help="Universe size")
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="Simulated round trip per repository call")
+    parser.add_argument("--request-ms", type=float, default=20.0, help="Simulated provider request latency")
+    parser.add_argument("--bar-us", type=float, default=2.0, help="Simulated provider transfer time per bar")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    symbols = [f"S{i:04d}" for i in range(args.symbols)]
+    repo = LatencyRepo(symbols, args.rtt_ms / 1000)
+    provider = LatencyProvider(args.request_ms / 1000, args.bar_us / 1e6)
+    bandwidth = provider.bar_cost * len(provider.bars) * len(symbols)
+
+    @contextmanager
+    def client():
+        yield repo
+
+    def per_symbol(service):
+        for symbol in symbols:
+            service.ensure_data(symbol, ["1Min"], end=END)
+
+    def universe(service):
+        service.ensure_universe(symbols, ["1Min"], end=END)
+
+    print(
+        f"{len(symbols)} symbols x {len(provider.bars)} 1Min bars, rtt={args.rtt_ms:.1f}ms, "
+        f"request={args.request_ms:.0f}ms, transfer floor={bandwidth:.2f}s"
+    )
+    baseline = None
+    with patch("src.marketdata.service.grpc_market_client", client):
+        for name, run in [("ensure_data", per_symbol), ("ensure_universe", universe)]:
+            service = MarketDataService(provider, db_manager=object())
+            start = time.perf_counter()
+            run(service)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{name:>16}: {elapsed:8.2f}s  x{baseline / elapsed:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark per-intent evaluate() against batched evaluate_many().
+
+Runs the registered evaluators over synthetic trade intents spread across
+many symbols. Context reads go through a reader that sleeps a fixed round
+trip per call to stand in for the data-service.
+
+Usage:
+    python -m tests.benchmarks.bench_evaluate_many
+    python -m tests.benchmarks.bench_evaluate_many --intents 1000 --symbols 50 --rtt-ms 5
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.evaluators.context import ContextPackBuilder
+from src.orchestrator import EvaluatorOrchestrator, OrchestratorConfig
+from src.trade.intent import TradeDirection, TradeIntent
+
+from tests.benchmarks.bench_context_build import LatencyReader
+
+
+def make_intents(n_intents: int, n_symbols: int, seed: int = 0) -> list[TradeIntent]:
+    """Generate long/short intents spread across ``n_symbols`` symbols."""
+    rng = np.random.default_rng(seed)
+    intents = []
+    for i in range(n_intents):
+        entry = float(rng.uniform(95, 105))
+        long = bool(rng.integers(0, 2))
+        risk = float(rng.uniform(0.5, 2.0))
+        intents.append(TradeIntent(
+            user_id=1,
+            symbol=f"SYM{i % n_symbols:03d}",
+            direction=TradeDirection.LONG if long else TradeDirection.SHORT,
+            timeframe="5Min",
+            entry_price=entry,
+            stop_loss=entry - risk if long else entry + risk,
+            profit_target=entry + 2 * risk if long else entry - 2 * risk,
+            position_size=100,
+        ))
+    return intents
+
+
+def _orchestrator(reader: LatencyReader, cache_enabled: bool, max_workers: int) -> EvaluatorOrchestrator:
+    builder = ContextPackBuilder(reader=reader, cache_enabled=cache_enabled)
+    orchestrator = EvaluatorOrchestrator(
+        config=OrchestratorConfig(max_workers=max_workers), context_builder=builder,
+    )
+    orchestrator.load_evaluators()
+    return orchestrator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--intents", type=int, default=1000, help="Number of trade intents")
+    parser.add_argument("--symbols", type=int, default=50, help="Distinct symbols")
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="Simulated round trip per reader call")
+    parser.add_argument("--workers", type=int, default=8, help="evaluate_many pool size")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    reader = LatencyReader(args.rtt_ms / 1000)
+    intents = make_intents(args.intents, args.symbols)
+
+    runs = [
+        ("evaluate, no cache", False, lambda o: [o.evaluate(i) for i in intents]),
+        ("evaluate, cached", True, lambda o: [o.evaluate(i) for i in intents]),
+        ("evaluate_many", True, lambda o: o.evaluate_many(intents, max_workers=args.workers)),
+    ]
+    print(f"{args.intents} intents over {args.symbols} symbols, rtt={args.rtt_ms:.1f}ms")
+    baseline = None
+    scores = None
+    for name, cache_enabled, run in runs:
+        orchestrator = _orchestrator(reader, cache_enabled, args.workers)
+        start = time.perf_counter()
+        results = run(orchestrator)
+        elapsed = time.perf_counter() - start
+        orchestrator.context_builder.close()
+
+        run_scores = [r.score for r in results]
+        assert scores is None or run_scores == scores, f"{name} scores differ"
+        scores = run_scores
+        baseline = baseline or elapsed
+        print(
+            f"{name:>20}: {elapsed:8.2f}s  {len(results) / elapsed:>9,.0f} intents/s  "
+            f"x{baseline / elapsed:5.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
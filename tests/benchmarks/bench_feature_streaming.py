@@ -0,0 +1,111 @@
+"""Benchmark per-cycle feature latency: batch recompute vs streaming.
+
+Simulates the live runner: every symbol has a warmup history, then one new
+bar arrives per symbol per cycle.  The batch path recomputes the pipeline
+over the cached history (what TradingRunner used to do); the streaming
+path feeds the new bar to each symbol's FeaturePipelineStream.
+
+The default pipeline is measured twice: once with only the calculators
+that have native O(1) streams, and once including the TA-Lib/pandas-ta
+indicators.  Those have no constant-time form and stream through
+WindowedFeatureStream, so each of their updates still runs ``compute()``
+over a trailing window; the difference between the two runs is their cost.
+
+Usage:
+    python -m tests.benchmarks.bench_feature_streaming
+    python -m tests.benchmarks.bench_feature_streaming --symbols 100 --cycles 5 --no-ta
+"""
+
+import argparse
+import logging
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from src.features.pipeline import FeaturePipeline
+from src.features.registry import get_default_calculators
+from src.features.streaming import WindowedFeatureStream
+
+
+def make_bars(n_bars: int, seed: int) -> pd.DataFrame:
+    """Generate a random-walk 1Min OHLCV frame."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-02 09:30", periods=n_bars, freq="1min")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) * 1.0005,
+        "low": np.minimum(open_, close) * 0.9995,
+        "close": close,
+        "volume": rng.integers(1000, 5000, n_bars).astype(float),
+    }, index=index)
+
+
+def run(pipeline: FeaturePipeline, data: dict[str, pd.DataFrame], warmup: int, cycles: int) -> tuple[float, float, float]:
+    """Time stream warmup, then batch and streaming updates per cycle.
+
+    Returns:
+        Tuple of (warmup seconds, batch seconds, streaming seconds), the
+        last two summed over all cycles
+    """
+    streams = {}
+    start = time.perf_counter()
+    for symbol, df in data.items():
+        streams[symbol] = pipeline.create_stream()
+        streams[symbol].update_many(df.iloc[:warmup])
+    warmup_time = time.perf_counter() - start
+
+    batch = 0.0
+    streaming = 0.0
+    for cycle in range(cycles):
+        end = warmup + cycle + 1
+        start = time.perf_counter()
+        for df in data.values():
+            pipeline.compute(df.iloc[end - warmup:end])
+        batch += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for symbol, df in data.items():
+            streams[symbol].update_many(df.iloc[end - 1:end])
+        streaming += time.perf_counter() - start
+
+    return warmup_time, batch, streaming
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=500, help="Number of symbols")
+    parser.add_argument("--warmup", type=int, default=300, help="Warmup bars per symbol")
+    parser.add_argument("--cycles", type=int, default=5, help="New bars per symbol")
+    parser.add_argument("--no-ta", action="store_true", help="Skip the run with TA-Lib indicators")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+    data = {f"SYM{k:03d}": make_bars(args.warmup + args.cycles, k) for k in range(args.symbols)}
+
+    configs = [("native streams only", False)]
+    if not args.no_ta:
+        configs.append(("with TA indicators", True))
+
+    print(f"{args.symbols} symbols, {args.warmup} warmup bars, {args.cycles} cycles")
+    for label, include_ta in configs:
+        pipeline = FeaturePipeline(get_default_calculators(include_ta_indicators=include_ta))
+        windowed = [
+            type(calc).__name__ for calc in pipeline.calculators
+            if isinstance(calc.create_stream(), WindowedFeatureStream)
+        ]
+        warmup, batch, streaming = run(pipeline, data, args.warmup, args.cycles)
+
+        print(f"{label} (windowed: {', '.join(windowed) or 'none'})")
+        print(f"  stream warmup:       {warmup:8.2f}s")
+        print(f"  batch per cycle:     {batch / args.cycles * 1e3:8.1f}ms")
+        print(f"  streaming per cycle: {streaming / args.cycles * 1e3:8.1f}ms  "
+              f"x{batch / streaming:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
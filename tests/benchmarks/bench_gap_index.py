@@ -0,0 +1,81 @@
+"""Benchmark gap detection over years of 1Min bars.
+
+Compares the per-gap ``get_loc`` loop that interval-based detection used
+with the session-calendar index, then times the full ``detect_gaps``
+report both ways.  Interval detection flags every overnight, weekend and
+holiday break; the calendar reports only the bars that were dropped.
+
+Usage:
+    python -m tests.benchmarks.bench_gap_index
+    python -m tests.benchmarks.bench_gap_index --years 10 --drop 0.001
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data.quality import detect_gaps
+from src.data.session_calendar import SessionCalendar
+
+
+def _loop_gaps(index: pd.DatetimeIndex, freq: str = "1min") -> int:
+    """Interval detection as a per-gap Python loop (the previous implementation)."""
+    expected_delta = pd.Timedelta(freq)
+    time_diffs = index.to_series().diff()
+    gaps = 0
+    for gap_end in index[time_diffs > expected_delta * 1.5]:
+        pos = index.get_loc(gap_end)
+        if pos and int((gap_end - index[pos - 1]) / expected_delta) > 1:
+            gaps += 1
+    return gaps
+
+
+def _time(func, *args, repeat: int = 3):
+    """Best wall time of ``repeat`` calls and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=5, help="Years of regular-session 1Min bars")
+    parser.add_argument("--drop", type=float, default=0.01, help="Fraction of bars removed at random")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    build, calendar = _time(SessionCalendar, repeat=1)
+    end = pd.Timestamp("2025-01-01")
+    full = calendar.expected_index("1Min", end - pd.DateOffset(years=args.years), end)
+    rng = np.random.default_rng(0)
+    index = full.delete(rng.choice(len(full), int(len(full) * args.drop), replace=False))
+    df = pd.DataFrame(
+        {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 1000}, index=index,
+    )
+    print(
+        f"{len(index):,} 1Min bars over {args.years} years, {len(full) - len(index):,} dropped "
+        f"(calendar build {build * 1000:.1f}ms)"
+    )
+
+    runs = [
+        ("loop (interval)", lambda: _loop_gaps(index)),
+        ("calendar missing_between", lambda: int((calendar.missing_between(index, "1Min") > 0).sum())),
+        ("calendar missing_ranges", lambda: len(calendar.missing_ranges(index, "1Min"))),
+        ("detect_gaps (interval)", lambda: len(detect_gaps(df, "1min"))),
+        ("detect_gaps (calendar)", lambda: len(detect_gaps(df, "1min", calendar=calendar))),
+    ]
+    baseline = None
+    for name, run in runs:
+        elapsed, gaps = _time(run)
+        baseline = baseline or elapsed
+        print(f"{name:>24}: {elapsed * 1000:9.1f}ms  x{baseline / elapsed:7.1f}  gaps={gaps:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark bar transfer in MarketDataGrpcClient.get_bars and iter_bars.
+
+Pages and stream messages are pre-serialized as the data-service would send
+them, and a fake stub deserializes each one as it is consumed, so the
+timings cover message parsing plus DataFrame construction on the client,
+without network time.
+
+Usage (generated stubs must be importable, as in the Docker image):
+    PYTHONPATH=proto/gen/python python -m tests.benchmarks.bench_grpc_bars
+    PYTHONPATH=proto/gen/python python -m tests.benchmarks.bench_grpc_bars --rows 1000000
+"""
+
+import argparse
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from proto.gen.python.market.v1 import bar_pb2, ticker_pb2
+from src.data import grpc_client
+from src.data.grpc_client import MarketDataGrpcClient, _dt_to_pb, bars_to_columns
+
+
+def _make_bars(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.0005, n)))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": rng.integers(100, 10_000, n),
+        },
+        index=pd.date_range("2018-01-02 14:30", periods=n, freq="1min"),
+    )
+
+
+def _row_pages(df: pd.DataFrame, page_size: int) -> list[bytes]:
+    pages = []
+    for lo in range(0, len(df), page_size):
+        page = df.iloc[lo:lo + page_size]
+        pages.append(bar_pb2.GetBarsResponse(
+            bars=[
+                bar_pb2.OHLCVBar(
+                    timestamp=_dt_to_pb(ts.to_pydatetime()),
+                    open=row.open, high=row.high, low=row.low, close=row.close,
+                    volume=int(row.volume),
+                )
+                for ts, row in zip(page.index, page.itertuples())
+            ],
+            next_page_token="" if lo + page_size >= len(df) else str(lo + page_size),
+        ).SerializeToString())
+    return pages
+
+
+def _columnar_pages(df: pd.DataFrame, page_size: int) -> list[bytes]:
+    return [
+        bar_pb2.GetBarsColumnarResponse(
+            columns=bars_to_columns(df.iloc[lo:lo + page_size]),
+            next_page_token="" if lo + page_size >= len(df) else str(lo + page_size),
+        ).SerializeToString()
+        for lo in range(0, len(df), page_size)
+    ]
+
+
+def _stream_messages(df: pd.DataFrame) -> list[bytes]:
+    return [
+        bar_pb2.OHLCVBar(
+            timestamp=_dt_to_pb(ts.to_pydatetime()),
+            open=row.open, high=row.high, low=row.low, close=row.close,
+            volume=int(row.volume),
+        ).SerializeToString()
+        for ts, row in zip(df.index, df.itertuples())
+    ]
+
+
+class _Stream:
+    def __init__(self, messages: list[bytes]):
+        self._messages = messages
+
+    def __iter__(self):
+        return (bar_pb2.OHLCVBar.FromString(m) for m in self._messages)
+
+    def cancel(self):
+        pass
+
+
+def _client(pages: list[bytes], response_type, columnar: bool) -> MarketDataGrpcClient:
+    client = MarketDataGrpcClient(MagicMock(), columnar_bars=columnar)
+    client.stub = MagicMock()
+    client.stub.GetTicker.return_value = ticker_pb2.GetTickerResponse(
+        ticker=ticker_pb2.Ticker(id=1, symbol="BENCH"),
+    )
+
+    def serve(req):
+        index = int(req.page_token) // req.page_size if req.page_token else 0
+        return response_type.FromString(pages[index])
+
+    if columnar:
+        client.stub.GetBarsColumnar.side_effect = serve
+    else:
+        # A zero count keeps get_bars on the paged GetBars path
+        client.stub.GetBarCount.return_value = bar_pb2.GetBarCountResponse(count=0)
+        client.stub.GetBars.side_effect = serve
+    return client
+
+
+def _stream_client(messages: list[bytes]) -> MarketDataGrpcClient:
+    client = _client([], bar_pb2.GetBarsResponse, columnar=False)
+    client.stub.GetBarCount.return_value = bar_pb2.GetBarCountResponse(count=len(messages))
+    client.stub.StreamBars.side_effect = lambda req: _Stream(messages)
+    return client
+
+
+def _time_chunks(client: MarketDataGrpcClient, chunk_rows: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    rows = sum(len(chunk) for chunk in client.iter_bars("BENCH", "1Min", chunk_rows=chunk_rows))
+    return time.perf_counter() - start, rows
+
+
+def _time(client: MarketDataGrpcClient) -> tuple[float, int]:
+    start = time.perf_counter()
+    df = client.get_bars("BENCH", "1Min")
+    return time.perf_counter() - start, len(df)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Bars to transfer")
+    args = parser.parse_args()
+
+    df = _make_bars(args.rows)
+    print(f"{args.rows:,} bars")
+
+    row_pages = _row_pages(df, grpc_client._ROW_PAGE_SIZE)
+    col_pages = _columnar_pages(df, grpc_client._COLUMNAR_PAGE_SIZE)
+    print(
+        f"  wire size: rows {sum(map(len, row_pages)) / 1e6:.1f} MB in {len(row_pages)} pages, "
+        f"columnar {sum(map(len, col_pages)) / 1e6:.1f} MB in {len(col_pages)} pages"
+    )
+
+    messages = _stream_messages(df)
+    results = {
+        "GetBars (rows)": _time(_client(row_pages, bar_pb2.GetBarsResponse, columnar=False)),
+        "StreamBars": _time(_stream_client(messages)),
+        "GetBarsColumnar": _time(_client(col_pages, bar_pb2.GetBarsColumnarResponse, columnar=True)),
+        "iter_bars (StreamBars)": _time_chunks(_stream_client(messages), 50_000),
+        "iter_bars (columnar)": _time_chunks(
+            _client(_columnar_pages(df, 50_000), bar_pb2.GetBarsColumnarResponse, columnar=True), 50_000,
+        ),
+    }
+
+    row_time = results["GetBars (rows)"][0]
+    for name, (elapsed, count) in results.items():
+        assert count == args.rows, f"{name}: {count} bars"
+        print(
+            f"  {name:>24}: {elapsed:8.3f}s  {args.rows / elapsed:>12,.0f} bars/s  "
+            f"x{row_time / elapsed:.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark per-bar HMM regime inference latency.
+
+Compares the HMM step of InferenceEngine.process before and after the
+emission cache: hmmlearn's predict_proba plus a per-state inv/det loop,
+versus the fused cached evaluation.  Also times the full process() call
+(scaler + encoder + HMM + anti-chatter) against the previous path (sklearn
+PCA.transform and the old HMM step), the filtered-posterior update (one
+online forward step versus re-running hmmlearn's forward pass over a
+trailing --window of bars), and a backfill of --backfill bars through
+process() one by one versus infer_batch.
+
+Usage:
+    python -m tests.benchmarks.bench_hmm_inference
+    python -m tests.benchmarks.bench_hmm_inference --states 12 --latent-dim 12 --covariance full
+"""
+
+import argparse
+import logging
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.features.state.hmm.contracts import ModelMetadata
+from src.features.state.hmm.encoders import PCAEncoder
+from src.features.state.hmm.hmm_model import EPS, GaussianHMMWrapper, _hmmc
+from src.features.state.hmm.inference import InferenceEngine
+from src.features.state.hmm.scalers import RobustScaler
+
+
+def _previous_step(wrapper: GaussianHMMWrapper, z: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-bar HMM work of the previous InferenceEngine.process."""
+    posteriors = wrapper.model_.predict_proba(z)
+    log_probs = np.zeros((len(z), wrapper.n_states))
+    for k in range(wrapper.n_states):
+        cov = wrapper.model_.covars_[k]
+        diff = z - wrapper.model_.means_[k]
+        inv_cov = np.linalg.inv(cov)
+        log_det = np.log(np.linalg.det(cov) + EPS)
+        mahal = np.sum(diff @ inv_cov * diff, axis=1)
+        log_probs[:, k] = -0.5 * (wrapper.latent_dim * np.log(2 * np.pi) + log_det + mahal)
+    log_liks = np.logaddexp.reduce(np.log(wrapper.model_.startprob_ + EPS) + log_probs, axis=1)
+    return posteriors, log_liks
+
+
+def _previous_infer(engine: InferenceEngine, X: np.ndarray):
+    """Scaler, sklearn PCA.transform and HMM step of the previous process().
+
+    The previous step's posteriors are discarded; the per-state frame
+    log-likelihoods feed the forward filter as in the current path.
+    """
+    z = engine.encoder.pca_.transform(engine.scaler.transform(X))
+    _, log_liks = _previous_step(engine.hmm, z)
+    return z, engine.hmm.model_._compute_log_likelihood(z), log_liks
+
+
+def _per_bar_us(fn, rows: np.ndarray) -> float:
+    start = time.perf_counter()
+    for i in range(len(rows)):
+        fn(rows[i:i + 1])
+    return (time.perf_counter() - start) / len(rows) * 1e6
+
+
+def _engine_per_bar_us(engine: InferenceEngine, features: list[dict], timestamps: list) -> float:
+    engine.reset()
+    start = time.perf_counter()
+    for row, ts in zip(features, timestamps):
+        engine.process(row, "BENCH", ts)
+    return (time.perf_counter() - start) / len(features) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=8, help="HMM states (K)")
+    parser.add_argument("--latent-dim", type=int, default=8, help="Latent dimension (d)")
+    parser.add_argument("--features", type=int, default=24, help="Input features")
+    parser.add_argument("--covariance", default="full", choices=["full", "diag", "tied"])
+    parser.add_argument("--bars", type=int, default=5000, help="Bars to time")
+    parser.add_argument("--window", type=int, default=390, help="Trailing bars for the hmmlearn forward pass")
+    parser.add_argument("--backfill", type=int, default=100_000, help="Bars for the backfill comparison")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(0)
+    centers = rng.normal(0, 2, (args.states, args.features))
+    n_rows = max(20_000, args.backfill)
+    X = centers[rng.integers(0, args.states, n_rows)] + rng.normal(0, 1, (n_rows, args.features))
+
+    scaler = RobustScaler().fit(X)
+    encoder = PCAEncoder(latent_dim=args.latent_dim).fit(scaler.transform(X))
+    Z = encoder.transform(scaler.transform(X))
+    wrapper = GaussianHMMWrapper(
+        n_states=args.states, covariance_type=args.covariance, n_iter=20, random_state=0,
+    ).fit(Z)
+
+    rows = Z[:args.bars]
+    # Log-likelihoods differ slightly: the old loop added EPS to the determinant
+    expected, _ = _previous_step(wrapper, rows[:100])
+    actual, _ = wrapper.predict_proba_and_log_likelihood(rows[:100])
+    assert np.allclose(expected, actual)
+
+    print(f"K={args.states}, d={args.latent_dim}, {args.covariance} covariance, {args.bars:,} bars")
+    old_hmm = _per_bar_us(lambda z: _previous_step(wrapper, z), rows)
+    new_hmm = _per_bar_us(wrapper.predict_proba_and_log_likelihood, rows)
+    print(f"  {'HMM step, inv/det loop':>28}: {old_hmm:8.1f} us/bar")
+    print(f"  {'HMM step, cached + fused':>28}: {new_hmm:8.1f} us/bar  x{old_hmm / new_hmm:.1f}")
+
+    model = wrapper.model_
+    window = args.window
+
+    def hmmlearn_filter(i: int) -> np.ndarray:
+        frames = model._compute_log_likelihood(Z[max(0, i - window + 1):i + 1])
+        _, fwdlattice = _hmmc.forward_log(model.startprob_, model.transmat_, frames)
+        return np.exp(fwdlattice[-1] - np.logaddexp.reduce(fwdlattice[-1]))
+
+    n_filter = min(args.bars, 2000)
+    start = time.perf_counter()
+    for i in range(window, window + n_filter):
+        hmmlearn_filter(i)
+    trailing = (time.perf_counter() - start) / n_filter * 1e6
+
+    frames = wrapper.state_log_likelihood(Z[:n_filter])
+    names = [f"f{i}" for i in range(args.features)]
+    metadata = ModelMetadata(
+        model_id="bench", timeframe="1Min", version="1", created_at=datetime(2024, 1, 1),
+        training_start=datetime(2023, 1, 1), training_end=datetime(2024, 1, 1),
+        n_states=args.states, latent_dim=args.latent_dim, feature_names=names, symbols=["BENCH"],
+        ood_threshold=-1e9,
+    )
+    features = [dict(zip(names, x)) for x in X[:args.bars]]
+    timestamps = [datetime(2024, 1, 2) + timedelta(minutes=i) for i in range(args.bars)]
+
+    engine = InferenceEngine(scaler, encoder, wrapper, metadata)
+
+    start = time.perf_counter()
+    for frame in frames:
+        engine._filter(frame)
+    online = (time.perf_counter() - start) / n_filter * 1e6
+    print(f"  {f'filter, forward over {window} bars':>28}: {trailing:8.1f} us/bar")
+    print(f"  {'filter, online O(K^2) step':>28}: {online:8.1f} us/bar  x{trailing / online:.0f}")
+
+    backfill = pd.DataFrame(X[:args.backfill], columns=names,
+                            index=pd.date_range("2024-01-02", periods=args.backfill, freq="1min"))
+    start = time.perf_counter()
+    engine.reset()
+    for ts, row in zip(backfill.index, backfill.itertuples(index=False)):
+        engine.process(row._asdict(), "BENCH", ts)
+    sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    engine.infer_batch(backfill)
+    batch = time.perf_counter() - start
+    print(f"  {'backfill, process() per bar':>28}: {sequential:8.2f} s  ({args.backfill:,} bars)")
+    print(f"  {'backfill, infer_batch':>28}: {batch:8.2f} s  x{sequential / batch:.0f}")
+
+    new_engine = _engine_per_bar_us(engine, features, timestamps)
+    engine._infer = lambda X: _previous_infer(engine, X)
+    old_engine = _engine_per_bar_us(engine, features, timestamps)
+    print(f"  {'process(), previous path':>28}: {old_engine:8.1f} us/bar")
+    print(f"  {'process(), cached + fused':>28}: {new_engine:8.1f} us/bar  x{old_engine / new_engine:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark live regime inference across many symbols per bar close.
+
+Compares one InferenceEngine per symbol, each called through process() for
+every bar, against a single MultiSymbolInferenceEngine that processes the
+whole cross-section of a bar close as one matrix.
+
+Usage:
+    python -m tests.benchmarks.bench_hmm_multi_symbol
+    python -m tests.benchmarks.bench_hmm_multi_symbol --symbols 5000 --bars 20
+"""
+
+import argparse
+import logging
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.features.state.hmm.contracts import ModelMetadata
+from src.features.state.hmm.encoders import PCAEncoder
+from src.features.state.hmm.hmm_model import GaussianHMMWrapper
+from src.features.state.hmm.inference import InferenceEngine, MultiSymbolInferenceEngine
+from src.features.state.hmm.scalers import RobustScaler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=800, help="Symbols per bar close")
+    parser.add_argument("--bars", type=int, default=50, help="Bar closes to time")
+    parser.add_argument("--states", type=int, default=8, help="HMM states (K)")
+    parser.add_argument("--latent-dim", type=int, default=8, help="Latent dimension (d)")
+    parser.add_argument("--features", type=int, default=24, help="Input features")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(0)
+    centers = rng.normal(0, 2, (args.states, args.features))
+    X = centers[rng.integers(0, args.states, 20_000)] + rng.normal(0, 1, (20_000, args.features))
+
+    scaler = RobustScaler().fit(X)
+    encoder = PCAEncoder(latent_dim=args.latent_dim).fit(scaler.transform(X))
+    wrapper = GaussianHMMWrapper(n_states=args.states, n_iter=20, random_state=0)
+    wrapper.fit(encoder.transform(scaler.transform(X)))
+
+    names = [f"f{i}" for i in range(args.features)]
+    symbols = [f"S{i:05d}" for i in range(args.symbols)]
+    metadata = ModelMetadata(
+        model_id="bench", timeframe="1Min", version="1", created_at=datetime(2024, 1, 1),
+        training_start=datetime(2023, 1, 1), training_end=datetime(2024, 1, 1),
+        n_states=args.states, latent_dim=args.latent_dim, feature_names=names, symbols=symbols,
+        ood_threshold=-1e9,
+    )
+
+    # One cross-section of features per bar close
+    labels = rng.integers(0, args.states, (args.bars, args.symbols))
+    panels = centers[labels] + rng.normal(0, 1, (args.bars, args.symbols, args.features))
+    timestamps = [datetime(2024, 1, 2, 14, 30) + timedelta(minutes=i) for i in range(args.bars)]
+    frames = [pd.DataFrame(p, index=symbols, columns=names) for p in panels]
+
+    engines = {s: InferenceEngine(scaler, encoder, wrapper, metadata) for s in symbols}
+    start = time.perf_counter()
+    for frame, ts in zip(frames, timestamps):
+        for symbol, row in zip(symbols, frame.to_dict(orient="records")):
+            engines[symbol].process(row, symbol, ts)
+    per_symbol = (time.perf_counter() - start) / args.bars
+
+    multi = MultiSymbolInferenceEngine(scaler, encoder, wrapper, metadata, symbols=symbols)
+    start = time.perf_counter()
+    for frame, ts in zip(frames, timestamps):
+        result = multi.update(frame, ts)
+    vectorized = (time.perf_counter() - start) / args.bars
+
+    last = {s: engines[s]._state.current_state for s in symbols}
+    assert result.state_id.tolist() == [last[s] for s in symbols]
+
+    print(f"{args.symbols:,} symbols, K={args.states}, d={args.latent_dim}, {args.bars} bar closes")
+    print(f"  {'InferenceEngine per symbol':>28}: {per_symbol * 1e3:8.1f} ms/bar  "
+          f"{args.symbols / per_symbol:>10,.0f} symbols/s")
+    print(f"  {'MultiSymbolInferenceEngine':>28}: {vectorized * 1e3:8.1f} ms/bar  "
+          f"{args.symbols / vectorized:>10,.0f} symbols/s  x{per_symbol / vectorized:.0f}")
+
+
+if __name__ == "__main__":
+    main()
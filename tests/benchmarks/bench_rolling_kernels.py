@@ -0,0 +1,78 @@
+"""Micro-benchmarks for the rolling feature kernels on 1M-row series.
+
+The vectorized kernels run on the full series.  The per-window reference
+implementations they replaced are timed on a smaller sample and
+extrapolated, since running them on 1M rows takes minutes.
+
+Usage:
+    python -m tests.benchmarks.bench_rolling_kernels
+    python -m tests.benchmarks.bench_rolling_kernels --rows 1000000 --window 60
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.features.base import ema, log_return, rolling_beta, rolling_regression_slope, zscore
+from tests.unit.features.test_base import reference_beta, reference_slope
+
+
+def _time(func, *args, repeat: int = 3) -> float:
+    """Best wall time of ``repeat`` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Series length")
+    parser.add_argument("--window", type=int, default=60, help="Rolling window")
+    parser.add_argument(
+        "--reference-rows", type=int, default=20_000,
+        help="Sample length for the per-window reference implementations",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-02 09:30", periods=args.rows, freq="1min")
+    market = pd.Series(rng.normal(0, 0.001, args.rows), index=index)
+    asset = 1.2 * market + pd.Series(rng.normal(0, 0.0005, args.rows), index=index)
+    log_prices = np.log(100) + asset.cumsum()
+    prices = np.exp(log_prices)
+    w = args.window
+
+    print(f"{args.rows:,} rows, window={w}")
+    kernels = [
+        ("rolling_regression_slope", rolling_regression_slope, (log_prices, w)),
+        ("rolling_beta", rolling_beta, (asset, market, w)),
+        ("zscore", zscore, (asset, w)),
+        ("ema", ema, (prices, w)),
+        ("log_return", log_return, (prices, 1)),
+    ]
+    for name, func, func_args in kernels:
+        elapsed = _time(func, *func_args)
+        print(f"  {name:>26}: {elapsed * 1e3:9.1f}ms  {args.rows / elapsed:>14,.0f} rows/s")
+
+    n = min(args.reference_rows, args.rows)
+    sample = (log_prices.iloc[:n], asset.iloc[:n], market.iloc[:n])
+    references = [
+        ("rolling_regression_slope", reference_slope, rolling_regression_slope, (sample[0], w)),
+        ("rolling_beta", reference_beta, rolling_beta, (sample[1], sample[2], w)),
+    ]
+    print(f"per-window reference on {n:,} rows, extrapolated to {args.rows:,}")
+    for name, reference, kernel, func_args in references:
+        reference_time = _time(reference, *func_args, repeat=1)
+        speedup = reference_time / _time(kernel, *func_args)
+        print(
+            f"  {name:>26}: {reference_time * args.rows / n:9.1f}s   "
+            f"vectorized is x{speedup:,.0f} faster"
+        )
+
+if __name__ == "__main__":
+    main()
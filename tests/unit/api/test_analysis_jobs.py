@@ -0,0 +1,208 @@
+"""Tests for the background analysis job runner and its endpoints."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.api import analysis, analysis_jobs
+from src.api._data_helpers import clear_all_cache, get_cached_data, set_cached_data
+from src.api.analysis_jobs import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    AnalysisJobManager,
+    report_progress,
+)
+from src.api.auth_middleware import get_current_user
+
+RELEASE = threading.Event()
+CALLS: list[tuple] = []
+
+
+def blocking_job(symbol, timeframe, params):
+    """Job that waits for RELEASE, reporting progress first."""
+    CALLS.append((symbol, timeframe))
+    report_progress(0.5, "halfway")
+    RELEASE.wait(timeout=5)
+    return {"symbol": symbol, "timeframe": timeframe, **params}
+
+
+def failing_job(symbol, timeframe, params):
+    raise HTTPException(status_code=400, detail="Insufficient data")
+
+
+def crashing_job(symbol, timeframe, params):
+    raise RuntimeError("boom")
+
+
+def echo_job(symbol, timeframe, params):
+    report_progress(0.5, "halfway")
+    return {"symbol": symbol}
+
+
+@pytest.fixture()
+def manager():
+    CALLS.clear()
+    RELEASE.clear()
+    mgr = AnalysisJobManager(max_workers=2, executor_factory=ThreadPoolExecutor)
+    yield mgr
+    RELEASE.set()
+    mgr.shutdown()
+
+
+def _wait(manager, job):
+    return asyncio.run(manager.wait(job.job_id))
+
+
+class TestAnalysisJobManager:
+    """Tests for AnalysisJobManager."""
+
+    def test_duplicate_requests_share_running_job(self, manager):
+        """Same symbol/timeframe while running returns the same job."""
+        first = manager.submit("hmm", blocking_job, "aapl", "1Min")
+        second = manager.submit("hmm", blocking_job, "AAPL", "1Min")
+        other = manager.submit("hmm", blocking_job, "AAPL", "5Min")
+
+        assert second.job_id == first.job_id
+        assert other.job_id != first.job_id
+
+        RELEASE.set()
+        done = _wait(manager, first)
+        _wait(manager, other)
+        assert done.status == JOB_COMPLETED
+        assert done.result == {"symbol": "AAPL", "timeframe": "1Min"}
+        assert sorted(CALLS) == [("AAPL", "1Min"), ("AAPL", "5Min")]
+
+    def test_completed_result_cached_unless_forced(self, manager):
+        """A finished job is reused until force=True."""
+        RELEASE.set()
+        first = _wait(manager, manager.submit("hmm", blocking_job, "AAPL", "1Min"))
+        cached = manager.submit("hmm", blocking_job, "AAPL", "1Min")
+        forced = _wait(manager, manager.submit("hmm", blocking_job, "AAPL", "1Min", force=True))
+
+        assert cached.job_id == first.job_id
+        assert forced.job_id != first.job_id
+        assert len(CALLS) == 2
+
+    def test_params_distinguish_jobs(self, manager):
+        """Different params are different jobs."""
+        a = manager.submit("pca", blocking_job, "AAPL", "1Min", {"n_states": 3})
+        b = manager.submit("pca", blocking_job, "AAPL", "1Min", {"n_states": 4})
+        assert a.job_id != b.job_id
+
+    def test_http_errors_reported(self, manager):
+        """HTTPException from a job marks it failed with its status code."""
+        job = _wait(manager, manager.submit("hmm", failing_job, "AAPL", "1Min"))
+
+        assert job.status == JOB_FAILED
+        assert job.status_code == 400
+        assert job.error == "Insufficient data"
+        # Failures are not cached
+        assert manager.submit("hmm", failing_job, "AAPL", "1Min").job_id != job.job_id
+
+    def test_unexpected_errors_hidden(self, manager):
+        """Unexpected exceptions become a generic 500."""
+        job = _wait(manager, manager.submit("hmm", crashing_job, "AAPL", "1Min"))
+
+        assert job.status == JOB_FAILED
+        assert job.status_code == 500
+        assert job.error == "Internal server error"
+
+    def test_progress_reported(self, manager):
+        """Progress from the worker is visible while the job runs."""
+        job = manager.submit("hmm", blocking_job, "AAPL", "1Min")
+        for _ in range(200):
+            if manager.get(job.job_id).progress == 0.5:
+                break
+            threading.Event().wait(0.01)
+
+        running = manager.get(job.job_id)
+        assert running.status == "running"
+        assert running.stage == "halfway"
+        RELEASE.set()
+        assert _wait(manager, job).progress == 1.0
+
+    def test_completion_hook_runs_before_completed(self):
+        """on_complete sees each successful job before it is marked completed."""
+        seen = []
+        mgr = AnalysisJobManager(
+            max_workers=2,
+            executor_factory=ThreadPoolExecutor,
+            on_complete=lambda job: seen.append((job.symbol, job.status)),
+        )
+        try:
+            job = _wait(mgr, mgr.submit("hmm", echo_job, "aapl", "1Min"))
+            _wait(mgr, mgr.submit("hmm", failing_job, "MSFT", "1Min"))
+        finally:
+            mgr.shutdown()
+
+        assert job.status == JOB_COMPLETED
+        assert [symbol for symbol, _ in seen] == ["AAPL"]
+        assert seen[0][1] != JOB_COMPLETED
+
+    def test_default_manager_invalidates_symbol_cache(self, monkeypatch):
+        """Background jobs drop the symbol's cached API responses on completion."""
+        monkeypatch.setattr(analysis_jobs, "_default_manager", None)
+        mgr = analysis_jobs.get_analysis_job_manager()
+        mgr._executor_factory = ThreadPoolExecutor
+        set_cached_data("regimes:AAPL:1Min", {"stale": True})
+        set_cached_data("regimes:MSFT:1Min", {"stale": True})
+        try:
+            _wait(mgr, mgr.submit("hmm", echo_job, "AAPL", "1Min"))
+        finally:
+            analysis_jobs.shutdown_analysis_job_manager()
+
+        assert get_cached_data("regimes:AAPL:1Min") is None
+        assert get_cached_data("regimes:MSFT:1Min") == {"stale": True}
+        clear_all_cache()
+
+    def test_process_pool(self):
+        """The default spawn process pool runs jobs and relays progress."""
+        mgr = AnalysisJobManager(max_workers=1)
+        try:
+            job = _wait(mgr, mgr.submit("hmm", echo_job, "AAPL", "1Min"))
+        finally:
+            mgr.shutdown()
+
+        assert job.status == JOB_COMPLETED
+        assert job.result == {"symbol": "AAPL"}
+
+
+class TestAnalysisEndpoints:
+    """Tests for the analysis job endpoints."""
+
+    @pytest.fixture()
+    def client(self, manager, monkeypatch):
+        monkeypatch.setattr(analysis, "get_analysis_job_manager", lambda: manager)
+        monkeypatch.setattr(analysis, "run_hmm_analysis", blocking_job)
+        app = FastAPI()
+        app.include_router(analysis.router)
+        app.dependency_overrides[get_current_user] = lambda: 1
+        yield TestClient(app)
+
+    def test_background_then_poll(self, client):
+        """background=true returns a job ID that can be polled to completion."""
+        resp = client.post("/api/analyze/AAPL", params={"timeframe": "1Day", "background": True})
+        assert resp.status_code == 202
+        job_id = resp.json()["job_id"]
+
+        RELEASE.set()
+        for _ in range(200):
+            status = client.get(f"/api/analyze/jobs/{job_id}").json()
+            if status["status"] == JOB_COMPLETED:
+                break
+            threading.Event().wait(0.01)
+
+        assert status["result"] == {"symbol": "AAPL", "timeframe": "1Day"}
+        assert [j["job_id"] for j in client.get("/api/analyze/jobs").json()] == [job_id]
+
+    def test_invalid_timeframe_rejected_before_submit(self, client, manager):
+        resp = client.post("/api/analyze/AAPL", params={"timeframe": "2Min"})
+        assert resp.status_code == 400
+        assert manager.list_jobs() == []
+
+    def test_unknown_job(self, client):
+        assert client.get("/api/analyze/jobs/missing").status_code == 404
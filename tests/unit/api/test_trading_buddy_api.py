@@ -0,0 +1,50 @@
+"""Tests for the Trading Buddy context endpoints."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.api import trading_buddy
+
+
+@pytest.fixture()
+def reader():
+    """Patch the default market data reader used by new context builders."""
+    index = pd.date_range("2024-01-01", periods=30, freq="D", name="timestamp")
+    close = np.linspace(100.0, 130.0, len(index))
+    bars = pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1000},
+        index=index,
+    )
+    mock_reader = MagicMock()
+    mock_reader.get_bars.return_value = bars
+    mock_reader.get_features.return_value = pd.DataFrame()
+
+    trading_buddy._get_context_builder.cache_clear()
+    with patch("src.evaluators.context.RepositoryMarketDataReader", return_value=mock_reader):
+        yield mock_reader
+    trading_buddy._get_context_builder.cache_clear()
+
+
+class TestContextBuilderSharing:
+    """Context builders (and their caches) are shared across requests."""
+
+    def test_factory_returns_shared_builder(self, reader):
+        first = trading_buddy._get_context_builder(include_regimes=False)
+        second = trading_buddy._get_context_builder(include_regimes=False)
+
+        assert first is second
+        assert trading_buddy._get_context_builder(ensure_fresh_data=True) is not first
+
+    def test_repeated_requests_fetch_once(self, reader):
+        first = asyncio.run(trading_buddy.get_key_levels(symbol="AAPL", timeframe="1Day"))
+        calls = reader.get_bars.call_count
+
+        second = asyncio.run(trading_buddy.get_key_levels(symbol="AAPL", timeframe="1Day"))
+
+        assert calls == 1
+        assert reader.get_bars.call_count == calls
+        assert second == first
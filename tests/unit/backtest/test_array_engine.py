@@ -0,0 +1,170 @@
+"""Tests for the array-backed backtesting engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.array_engine import AlignedBars, ArrayBacktestEngine
+from src.backtest.engine import (
+    BacktestConfig,
+    BacktestEngine,
+    Signal,
+    SignalDirection,
+)
+
+
+class CyclingStrategy:
+    """Opens and closes positions on a fixed bar cadence per symbol."""
+
+    def __init__(self, direction: SignalDirection = SignalDirection.LONG, size: float = 0.0):
+        self._direction = direction
+        self._size = size
+        self.seen_states: list = []
+
+    def generate_signals(self, features, timestamp, state=None, **kwargs):
+        self.seen_states.append(None if state is None else float(np.sum(state)))
+        n = len(features)
+
+        if n % 37 == 1:
+            return [Signal(timestamp, "default", self._direction, strength=0.3, size=self._size)]
+        if n % 37 == 20:
+            return [Signal(timestamp, "default", SignalDirection.FLAT)]
+        if n % 53 == 7:
+            opposite = SignalDirection.SHORT if self._direction == SignalDirection.LONG else SignalDirection.LONG
+            return [Signal(timestamp, "default", opposite, strength=0.2)]
+        return []
+
+
+class PositionStrategy:
+    """Strategy using the ArrayStrategy positional protocol."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_signals(self, features, timestamp, state=None, **kwargs):
+        raise AssertionError("array engine should call generate_signals_at")
+
+    def generate_signals_at(self, features, position, timestamp, state=None):
+        self.calls += 1
+        if position % 50 == 0:
+            return [Signal(timestamp, "default", SignalDirection.LONG, strength=0.5)]
+        if position % 50 == 25:
+            return [Signal(timestamp, "default", SignalDirection.FLAT)]
+        return []
+
+
+def _multi_symbol_data() -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(7)
+    frames = {}
+    full_index = pd.date_range("2024-01-02 09:30", periods=600, freq="1min")
+    for k, symbol in enumerate(["AAPL", "MSFT", "SPY"]):
+        keep = rng.random(len(full_index)) > 0.1 * k
+        index = full_index[keep]
+        close = 100 * (k + 1) * np.exp(np.cumsum(rng.normal(0, 0.001, len(index))))
+        open_ = np.r_[close[0], close[:-1]]
+        frames[symbol] = pd.DataFrame({
+            "open": open_,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": rng.integers(1000, 5000, len(index)),
+        }, index=index)
+    return frames
+
+
+def _assert_same_result(expected, actual):
+    pd.testing.assert_series_equal(expected.equity_curve, actual.equity_curve, check_freq=False)
+    assert [t.to_dict() for t in expected.trades] == [t.to_dict() for t in actual.trades]
+    assert len(expected.signals) == len(actual.signals)
+    assert [(s.timestamp, s.symbol, s.direction) for s in expected.signals] == [
+        (s.timestamp, s.symbol, s.direction) for s in actual.signals
+    ]
+    assert expected.positions_history == actual.positions_history
+    assert expected.metrics.to_dict() == actual.metrics.to_dict()
+
+
+class TestAlignedBars:
+    """Tests for timeline alignment."""
+
+    def test_union_timeline_and_rows(self):
+        """Symbols are aligned onto the sorted union of their timestamps."""
+        index = pd.date_range("2024-01-01", periods=4, freq="1min")
+        a = pd.DataFrame({"open": [1.0, 2, 3, 4], "close": [1.5, 2.5, 3.5, 4.5]}, index=index)
+        b = pd.DataFrame({"open": [10.0, 30], "close": [11.0, 31]}, index=index[[0, 2]])
+
+        bars = AlignedBars.from_frames({"A": a, "B": b})
+
+        assert list(bars.timeline) == list(index)
+        assert bars.data_rows[:, 1].tolist() == [0, -1, 1, -1]
+        assert bars.present[:, 1].tolist() == [True, False, True, False]
+        assert bars.close[2, 1] == 31.0
+        assert np.isnan(bars.open[1, 1])
+
+
+class TestArrayEngineParity:
+    """The array engine must reproduce the event-driven engine exactly."""
+
+    def test_single_symbol_parity(self, sample_ohlcv_data):
+        """Matches event engine on single-symbol data."""
+        expected = BacktestEngine().run(sample_ohlcv_data, CyclingStrategy())
+        actual = ArrayBacktestEngine().run(sample_ohlcv_data, CyclingStrategy())
+        _assert_same_result(expected, actual)
+
+    def test_parity_with_features(self, sample_ohlcv_data, sample_features):
+        """Feature frames with missing leading rows skip the same bars."""
+        expected = BacktestEngine().run(
+            sample_ohlcv_data, CyclingStrategy(), features=sample_features,
+        )
+        actual = ArrayBacktestEngine().run(
+            sample_ohlcv_data, CyclingStrategy(), features=sample_features,
+        )
+        _assert_same_result(expected, actual)
+
+    def test_parity_with_states(self, sample_ohlcv_data):
+        """States are looked up by each symbol's own row."""
+        states = {"AAPL": np.arange(800 * 2, dtype=float).reshape(800, 2)}
+        expected_strategy = CyclingStrategy()
+        actual_strategy = CyclingStrategy()
+        BacktestEngine().run(sample_ohlcv_data, expected_strategy, states=states)
+        ArrayBacktestEngine().run(sample_ohlcv_data, actual_strategy, states=states)
+        assert expected_strategy.seen_states == actual_strategy.seen_states
+
+    @pytest.mark.parametrize("fill_on_next_bar", [True, False])
+    @pytest.mark.parametrize("fractional", [True, False])
+    def test_multi_symbol_parity(self, fill_on_next_bar, fractional):
+        """Misaligned multi-symbol data yields identical results."""
+        data = _multi_symbol_data()
+        config = BacktestConfig(
+            fill_on_next_bar=fill_on_next_bar,
+            allow_fractional_shares=fractional,
+            max_position_pct=0.5,
+        )
+        expected = BacktestEngine(config).run(data, CyclingStrategy(SignalDirection.SHORT))
+        actual = ArrayBacktestEngine(config).run(data, CyclingStrategy(SignalDirection.SHORT))
+        _assert_same_result(expected, actual)
+
+    def test_final_positions_match(self):
+        """Open positions after the run match the event engine."""
+        data = _multi_symbol_data()
+        expected_engine = BacktestEngine()
+        actual_engine = ArrayBacktestEngine()
+        expected_engine.run(data, CyclingStrategy(size=2000.0))
+        actual_engine.run(data, CyclingStrategy(size=2000.0))
+
+        assert actual_engine.cash == expected_engine.cash
+        assert list(actual_engine.positions) == list(expected_engine.positions)
+        for symbol, pos in expected_engine.positions.items():
+            assert actual_engine.positions[symbol].quantity == pos.quantity
+            assert actual_engine.positions[symbol].entry_time == pos.entry_time
+
+
+class TestArrayStrategyProtocol:
+    """Tests for the positional strategy protocol."""
+
+    def test_generate_signals_at_is_used(self, sample_ohlcv_data):
+        """Strategies with generate_signals_at receive row positions."""
+        strategy = PositionStrategy()
+        result = ArrayBacktestEngine().run(sample_ohlcv_data, strategy)
+
+        assert strategy.calls == len(sample_ohlcv_data["AAPL"])
+        assert len(result.trades) > 0
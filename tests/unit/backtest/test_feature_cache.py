@@ -0,0 +1,84 @@
+"""Tests for the walk-forward feature cache."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.feature_cache import FeatureLeakageError, WindowFeatureCache, slice_window
+
+
+def causal_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Rolling and EWM features that only look backwards."""
+    r1 = np.log(df["close"] / df["close"].shift(1))
+    return pd.DataFrame({
+        "r1": r1,
+        "rv_15": r1.rolling(15).std(),
+        "ema_10": df["close"].ewm(span=10, adjust=False).mean(),
+    }, index=df.index).dropna()
+
+
+def centered_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Leaky feature: centered rolling mean uses future bars."""
+    return pd.DataFrame({
+        "ma_c": df["close"].rolling(11, center=True, min_periods=1).mean(),
+    }, index=df.index)
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    index = pd.date_range("2024-01-02 09:30", periods=500, freq="1min")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, len(index))))
+    return pd.DataFrame({"open": close, "high": close, "low": close, "close": close, "volume": 1.0}, index=index)
+
+
+class TestWindowFeatureCache:
+    """Tests for WindowFeatureCache."""
+
+    def test_slice_matches_full_history(self, ohlcv):
+        """Window slices are the full-history rows in [start, end)."""
+        cache = WindowFeatureCache(causal_features, lookback_bars=15)
+        cache.build({"AAPL": ohlcv})
+
+        start, end = datetime(2024, 1, 2, 11, 0), datetime(2024, 1, 2, 12, 0)
+        window = cache.slice("AAPL", start, end)
+
+        assert window.index[0] == pd.Timestamp(start)
+        assert window.index[-1] < pd.Timestamp(end)
+        assert len(window) == 60
+        pd.testing.assert_frame_equal(window, cache.features["AAPL"].loc[start:"2024-01-02 11:59"])
+
+    def test_window_start_has_lookback(self, ohlcv):
+        """Rows at a window start use bars before it instead of NaN warmup."""
+        cache = WindowFeatureCache(causal_features, lookback_bars=15)
+        cache.build({"AAPL": ohlcv})
+
+        start, end = datetime(2024, 1, 2, 10, 0), datetime(2024, 1, 2, 11, 0)
+        per_window = causal_features(slice_window(ohlcv, start, end))
+        cached = cache.slice("AAPL", start, end)
+
+        assert len(cached) > len(per_window)
+        assert not cached.isna().any().any()
+
+    def test_causal_pipeline_passes_guard(self, ohlcv):
+        """Backward-looking features pass the leakage guard."""
+        cache = WindowFeatureCache(causal_features, lookback_bars=15)
+        cache.verify_boundary(ohlcv, "AAPL", datetime(2024, 1, 2, 13, 0))
+
+    def test_leaky_pipeline_fails_guard(self, ohlcv):
+        """Features that read future bars are rejected."""
+        cache = WindowFeatureCache(centered_features, lookback_bars=11)
+        with pytest.raises(FeatureLeakageError, match="ma_c"):
+            cache.verify_boundary(ohlcv, "AAPL", datetime(2024, 1, 2, 13, 0))
+
+    def test_tz_aware_index(self, ohlcv):
+        """Naive window bounds are localized to the index timezone."""
+        tz_ohlcv = ohlcv.tz_localize("America/New_York")
+        cache = WindowFeatureCache(causal_features)
+        cache.build({"AAPL": tz_ohlcv})
+
+        window = cache.slice("AAPL", datetime(2024, 1, 2, 11, 0), datetime(2024, 1, 2, 12, 0))
+        assert len(window) == 60
+        assert window.index.tz is not None
@@ -244,3 +244,94 @@ class TestWalkForwardValidator:
 
         with pytest.raises(ValueError, match="No valid windows"):
             validator.run(short_data, strategy_factory=SimpleStrategy)
+
+
+class TestParallelWalkForward:
+    """Tests for the process-pool executor."""
+
+    def test_invalid_executor_raises(self):
+        """Unknown executor names are rejected."""
+        with pytest.raises(ValueError, match="executor"):
+            WalkForwardConfig(executor="threads")
+
+    def test_process_executor_matches_serial(self, long_ohlcv_data):
+        """Parallel windows produce the same results, in window order."""
+        params = dict(train_period_days=60, test_period_days=30, step_days=30)
+
+        serial = WalkForwardValidator(WalkForwardConfig(**params)).run(
+            long_ohlcv_data, strategy_factory=SimpleStrategy,
+        )
+        parallel = WalkForwardValidator(
+            WalkForwardConfig(executor="process", max_workers=2, **params)
+        ).run(long_ohlcv_data, strategy_factory=SimpleStrategy)
+
+        assert [w.window_id for w in parallel.windows] == [w.window_id for w in serial.windows]
+        for expected, actual in zip(serial.windows, parallel.windows):
+            pd.testing.assert_series_equal(
+                expected.test_result.equity_curve, actual.test_result.equity_curve,
+            )
+            assert len(expected.train_result.trades) == len(actual.train_result.trades)
+        pd.testing.assert_series_equal(serial.combined_equity, parallel.combined_equity)
+        assert serial.combined_metrics.to_dict() == parallel.combined_metrics.to_dict()
+
+
+def close_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Causal feature pipeline for walk-forward cache tests."""
+    out = df.copy()
+    out["r1"] = np.log(df["close"] / df["close"].shift(1))
+    out["rv_5"] = out["r1"].rolling(5).std()
+    return out.dropna()
+
+
+def leaky_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Feature pipeline that peeks at the next bar."""
+    out = df.copy()
+    out["next_r1"] = np.log(df["close"].shift(-1) / df["close"])
+    return out
+
+
+class TestWalkForwardFeatureCache:
+    """Tests for reuse_features."""
+
+    PARAMS = dict(train_period_days=60, test_period_days=30, step_days=30)
+
+    def test_cache_featurizes_each_symbol_once(self, long_ohlcv_data):
+        """The pipeline runs once per symbol plus leakage probes, not per window."""
+        calls = []
+
+        def counting_features(df):
+            calls.append(len(df))
+            return close_features(df)
+
+        config = WalkForwardConfig(reuse_features=True, verify_feature_leakage=False, **self.PARAMS)
+        result = WalkForwardValidator(config).run(
+            long_ohlcv_data, strategy_factory=SimpleStrategy, feature_pipeline=counting_features,
+        )
+
+        assert calls == [len(long_ohlcv_data["AAPL"])]
+        assert len(result.windows) > 1
+
+    def test_leaky_pipeline_raises(self, long_ohlcv_data):
+        """Leakage guard rejects pipelines that read bars after a window end."""
+        from src.backtest.feature_cache import FeatureLeakageError
+
+        config = WalkForwardConfig(reuse_features=True, feature_lookback_bars=5, **self.PARAMS)
+        with pytest.raises(FeatureLeakageError):
+            WalkForwardValidator(config).run(
+                long_ohlcv_data, strategy_factory=SimpleStrategy, feature_pipeline=leaky_features,
+            )
+
+    def test_cached_process_executor_matches_serial(self, long_ohlcv_data):
+        """Cached features give identical results on the process pool."""
+        serial = WalkForwardValidator(
+            WalkForwardConfig(reuse_features=True, feature_lookback_bars=5, **self.PARAMS)
+        ).run(long_ohlcv_data, strategy_factory=SimpleStrategy, feature_pipeline=close_features)
+        parallel = WalkForwardValidator(
+            WalkForwardConfig(
+                reuse_features=True, feature_lookback_bars=5,
+                executor="process", max_workers=2, **self.PARAMS,
+            )
+        ).run(long_ohlcv_data, strategy_factory=SimpleStrategy, feature_pipeline=close_features)
+
+        pd.testing.assert_series_equal(serial.combined_equity, parallel.combined_equity)
+        assert serial.combined_metrics.to_dict() == parallel.combined_metrics.to_dict()
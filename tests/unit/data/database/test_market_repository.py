@@ -1,7 +1,9 @@
 """Unit tests for OHLCV repository."""
 
+import struct
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pandas as pd
 import pytest
 from unittest.mock import MagicMock, patch
@@ -14,7 +16,8 @@ from src.data.database.models import (
     VALID_TIMEFRAMES,
     VALID_SOURCES,
 )
-from src.data.database.market_repository import OHLCVRepository
+from src.data.database.market_repository import OHLCVRepository, encode_bars_copy_binary
+from src.data.feature_store import ColumnarFeatureStore
 
 
 @pytest.fixture
@@ -59,6 +62,21 @@ def sample_ohlcv_df():
     )
 
 
+def _make_bars(n: int) -> pd.DataFrame:
+    """Create ``n`` minute bars with valid OHLC relationships."""
+    close = 100 + np.cumsum(np.full(n, 0.01))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 0.5,
+            "low": close - 0.5,
+            "close": close,
+            "volume": np.full(n, 1000),
+        },
+        index=pd.date_range("2024-01-01 09:30", periods=n, freq="1min"),
+    )
+
+
 class TestTickerOperations:
     """Tests for ticker-related operations."""
 
@@ -237,6 +255,33 @@ class TestOHLCVBarOperations:
         assert result == 5
         mock_session.execute.assert_called_once()
 
+    def test_bulk_insert_bars_chunks_large_frames(self, repository, mock_session):
+        """Large frames are split so each INSERT stays under the parameter limit."""
+        df = _make_bars(12_000)
+        mock_session.execute.return_value.rowcount = 4_000
+
+        result = repository.bulk_insert_bars(df, 1, "1Min", "alpaca")
+
+        assert mock_session.execute.call_count == 3
+        assert result == 12_000
+
+    def test_bulk_insert_bars_uses_copy_on_psycopg2(self, repository, mock_session):
+        """Large frames on psycopg2 are COPYed into staging and merged per chunk."""
+        df = _make_bars(12_000)
+        dialect = mock_session.get_bind.return_value.dialect
+        dialect.name, dialect.driver = "postgresql", "psycopg2"
+        cursor = mock_session.connection.return_value.connection.cursor.return_value.__enter__.return_value
+        cursor.rowcount = 5_000
+
+        result = repository.bulk_insert_bars(df, 7, "1Min", "alpaca", chunk_rows=5_000)
+
+        assert cursor.copy_expert.call_count == 3
+        merges = [c for c in cursor.execute.call_args_list if "INSERT INTO ohlcv_bars" in c[0][0]]
+        assert len(merges) == 3
+        assert merges[0][0][1] == (7, "1Min", "alpaca")
+        assert result == 15_000
+        mock_session.execute.assert_not_called()
+
     def test_delete_bars_returns_zero_when_ticker_not_found(self, repository, mock_session):
         """Test that delete_bars returns 0 when ticker not found."""
         mock_session.query.return_value.filter.return_value.first.return_value = None
@@ -246,6 +291,128 @@ class TestOHLCVBarOperations:
         assert result == 0
 
 
+class TestCopyEncoding:
+    """Tests for the binary COPY payload."""
+
+    def test_payload_layout(self, sample_ohlcv_df):
+        payload = encode_bars_copy_binary(sample_ohlcv_df)
+
+        assert payload[:11] == b"PGCOPY\n\xff\r\n\x00"
+        assert struct.unpack("!ii", payload[11:19]) == (0, 0)
+        assert struct.unpack("!h", payload[-2:]) == (-1,)
+
+        body = payload[19:-2]
+        assert len(body) == len(sample_ohlcv_df) * (2 + 6 * 12)
+        fields, ts_len, ts, open_len, open_ = struct.unpack("!hiqid", body[:26])
+        assert (fields, ts_len, open_len) == (6, 8, 8)
+        assert open_ == 100.0
+        # timestamptz is microseconds since 2000-01-01 UTC
+        assert ts == (pd.Timestamp("2024-01-01 09:30") - pd.Timestamp("2000-01-01")) // pd.Timedelta("1us")
+
+    def test_payload_volume(self, sample_ohlcv_df):
+        body = encode_bars_copy_binary(sample_ohlcv_df)[19:-2]
+        tuple_size = 2 + 6 * 12
+        volumes = [
+            struct.unpack("!q", body[i * tuple_size + tuple_size - 8:(i + 1) * tuple_size])[0]
+            for i in range(len(sample_ohlcv_df))
+        ]
+        assert volumes == sample_ohlcv_df["volume"].tolist()
+
+
+class TestFeatureOperations:
+    """Tests for feature storage operations."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return ColumnarFeatureStore(tmp_path / "features")
+
+    @pytest.fixture
+    def features_df(self, sample_ohlcv_df):
+        return pd.DataFrame(
+            {"r1": [0.1, 0.2, float("nan"), 0.4, 0.5], "clv": [1.0, 2.0, 3.0, 4.0, 5.0]},
+            index=sample_ohlcv_df.index,
+        )
+
+    def _mock_bars(self, mock_session, index):
+        bars = [MagicMock(timestamp=ts, id=i + 1) for i, ts in enumerate(index)]
+        mock_session.query.return_value.filter.return_value.all.return_value = bars
+        mock_session.query.return_value.filter.return_value.scalar.return_value = "AAPL"
+        mock_session.execute.return_value.rowcount = len(bars)
+
+    def test_store_features_as_json(self, repository, mock_session, features_df):
+        self._mock_bars(mock_session, features_df.index)
+
+        result = repository.store_features(features_df, ticker_id=1, timeframe="1Min")
+
+        assert result == 5
+        params = mock_session.execute.call_args[0][0].compile().params
+        assert params["features_m2"] == {"clv": 3.0}
+
+    def test_store_features_skips_missing_bars(self, repository, mock_session, features_df):
+        self._mock_bars(mock_session, features_df.index[:2])
+
+        repository.store_features(features_df, ticker_id=1, timeframe="1Min")
+
+        params = mock_session.execute.call_args[0][0].compile().params
+        assert "bar_id_m1" in params and "bar_id_m2" not in params
+
+    def test_store_features_writes_columnar_store_and_json(self, mock_session, store, features_df):
+        repository = OHLCVRepository(mock_session, feature_store=store)
+        self._mock_bars(mock_session, features_df.index)
+
+        repository.store_features(features_df, ticker_id=1, timeframe="1Min", version="v2.0")
+
+        params = mock_session.execute.call_args[0][0].compile().params
+        assert params["features_m0"] == {"r1": 0.1, "clv": 1.0}
+        stored = store.read("AAPL", "1Min", version="v2.0")
+        assert stored["clv"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_get_features_reads_columnar_store(self, mock_session, store, features_df):
+        repository = OHLCVRepository(mock_session, feature_store=store)
+        store.write("AAPL", "1Min", features_df)
+
+        result = repository.get_features("aapl", "1Min", end=features_df.index[1], columns=["clv"])
+
+        assert list(result.columns) == ["clv"]
+        assert result["clv"].tolist() == [1.0, 2.0]
+        mock_session.query.assert_not_called()
+
+    def test_get_features_falls_back_to_json(self, mock_session, store):
+        repository = OHLCVRepository(mock_session, feature_store=store)
+        rows = [
+            (datetime(2024, 1, 1, 9, 31), {"r1": 0.2}),
+            (datetime(2024, 1, 1, 9, 30), {"r1": 0.1, "clv": 1.0}),
+        ]
+        mock_session.query.return_value.join.return_value.filter.return_value.order_by.return_value.all.return_value = rows
+
+        result = repository.get_features("AAPL", "1Min")
+
+        assert result["r1"].tolist() == [0.1, 0.2]
+        assert result.index.name == "timestamp"
+
+    def test_migrate_keeps_json_by_default(self, mock_session, store):
+        repository = OHLCVRepository(mock_session, feature_store=store)
+        mock_session.query.return_value.filter.return_value.scalar.return_value = "AAPL"
+        rows = [
+            MagicMock(id=1, timestamp=datetime(2024, 1, 1, 9, 30), features={"clv": 1.0}, feature_version=None),
+            MagicMock(id=2, timestamp=datetime(2024, 1, 1, 9, 31), features={"clv": 2.0}, feature_version=None),
+        ]
+        query = mock_session.query.return_value.filter.return_value
+        query.order_by.return_value.limit.return_value.all.return_value = rows
+
+        migrated = repository.migrate_features_to_store(1, "1Min", batch_size=10)
+
+        assert migrated == 2
+        assert store.read("AAPL", "1Min")["clv"].tolist() == [1.0, 2.0]
+        query.filter.return_value.update.assert_not_called()
+        query.update.assert_not_called()
+
+    def test_migrate_requires_feature_store(self, repository):
+        repository.feature_store = None
+        with pytest.raises(ValueError, match="feature store"):
+            repository.migrate_features_to_store(1, "1Min")
+
+
 class TestSyncLogOperations:
     """Tests for sync log operations."""
 
@@ -34,11 +34,13 @@ def mock_alpaca_client(sample_bars_df):
         client_instance = MagicMock()
 
         def _make_response(request):
-            """Return a response that matches any requested symbol."""
-            symbol = request.symbol_or_symbols
+            """Return the sample bars for every requested symbol."""
+            symbols = request.symbol_or_symbols
+            if isinstance(symbols, str):
+                symbols = [symbols]
             resp = MagicMock()
-            resp.df = sample_bars_df
-            resp.data = {symbol: [MagicMock()]}
+            resp.df = pd.concat({s: sample_bars_df for s in symbols}, names=["symbol", "timestamp"])
+            resp.data = {s: [MagicMock()] for s in symbols}
             return resp
 
         client_instance.get_stock_bars.side_effect = _make_response
@@ -0,0 +1,102 @@
+"""Tests for the columnar feature store."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.feature_store import ColumnarFeatureStore
+
+
+@pytest.fixture
+def store(tmp_path) -> ColumnarFeatureStore:
+    """Create a store rooted in a temporary directory."""
+    return ColumnarFeatureStore(tmp_path / "features")
+
+
+@pytest.fixture
+def features_df() -> pd.DataFrame:
+    """Two sessions of minute features with a few NaNs."""
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2024-01-02 14:30", periods=390, freq="1min").append(
+        pd.date_range("2024-01-03 14:30", periods=390, freq="1min")
+    )
+    df = pd.DataFrame(
+        rng.normal(size=(len(index), 3)), index=index, columns=["r1", "rv_60", "clv"],
+    )
+    df.iloc[:60, 1] = np.nan
+    return df
+
+
+class TestColumnarFeatureStore:
+    """Tests for ColumnarFeatureStore."""
+
+    def test_round_trip_as_float32(self, store, features_df):
+        assert store.write("aapl", "1Min", features_df, version="v2.0") == len(features_df)
+
+        result = store.read("AAPL", "1Min")
+
+        assert list(result.columns) == ["r1", "rv_60", "clv"]
+        assert all(dtype == np.float32 for dtype in result.dtypes)
+        assert str(result.index.tz) == "UTC"
+        assert result.index.equals(features_df.index.tz_localize("UTC"))
+        np.testing.assert_array_equal(
+            result.to_numpy(), features_df.to_numpy(dtype=np.float32),
+        )
+
+    def test_partitions_by_day(self, store, features_df):
+        store.write("AAPL", "1Min", features_df, version="v2.0")
+
+        files = sorted(p.parent.name for p in store.root.rglob("data.parquet"))
+        assert files == ["date=2024-01-02", "date=2024-01-03"]
+
+    def test_read_range_is_inclusive(self, store, features_df):
+        store.write("AAPL", "1Min", features_df)
+        start, end = features_df.index[380], features_df.index[400]
+
+        result = store.read("AAPL", "1Min", start=start, end=end)
+
+        assert len(result) == 21
+        assert result.index[0] == pd.Timestamp(start, tz="UTC")
+        assert result.index[-1] == pd.Timestamp(end, tz="UTC")
+
+    def test_write_replaces_rows_and_adds_columns(self, store, features_df):
+        store.write("AAPL", "1Min", features_df)
+        ts = features_df.index[[5]]
+        store.write("AAPL", "1Min", pd.DataFrame({"r1": [9.0], "new": [1.0]}, index=ts))
+
+        result = store.read("AAPL", "1Min")
+
+        assert len(result) == len(features_df)
+        assert list(result.columns) == ["r1", "rv_60", "clv", "new"]
+        assert result["r1"].iloc[5] == 9.0
+        assert np.isnan(result["clv"].iloc[5])
+        assert result["new"].isna().sum() == len(features_df) - 1
+
+    def test_column_subset_fills_missing_with_nan(self, store, features_df):
+        store.write("AAPL", "1Min", features_df)
+
+        result = store.read("AAPL", "1Min", columns=["clv", "missing"])
+
+        assert list(result.columns) == ["clv", "missing"]
+        assert result["missing"].isna().all()
+
+    def test_versions_and_latest(self, store, features_df):
+        store.write("AAPL", "1Min", features_df.iloc[:10], version="v1")
+        store.write("AAPL", "1Min", features_df.iloc[:20], version="v2")
+
+        assert store.list_versions("AAPL", "1Min") == ["v1", "v2"]
+        assert store.latest_version("AAPL", "1Min") == "v2"
+        assert len(store.read("AAPL", "1Min")) == 20
+        assert len(store.read("AAPL", "1Min", version="v1")) == 10
+
+    def test_timestamps(self, store, features_df):
+        store.write("AAPL", "1Min", features_df)
+
+        timestamps = store.timestamps("AAPL", "1Min", end=features_df.index[9])
+
+        assert timestamps.equals(features_df.index[:10].tz_localize("UTC"))
+
+    def test_missing_symbol(self, store):
+        assert not store.has_features("MSFT", "1Min")
+        assert store.read("MSFT", "1Min").empty
+        assert store.timestamps("MSFT", "1Min").empty
@@ -0,0 +1,272 @@
+"""Tests for the data-service gRPC client bar transfer."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import grpc
+import numpy as np
+import pandas as pd
+import pytest
+
+from proto.gen.python.market.v1 import bar_pb2, ticker_pb2
+from src.data.grpc_client import MarketDataGrpcClient, bars_to_columns, columns_to_bars, _dt_to_pb
+
+
+class _Unimplemented(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNIMPLEMENTED
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    """Bars spanning several pages."""
+    rng = np.random.default_rng(1)
+    n = 450
+    close = 100 + np.cumsum(rng.normal(0, 0.1, n))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 0.25,
+            "low": close - 0.25,
+            "close": close,
+            "volume": rng.integers(100, 5000, n),
+        },
+        index=pd.date_range("2024-01-02 14:30", periods=n, freq="1min"),
+    )
+
+
+def _page_bounds(req, bars: pd.DataFrame) -> tuple[int, int]:
+    """Locate the page a GetBarsRequest asks for (page token = last timestamp)."""
+    lo = 0
+    if req.page_token:
+        lo = int(bars.index.searchsorted(pd.Timestamp(req.page_token), side="right"))
+    return lo, min(lo + req.page_size, len(bars))
+
+
+def _next_token(bars: pd.DataFrame, hi: int, page_size: int, count: int) -> str:
+    return bars.index[hi - 1].isoformat() if count == page_size else ""
+
+
+class _FakeStream:
+    """Server-streaming call over a list of messages."""
+
+    def __init__(self, messages):
+        self._messages = iter(messages)
+        self.cancelled = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._messages)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def _to_pb_bars(bars: pd.DataFrame) -> list:
+    return [
+        bar_pb2.OHLCVBar(
+            timestamp=_dt_to_pb(ts.to_pydatetime()),
+            open=row.open, high=row.high, low=row.low, close=row.close,
+            volume=int(row.volume),
+        )
+        for ts, row in zip(bars.index, bars.itertuples())
+    ]
+
+
+def _fake_client(bars: pd.DataFrame, columnar: bool = True) -> MarketDataGrpcClient:
+    """Client whose stub serves ``bars`` through the paged and streaming bar RPCs."""
+    client = MarketDataGrpcClient(MagicMock())
+    client.stub = MagicMock()
+    client.stub.GetTicker.return_value = ticker_pb2.GetTickerResponse(
+        ticker=ticker_pb2.Ticker(id=3, symbol="AAPL"),
+    )
+
+    def get_bars(req):
+        lo, hi = _page_bounds(req, bars)
+        page = bars.iloc[lo:hi]
+        return bar_pb2.GetBarsResponse(
+            bars=_to_pb_bars(page),
+            next_page_token=_next_token(bars, hi, req.page_size, len(page)),
+        )
+
+    def get_bars_columnar(req):
+        if not columnar:
+            raise _Unimplemented()
+        lo, hi = _page_bounds(req, bars)
+        return bar_pb2.GetBarsColumnarResponse(
+            columns=bars_to_columns(bars.iloc[lo:hi]),
+            next_page_token=_next_token(bars, hi, req.page_size, hi - lo),
+        )
+
+    client.streams = []
+
+    def stream_bars(req):
+        stream = _FakeStream(_to_pb_bars(bars))
+        client.streams.append(stream)
+        return stream
+
+    client.stub.GetBars.side_effect = get_bars
+    client.stub.GetBarsColumnar.side_effect = get_bars_columnar
+    client.stub.StreamBars.side_effect = stream_bars
+    client.stub.GetBarCount.return_value = bar_pb2.GetBarCountResponse(count=len(bars))
+    return client
+
+
+class TestBarColumns:
+    """Tests for the column buffer encoding."""
+
+    def test_round_trip(self, bars):
+        result = columns_to_bars([bars_to_columns(bars)])
+        pd.testing.assert_frame_equal(result, bars, check_freq=False)
+
+    def test_pages_concatenate(self, bars):
+        pages = [bars_to_columns(bars.iloc[:100]), bars_to_columns(bars.iloc[100:])]
+        result = columns_to_bars(pages)
+        np.testing.assert_array_equal(result.index.values, bars.index.values)
+        np.testing.assert_array_equal(result["volume"].to_numpy(), bars["volume"].to_numpy())
+
+
+class TestGetBars:
+    """Tests for MarketDataGrpcClient.get_bars."""
+
+    def test_columnar_matches_row_path(self, bars, monkeypatch):
+        monkeypatch.setattr("src.data.grpc_client._COLUMNAR_PAGE_SIZE", 200)
+        columnar = _fake_client(bars).get_bars("AAPL", "1Min")
+        rows = _fake_client(bars, columnar=False).get_bars("AAPL", "1Min")
+
+        pd.testing.assert_frame_equal(columnar, rows)
+        assert len(columnar) == len(bars)
+        assert columnar.index.tz is None
+
+    def test_columnar_pages(self, bars, monkeypatch):
+        monkeypatch.setattr("src.data.grpc_client._COLUMNAR_PAGE_SIZE", 200)
+        client = _fake_client(bars)
+
+        client.get_bars("AAPL", "1Min", start=datetime(2024, 1, 2))
+
+        assert client.stub.GetBarsColumnar.call_count == 3
+        client.stub.GetBars.assert_not_called()
+        assert client.stub.GetBarsColumnar.call_args_list[0][0][0].HasField("start")
+
+    def test_limit(self, bars):
+        result = _fake_client(bars).get_bars("AAPL", "1Min", limit=10)
+        assert len(result) == 10
+        assert result.index[-1] == bars.index[9]
+
+    def test_falls_back_when_unimplemented(self, bars):
+        client = _fake_client(bars, columnar=False)
+
+        first = client.get_bars("AAPL", "1Min")
+        client.get_bars("AAPL", "1Min")
+
+        assert len(first) == len(bars)
+        assert client.stub.GetBarsColumnar.call_count == 1
+
+    def test_missing_ticker(self):
+        client = MarketDataGrpcClient(MagicMock())
+        client.get_ticker = MagicMock(return_value=None)
+        assert list(client.get_bars("ZZZZ", "1Min").columns) == ["open", "high", "low", "close", "volume"]
+
+
+class TestStreamBars:
+    """Tests for the StreamBars path of get_bars and for iter_bars."""
+
+    @pytest.fixture(autouse=True)
+    def small_threshold(self, monkeypatch):
+        monkeypatch.setattr("src.data.grpc_client._STREAM_THRESHOLD", 100)
+
+    def test_large_read_streams(self, bars):
+        client = _fake_client(bars, columnar=False)
+
+        result = client.get_bars("AAPL", "1Min")
+
+        client.stub.GetBars.assert_not_called()
+        assert client.stub.StreamBars.call_count == 1
+        pd.testing.assert_frame_equal(result, bars, check_freq=False)
+
+    def test_small_read_pages(self, bars):
+        client = _fake_client(bars.iloc[:80], columnar=False)
+
+        result = client.get_bars("AAPL", "1Min")
+
+        assert len(result) == 80
+        client.stub.StreamBars.assert_not_called()
+
+    def test_stream_grows_past_count(self, bars):
+        client = _fake_client(bars, columnar=False)
+        client.stub.GetBarCount.return_value = bar_pb2.GetBarCountResponse(count=101)
+
+        assert len(client.get_bars("AAPL", "1Min")) == len(bars)
+
+    def test_limit_cancels_stream(self, bars):
+        client = _fake_client(bars, columnar=False)
+
+        result = client.get_bars("AAPL", "1Min", limit=150)
+
+        assert len(result) == 150
+        assert result.index[-1] == bars.index[149]
+        assert client.streams[0].cancelled
+
+    @pytest.mark.parametrize("columnar", [True, False])
+    def test_iter_bars_chunks(self, bars, columnar):
+        client = _fake_client(bars, columnar=columnar)
+
+        chunks = list(client.iter_bars("AAPL", "1Min", chunk_rows=200))
+
+        assert [len(c) for c in chunks] == [200, 200, 50]
+        result = pd.concat(chunks)
+        np.testing.assert_array_equal(result.index.values, bars.index.values)
+        np.testing.assert_array_equal(result["volume"].to_numpy(), bars["volume"].to_numpy())
+
+    def test_iter_bars_chunks_are_independent(self, bars):
+        client = _fake_client(bars, columnar=False)
+
+        first, second, _ = client.iter_bars("AAPL", "1Min", chunk_rows=200)
+
+        assert first["open"].iloc[0] == bars["open"].iloc[0]
+        assert second["open"].iloc[0] == bars["open"].iloc[200]
+
+    def test_iter_bars_early_exit_cancels(self, bars):
+        client = _fake_client(bars, columnar=False)
+
+        chunks = client.iter_bars("AAPL", "1Min", chunk_rows=100)
+        next(chunks)
+        chunks.close()
+
+        assert client.streams[0].cancelled
+
+    def test_iter_bars_falls_back_to_stream(self, bars):
+        client = _fake_client(bars, columnar=False)
+        client._columnar_bars = True
+
+        assert sum(len(c) for c in client.iter_bars("AAPL", "1Min")) == len(bars)
+        assert client.stub.StreamBars.call_count == 1
+        assert not client._columnar_bars
+
+
+class TestLatestTimestamps:
+    """Tests for the batched latest-timestamp lookup."""
+
+    def test_one_listing_and_concurrent_lookups(self):
+        client = MarketDataGrpcClient(MagicMock())
+        client.stub = MagicMock()
+        client.stub.ListTickers.return_value = ticker_pb2.ListTickersResponse(tickers=[
+            ticker_pb2.Ticker(id=1, symbol="AAPL"), ticker_pb2.Ticker(id=2, symbol="MSFT"),
+        ])
+        latest = {1: datetime(2024, 1, 2, 15, 59), 2: None}
+
+        def lookup(req):
+            call = MagicMock()
+            call.result.return_value = bar_pb2.GetLatestTimestampResponse(timestamp=_dt_to_pb(latest[req.ticker_id]))
+            return call
+
+        client.stub.GetLatestTimestamp.future.side_effect = lookup
+
+        result = client.get_latest_timestamps(["aapl", "MSFT", "NEW"], "1Min")
+
+        assert result == {"AAPL": datetime(2024, 1, 2, 15, 59), "MSFT": None, "NEW": None}
+        client.stub.ListTickers.assert_called_once()
+        assert client.stub.GetLatestTimestamp.future.call_count == 2
+        client.stub.GetTicker.assert_not_called()
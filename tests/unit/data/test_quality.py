@@ -12,6 +12,7 @@ from src.data.quality import (
     detect_outliers,
     generate_quality_report,
 )
+from src.data.session_calendar import SessionCalendar
 
 
 @pytest.fixture
@@ -339,3 +340,36 @@ class TestDataQualityReportIssues:
         assert "gap" in issues_str
         assert "outlier" in issues_str
         assert not report.is_valid
+
+
+class TestSessionAwareGaps:
+    """Gap detection against the exchange session calendar."""
+
+    @staticmethod
+    def _bars(index: pd.DatetimeIndex) -> pd.DataFrame:
+        return pd.DataFrame(
+            {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 1000},
+            index=index,
+        )
+
+    def test_overnight_and_holiday_are_not_gaps(self):
+        """Fri -> Tue over the MLK weekend is continuous; interval detection flags it."""
+        calendar = SessionCalendar()
+        index = calendar.expected_index("1Min", "2024-01-12", "2024-01-17")
+        df = self._bars(index)
+
+        assert detect_gaps(df, expected_frequency="1min", calendar=calendar) == []
+        assert len(detect_gaps(df, expected_frequency="1min")) == 1
+
+    def test_missing_session_bars_reported(self):
+        calendar = SessionCalendar()
+        index = calendar.expected_index("5Min", "2024-01-02", "2024-01-04")
+        df = self._bars(index.delete([3, 4]))
+
+        report = DataQualityValidator(expected_frequency="5min", calendar=calendar).validate(df)
+
+        assert len(report.gaps) == 1
+        assert report.gaps[0].start == index[2]
+        assert report.gaps[0].end == index[5]
+        assert report.gaps[0].missing_bars == 2
+        assert report.total_gap_bars == 2
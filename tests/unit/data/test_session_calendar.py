@@ -0,0 +1,170 @@
+"""Tests for the exchange session calendar and expected-bar index."""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.session_calendar import (
+    SessionCalendar,
+    get_session_calendar,
+    nyse_early_closes,
+    nyse_holidays,
+)
+
+
+@pytest.fixture(scope="module")
+def calendar() -> SessionCalendar:
+    return SessionCalendar()
+
+
+@pytest.fixture(scope="module")
+def extended() -> SessionCalendar:
+    return SessionCalendar(extended_hours=True)
+
+
+def session_bars(day: str, calendar: SessionCalendar) -> pd.DatetimeIndex:
+    """Every 1Min bar of one session (extended sessions run past UTC midnight)."""
+    return calendar.expected_index("1Min", day, pd.Timestamp(day) + pd.Timedelta(hours=32))
+
+
+class TestHolidayRules:
+    """Tests for the built-in NYSE holiday and early-close rules."""
+
+    def test_2024_holidays(self):
+        assert sorted(nyse_holidays(2024)) == [
+            date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 19), date(2024, 3, 29),
+            date(2024, 5, 27), date(2024, 6, 19), date(2024, 7, 4), date(2024, 9, 2),
+            date(2024, 11, 28), date(2024, 12, 25),
+        ]
+
+    def test_observed_and_special_closures(self):
+        assert date(2021, 12, 24) in nyse_holidays(2021)   # Christmas on Saturday
+        assert date(2021, 12, 31) not in nyse_holidays(2021)  # New Year 2022 on Saturday
+        assert date(2026, 7, 3) in nyse_holidays(2026)     # July 4 on Saturday
+        assert date(2021, 6, 18) not in nyse_holidays(2021)  # Juneteenth starts 2022
+        assert date(2025, 1, 9) in nyse_holidays(2025)
+
+    def test_early_closes(self):
+        assert sorted(nyse_early_closes(2024)) == [date(2024, 7, 3), date(2024, 11, 29), date(2024, 12, 24)]
+        # July 3 is itself the observed holiday
+        assert date(2026, 7, 3) not in nyse_early_closes(2026)
+
+
+class TestExpectedIndex:
+    """Tests for expected bars per range."""
+
+    def test_regular_session_winter_and_summer(self, calendar):
+        winter = session_bars("2024-01-02", calendar)
+        summer = session_bars("2024-07-01", calendar)
+
+        assert len(winter) == len(summer) == 390
+        assert winter[0] == pd.Timestamp("2024-01-02 14:30")
+        assert summer[0] == pd.Timestamp("2024-07-01 13:30")
+
+    def test_early_close_and_holiday(self, calendar):
+        assert len(session_bars("2024-11-29", calendar)) == 210
+        assert len(session_bars("2024-11-28", calendar)) == 0
+        assert calendar.expected_count("1Min", "2024-01-06", "2024-01-08") == 0  # weekend
+
+    def test_extended_hours(self, extended):
+        bars = session_bars("2024-01-02", extended)
+
+        assert len(bars) == 16 * 60
+        assert bars[0] == pd.Timestamp("2024-01-02 09:00")
+        assert len(session_bars("2024-11-29", extended)) == 13 * 60
+
+    def test_hour_buckets_floor_on_utc(self, calendar):
+        """1Hour slots match the aggregator's UTC-floored buckets."""
+        bars = calendar.expected_index("1Hour", "2024-01-02", "2024-01-03")
+
+        assert list(bars.hour) == [14, 15, 16, 17, 18, 19, 20]
+
+    def test_daily(self, calendar):
+        days = calendar.expected_index("1Day", "2024-01-01", "2024-01-08")
+
+        assert list(days.day) == [2, 3, 4, 5, 8]
+        assert calendar.expected_count("1Day", "2024-01-01", "2024-12-31") == 252
+
+    def test_range_is_clipped(self, calendar):
+        bars = calendar.expected_index("5Min", "2024-01-02 15:02", "2024-01-02 15:20")
+
+        assert list(bars.minute) == [0, 5, 10, 15, 20]
+
+    def test_first_expected_skips_closed_market(self, calendar, extended):
+        assert calendar.first_expected("1Min", "2024-01-05 21:00", "2024-01-09") == pd.Timestamp("2024-01-08 14:30")
+        assert extended.first_expected("1Min", "2024-01-05 21:00", "2024-01-09") == pd.Timestamp("2024-01-05 21:00")
+        assert extended.first_expected("1Min", "2024-01-06 01:00", "2024-01-08 08:00") is None
+
+    def test_tz_aware_bounds(self, calendar):
+        start = pd.Timestamp("2024-01-02 09:30", tz="America/New_York")
+        end = pd.Timestamp("2024-01-02 09:34", tz="America/New_York")
+
+        assert calendar.expected_count("1Min", start, end) == 5
+
+    def test_outside_coverage_raises(self, calendar):
+        assert not calendar.covers(datetime(1999, 1, 4), datetime(1999, 1, 5))
+        with pytest.raises(ValueError):
+            calendar.expected_index("1Min", datetime(1999, 1, 4), datetime(1999, 1, 5))
+
+
+class TestMissing:
+    """Tests for expected-vs-actual comparisons."""
+
+    def test_overnight_and_weekend_are_not_missing(self, calendar):
+        index = calendar.expected_index("1Min", "2024-01-04", "2024-01-09")
+
+        assert len(calendar.missing(index, "1Min")) == 0
+        assert not calendar.missing_between(index, "1Min").any()
+        assert calendar.missing_ranges(index, "1Min") == []
+
+    def test_missing_bars_and_ranges(self, calendar):
+        full = session_bars("2024-01-03", calendar)
+        index = full.delete([5, 6, 7, 100])
+
+        missing = calendar.missing(index, "1Min")
+        ranges = calendar.missing_ranges(index, "1Min")
+
+        assert list(missing) == [full[5], full[6], full[7], full[100]]
+        assert [(r.start, r.end, r.missing_bars) for r in ranges] == [
+            (full[5], full[7], 3), (full[100], full[100], 1),
+        ]
+
+    def test_missing_session(self, calendar):
+        """A whole missing trading day is one gap of one session's bars."""
+        index = session_bars("2024-01-02", calendar).append(session_bars("2024-01-04", calendar))
+
+        between = calendar.missing_between(index, "1Min")
+
+        assert between.sum() == 390
+        assert between[390] == 390
+
+    def test_explicit_range_counts_leading_and_trailing(self, calendar):
+        index = pd.date_range("2024-01-02 15:00", periods=30, freq="1min")
+
+        missing = calendar.missing(index, "1Min", "2024-01-02", "2024-01-03")
+
+        assert len(missing) == 390 - 30
+
+    def test_extended_bars_outside_regular_session_ignored(self, calendar):
+        index = session_bars("2024-01-02", calendar).append(pd.DatetimeIndex(["2024-01-02 22:00"]))
+
+        assert len(calendar.missing(index, "1Min")) == 0
+
+    def test_daily_bars_stamped_at_local_midnight(self, calendar):
+        index = pd.DatetimeIndex(["2024-01-02 05:00", "2024-01-03 05:00", "2024-01-05 05:00"])
+
+        assert list(calendar.missing(index, "1Day")) == [pd.Timestamp("2024-01-04")]
+        assert list(calendar.missing_between(index, "1Day")) == [0, 0, 1]
+
+    def test_unsorted_and_aware_index(self, calendar):
+        index = session_bars("2024-01-02", calendar).delete(10)
+        shuffled = index[np.random.default_rng(0).permutation(len(index))].tz_localize("UTC")
+
+        assert list(calendar.missing(shuffled, "1Min")) == [pd.Timestamp("2024-01-02 14:40")]
+
+
+def test_shared_instance():
+    assert get_session_calendar() is get_session_calendar()
+    assert get_session_calendar(extended_hours=True).extended_hours
@@ -3,13 +3,17 @@
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch, call
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from src.data.loaders.database_loader import aggregate_ohlcv
 from src.data.timeframe_aggregator import (
     DEFAULT_TARGET_TIMEFRAMES,
     INTRADAY_AGGREGATABLE,
+    StreamingBarAggregator,
     TimeframeAggregator,
+    aggregate_ohlcv_multi,
 )
 
 
@@ -141,7 +145,7 @@ class TestAggregateIntraday:
 
         mock_repo = MagicMock()
         mock_repo.get_latest_timestamp.return_value = None
-        mock_repo.get_bars.return_value = sample_1min_df
+        mock_repo.iter_bars.return_value = iter([sample_1min_df])
         mock_repo.bulk_insert_bars.return_value = 4  # 60min / 15 = 4
         mock_ticker = MagicMock()
         mock_ticker.id = 1
@@ -161,9 +165,7 @@ class TestAggregateIntraday:
 
         mock_repo = MagicMock()
         mock_repo.get_latest_timestamp.return_value = None
-        mock_repo.get_bars.return_value = pd.DataFrame(
-            columns=["open", "high", "low", "close", "volume"]
-        )
+        mock_repo.iter_bars.return_value = iter([])
 
         count = agg._aggregate_intraday(mock_repo, "AAPL", "15Min")
 
@@ -180,7 +182,7 @@ class TestAggregateIntraday:
         existing_ts = datetime(2024, 1, 2, 9, 45)
         mock_repo = MagicMock()
         mock_repo.get_latest_timestamp.return_value = existing_ts
-        mock_repo.get_bars.return_value = sample_1min_df
+        mock_repo.iter_bars.return_value = iter([sample_1min_df])
         mock_repo.bulk_insert_bars.return_value = 2
         mock_ticker = MagicMock()
         mock_ticker.id = 1
@@ -188,8 +190,8 @@ class TestAggregateIntraday:
 
         agg._aggregate_intraday(mock_repo, "AAPL", "15Min")
 
-        # get_bars should be called with start=existing_ts (stripped tz)
-        mock_repo.get_bars.assert_called_once_with("AAPL", "1Min", start=existing_ts)
+        # iter_bars should be called with start=existing_ts (stripped tz)
+        mock_repo.iter_bars.assert_called_once_with("AAPL", "1Min", start=existing_ts)
 
     def test_handles_timezone_aware_latest_ts(self, mock_db_manager, sample_1min_df):
         """Timezone-aware timestamps from the DB are normalised to naive."""
@@ -198,7 +200,7 @@ class TestAggregateIntraday:
         tz_aware_ts = datetime(2024, 1, 2, 9, 45, tzinfo=timezone.utc)
         mock_repo = MagicMock()
         mock_repo.get_latest_timestamp.return_value = tz_aware_ts
-        mock_repo.get_bars.return_value = sample_1min_df
+        mock_repo.iter_bars.return_value = iter([sample_1min_df])
         mock_repo.bulk_insert_bars.return_value = 2
         mock_ticker = MagicMock()
         mock_ticker.id = 1
@@ -207,7 +209,7 @@ class TestAggregateIntraday:
         agg._aggregate_intraday(mock_repo, "AAPL", "1Hour")
 
         expected_naive = datetime(2024, 1, 2, 9, 45)
-        mock_repo.get_bars.assert_called_once_with("AAPL", "1Min", start=expected_naive)
+        mock_repo.iter_bars.assert_called_once_with("AAPL", "1Min", start=expected_naive)
 
     def test_updates_sync_log_on_insert(self, mock_db_manager, sample_1min_df):
         """Sync log is updated when bars are inserted."""
@@ -215,7 +217,7 @@ class TestAggregateIntraday:
 
         mock_repo = MagicMock()
         mock_repo.get_latest_timestamp.return_value = None
-        mock_repo.get_bars.return_value = sample_1min_df
+        mock_repo.iter_bars.return_value = iter([sample_1min_df])
         mock_repo.bulk_insert_bars.return_value = 4
         mock_ticker = MagicMock()
         mock_ticker.id = 42
@@ -236,9 +238,7 @@ class TestAggregateIntraday:
 
         mock_repo = MagicMock()
         mock_repo.get_latest_timestamp.return_value = None
-        mock_repo.get_bars.return_value = pd.DataFrame(
-            columns=["open", "high", "low", "close", "volume"]
-        )
+        mock_repo.iter_bars.return_value = iter([])
 
         agg._aggregate_intraday(mock_repo, "AAPL", "15Min")
 
@@ -419,13 +419,17 @@ class TestAggregateMissingTimeframes:
 
         with (
             _patch_grpc(),
-            patch.object(agg, "_aggregate_intraday", return_value=4) as mock_intra,
+            patch.object(
+                agg, "_aggregate_intraday_targets", return_value={"15Min": 4, "1Hour": 1},
+            ) as mock_intra,
             patch.object(agg, "_aggregate_daily", return_value=5) as mock_daily,
         ):
             result = agg.aggregate_missing_timeframes("aapl")
 
-        assert result == {"15Min": 4, "1Hour": 4, "1Day": 5}
-        assert mock_intra.call_count == 2
+        assert result == {"15Min": 4, "1Hour": 1, "1Day": 5}
+        # Both intraday targets come from a single 1Min read
+        mock_intra.assert_called_once()
+        assert mock_intra.call_args.args[2] == ["15Min", "1Hour"]
         mock_daily.assert_called_once()
 
     def test_normalises_ticker_to_uppercase(self, mock_db_manager):
@@ -434,7 +438,7 @@ class TestAggregateMissingTimeframes:
 
         with (
             _patch_grpc(),
-            patch.object(agg, "_aggregate_intraday", return_value=0) as mock_intra,
+            patch.object(agg, "_aggregate_intraday_targets", return_value={"15Min": 0}) as mock_intra,
         ):
             agg.aggregate_missing_timeframes("aapl", target_timeframes=["15Min"])
 
@@ -448,7 +452,7 @@ class TestAggregateMissingTimeframes:
 
         with (
             _patch_grpc(),
-            patch.object(agg, "_aggregate_intraday", return_value=10) as mock_intra,
+            patch.object(agg, "_aggregate_intraday_targets", return_value={"1Hour": 10}) as mock_intra,
         ):
             result = agg.aggregate_missing_timeframes(
                 "SPY", target_timeframes=["1Hour"]
@@ -476,7 +480,7 @@ class TestAggregateMissingTimeframes:
 
         with (
             _patch_grpc(),
-            patch.object(agg, "_aggregate_intraday", return_value=0),
+            patch.object(agg, "_aggregate_intraday_targets", return_value={"15Min": 0, "1Hour": 0}),
             patch.object(agg, "_aggregate_daily", return_value=0),
         ):
             result = agg.aggregate_missing_timeframes("AAPL")
@@ -669,3 +673,199 @@ class TestNormalizeTs:
         result = TimeframeAggregator._normalize_ts(ts)
         assert result == datetime(2024, 1, 2, 9, 30)
         assert result.tzinfo is None
+
+
+# ---------------------------------------------------------------------------
+# Multi-timeframe and streaming aggregation
+# ---------------------------------------------------------------------------
+
+
+def _sessions(days: list[str], tz: str = "America/New_York") -> pd.DataFrame:
+    """Regular-session 1Min bars for *days*, indexed in naive UTC."""
+    rng = np.random.default_rng(7)
+    index = pd.DatetimeIndex(np.concatenate([
+        pd.date_range(f"{day} 09:30", f"{day} 15:59", freq="1min", tz=tz).tz_convert("UTC").tz_localize(None)
+        for day in days
+    ]))
+    close = 100 + np.cumsum(rng.normal(0, 0.1, len(index)))
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.02, len(index)),
+            "high": close + 0.1,
+            "low": close - 0.1,
+            "close": close,
+            "volume": rng.integers(100, 1000, len(index)),
+        },
+        index=index,
+    )
+
+
+# Sessions either side of the 2024-03-10 DST change, with a weekend gap
+DST_DAYS = ["2024-03-07", "2024-03-08", "2024-03-11", "2024-03-12"]
+TARGETS = ["5Min", "15Min", "1Hour"]
+
+
+class TestAggregateOhlcvMulti:
+    """Tests for the single-pass multi-timeframe aggregation."""
+
+    def test_matches_resample_across_dst_and_gaps(self):
+        df = _sessions(DST_DAYS)
+
+        result = aggregate_ohlcv_multi(df, TARGETS)
+
+        for tf in TARGETS:
+            pd.testing.assert_frame_equal(result[tf], aggregate_ohlcv(df, tf), check_freq=False, check_dtype=False)
+
+    def test_session_open_hour_bucket(self):
+        """The 09:30 ET open lands in the UTC hour bucket on both sides of DST."""
+        hours = aggregate_ohlcv_multi(_sessions(DST_DAYS), ["1Hour"])["1Hour"]
+
+        assert pd.Timestamp("2024-03-08 14:00") in hours.index  # EST: 09:30 = 14:30 UTC
+        assert pd.Timestamp("2024-03-11 13:00") in hours.index  # EDT: 09:30 = 13:30 UTC
+        # No bucket spans the overnight gap
+        assert hours.loc["2024-03-08 20:00", "close"] == _sessions(DST_DAYS).loc["2024-03-08 20:59", "close"]
+
+    def test_tz_aware_input_keeps_timezone(self):
+        df = _sessions(DST_DAYS)
+        local = df.tz_localize("UTC").tz_convert("America/New_York")
+
+        result = aggregate_ohlcv_multi(local, ["15Min"])["15Min"]
+
+        assert str(result.index.tz) == "America/New_York"
+        expected = aggregate_ohlcv_multi(df, ["15Min"])["15Min"]
+        assert (result.index.tz_convert("UTC").tz_localize(None) == expected.index).all()
+
+    def test_unsorted_and_duplicate_rows(self, sample_1min_df):
+        shuffled = pd.concat([sample_1min_df.iloc[::-1], sample_1min_df.iloc[:3]])
+
+        result = aggregate_ohlcv_multi(shuffled, ["15Min"])["15Min"]
+
+        pd.testing.assert_frame_equal(result, aggregate_ohlcv(sample_1min_df, "15Min"), check_freq=False)
+
+    def test_empty_and_unknown(self):
+        empty = pd.DataFrame(columns=["open", "high", "low", "close", "volume"], index=pd.DatetimeIndex([]))
+        assert aggregate_ohlcv_multi(empty, ["5Min"])["5Min"].empty
+        with pytest.raises(ValueError):
+            aggregate_ohlcv_multi(empty, ["1Day"])
+
+
+class TestStreamingBarAggregator:
+    """Tests for StreamingBarAggregator."""
+
+    def _collect(self, parts: list[dict]) -> dict[str, pd.DataFrame]:
+        return {
+            tf: pd.concat([p[tf] for p in parts if tf in p and not p[tf].empty])
+            for tf in TARGETS
+        }
+
+    def test_per_bar_updates_match_batch(self):
+        df = _sessions(DST_DAYS[1:3])
+        agg = StreamingBarAggregator(TARGETS)
+
+        parts = [agg.update(ts, *row) for ts, row in zip(df.index, df.itertuples(index=False))]
+        parts.append(agg.flush())
+
+        expected = aggregate_ohlcv_multi(df, TARGETS)
+        for tf, got in self._collect(parts).items():
+            pd.testing.assert_frame_equal(got, expected[tf], check_dtype=False)
+
+    def test_frame_updates_match_batch(self):
+        df = _sessions(DST_DAYS[1:3])
+        agg = StreamingBarAggregator(TARGETS)
+
+        # Chunks that split buckets mid-way
+        parts = [agg.update_frame(df.iloc[i:i + 37]) for i in range(0, len(df), 37)]
+        parts.append(agg.flush())
+
+        expected = aggregate_ohlcv_multi(df, TARGETS)
+        for tf, got in self._collect(parts).items():
+            pd.testing.assert_frame_equal(got, expected[tf], check_dtype=False)
+
+    def test_partial_bar_updates_in_place(self):
+        agg = StreamingBarAggregator(["5Min"])
+        assert agg.update(datetime(2024, 1, 2, 14, 30), 10, 11, 9, 10.5, 100) == {}
+        agg.update(datetime(2024, 1, 2, 14, 31), 10.5, 12, 10, 11.5, 50)
+
+        partial = agg.partial_bars()["5Min"].iloc[0]
+        assert (partial["open"], partial["high"], partial["low"], partial["close"], partial["volume"]) == (10, 12, 9, 11.5, 150)
+
+        completed = agg.update(datetime(2024, 1, 2, 14, 35), 11, 11, 11, 11, 1)
+        assert completed["5Min"].index[0] == pd.Timestamp("2024-01-02 14:30")
+        assert completed["5Min"]["volume"].iloc[0] == 150
+
+    def test_stale_bars_ignored(self):
+        agg = StreamingBarAggregator(["5Min"])
+        agg.update(datetime(2024, 1, 2, 14, 31), 10, 10, 10, 10, 1)
+        agg.update(datetime(2024, 1, 2, 14, 31), 99, 99, 99, 99, 99)
+        agg.update(datetime(2024, 1, 2, 14, 30), 99, 99, 99, 99, 99)
+
+        assert agg.partial_bars()["5Min"]["volume"].iloc[0] == 1
+
+
+class TestAggregateIntradayIncremental:
+    """Tests for the single-read incremental aggregation into the database."""
+
+    @staticmethod
+    def _chunks(df, rows=7):
+        """Yield *df* in chunks that split buckets mid-way."""
+        return iter([df.iloc[i:i + rows] for i in range(0, len(df), rows)])
+
+    def _repo(self, df, latest):
+        repo = MagicMock()
+        repo.get_latest_timestamp.side_effect = lambda symbol, tf: latest.get(tf)
+        repo.iter_bars.side_effect = lambda symbol, tf, start=None, end=None: self._chunks(
+            df[df.index >= start] if start else df
+        )
+        repo.bulk_insert_bars.side_effect = lambda df, **kw: len(df)
+        return repo
+
+    def test_reads_once_from_oldest_latest_bar(self, sample_1min_df):
+        latest = {"5Min": datetime(2024, 1, 2, 10, 5), "15Min": datetime(2024, 1, 2, 10, 0)}
+        repo = self._repo(sample_1min_df, latest)
+
+        result = TimeframeAggregator.aggregate_intraday_incremental(
+            repo, MagicMock(id=1), "AAPL", ["5Min", "15Min"],
+        )
+
+        repo.iter_bars.assert_called_once_with("AAPL", "1Min", start=datetime(2024, 1, 2, 10, 0))
+        # 5Min: 10:05 rebuilt + 10:10..10:25 new; 15Min: 10:00 rebuilt + 10:15 new
+        assert result == {"5Min": 4, "15Min": 1}
+        repo.delete_bars.assert_any_call("AAPL", "5Min", latest["5Min"], latest["5Min"])
+        repo.delete_bars.assert_any_call("AAPL", "15Min", latest["15Min"], latest["15Min"])
+        inserted = {c.kwargs["timeframe"]: c.kwargs["df"] for c in repo.bulk_insert_bars.call_args_list}
+        assert inserted["5Min"].index[0] == pd.Timestamp(latest["5Min"])
+
+    def test_partial_bar_rebuilt_when_bucket_fills(self):
+        """A bar stored from a partial bucket is replaced once more 1Min bars arrive."""
+        df = _sessions(["2024-01-02"]).loc[:"2024-01-02 14:44"]
+        latest = {"15Min": datetime(2024, 1, 2, 14, 30)}
+        repo = self._repo(df, latest)
+
+        result = TimeframeAggregator.aggregate_intraday_incremental(repo, MagicMock(id=1), "AAPL", ["15Min"])
+
+        assert result == {"15Min": 0}
+        repo.delete_bars.assert_called_once()
+        rebuilt = repo.bulk_insert_bars.call_args.kwargs["df"]
+        assert rebuilt["volume"].iloc[0] == df.loc["2024-01-02 14:30":, "volume"].sum()
+
+    def test_new_target_reads_full_range(self, sample_1min_df):
+        repo = self._repo(sample_1min_df, {"5Min": datetime(2024, 1, 2, 10, 5)})
+
+        result = TimeframeAggregator.aggregate_intraday_incremental(repo, MagicMock(id=1), "AAPL", ["5Min", "1Hour"])
+
+        repo.iter_bars.assert_called_once_with("AAPL", "1Min", start=None)
+        assert result["1Hour"] == 2
+
+    def test_range_end_inside_bucket_does_not_replace(self, sample_1min_df):
+        latest = {"1Hour": datetime(2024, 1, 2, 10, 0)}
+        repo = self._repo(sample_1min_df, latest)
+
+        TimeframeAggregator.aggregate_intraday_incremental(
+            repo, MagicMock(id=1), "AAPL", ["1Hour"],
+            start=datetime(2024, 1, 2, 9, 40), end=datetime(2024, 1, 2, 10, 15),
+        )
+
+        repo.iter_bars.assert_called_once_with(
+            "AAPL", "1Min", start=datetime(2024, 1, 2, 9, 0), end=datetime(2024, 1, 2, 10, 15),
+        )
+        repo.delete_bars.assert_not_called()
@@ -3,6 +3,8 @@ and MarketDataReader dependency injection."""
 
 import math
 from datetime import datetime
+import threading
+import time
 from typing import Optional
 
 import pandas as pd
@@ -541,3 +543,179 @@ class TestContextPackBuilderWithReader:
             cache_enabled=False,
         )
         assert isinstance(builder._reader, RepositoryMarketDataReader)
+
+
+class CountingReader(StubMarketDataReader):
+    """Stub reader that counts calls per method."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls: dict[str, list] = {"bars": [], "features": [], "states": []}
+
+    def get_bars(self, symbol, timeframe, start=None, end=None, limit=None):
+        self.calls["bars"].append((timeframe, end, limit))
+        return super().get_bars(symbol, timeframe, start=start, end=end, limit=limit)
+
+    def get_features(self, symbol, timeframe, start=None, end=None):
+        self.calls["features"].append((timeframe, start, end))
+        return super().get_features(symbol, timeframe, start=start, end=end)
+
+    def get_latest_states(self, symbol, timeframe):
+        self.calls["states"].append(timeframe)
+        return super().get_latest_states(symbol, timeframe)
+
+
+class TestContextPackBuilderCache:
+    """Tests for the per-component bars/features/regimes caches."""
+
+    def _reader(self) -> CountingReader:
+        daily_bars = _make_bars_df(n=10, base_price=200.0)
+        daily_bars.index = pd.date_range("2025-01-01", periods=10, freq="D")
+        return CountingReader(
+            bars={"AAPL_5Min": _make_bars_df(), "AAPL_1Day": daily_bars},
+            features={"AAPL_5Min": _make_features_df()},
+            states={"AAPL_5Min": _make_states_df()},
+        )
+
+    def test_timeframes_shared_across_builds(self):
+        """A 5Min build reuses the 1Day bars loaded by a 1Day build."""
+        reader = self._reader()
+        builder = ContextPackBuilder(reader=reader, include_key_levels=False)
+
+        builder.build("AAPL", "1Day", lookback_bars=100)
+        ctx = builder.build("AAPL", "5Min", lookback_bars=100, additional_timeframes=["1Day"])
+
+        assert [c[0] for c in reader.calls["bars"]] == ["1Day", "5Min"]
+        assert ctx.has_bars and ctx.has_features and ctx.has_regimes
+        stats = builder.cache_stats()
+        assert stats["bars"]["hits"] == 1
+        assert stats["bars"]["misses"] == 2
+
+    def test_repeat_build_reads_nothing(self):
+        """A second identical build is served entirely from cache."""
+        reader = self._reader()
+        builder = ContextPackBuilder(reader=reader)
+
+        first = builder.build("AAPL", "5Min")
+        second = builder.build("aapl", "5Min")
+
+        assert len(reader.calls["bars"]) == 1
+        assert len(reader.calls["features"]) == 1
+        assert len(reader.calls["states"]) == 1
+        assert second.current_price == first.current_price
+        assert second.primary_regime == first.primary_regime
+
+    def test_point_in_time_keyed_by_as_of(self):
+        """Different as_of values do not share bars."""
+        reader = self._reader()
+        builder = ContextPackBuilder(reader=reader, include_features=False, include_regimes=False)
+
+        builder.build("AAPL", "5Min", as_of=datetime(2025, 1, 1, 0, 10))
+        builder.build("AAPL", "5Min", as_of=datetime(2025, 1, 1, 0, 20))
+        builder.build("AAPL", "5Min", as_of=datetime(2025, 1, 1, 0, 20))
+
+        assert [c[1] for c in reader.calls["bars"]] == [
+            datetime(2025, 1, 1, 0, 10),
+            datetime(2025, 1, 1, 0, 20),
+        ]
+
+    def test_cache_bounded(self):
+        """Entries beyond cache_size are evicted."""
+        reader = self._reader()
+        builder = ContextPackBuilder(
+            reader=reader, include_features=False, include_regimes=False, cache_size=2,
+        )
+
+        for minute in range(5):
+            builder.build("AAPL", "5Min", as_of=datetime(2025, 1, 1, 0, minute))
+
+        stats = builder.cache_stats()["bars"]
+        assert stats["size"] == 2
+        assert stats["evictions"] == 3
+
+    def test_cache_disabled_always_reads(self):
+        """With caching off every build hits the reader."""
+        reader = self._reader()
+        builder = ContextPackBuilder(reader=reader, cache_enabled=False)
+
+        builder.build("AAPL", "5Min")
+        builder.build("AAPL", "5Min")
+
+        assert len(reader.calls["bars"]) == 2
+        assert builder.cache_stats()["bars"]["misses"] == 0
+
+
+class SlowReader(StubMarketDataReader):
+    """Stub reader that sleeps per call and tracks peak concurrency."""
+
+    def __init__(self, delay: float = 0.02, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+    def get_bars(self, *args, **kwargs):
+        self._enter()
+        return super().get_bars(*args, **kwargs)
+
+    def get_latest_states(self, *args, **kwargs):
+        self._enter()
+        return super().get_latest_states(*args, **kwargs)
+
+
+class TestContextPackBuilderConcurrentFetch:
+    """Tests for concurrent multi-timeframe reads."""
+
+    def _data(self) -> dict:
+        daily_bars = _make_bars_df(n=10, base_price=200.0)
+        daily_bars.index = pd.date_range("2025-01-01", periods=10, freq="D")
+        return {
+            "bars": {"AAPL_5Min": _make_bars_df(), "AAPL_1Hour": _make_bars_df(), "AAPL_1Day": daily_bars},
+            "states": {"AAPL_5Min": _make_states_df(), "AAPL_1Day": _make_states_df(state_id=1)},
+        }
+
+    def test_reads_issued_concurrently(self):
+        """Timeframes are read in parallel and results land on the right timeframe."""
+        reader = SlowReader(**self._data())
+        builder = ContextPackBuilder(reader=reader, include_features=False, cache_enabled=False)
+
+        ctx = builder.build("AAPL", "5Min", additional_timeframes=["1Hour", "1Day"])
+        builder.close()
+
+        assert reader.peak > 1
+        assert list(ctx.bars) == ["5Min", "1Hour", "1Day"]
+        assert ctx.regimes["5Min"].state_id == 2
+        assert ctx.regimes["1Day"].state_id == 1
+        assert "1Hour" not in ctx.regimes
+
+    def test_single_worker_reads_sequentially(self):
+        """fetch_workers=1 never overlaps reader calls."""
+        reader = SlowReader(delay=0.001, **self._data())
+        builder = ContextPackBuilder(reader=reader, include_features=False, cache_enabled=False, fetch_workers=1)
+
+        builder.build("AAPL", "5Min", additional_timeframes=["1Hour", "1Day"])
+
+        assert reader.peak == 1
+
+    def test_feature_start_bound_pushed_down(self):
+        """Features are requested from the first returned bar onward."""
+        bars = _make_bars_df(n=20)
+        reader = CountingReader(
+            bars={"AAPL_5Min": bars},
+            features={"AAPL_5Min": _make_features_df(n=20)},
+        )
+        builder = ContextPackBuilder(reader=reader, include_regimes=False, cache_enabled=False)
+
+        ctx = builder.build("AAPL", "5Min", lookback_bars=5)
+
+        assert reader.calls["features"] == [("5Min", bars.index[-5].to_pydatetime(), None)]
+        assert len(ctx.primary_features) == 5
@@ -0,0 +1,120 @@
+"""Tests for ContextCache — LRU/TTL bounds, single-flight loading, and metrics."""
+
+import threading
+import time
+
+import pytest
+
+from src.evaluators.context_cache import ContextCache
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestContextCache:
+    """Tests for ContextCache."""
+
+    def test_hit_after_miss(self):
+        """Second lookup is served from the cache."""
+        cache = ContextCache(maxsize=4, ttl=60)
+        calls = []
+
+        assert cache.get_or_load("a", lambda: calls.append(1) or "v") == "v"
+        assert cache.get_or_load("a", lambda: calls.append(1) or "other") == "v"
+
+        stats = cache.stats()
+        assert len(calls) == 1
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == pytest.approx(0.5)
+
+    def test_lru_eviction(self):
+        """The least recently used key is evicted once maxsize is exceeded."""
+        cache = ContextCache(maxsize=2, ttl=60)
+        cache.get_or_load("a", lambda: 1)
+        cache.get_or_load("b", lambda: 2)
+        cache.get_or_load("a", lambda: 1)  # touch "a"
+        cache.get_or_load("c", lambda: 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats().evictions == 1
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are reloaded and counted as expired."""
+        clock = FakeClock()
+        cache = ContextCache(maxsize=4, ttl=10, timer=clock)
+        cache.get_or_load("a", lambda: "old")
+
+        clock.now = 11
+        assert cache.get_or_load("a", lambda: "new") == "new"
+
+        stats = cache.stats()
+        assert stats.misses == 2
+        assert stats.expirations == 1
+        assert stats.evictions == 0
+
+    def test_loader_errors_are_not_cached(self):
+        """A failing loader raises and the next lookup retries."""
+        cache = ContextCache(maxsize=4, ttl=60)
+
+        def boom():
+            raise RuntimeError("service down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("a", boom)
+        assert cache.get_or_load("a", lambda: "ok") == "ok"
+
+    def test_concurrent_lookups_single_flight(self):
+        """Concurrent misses for one key run the loader once."""
+        cache = ContextCache(maxsize=4, ttl=60)
+        calls = []
+        started = threading.Event()
+
+        def slow_loader():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return "v"
+
+        results = []
+        owner = threading.Thread(target=lambda: results.append(cache.get_or_load("a", slow_loader)))
+        owner.start()
+        started.wait()
+        waiters = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("a", slow_loader)))
+            for _ in range(7)
+        ]
+        for t in waiters:
+            t.start()
+        for t in [owner, *waiters]:
+            t.join()
+
+        stats = cache.stats()
+        assert results == ["v"] * 8
+        assert len(calls) == 1
+        assert stats.misses == 1
+        assert stats.hits + stats.coalesced == 7
+
+    def test_clear_keeps_counters(self):
+        """clear() empties the cache without counting evictions."""
+        cache = ContextCache(maxsize=4, ttl=60)
+        cache.get_or_load("a", lambda: 1)
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats.size == 0
+        assert stats.evictions == 0
+        assert stats.misses == 1
+
+    def test_invalid_maxsize(self):
+        """maxsize must be positive."""
+        with pytest.raises(ValueError):
+            ContextCache(maxsize=0)
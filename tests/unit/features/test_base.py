@@ -0,0 +1,112 @@
+"""Tests for feature utility kernels in src.features.base."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.base import EPS, rolling_beta, rolling_regression_slope
+
+
+def reference_slope(series: pd.Series, window: int) -> pd.Series:
+    """Per-window Python implementation the vectorized kernel replaced."""
+    def _slope(y: np.ndarray) -> float:
+        if len(y) < window or np.any(np.isnan(y)):
+            return np.nan
+        x = np.arange(len(y))
+        numerator = np.sum((x - x.mean()) * (y - y.mean()))
+        denominator = np.sum((x - x.mean()) ** 2)
+        if denominator < EPS:
+            return 0.0
+        return numerator / denominator
+
+    return series.rolling(window=window, min_periods=window).apply(_slope, raw=True)
+
+
+def reference_beta(asset: pd.Series, market: pd.Series, window: int):
+    """Row-by-row implementation the vectorized kernel replaced."""
+    betas, resids = [], []
+    for i in range(len(asset)):
+        if i < window - 1:
+            betas.append(np.nan)
+            resids.append(np.nan)
+            continue
+        y = asset.iloc[i - window + 1:i + 1].values
+        x = market.iloc[i - window + 1:i + 1].values
+        if np.any(np.isnan(y)) or np.any(np.isnan(x)):
+            betas.append(np.nan)
+            resids.append(np.nan)
+            continue
+        var = np.sum((x - x.mean()) ** 2)
+        if var < EPS:
+            betas.append(0.0)
+            resids.append(np.std(y))
+        else:
+            beta = np.sum((x - x.mean()) * (y - y.mean())) / var
+            alpha = y.mean() - beta * x.mean()
+            betas.append(beta)
+            resids.append(np.std(y - (alpha + beta * x)))
+    return pd.Series(betas, index=asset.index), pd.Series(resids, index=asset.index)
+
+
+@pytest.fixture
+def returns() -> tuple[pd.Series, pd.Series]:
+    """Correlated asset/market returns with gaps and a flat stretch."""
+    rng = np.random.default_rng(5)
+    n = 500
+    index = pd.date_range("2024-01-02 09:30", periods=n, freq="1min")
+    market = rng.normal(0, 0.001, n)
+    asset = 1.3 * market + rng.normal(0, 0.0005, n)
+    market[200:260] = 0.0
+    asset[[0, 75, 76, 300]] = np.nan
+    market[[120, 410]] = np.nan
+    return pd.Series(asset, index=index), pd.Series(market, index=index)
+
+
+class TestRollingRegressionSlope:
+    """Tests for rolling_regression_slope."""
+
+    @pytest.mark.parametrize("window", [1, 2, 20, 60])
+    def test_matches_reference(self, returns, window):
+        series = np.log(100 * np.exp(returns[0].fillna(0).cumsum()))
+        series.iloc[[40, 41, 333]] = np.nan
+        expected = reference_slope(series, window)
+        result = rolling_regression_slope(series, window)
+
+        np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+        np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-15)
+
+    def test_flat_window_is_exactly_zero(self):
+        series = pd.Series([4.2] * 30 + [4.3, 4.4])
+        result = rolling_regression_slope(series, window=10)
+        assert (result.iloc[9:30] == 0.0).all()
+
+    def test_short_series_is_all_nan(self):
+        result = rolling_regression_slope(pd.Series([1.0, 2.0, 3.0], name="lp"), window=5)
+        assert result.isna().all()
+        assert result.name == "lp"
+
+
+class TestRollingBeta:
+    """Tests for rolling_beta."""
+
+    @pytest.mark.parametrize("window", [2, 30, 60])
+    def test_matches_reference(self, returns, window):
+        asset, market = returns
+        expected_beta, expected_resid = reference_beta(asset, market, window)
+        beta, resid = rolling_beta(asset, market, window)
+
+        np.testing.assert_array_equal(np.isnan(beta), np.isnan(expected_beta))
+        np.testing.assert_allclose(beta, expected_beta, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(resid, expected_resid, rtol=1e-9, atol=1e-15)
+
+    def test_flat_market_window(self, returns):
+        """Zero market variance gives beta 0 and the asset's own std."""
+        asset, market = returns
+        beta, resid = rolling_beta(asset, market, window=30)
+        assert beta.iloc[259] == 0.0
+        assert resid.iloc[259] == pytest.approx(np.std(asset.iloc[230:260].values))
+
+    def test_short_market_series_raises(self, returns):
+        asset, market = returns
+        with pytest.raises(ValueError, match="market_returns"):
+            rolling_beta(asset, market.iloc[:-1], window=30)
@@ -0,0 +1,222 @@
+"""Tests for streaming (per-bar) feature computation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.base import rolling_beta, rolling_regression_slope
+from src.features.pipeline import FeaturePipeline, PipelineConfig
+from src.features.registry import get_calculator, list_calculators
+from src.features.streaming import (
+    EWMState,
+    History,
+    RollingMax,
+    RollingMean,
+    RollingRegression,
+    RollingSlope,
+    RollingStd,
+    RollingSum,
+    WindowedFeatureStream,
+)
+from src.features.time_of_day import TimeOfDayFeatureCalculator
+
+
+@pytest.fixture
+def long_ohlcv() -> pd.DataFrame:
+    """400 bars of synthetic minute data spanning two sessions."""
+    rng = np.random.default_rng(11)
+    n_bars = 400
+    index = pd.date_range("2024-01-15 09:30", periods=n_bars, freq="1min")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    open_prices = np.r_[close[0], close[:-1]]
+    volume = rng.integers(1000, 20000, n_bars).astype(float)
+    # A run of identical values exercises pandas' equal-value handling
+    volume[150:220] = 5000.0
+    return pd.DataFrame(
+        {
+            "open": open_prices,
+            "high": np.maximum(open_prices, close) * 1.0005,
+            "low": np.minimum(open_prices, close) * 0.9995,
+            "close": close,
+            "volume": volume,
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def long_market(long_ohlcv: pd.DataFrame) -> pd.DataFrame:
+    """Market data aligned with long_ohlcv."""
+    rng = np.random.default_rng(12)
+    close = 450 * np.exp(np.cumsum(rng.normal(0, 0.0008, len(long_ohlcv))))
+    return pd.DataFrame({"close": close}, index=long_ohlcv.index)
+
+
+def _stream_rows(stream, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    """Feed bars one at a time and collect the outputs."""
+    rows = [
+        stream.update(timestamp, bar._asdict(), **{k: v[i] for k, v in kwargs.items()})
+        for i, (timestamp, bar) in enumerate(zip(df.index, df.itertuples(index=False)))
+    ]
+    return pd.DataFrame(rows, index=df.index)
+
+
+def _assert_close(expected: pd.DataFrame, actual: pd.DataFrame) -> None:
+    assert list(actual.columns) == list(expected.columns)
+    np.testing.assert_allclose(
+        actual.to_numpy(dtype=float),
+        expected.to_numpy(dtype=float),
+        rtol=1e-7,
+        atol=1e-10,
+    )
+
+
+class TestRollingPrimitives:
+    """Primitives must match the pandas kernels they replace."""
+
+    @pytest.fixture
+    def series(self) -> pd.Series:
+        rng = np.random.default_rng(3)
+        values = rng.normal(0, 1, 300)
+        values[[5, 40, 41, 170]] = np.nan
+        values[100:130] = 2.5
+        return pd.Series(values)
+
+    def _run(self, primitive, series: pd.Series) -> np.ndarray:
+        return np.array([primitive.update(v) for v in series.tolist()])
+
+    def test_rolling_sum(self, series):
+        expected = series.rolling(20, min_periods=20).sum()
+        np.testing.assert_allclose(self._run(RollingSum(20), series), expected, rtol=1e-12)
+
+    def test_rolling_mean(self, series):
+        expected = series.rolling(20, min_periods=20).mean()
+        np.testing.assert_allclose(self._run(RollingMean(20), series), expected, rtol=1e-12)
+
+    def test_rolling_std(self, series):
+        expected = series.rolling(20, min_periods=20).std()
+        np.testing.assert_allclose(self._run(RollingStd(20), series), expected, rtol=1e-9)
+
+    def test_rolling_std_constant_run_is_zero(self, series):
+        result = self._run(RollingStd(20), series)
+        assert (result[119:130] == 0.0).all()
+
+    def test_rolling_max_and_min(self, series):
+        np.testing.assert_array_equal(
+            self._run(RollingMax(15), series), series.rolling(15, min_periods=15).max(),
+        )
+        np.testing.assert_array_equal(
+            self._run(RollingMax(15, minimum=True), series),
+            series.rolling(15, min_periods=15).min(),
+        )
+
+    def test_ewm(self, series):
+        expected = series.ewm(span=12, adjust=False).mean()
+        np.testing.assert_allclose(self._run(EWMState(12), series), expected, rtol=1e-12)
+
+    def test_slope_across_rebuilds(self, series):
+        expected = rolling_regression_slope(series, window=25)
+        np.testing.assert_allclose(self._run(RollingSlope(25), series), expected, rtol=1e-8, atol=1e-12)
+
+    def test_regression(self, series):
+        x = series.shift(1) * 0.5 + 0.1
+        beta, resid = rolling_beta(series, x, window=30)
+        regression = RollingRegression(30)
+        result = np.array([regression.update(a, b) for a, b in zip(x.tolist(), series.tolist())])
+        np.testing.assert_allclose(result[:, 0], beta, rtol=1e-8, atol=1e-12)
+        np.testing.assert_allclose(result[:, 1], resid, rtol=1e-8, atol=1e-12)
+
+    def test_history(self):
+        history = History(3)
+        for value in [1.0, 2.0, 3.0, 4.0]:
+            history.append(value)
+        assert history.ago(0) == 4.0
+        assert history.ago(2) == 2.0
+        assert np.isnan(history.ago(3))
+
+
+@pytest.mark.parametrize("name", list_calculators())
+def test_stream_matches_batch_compute(name, long_ohlcv, long_market):
+    """Every registered calculator streams the same values as compute()."""
+    calc = get_calculator(name)()
+    kwargs = {"market_df": long_market} if name == "market_context" else {}
+    stream = calc.create_stream(lookback_buffer=50)
+
+    if isinstance(stream, WindowedFeatureStream):
+        # Fallback streams equal compute() over their trailing window
+        streamed = _stream_rows(stream, long_ohlcv)
+        for end in (1, stream.window, len(long_ohlcv)):
+            window = long_ohlcv.iloc[max(0, end - stream.window):end]
+            expected = calc.compute(window).iloc[[-1]]
+            _assert_close(expected, streamed.iloc[[end - 1]])
+        return
+
+    market_bars = [{"close": c} for c in long_market["close"].tolist()]
+    stream_kwargs = {"market_bar": market_bars} if name == "market_context" else {}
+    expected = calc.compute(long_ohlcv, **kwargs)
+    _assert_close(expected, _stream_rows(stream, long_ohlcv, **stream_kwargs))
+
+
+def test_windowed_update_frame_matches_compute(long_ohlcv):
+    """A block update of the fallback stream is one compute() over its context."""
+    calc = TimeOfDayFeatureCalculator()
+    stream = WindowedFeatureStream(calc, window=100)
+    stream.update_frame(long_ohlcv.iloc[:150])
+    block = stream.update_frame(long_ohlcv.iloc[150:160])
+
+    expected = calc.compute(long_ohlcv.iloc[50:160]).iloc[-10:]
+    _assert_close(expected, block)
+
+
+class TestFeaturePipelineStream:
+    """Tests for the pipeline-level stream."""
+
+    @pytest.fixture
+    def pipeline(self) -> FeaturePipeline:
+        pipeline = FeaturePipeline.default(include_market_context=True)
+        pipeline.config = PipelineConfig(drop_leading_na=False, include_market_context=True)
+        return pipeline
+
+    def test_update_many_matches_compute(self, pipeline, long_ohlcv, long_market):
+        """Warmup through update_many reproduces compute()."""
+        expected = pipeline.compute(long_ohlcv, market_df=long_market)
+        actual = pipeline.create_stream().update_many(long_ohlcv, market_df=long_market)
+        _assert_close(expected, actual)
+
+    def test_per_bar_updates_continue_warmup(self, pipeline, long_ohlcv, long_market):
+        """Bars streamed after warmup match compute() on the native features."""
+        pipeline.calculators = [
+            c for c in pipeline.calculators
+            if not isinstance(c.create_stream(), WindowedFeatureStream)
+        ]
+        stream = pipeline.create_stream()
+        stream.update_many(long_ohlcv.iloc[:300], market_df=long_market)
+
+        tail = long_ohlcv.iloc[300:]
+        rows = [
+            stream.update(ts, bar._asdict(), market_bar={"close": long_market.at[ts, "close"]})
+            for ts, bar in zip(tail.index, tail.itertuples(index=False))
+        ]
+        expected = pipeline.compute(long_ohlcv, market_df=long_market).iloc[300:]
+        _assert_close(expected, pd.DataFrame(rows, index=tail.index))
+        assert stream.last_timestamp == long_ohlcv.index[-1]
+
+    def test_rejects_out_of_order_bars(self, long_ohlcv):
+        stream = FeaturePipeline.default().create_stream()
+        stream.update_many(long_ohlcv.iloc[:10])
+        ts = long_ohlcv.index[5]
+        with pytest.raises(ValueError, match="not after"):
+            stream.update(ts, long_ohlcv.loc[ts].to_dict())
+        with pytest.raises(ValueError, match="not after"):
+            stream.update_many(long_ohlcv.iloc[5:20])
+
+    def test_market_data_required(self, pipeline, long_ohlcv):
+        stream = pipeline.create_stream()
+        with pytest.raises(ValueError, match="market"):
+            stream.update_many(long_ohlcv)
+
+    def test_market_context_skipped_when_optional(self, long_ohlcv):
+        pipeline = FeaturePipeline.default()
+        result = pipeline.create_stream().update_many(long_ohlcv)
+        assert "beta_60" not in result.columns
+        assert "r1" in result.columns
@@ -0,0 +1,173 @@
+"""Tests for batch HMM training orchestration."""
+
+import json
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+try:
+    import hmmlearn  # noqa: F401
+    HAS_HMMLEARN = True
+except ImportError:
+    HAS_HMMLEARN = False
+
+from src.features.state.hmm.artifacts import get_model_path
+from src.features.state.hmm.batch_training import (
+    BatchTrainer,
+    BatchTrainingConfig,
+    JobResult,
+    TrainingJob,
+    data_fingerprint,
+)
+from src.features.state.hmm.contracts import ModelMetadata
+
+FEATURES = ["r1", "r5", "vol", "rsi"]
+
+
+def _features(seed: int, n_days: int = 120) -> pd.DataFrame:
+    """Daily feature frame with a DatetimeIndex."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=n_days, freq="D")
+    return pd.DataFrame(rng.standard_normal((n_days, len(FEATURES))), index=index, columns=FEATURES)
+
+
+class StubLoader:
+    """Feature loader returning canned frames and recording calls."""
+
+    def __init__(self, frames: dict[str, pd.DataFrame]):
+        self.frames = frames
+        self.calls = []
+
+    def __call__(self, symbol, timeframe, start, end, feature_names):
+        self.calls.append((symbol, timeframe))
+        return self.frames.get(symbol, pd.DataFrame(columns=feature_names))
+
+
+def _config(symbols, **kwargs) -> BatchTrainingConfig:
+    return BatchTrainingConfig(
+        symbols=symbols,
+        timeframes=["1Day"],
+        start=datetime(2024, 1, 1),
+        end=datetime(2024, 12, 31),
+        feature_names={"1Day": FEATURES},
+        n_states={"1Day": 3},
+        latent_dim={"1Day": 2},
+        min_train_rows=50,
+        min_val_rows=10,
+        **kwargs,
+    )
+
+
+def _write_metadata(root, symbol, fingerprint) -> None:
+    paths = get_model_path(symbol, "1Day", "state_v001", root)
+    paths.save_metadata(ModelMetadata(
+        model_id="state_v001",
+        timeframe="1Day",
+        version="1.0.0",
+        created_at=datetime.now(timezone.utc),
+        training_start=datetime(2024, 1, 1),
+        training_end=datetime(2024, 3, 1),
+        n_states=3,
+        latent_dim=2,
+        feature_names=FEATURES,
+        symbols=[symbol],
+        data_fingerprint=fingerprint,
+    ))
+
+
+class TestDataFingerprint:
+    """Tests for data_fingerprint."""
+
+    def test_stable_and_sensitive(self, tmp_path):
+        """Same inputs hash equal; data or parameter changes do not."""
+        trainer = BatchTrainer(_config(["AAPL"]), models_root=tmp_path, load_features=StubLoader({"AAPL": _features(0)}))
+        prepared = trainer._load_and_clean(TrainingJob("AAPL", "1Day"))
+        base = data_fingerprint(prepared.train_df, prepared.val_df, prepared.config)
+
+        assert base == prepared.config.data_fingerprint
+        assert data_fingerprint(prepared.train_df.copy(), prepared.val_df, prepared.config) == base
+
+        changed = prepared.train_df.copy()
+        changed.iloc[0, 0] += 1e-9
+        assert data_fingerprint(changed, prepared.val_df, prepared.config) != base
+
+        prepared.config.n_states = 4
+        assert data_fingerprint(prepared.train_df, prepared.val_df, prepared.config) != base
+
+
+class TestBatchTrainer:
+    """Tests for BatchTrainer scheduling."""
+
+    def test_unchanged_data_is_skipped(self, tmp_path):
+        """A job whose fingerprint matches the latest model is not retrained."""
+        loader = StubLoader({"AAPL": _features(0)})
+        trainer = BatchTrainer(_config(["AAPL"]), models_root=tmp_path, load_features=loader)
+        fingerprint = trainer._load_and_clean(TrainingJob("AAPL", "1Day")).config.data_fingerprint
+        _write_metadata(tmp_path, "AAPL", fingerprint)
+
+        summary = trainer.run()
+
+        result = summary.results[0]
+        assert result.status == "skipped"
+        assert result.model_id == "state_v001"
+        assert result.n_train_rows > 0
+
+    def test_failures_do_not_stop_the_batch(self, tmp_path):
+        """Missing and too-short data fail their own job only."""
+        loader = StubLoader({"AAPL": _features(0, n_days=20)})
+        _write_metadata(tmp_path, "MSFT", "stale")
+        trainer = BatchTrainer(_config(["AAPL", "MSFT"]), models_root=tmp_path, load_features=loader)
+
+        summary = trainer.run()
+
+        assert [r.symbol for r in summary.results] == ["AAPL", "MSFT"]
+        assert [r.status for r in summary.results] == ["failed", "failed"]
+        assert "insufficient" in summary.results[0].error
+        assert "no features" in summary.results[1].error
+        assert loader.calls == [("AAPL", "1Day"), ("MSFT", "1Day")]
+
+    def test_corrupt_metadata_is_treated_as_no_prior_model(self, tmp_path):
+        """Unreadable metadata.json retrains the job instead of aborting the batch."""
+        loader = StubLoader({"AAPL": _features(0), "MSFT": _features(1)})
+        trainer = BatchTrainer(_config(["AAPL", "MSFT"]), models_root=tmp_path, load_features=loader)
+        _write_metadata(tmp_path, "AAPL", "stale")
+        get_model_path("AAPL", "1Day", "state_v001", tmp_path).metadata_path.write_text("{not json")
+        fingerprint = trainer._load_and_clean(TrainingJob("MSFT", "1Day")).config.data_fingerprint
+        _write_metadata(tmp_path, "MSFT", fingerprint)
+
+        assert not isinstance(trainer._prepare(TrainingJob("AAPL", "1Day")), JobResult)
+
+        summary = trainer.run()
+
+        assert [r.symbol for r in summary.results] == ["AAPL", "MSFT"]
+        assert summary.results[0].status != "skipped"
+        assert summary.results[1].status == "skipped"
+
+    def test_summary_written_as_json(self, tmp_path):
+        """The run summary records counts and per-job rows."""
+        loader = StubLoader({})
+        summary = BatchTrainer(_config(["AAPL"]), models_root=tmp_path, load_features=loader).run()
+
+        path = tmp_path / "runs" / "summary.json"
+        summary.save(path)
+        data = json.loads(path.read_text())
+
+        assert data["n_jobs"] == 1
+        assert data["n_failed"] == 1
+        assert data["jobs"][0]["symbol"] == "AAPL"
+
+    @pytest.mark.skipif(not HAS_HMMLEARN, reason="hmmlearn not installed")
+    def test_trains_then_skips_on_rerun(self, tmp_path):
+        """Trained models carry the fingerprint, so a rerun skips them."""
+        loader = StubLoader({"AAPL": _features(0), "MSFT": _features(1)})
+        config = _config(["AAPL", "MSFT"])
+
+        first = BatchTrainer(config, models_root=tmp_path, load_features=loader).run()
+        assert [r.status for r in first.results] == ["trained", "trained"]
+        assert all(r.train_seconds > 0 and r.peak_traced_mb > 0 for r in first.results)
+
+        second = BatchTrainer(config, models_root=tmp_path, load_features=loader).run()
+        assert [r.status for r in second.results] == ["skipped", "skipped"]
+        assert [r.model_id for r in second.results] == [r.model_id for r in first.results]
@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from src.data.session_calendar import SessionCalendar
 from src.features.state.hmm.data_pipeline import (
     DataSplit,
     GapHandler,
@@ -100,6 +101,18 @@ class TestGapHandler:
         assert "has_gap" in result.columns
         assert not result["has_gap"].any()
 
+    def test_session_calendar_ignores_overnight(self):
+        """With a calendar only missing session bars are gaps."""
+        calendar = SessionCalendar()
+        index = calendar.expected_index("1Min", "2024-01-02", "2024-01-04").delete(5)
+        df = pd.DataFrame({"a": np.arange(len(index), dtype=float)}, index=index)
+
+        result = GapHandler(timeframe="1Min", calendar=calendar).handle_gaps(df)
+
+        assert result["has_gap"].sum() == 1
+        assert result["has_gap"].iloc[5]
+        assert not result["has_gap"].iloc[390 - 1]  # first bar of the second session
+
 
 class TestTimeSplitter:
     """Tests for TimeSplitter."""
@@ -8,6 +8,7 @@ from src.features.state.hmm.encoders import (
     TemporalPCAEncoder,
     create_encoder,
     create_windows,
+    iter_flat_windows,
     select_latent_dim,
 )
 
@@ -30,6 +31,17 @@ class TestPCAEncoder:
         assert encoder.latent_dim == 5
         assert encoder.input_dim == 10
 
+    @pytest.mark.parametrize("whiten", [False, True])
+    def test_transform_matches_sklearn(self, sample_data: np.ndarray, whiten: bool):
+        """Projection matches sklearn and is independent of batch size."""
+        encoder = PCAEncoder(latent_dim=5, whiten=whiten).fit(sample_data)
+
+        Z = encoder.transform(sample_data)
+
+        np.testing.assert_allclose(Z, encoder.pca_.transform(sample_data), atol=1e-12)
+        rows = np.vstack([encoder.transform(sample_data[i]) for i in range(len(sample_data))])
+        np.testing.assert_array_equal(rows, Z)
+
     def test_dimensionality_reduction(self, sample_data: np.ndarray):
         """Test that latent dim is less than input dim."""
         encoder = PCAEncoder(latent_dim=3)
@@ -77,6 +89,18 @@ class TestPCAEncoder:
         assert np.isnan(Z[50]).all()
         assert not np.isnan(Z[1]).any()
 
+    def test_fit_chunks_matches_fit(self, sample_data: np.ndarray):
+        """Chunked fit reproduces the in-memory PCA fit."""
+        X = sample_data.copy()
+        X[7, 3] = np.nan
+        full = PCAEncoder(latent_dim=5).fit(X)
+        chunked = PCAEncoder(latent_dim=5).fit_chunks(X[i : i + 16] for i in range(0, len(X), 16))
+
+        np.testing.assert_allclose(chunked.pca_.mean_, full.pca_.mean_, atol=1e-12)
+        np.testing.assert_allclose(chunked.explained_variance_ratio, full.explained_variance_ratio, atol=1e-10)
+        np.testing.assert_allclose(np.abs(chunked.transform(X)), np.abs(full.transform(X)), atol=1e-8, equal_nan=True)
+        assert chunked.metrics_.reconstruction_error == pytest.approx(full.metrics_.reconstruction_error)
+
     def test_components_property(self, sample_data: np.ndarray):
         """Test components property returns loadings."""
         encoder = PCAEncoder(latent_dim=5)
@@ -134,6 +158,38 @@ class TestTemporalPCAEncoder:
         with pytest.raises(ValueError, match="Window size mismatch"):
             encoder.fit(X)
 
+    def test_chunked_fit_transform_matches_unchunked(self):
+        """Chunking bounds memory without changing the encoding."""
+        np.random.seed(0)
+        series = np.random.randn(300, 4)
+        windows = create_windows(series, window_size=5)
+
+        full = TemporalPCAEncoder(latent_dim=3, window_size=5).fit(windows)
+        chunked = TemporalPCAEncoder(latent_dim=3, window_size=5, chunk_size=64).fit(windows)
+
+        Z_full = full.transform(windows)
+        Z_chunked = chunked.transform(windows)
+        assert Z_chunked.shape == (296, 3)
+        np.testing.assert_allclose(np.abs(Z_chunked), np.abs(Z_full), atol=1e-8)
+        np.testing.assert_array_equal(chunked.transform_series(series), Z_chunked)
+
+    def test_streaming_matches_transform_series(self):
+        """Ring-buffer encoding matches the batch windows bar by bar."""
+        np.random.seed(1)
+        series = np.random.randn(60, 4)
+        encoder = TemporalPCAEncoder(latent_dim=3, window_size=5).fit_series(series)
+
+        stream = encoder.streaming()
+        Z = np.vstack([stream.update(x) for x in series])
+
+        assert np.isnan(Z[:4]).all()
+        np.testing.assert_allclose(Z[4:], encoder.transform_series(series), atol=1e-12)
+        np.testing.assert_array_equal(stream.window(), series[-5:])
+
+        stream.reset()
+        assert not stream.is_ready
+        assert np.isnan(stream.update(series[0])).all()
+
 
 class TestCreateWindows:
     """Tests for create_windows utility."""
@@ -156,6 +212,25 @@ class TestCreateWindows:
         assert np.array_equal(windows[0], X[0:3])
         assert np.array_equal(windows[1], X[2:5])
 
+    def test_returns_view(self):
+        """Windows are a strided view of the input, not a copy."""
+        X = np.random.randn(1000, 4)
+        windows = create_windows(X, window_size=30)
+
+        assert np.shares_memory(windows, X)
+        assert not windows.flags.writeable
+        np.testing.assert_array_equal(windows[-1], X[-30:])
+
+    def test_iter_flat_windows(self):
+        """Chunks concatenate to the fully flattened windows."""
+        X = np.arange(40.0).reshape(20, 2)
+        windows = create_windows(X, window_size=4)
+
+        chunks = list(iter_flat_windows(windows, chunk_size=6))
+
+        assert [len(c) for c in chunks] == [6, 6, 5]
+        np.testing.assert_array_equal(np.vstack(chunks), windows.reshape(17, -1))
+
     def test_window_too_large(self):
         """Test that large window raises error."""
         X = np.random.randn(5, 3)
@@ -11,6 +11,9 @@ except ImportError:
 
 from src.features.state.hmm.hmm_model import (
     GaussianHMMWrapper,
+    ModelSearch,
+    ModelSearchCandidate,
+    ModelSearchResult,
     match_states_hungarian,
     select_n_states,
 )
@@ -139,6 +142,72 @@ class TestGaussianHMMWrapper:
             wrapper.predict(np.random.randn(10, 4))
 
 
+@pytest.mark.skipif(not HAS_HMMLEARN, reason="hmmlearn not installed")
+class TestEmissionCache:
+    """Tests for the cached emission terms."""
+
+    @pytest.fixture
+    def sample_latent(self) -> np.ndarray:
+        rng = np.random.default_rng(7)
+        return np.vstack([
+            rng.normal(0.0, 0.3, (80, 4)),
+            rng.normal(2.0, 0.6, (80, 4)),
+            rng.normal(-1.5, 1.0, (80, 4)),
+        ])
+
+    @pytest.mark.parametrize("covariance_type", ["diag", "full", "tied"])
+    def test_matches_hmmlearn(self, sample_latent, covariance_type):
+        """Posteriors and emission terms match hmmlearn's computation."""
+        wrapper = GaussianHMMWrapper(
+            n_states=3, covariance_type=covariance_type, n_iter=20, random_state=0,
+        ).fit(sample_latent)
+        model = wrapper.model_
+        frame = model._compute_log_likelihood(sample_latent)
+
+        posteriors, log_liks = wrapper.predict_proba_and_log_likelihood(sample_latent)
+
+        np.testing.assert_allclose(posteriors, model.predict_proba(sample_latent), atol=1e-10)
+        np.testing.assert_allclose(
+            wrapper.predict_proba(sample_latent[5:6]), model.predict_proba(sample_latent[5:6]),
+        )
+        expected = np.logaddexp.reduce(np.log(model.startprob_ + 1e-9) + frame, axis=1)
+        np.testing.assert_allclose(log_liks, expected, rtol=1e-10)
+        np.testing.assert_array_equal(wrapper.emission_log_likelihood(sample_latent), log_liks)
+
+    def test_nan_rows(self, sample_latent):
+        wrapper = GaussianHMMWrapper(n_states=3, n_iter=20, random_state=0).fit(sample_latent)
+        Z = sample_latent[:5].copy()
+        Z[2, 1] = np.nan
+
+        posteriors, log_liks = wrapper.predict_proba_and_log_likelihood(Z)
+
+        assert np.isnan(posteriors[2]).all()
+        assert np.isnan(log_liks[2])
+        assert np.isfinite(log_liks[[0, 1, 3, 4]]).all()
+
+    def test_refit_rebuilds_cache(self, sample_latent):
+        wrapper = GaussianHMMWrapper(n_states=3, n_iter=20, random_state=0).fit(sample_latent)
+        before = wrapper._emission_cache
+
+        wrapper.fit(sample_latent + 5.0)
+
+        assert wrapper._emission_cache is not before
+        np.testing.assert_allclose(wrapper._emission_cache.means, wrapper.means)
+
+    def test_cache_rebuilt_on_load(self, sample_latent, tmp_path):
+        wrapper = GaussianHMMWrapper(n_states=3, n_iter=20, random_state=0).fit(sample_latent)
+        wrapper.save(tmp_path / "hmm.pkl")
+
+        assert wrapper.__getstate__()["_emission_cache"] is None
+        loaded = GaussianHMMWrapper.load(tmp_path / "hmm.pkl")
+
+        assert loaded._emission_cache is not None
+        np.testing.assert_array_equal(
+            loaded.emission_log_likelihood(sample_latent),
+            wrapper.emission_log_likelihood(sample_latent),
+        )
+
+
 @pytest.mark.skipif(not HAS_HMMLEARN, reason="hmmlearn not installed")
 class TestSelectNStates:
     """Tests for select_n_states utility."""
@@ -160,6 +229,58 @@ class TestSelectNStates:
         assert 2 <= best_k <= 5
         assert len(scores) >= 1
 
+    def test_parallel_matches_serial(self):
+        """Process-pool selection returns exactly the serial scores."""
+        np.random.seed(7)
+        Z = np.vstack([np.random.randn(80, 3) + 3, np.random.randn(80, 3) - 3])
+
+        serial = select_n_states(Z, state_range=range(2, 6), random_state=3)
+        parallel = select_n_states(Z, state_range=range(2, 6), random_state=3, max_workers=2)
+
+        assert parallel == serial
+
+
+class TestModelSearch:
+    """Tests for ModelSearch."""
+
+    @pytest.mark.skipif(not HAS_HMMLEARN, reason="hmmlearn not installed")
+    def test_results_in_candidate_order_with_val_metrics(self):
+        """Results keep candidate order and score validation data per key."""
+        np.random.seed(0)
+        Z = {2: np.random.randn(120, 2), 3: np.random.randn(120, 3)}
+        candidates = [
+            ModelSearchCandidate(n_states=k, random_state=1, data_key=d)
+            for d in (3, 2) for k in (2, 3)
+        ]
+
+        results = ModelSearch(n_iter=20).run(candidates, Z, Z)
+
+        assert [r.candidate for r in results] == candidates
+        assert all(r.ok and "val_log_likelihood" in r.metrics for r in results)
+
+    def test_failed_candidate_is_reported(self):
+        """A candidate that cannot fit is returned with its error."""
+        results = ModelSearch().run([ModelSearchCandidate(n_states=50)], np.random.randn(10, 2))
+
+        assert results[0].error is not None
+        assert not results[0].ok
+
+    def test_probe_prunes_dominated_candidates(self):
+        """Only candidates within the margin of the best probe are refitted."""
+        candidates = [ModelSearchCandidate(n_states=k) for k in (3, 4, 5)]
+        bic = {3: 100.0, 4: 105.0, 5: 300.0}
+        calls = []
+
+        def fit_all(batch, n_iter):
+            calls.append(([c.n_states for c in batch], n_iter))
+            return [ModelSearchResult(c, {"train_bic": bic[c.n_states]}) for c in batch]
+
+        search = ModelSearch(n_iter=50, probe_iter=5, prune_margin=0.1)
+        results = search._search(candidates, fit_all)
+
+        assert calls == [([3, 4, 5], 5), ([3, 4], 50)]
+        assert [r.pruned for r in results] == [False, False, True]
+
 
 class TestMatchStatesHungarian:
     """Tests for Hungarian state matching."""
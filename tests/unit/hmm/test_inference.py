@@ -0,0 +1,293 @@
+"""Tests for the HMM inference engine."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+try:
+    from hmmlearn import hmm  # noqa: F401
+    HAS_HMMLEARN = True
+except ImportError:
+    HAS_HMMLEARN = False
+
+from src.features.state.hmm.contracts import ModelMetadata
+from src.features.state.hmm.encoders import PCAEncoder
+from src.features.state.hmm.hmm_model import GaussianHMMWrapper
+from src.features.state.hmm.inference import InferenceEngine, MultiSymbolInferenceEngine
+from src.features.state.hmm.scalers import RobustScaler
+
+FEATURES = [f"f{i}" for i in range(6)]
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    """Scaler, encoder and HMM fitted on three clustered regimes."""
+    rng = np.random.default_rng(3)
+    centers = rng.normal(0, 2, (3, len(FEATURES)))
+    labels = np.repeat(rng.integers(0, 3, 60), 20)
+    X = centers[labels] + rng.normal(0, 0.7, (len(labels), len(FEATURES)))
+
+    scaler = RobustScaler().fit(X)
+    encoder = PCAEncoder(latent_dim=3).fit(scaler.transform(X))
+    wrapper = GaussianHMMWrapper(n_states=3, covariance_type="full", n_iter=20, random_state=0)
+    # Short sequences so startprob_ is not degenerate
+    wrapper.fit(encoder.transform(scaler.transform(X)), lengths=[20] * 60)
+    return scaler, encoder, wrapper, X
+
+
+@pytest.fixture
+def engine(fitted) -> InferenceEngine:
+    scaler, encoder, wrapper, _ = fitted
+    metadata = ModelMetadata(
+        model_id="state_v001",
+        timeframe="1Min",
+        version="1.0.0",
+        created_at=datetime(2024, 1, 1),
+        training_start=datetime(2023, 1, 1),
+        training_end=datetime(2024, 1, 1),
+        n_states=3,
+        latent_dim=3,
+        feature_names=FEATURES,
+        symbols=["AAPL"],
+        ood_threshold=-30.0,
+    )
+    return InferenceEngine(scaler, encoder, wrapper, metadata)
+
+
+@pytest.fixture
+def features_df(fitted) -> pd.DataFrame:
+    """Bars with a NaN row and a few far-out (OOD) rows."""
+    X = fitted[3][:400].copy()
+    X[10, 2] = np.nan
+    X[50:53] += 25.0
+    index = pd.date_range("2024-01-02 14:30", periods=len(X), freq="1min")
+    return pd.DataFrame(X, index=index, columns=FEATURES)
+
+
+def _sequential(engine, features_df):
+    engine.reset()
+    return [
+        engine.process(row._asdict(), "AAPL", ts)
+        for ts, row in zip(features_df.index, features_df.itertuples(index=False))
+    ]
+
+
+@pytest.mark.skipif(not HAS_HMMLEARN, reason="hmmlearn not installed")
+class TestInferBatch:
+    """Tests for InferenceEngine.infer_batch."""
+
+    def test_bit_identical_to_process(self, engine, features_df):
+        outputs = _sequential(engine, features_df)
+
+        result = engine.infer_batch(features_df)
+
+        assert result.is_ood[10] and result.is_ood[50:53].all()
+        assert len(set(result.state_id.tolist())) > 2
+        np.testing.assert_array_equal(result.state_id, [o.state_id for o in outputs])
+        np.testing.assert_array_equal(result.state_prob, [o.state_prob for o in outputs])
+        np.testing.assert_array_equal(result.posterior, np.vstack([o.posterior for o in outputs]))
+        np.testing.assert_array_equal(result.log_likelihood, [o.log_likelihood for o in outputs])
+        np.testing.assert_array_equal(result.is_ood, [o.is_ood for o in outputs])
+        np.testing.assert_array_equal(result.z, np.vstack([o.z for o in outputs]))
+
+    def test_leaves_same_online_state(self, engine, features_df):
+        _sequential(engine, features_df)
+        sequential_state = engine._state
+
+        engine.infer_batch(features_df)
+
+        assert engine._state.current_state == sequential_state.current_state
+        assert engine._state.dwell_count == sequential_state.dwell_count
+        assert engine._state.recent_states == sequential_state.recent_states
+        assert engine._state.last_timestamp == sequential_state.last_timestamp
+
+    def test_continue_without_reset(self, engine, features_df):
+        whole = engine.infer_batch(features_df)
+
+        first = engine.infer_batch(features_df.iloc[:200])
+        second = engine.infer_batch(features_df.iloc[200:], reset=False)
+
+        np.testing.assert_array_equal(np.r_[first.state_id, second.state_id], whole.state_id)
+
+    def test_array_input_and_frame(self, engine, features_df):
+        timestamps = list(features_df.index)
+        result = engine.infer_batch(features_df.to_numpy(), timestamps=timestamps)
+
+        df = result.to_frame()
+
+        assert list(df.columns) == [
+            "state_id", "state_prob", "log_likelihood", "is_ood", "p_0", "p_1", "p_2",
+        ]
+        assert df.index.equals(features_df.index)
+        assert df.loc[features_df.index[50], "state_id"] == -1
+
+    def test_missing_columns_are_nan(self, engine, features_df):
+        result = engine.infer_batch(features_df.drop(columns=["f0"]))
+        assert result.is_ood.all()
+
+    def test_process_batch(self, engine, features_df):
+        outputs = _sequential(engine, features_df)
+
+        batch = engine.process_batch(
+            [row._asdict() for row in features_df.itertuples(index=False)],
+            "AAPL",
+            list(features_df.index),
+        )
+
+        assert [o.state_id for o in batch] == [o.state_id for o in outputs]
+        assert [o.is_ood for o in batch] == [o.is_ood for o in outputs]
+        assert batch[0].timestamp == features_df.index[0]
+        np.testing.assert_array_equal(batch[5].posterior, outputs[5].posterior)
+
+
+@pytest.mark.skipif(not HAS_HMMLEARN, reason="hmmlearn not installed")
+class TestForwardFilter:
+    """Tests for the online forward-filter recursion."""
+
+    def test_matches_hmmlearn_forward_pass(self, engine, fitted):
+        from hmmlearn import _hmmc
+
+        X = fitted[3][:600]
+        index = pd.date_range("2024-01-02 14:30", periods=len(X), freq="1min")
+        engine.ood_threshold = -np.inf
+
+        result = engine.infer_batch(pd.DataFrame(X, index=index, columns=FEATURES))
+
+        model = engine.hmm.model_
+        _, fwdlattice = _hmmc.forward_log(
+            model.startprob_, model.transmat_, model._compute_log_likelihood(result.z),
+        )
+        expected = np.exp(fwdlattice - np.logaddexp.reduce(fwdlattice, axis=1, keepdims=True))
+        np.testing.assert_allclose(result.posterior, expected, atol=1e-10)
+
+    def test_process_carries_forward_vector(self, engine, features_df):
+        _, second = _sequential(engine, features_df.iloc[:2])
+        assert engine._state.log_alpha is not None
+
+        engine.reset()
+        restarted = engine.process(features_df.iloc[1].to_dict(), "AAPL", features_df.index[1])
+
+        assert not np.array_equal(second.posterior, restarted.posterior)
+
+    def test_gap_restarts_filter(self, engine, features_df):
+        shifted = features_df.copy()
+        shifted.index = shifted.index.where(np.arange(len(shifted)) < 200, shifted.index + pd.Timedelta(hours=18))
+
+        engine.reset()
+        restarted = engine.process(shifted.iloc[200].to_dict(), "AAPL", shifted.index[200])
+        result = engine.infer_batch(shifted)
+
+        np.testing.assert_array_equal(result.posterior[200], restarted.posterior)
+        assert not np.array_equal(engine.infer_batch(features_df).posterior[200], restarted.posterior)
+
+    def test_ood_restarts_filter(self, engine, features_df):
+        result = engine.infer_batch(features_df)
+
+        engine.reset()
+        restarted = engine.process(features_df.iloc[53].to_dict(), "AAPL", features_df.index[53])
+
+        assert result.is_ood[52]
+        np.testing.assert_array_equal(result.posterior[53], restarted.posterior)
+
+
+SYMBOLS = ["AAPL", "MSFT", "NVDA", "SPY", "QQQ"]
+
+
+@pytest.fixture
+def multi_engine(engine) -> MultiSymbolInferenceEngine:
+    return MultiSymbolInferenceEngine(
+        engine.scaler, engine.encoder, engine.hmm, engine.metadata, symbols=SYMBOLS[:2],
+    )
+
+
+@pytest.fixture
+def panel(fitted) -> dict[str, pd.DataFrame]:
+    """Per-symbol bars with OOD rows, a NaN and missing bars (one long gap)."""
+    X = fitted[3]
+    index = pd.date_range("2024-01-02 14:30", periods=300, freq="1min")
+    bars = {}
+    for i, symbol in enumerate(SYMBOLS):
+        df = pd.DataFrame(X[i * 150:i * 150 + 300].copy(), index=index, columns=FEATURES)
+        df.iloc[40 + 10 * i] += 25.0
+        bars[symbol] = df
+    bars["MSFT"].iloc[70, 1] = np.nan
+    bars["SPY"] = bars["SPY"].drop(index[100:110])
+    bars["QQQ"] = bars["QQQ"].drop(index[150:153])
+    return bars
+
+
+@pytest.mark.skipif(not HAS_HMMLEARN, reason="hmmlearn not installed")
+class TestMultiSymbolInferenceEngine:
+    """Tests for MultiSymbolInferenceEngine."""
+
+    def _run(self, multi_engine, panel):
+        results = []
+        for ts in panel["AAPL"].index:
+            cross_section = pd.DataFrame(
+                {s: df.loc[ts] for s, df in panel.items() if ts in df.index}
+            ).T
+            results.append(multi_engine.update(cross_section, ts))
+        return results
+
+    def test_matches_per_symbol_engines(self, engine, multi_engine, panel):
+        results = self._run(multi_engine, panel)
+
+        for symbol, df in panel.items():
+            expected = engine.infer_batch(df)
+            rows = [(r, r.symbols.index(symbol)) for r in results if symbol in r.symbols]
+            assert len(rows) == len(df)
+
+            np.testing.assert_array_equal([r.state_id[i] for r, i in rows], expected.state_id)
+            np.testing.assert_array_equal([r.posterior[i] for r, i in rows], expected.posterior)
+            np.testing.assert_array_equal([r.log_likelihood[i] for r, i in rows], expected.log_likelihood)
+            np.testing.assert_array_equal([r.is_ood[i] for r, i in rows], expected.is_ood)
+
+            state = multi_engine.get_state(symbol)
+            assert state.current_state == engine._state.current_state
+            assert state.dwell_count == engine._state.dwell_count
+            assert state.recent_states == engine._state.recent_states
+            assert state.last_timestamp == engine._state.last_timestamp
+            np.testing.assert_array_equal(state.log_alpha, engine._state.log_alpha)
+
+        assert len({tuple(r.state_id) for r in results}) > 1
+
+    def test_registers_symbols_and_grows(self, engine, fitted):
+        multi = MultiSymbolInferenceEngine(engine.scaler, engine.encoder, engine.hmm, engine.metadata)
+        symbols = [f"S{i:03d}" for i in range(40)]
+
+        result = multi.update(fitted[3][:40], datetime(2024, 1, 2, 14, 30), symbols=symbols)
+
+        assert multi.symbols == symbols
+        assert len(result) == 40
+        assert list(result.to_frame().index) == symbols
+        assert multi.get_state("S039").dwell_count == 1
+
+    def test_reset_single_symbol(self, multi_engine, panel):
+        self._run(multi_engine, {s: panel[s].iloc[:20] for s in SYMBOLS[:2]})
+
+        multi_engine.reset(["AAPL"])
+
+        assert multi_engine.get_state("AAPL").current_state == -1
+        assert multi_engine.get_state("AAPL").log_alpha is None
+        assert multi_engine.get_state("MSFT").dwell_count > 0
+
+    def test_process_returns_outputs(self, engine, multi_engine, features_df):
+        row = features_df.iloc[0].to_dict()
+        outputs = multi_engine.process({"AAPL": row, "MSFT": row}, features_df.index[0])
+        expected = engine.process(row, "AAPL", features_df.index[0])
+
+        assert set(outputs) == {"AAPL", "MSFT"}
+        assert outputs["MSFT"].symbol == "MSFT"
+        assert outputs["AAPL"].state_id == expected.state_id
+        np.testing.assert_array_equal(outputs["AAPL"].posterior, expected.posterior)
+
+    def test_rejects_bad_rows(self, multi_engine, features_df):
+        X = features_df.to_numpy()[:2]
+        ts = features_df.index[0]
+
+        with pytest.raises(ValueError):
+            multi_engine.update(X, ts)
+        with pytest.raises(ValueError):
+            multi_engine.update(X, ts, symbols=["AAPL", "AAPL"])
@@ -0,0 +1,228 @@
+"""Tests for the token-bucket RateLimiter and batched multi-symbol provider fetches."""
+
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from src.data.session_calendar import get_session_calendar
+from src.marketdata.alpaca_provider import (
+    MAX_SYMBOLS_PER_REQUEST,
+    PAGE_LIMIT,
+    RESOLUTION_MAP,
+    AlpacaProvider,
+    symbols_per_request,
+)
+from src.marketdata.base import MarketDataProvider
+from src.marketdata.utils import RateLimiter
+
+
+class FakeClock:
+    """Clock that only advances when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_burst_then_sustained_rate(self):
+        """Up to ``burst`` calls pass immediately, then calls are spaced evenly."""
+        clock = FakeClock()
+        waits = []
+        limiter = RateLimiter(60, burst=3, metrics_hook=waits.append, clock=clock, sleep=clock.sleep)
+
+        for _ in range(5):
+            limiter.acquire()
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3:] == pytest.approx([1.0, 1.0])
+        assert limiter.stats() == {"calls": 5, "throttled_calls": 2, "total_wait_seconds": pytest.approx(2.0)}
+
+    def test_refills_while_idle(self):
+        """An idle period refills the bucket up to ``burst`` only."""
+        clock = FakeClock()
+        limiter = RateLimiter(60, burst=2, clock=clock, sleep=clock.sleep)
+        limiter.acquire()
+        limiter.acquire()
+
+        clock.now += 100.0
+        assert [limiter.acquire() for _ in range(3)] == pytest.approx([0.0, 0.0, 1.0])
+
+    def test_default_spacing_matches_min_interval(self):
+        """With burst=1 consecutive calls are min_interval apart."""
+        clock = FakeClock()
+        limiter = RateLimiter(120, clock=clock, sleep=clock.sleep)
+
+        limiter.wait()
+        limiter.wait()
+
+        assert clock.sleeps == pytest.approx([limiter.min_interval])
+
+    def test_shared_across_threads(self):
+        """Concurrent callers each reserve the next slot at the sustained rate."""
+        clock = FakeClock()
+        waits = []
+        # The clock stays frozen, so each wait is the caller's reserved slot
+        limiter = RateLimiter(6000, burst=1, metrics_hook=waits.append, clock=clock, sleep=lambda s: None)
+
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(21)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert limiter.calls == 21
+        assert sorted(waits) == pytest.approx([i * 0.01 for i in range(21)])
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+        with pytest.raises(ValueError):
+            RateLimiter(60, burst=0)
+
+
+class FakeAlpacaProvider(AlpacaProvider):
+    """AlpacaProvider with the SDK call replaced by an in-memory feed.
+
+    Bars exist at every extended-hours session slot.  Like the SDK, one
+    request follows ``next_page_token`` through pages of ``PAGE_LIMIT``
+    bars, each recorded as an HTTP call in ``pages``.
+    """
+
+    def __init__(self, rate_limiter: RateLimiter, fail_symbols=(), max_workers: int = 8):
+        self.rate_limiter = rate_limiter
+        self.max_retries = 1
+        self.max_workers = max_workers
+        self.fail_symbols = set(fail_symbols)
+        self.requests: list[int] = []
+        self.pages: list[int] = []
+        self._lock = threading.Lock()
+
+    def _request_bars(self, symbols, start, end, timeframe):
+        resolution = next(r for r, tf in RESOLUTION_MAP.items() if tf is timeframe)
+        index = get_session_calendar(extended_hours=True).expected_index(resolution, start, end)
+        n_bars = len(symbols) * len(index)
+        with self._lock:
+            self.requests.append(len(symbols))
+            self.pages.extend(min(PAGE_LIMIT, n_bars - i) for i in range(0, max(n_bars, 1), PAGE_LIMIT))
+        if self.fail_symbols & set(symbols):
+            raise ConnectionError("upstream error")
+        frames = []
+        for i, symbol in enumerate(symbols):
+            price = 100.0 + i
+            frames.append(pd.DataFrame({
+                "symbol": symbol,
+                "timestamp": index.tz_localize("UTC"),
+                "open": price, "high": price + 1, "low": price - 1, "close": price, "volume": 1000,
+                "trade_count": 10, "vwap": price,
+            }))
+        return pd.concat(frames).set_index(["symbol", "timestamp"])
+
+
+class TestAlpacaMultiSymbol:
+    """Tests for AlpacaProvider.fetch_bars_multi using a fake SDK call."""
+
+    START = datetime(2023, 1, 1)
+    END = datetime(2024, 12, 31)
+
+    @staticmethod
+    def _limiter(rate_per_second: float, burst: int) -> tuple[RateLimiter, list[float]]:
+        """Limiter on a frozen clock; the waits are each token's release time."""
+        waits = []
+        limiter = RateLimiter(
+            int(rate_per_second * 60), burst=burst, metrics_hook=waits.append,
+            clock=FakeClock(), sleep=lambda s: None,
+        )
+        return limiter, waits
+
+    def test_500_symbol_daily_refresh_within_rate_budget(self):
+        """500 symbols are batched so every HTTP page takes one limiter token."""
+        rate_per_second, burst = 20.0, 4
+        limiter, waits = self._limiter(rate_per_second, burst)
+        provider = FakeAlpacaProvider(limiter)
+        symbols = [f"S{i:03d}" for i in range(500)]
+
+        result = provider.fetch_bars_multi(symbols, self.START, self.END, resolution="1Day")
+
+        assert max(provider.pages) <= PAGE_LIMIT
+        assert len(provider.pages) == len(provider.requests) == limiter.calls
+        assert max(provider.requests) > 1
+
+        # Tokens are released at the sustained rate after the burst ...
+        releases = sorted(waits)
+        assert releases[:burst] == [0.0] * burst
+        assert releases[-1] == pytest.approx((limiter.calls - burst) / rate_per_second)
+        # ... and far from one request per symbol per chunk
+        assert limiter.calls < len(symbols) / 10
+
+        assert sorted(result) == symbols
+        assert len(result["S000"]) == get_session_calendar().expected_count("1Day", self.START, self.END)
+        assert list(result["S499"].columns) == ["open", "high", "low", "close", "volume"]
+        assert result["S499"].index.tz is None
+
+    def test_minute_batches_fit_one_page(self):
+        """1Min requests over several weeks never spill onto a second page."""
+        limiter, _ = self._limiter(1000.0, 50)
+        provider = FakeAlpacaProvider(limiter)
+        symbols = [f"S{i:03d}" for i in range(30)]
+
+        result = provider.fetch_bars_multi(symbols, datetime(2024, 3, 1), datetime(2024, 4, 1), resolution="1Min")
+
+        assert max(provider.pages) <= PAGE_LIMIT
+        assert len(provider.pages) == limiter.calls
+        assert len(result["S000"]) == get_session_calendar(extended_hours=True).expected_count(
+            "1Min", datetime(2024, 3, 1), datetime(2024, 4, 1),
+        )
+
+    def test_symbols_per_request(self):
+        day = datetime(2024, 1, 2)
+        # 900 bars from 04:00 ET to midnight UTC
+        assert symbols_per_request("1Min", day, day + timedelta(days=1)) == PAGE_LIMIT // 900
+        assert symbols_per_request("1Min", day, day + timedelta(days=10)) == 1
+        assert symbols_per_request("1Day", day, day + timedelta(days=7)) == MAX_SYMBOLS_PER_REQUEST["1Day"]
+        assert symbols_per_request("1Day", self.START, self.START + timedelta(days=365)) == PAGE_LIMIT // 250
+
+    def test_failed_batch_omitted(self):
+        """Symbols in a failed request are left out; the rest are returned."""
+        provider = FakeAlpacaProvider(RateLimiter(60000, burst=50), fail_symbols={"S250"})
+        symbols = [f"S{i:03d}" for i in range(300)]
+
+        result = provider.fetch_bars_multi(symbols, self.START, self.END, resolution="1Day")
+
+        assert "S250" not in result
+        assert {"S000", "S299"} <= set(result)
+
+    def test_single_symbol_fetch_raises(self):
+        """fetch_bars keeps raising on failure."""
+        provider = FakeAlpacaProvider(RateLimiter(60000, burst=50), fail_symbols={"AAPL"})
+
+        with pytest.raises(RuntimeError):
+            provider.fetch_bars("aapl", self.START, self.END, resolution="1Day")
+
+
+class TestDefaultMultiSymbol:
+    """Tests for the MarketDataProvider.fetch_bars_multi fallback."""
+
+    def test_loops_over_fetch_bars(self):
+        class OneAtATime(MarketDataProvider):
+            source_name = "fake"
+
+            def fetch_bars(self, symbol, start, end, resolution="1Min"):
+                if symbol == "BAD":
+                    raise RuntimeError("nope")
+                return pd.DataFrame({"close": [1.0]})
+
+        result = OneAtATime().fetch_bars_multi(["aapl", "AAPL", "bad", "msft"], datetime(2024, 1, 1), datetime(2024, 2, 1))
+
+        assert list(result) == ["AAPL", "MSFT"]
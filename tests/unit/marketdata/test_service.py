@@ -1,5 +1,6 @@
 """Tests for MarketDataService."""
 
+import threading
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch, call
 
@@ -152,6 +153,32 @@ class TestEnsureData1Min:
         fetch_start = call_args[0][1]
         assert fetch_start > old_latest
 
+    def test_skips_fetch_when_market_closed(
+        self, mock_provider, mock_db_manager, mock_repo,
+    ):
+        """Nothing is requested when only weekend time has passed."""
+        mock_repo.get_latest_timestamp.return_value = datetime(2024, 1, 6, 0, 59)  # Fri post-market close
+
+        with _patch_grpc(mock_repo):
+            svc = _make_service(mock_provider, mock_db_manager)
+            result = svc.ensure_data("AAPL", ["1Min"], end=datetime(2024, 1, 8, 8, 0))
+
+        assert result["1Min"] == 0
+        mock_provider.fetch_1min_bars.assert_not_called()
+
+    def test_fetch_starts_at_next_session(
+        self, mock_provider, mock_db_manager, mock_repo, sample_1min_df,
+    ):
+        """The fetch skips the weekend and MLK day to Tuesday's pre-market."""
+        mock_repo.get_latest_timestamp.return_value = datetime(2024, 1, 13, 0, 59)
+        mock_provider.fetch_1min_bars.return_value = sample_1min_df
+
+        with _patch_grpc(mock_repo):
+            svc = _make_service(mock_provider, mock_db_manager)
+            svc.ensure_data("AAPL", ["1Min"], end=datetime(2024, 1, 16, 15, 0))
+
+        assert mock_provider.fetch_1min_bars.call_args[0][1] == datetime(2024, 1, 16, 9, 0)
+
     def test_empty_provider_response_returns_zero(
         self, mock_provider, mock_db_manager, mock_repo,
     ):
@@ -221,7 +248,7 @@ class TestEnsureDataAggregation:
         self, mock_provider, mock_db_manager, mock_repo, sample_1min_df,
     ):
         mock_provider.fetch_1min_bars.return_value = sample_1min_df
-        mock_repo.get_bars.return_value = sample_1min_df
+        mock_repo.iter_bars.return_value = iter([sample_1min_df])
         # First call for 1Min bulk_insert, second for 5Min bulk_insert
         mock_repo.bulk_insert_bars.side_effect = [60, 12]
 
@@ -238,7 +265,7 @@ class TestEnsureDataAggregation:
         self, mock_provider, mock_db_manager, mock_repo, sample_1min_df,
     ):
         mock_provider.fetch_1min_bars.return_value = sample_1min_df
-        mock_repo.get_bars.return_value = sample_1min_df
+        mock_repo.iter_bars.return_value = iter([sample_1min_df])
         mock_repo.bulk_insert_bars.side_effect = [60, 12]
 
         with _patch_grpc(mock_repo):
@@ -254,7 +281,7 @@ class TestEnsureDataAggregation:
         self, mock_provider, mock_db_manager, mock_repo,
     ):
         mock_provider.fetch_1min_bars.return_value = pd.DataFrame()
-        mock_repo.get_bars.return_value = pd.DataFrame()
+        mock_repo.iter_bars.return_value = iter([pd.DataFrame()])
 
         with _patch_grpc(mock_repo):
             svc = _make_service(mock_provider, mock_db_manager)
@@ -274,7 +301,7 @@ class TestEnsureDataMixed:
     ):
         mock_provider.fetch_1min_bars.return_value = sample_1min_df
         mock_provider.fetch_daily_bars.return_value = sample_daily_df
-        mock_repo.get_bars.return_value = sample_1min_df
+        mock_repo.iter_bars.return_value = iter([sample_1min_df])
         # 1Min, 5Min, 1Hour, 1Day
         mock_repo.bulk_insert_bars.side_effect = [60, 12, 1, 20]
 
@@ -391,3 +418,249 @@ class TestEdgeCases:
         sync_call = mock_repo.update_sync_log.call_args
         assert sync_call[1]["status"] == "failed"
         assert "API down" in sync_call[1]["error_message"]
+
+
+# -----------------------------------------------------------------------
+# Request coalescing
+# -----------------------------------------------------------------------
+
+
+class TestCoalescing:
+    def _blocking_provider(self, mock_provider, df, release):
+        """Make 1Min fetches block on ``release``; each fetch releases ``fetched``."""
+        calls = []
+        fetched = threading.Semaphore(0)
+
+        def fetch(symbol, start, end):
+            calls.append((symbol, start, end))
+            fetched.release()
+            release.wait(timeout=5)
+            return df
+
+        mock_provider.fetch_1min_bars.side_effect = fetch
+        return calls, fetched
+
+    def _run_concurrently(self, svc, first, second):
+        """Start two ensure_data calls, the second once the first has claimed its work.
+
+        Returns the threads, their results and an event set once the second
+        call has claimed (or borrowed) its work.
+        """
+        claimed = [threading.Event(), threading.Event()]
+        claim = svc._claim
+
+        def tracked_claim(*args, **kwargs):
+            result = claim(*args, **kwargs)
+            next(e for e in claimed if not e.is_set()).set()
+            return result
+
+        svc._claim = tracked_claim
+        results = {}
+        t1 = threading.Thread(target=lambda: results.setdefault("first", svc.ensure_data(*first[0], **first[1])))
+        t1.start()
+        assert claimed[0].wait(timeout=5)
+        t2 = threading.Thread(target=lambda: results.setdefault("second", svc.ensure_data(*second[0], **second[1])))
+        t2.start()
+        return t1, t2, results, claimed[1]
+
+    def test_contained_range_reuses_in_flight_request(
+        self, mock_provider, mock_db_manager, mock_repo, sample_1min_df,
+    ):
+        release = threading.Event()
+        calls, _ = self._blocking_provider(mock_provider, sample_1min_df, release)
+        mock_repo.bulk_insert_bars.return_value = 60
+        end = datetime(2024, 1, 2, 11, 0)
+
+        with _patch_grpc(mock_repo):
+            svc = _make_service(mock_provider, mock_db_manager)
+            t1, t2, results, second_claimed = self._run_concurrently(
+                svc,
+                (("AAPL", ["1Min"]), {"start": datetime(2024, 1, 1), "end": end}),
+                (("aapl", ["1Min"]), {"start": datetime(2024, 1, 2), "end": end}),
+            )
+            assert second_claimed.wait(timeout=5)
+            release.set()
+            t1.join()
+            t2.join()
+
+        assert len(calls) == 1
+        assert results["first"] == results["second"] == {"1Min": 60}
+        assert svc._pending_requests == {}
+
+    def test_other_timeframe_not_reused(
+        self, mock_provider, mock_db_manager, mock_repo, sample_1min_df, sample_daily_df,
+    ):
+        """A 1Day request must not wait on and reuse an in-flight 1Min request."""
+        release = threading.Event()
+        self._blocking_provider(mock_provider, sample_1min_df, release)
+        mock_provider.fetch_daily_bars.return_value = sample_daily_df
+        mock_repo.bulk_insert_bars.side_effect = lambda df, **kw: len(df)
+
+        with _patch_grpc(mock_repo):
+            svc = _make_service(mock_provider, mock_db_manager)
+            t1, t2, results, _ = self._run_concurrently(
+                svc,
+                (("AAPL", ["1Min"]), {"start": datetime(2024, 1, 2)}),
+                (("AAPL", ["1Day"]), {"start": datetime(2024, 1, 2)}),
+            )
+            t2.join(timeout=5)
+            assert results["second"] == {"1Day": 20}
+            release.set()
+            t1.join()
+
+        mock_provider.fetch_daily_bars.assert_called_once()
+        assert results["first"] == {"1Min": 60}
+
+    def test_wider_range_not_reused(
+        self, mock_provider, mock_db_manager, mock_repo, sample_1min_df,
+    ):
+        release = threading.Event()
+        calls, fetched = self._blocking_provider(mock_provider, sample_1min_df, release)
+        end = datetime(2024, 1, 2, 11, 0)
+
+        with _patch_grpc(mock_repo):
+            svc = _make_service(mock_provider, mock_db_manager)
+            t1, t2, _, _ = self._run_concurrently(
+                svc,
+                (("AAPL", ["1Min"]), {"start": datetime(2024, 1, 2), "end": end}),
+                (("AAPL", ["1Min"]), {"start": datetime(2023, 12, 1), "end": end}),
+            )
+            # Both requests reach the provider while the first is still blocked
+            assert fetched.acquire(timeout=5)
+            assert fetched.acquire(timeout=5)
+            release.set()
+            t1.join()
+            t2.join()
+
+        assert len(calls) == 2
+
+    def test_error_propagates_to_waiters(
+        self, mock_provider, mock_db_manager, mock_repo,
+    ):
+        svc = _make_service(mock_provider, mock_db_manager)
+        owned, _ = svc._claim(["AAPL"], ["1Min"], None, datetime(2024, 1, 2))
+        _, borrowed = svc._claim(["AAPL"], ["1Min"], None, datetime(2024, 1, 2))
+
+        svc._release(owned, {}, error=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            borrowed[("AAPL", "1Min")].wait()
+        assert svc._pending_requests == {}
+
+
+# -----------------------------------------------------------------------
+# ensure_universe
+# -----------------------------------------------------------------------
+
+
+def _minute_frame(start: str, periods: int) -> pd.DataFrame:
+    index = pd.date_range(start, periods=periods, freq="1min")
+    return pd.DataFrame(
+        {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 1000},
+        index=index,
+    )
+
+
+@pytest.fixture
+def universe_repo():
+    """Repo with tickers for S000..S249 and per-symbol latest timestamps."""
+    repo = MagicMock()
+    repo.list_tickers.return_value = [MagicMock(symbol=f"S{i:03d}", id=i) for i in range(250)]
+    repo.get_or_create_ticker.side_effect = lambda s: MagicMock(symbol=s, id=999)
+    repo.latest = {}
+    repo.get_latest_timestamps.side_effect = lambda symbols, tf: {
+        s: repo.latest.get((s, tf)) for s in symbols
+    }
+    repo.bulk_insert_bars.side_effect = lambda df, **kw: len(df)
+    return repo
+
+
+class TestEnsureUniverse:
+    END = datetime(2024, 1, 3, 0, 0)
+
+    def test_batches_lookups_and_fetches(self, mock_provider, mock_db_manager, universe_repo):
+        symbols = [f"S{i:03d}" for i in range(250)]
+        for s in symbols[:200]:
+            universe_repo.latest[(s, "1Min")] = datetime(2024, 1, 2, 9, 29)
+        # Up to date: no fetch
+        for s in symbols[200:]:
+            universe_repo.latest[(s, "1Min")] = self.END
+        mock_provider.fetch_bars_multi.side_effect = lambda syms, start, end, res: {
+            s: _minute_frame("2024-01-02 09:30", 10) for s in syms
+        }
+
+        with _patch_grpc(universe_repo):
+            svc = _make_service(mock_provider, mock_db_manager)
+            result = svc.ensure_universe([s.lower() for s in symbols], ["1Min"], end=self.END, batch_size=100)
+
+        universe_repo.get_latest_timestamps.assert_called_once()
+        universe_repo.get_latest_timestamp.assert_not_called()
+        universe_repo.get_or_create_ticker.assert_not_called()
+        assert mock_provider.fetch_bars_multi.call_count == 2
+        fetched = [s for c in mock_provider.fetch_bars_multi.call_args_list for s in c.args[0]]
+        assert sorted(fetched) == symbols[:200]
+        assert result["S000"] == {"1Min": 10}
+        assert result["S249"] == {"1Min": 0}
+        mock_provider.fetch_1min_bars.assert_not_called()
+
+    def test_shared_request_trimmed_per_symbol(self, mock_provider, mock_db_manager, universe_repo):
+        """Symbols with different gaps on the same day share one request."""
+        universe_repo.latest[("S000", "1Min")] = datetime(2024, 1, 2, 9, 29)
+        universe_repo.latest[("S001", "1Min")] = datetime(2024, 1, 2, 9, 34)
+        mock_provider.fetch_bars_multi.side_effect = lambda syms, start, end, res: {
+            s: _minute_frame("2024-01-02 09:30", 10) for s in syms
+        }
+
+        with _patch_grpc(universe_repo):
+            svc = _make_service(mock_provider, mock_db_manager)
+            result = svc.ensure_universe(["S000", "S001"], ["1Min"], end=self.END)
+
+        mock_provider.fetch_bars_multi.assert_called_once()
+        assert mock_provider.fetch_bars_multi.call_args.args[1] == datetime(2024, 1, 2, 9, 30)
+        assert result == {"S000": {"1Min": 10}, "S001": {"1Min": 5}}
+
+    def test_failed_symbols_isolated(self, mock_provider, mock_db_manager, universe_repo):
+        mock_provider.fetch_bars_multi.side_effect = lambda syms, start, end, res: {
+            s: _minute_frame("2024-01-02 09:30", 3) for s in syms if s != "S001"
+        }
+
+        with _patch_grpc(universe_repo):
+            svc = _make_service(mock_provider, mock_db_manager)
+            result = svc.ensure_universe(["S000", "S001", "NEW"], ["1Min"], start=datetime(2024, 1, 2), end=self.END)
+
+        assert result == {"S000": {"1Min": 3}, "S001": {"1Min": 0}, "NEW": {"1Min": 3}}
+        universe_repo.get_or_create_ticker.assert_called_once_with("NEW")
+        failed = [c.kwargs for c in universe_repo.update_sync_log.call_args_list if c.kwargs["status"] == "failed"]
+        assert [f["ticker_id"] for f in failed] == [1]
+
+    def test_aggregates_from_single_read(self, mock_provider, mock_db_manager, universe_repo, sample_daily_df):
+        mock_provider.fetch_bars_multi.side_effect = lambda syms, start, end, res: {
+            s: (sample_daily_df if res == "1Day" else _minute_frame("2024-01-02 15:00", 60)) for s in syms
+        }
+        universe_repo.iter_bars.side_effect = lambda *a, **kw: iter([_minute_frame("2024-01-02 15:00", 60)])
+
+        with _patch_grpc(universe_repo):
+            svc = _make_service(mock_provider, mock_db_manager)
+            result = svc.ensure_universe(
+                ["S000", "S001"], ["5Min", "1Hour", "1Day"], start=datetime(2024, 1, 2), end=self.END,
+            )
+
+        assert result["S000"] == {"1Min": 60, "5Min": 12, "1Hour": 1, "1Day": 20}
+        assert universe_repo.iter_bars.call_count == 2
+        assert {c.args[3] for c in mock_provider.fetch_bars_multi.call_args_list} == {"1Min", "1Day"}
+
+    def test_coalesces_with_in_flight_ensure_data(self, mock_provider, mock_db_manager, universe_repo):
+        svc = _make_service(mock_provider, mock_db_manager)
+        owned, _ = svc._claim(["S000"], ["1Min"], None, self.END)
+
+        def fetch(syms, start, end, res):
+            # S000 is borrowed by now; finish the in-flight request mid-fetch
+            svc._release(owned, {("S000", "1Min"): 7})
+            return {s: _minute_frame("2024-01-02 09:30", 2) for s in syms}
+
+        mock_provider.fetch_bars_multi.side_effect = fetch
+        with _patch_grpc(universe_repo):
+            result = svc.ensure_universe(["S000", "S001"], ["1Min"], end=self.END)
+
+        assert result == {"S000": {"1Min": 7}, "S001": {"1Min": 2}}
+        assert mock_provider.fetch_bars_multi.call_args.args[0] == ["S001"]
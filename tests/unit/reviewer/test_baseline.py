@@ -0,0 +1,156 @@
+"""Unit tests for batched indicator snapshots in baseline stats computation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.session_calendar import get_session_calendar
+from src.reviewer.baseline import (
+    _bars_to_dataframe,
+    _compute_fill_snapshots,
+    _compute_indicator_snapshot,
+    compute_baseline_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_talib(monkeypatch):
+    """TA-Lib is optional; snapshot the pandas calculators only."""
+    monkeypatch.setattr("src.features.talib_indicators.TALIB_AVAILABLE", False)
+
+
+class StubApiClient:
+    """In-memory ReviewerApiClient serving 15Min bars for a few symbols."""
+
+    def __init__(self, symbols=("AAPL", "MSFT"), start="2024-01-02", end="2024-04-01", fills=None):
+        index = get_session_calendar().expected_index("15Min", start, end)
+        rng = np.random.default_rng(0)
+        self.bars = {}
+        for symbol in symbols:
+            close = 100 + np.cumsum(rng.normal(0, 0.2, len(index)))
+            self.bars[symbol] = pd.DataFrame(
+                {
+                    "open": close, "high": close + 0.3, "low": close - 0.3, "close": close,
+                    "volume": rng.integers(1_000, 5_000, len(index)).astype(float),
+                },
+                index=index,
+            )
+        self.fills = fills or []
+        self.bar_requests = []
+        self.saved = None
+
+    def get_fills(self, account_id, lookback_days):
+        return self.fills
+
+    def get_profile(self, account_id):
+        return {"account_balance": 100_000.0}
+
+    def get_ohlcv_bars(self, symbol, timeframe, end=None, last_n_bars=None, start=None):
+        self.bar_requests.append((symbol, timeframe, start, end, last_n_bars))
+        df = self.bars.get(symbol)
+        if df is None:
+            return []
+        if end:
+            df = df[df.index <= pd.Timestamp(end).tz_localize(None)]
+        if start:
+            df = df[df.index >= pd.Timestamp(start).tz_localize(None)]
+        if last_n_bars:
+            df = df.iloc[-last_n_bars:]
+        return [
+            {"timestamp": ts.isoformat(), **row}
+            for ts, row in zip(df.index, df.to_dict("records"))
+        ]
+
+    def save_baseline_stats(self, account_id, stats):
+        self.saved = stats
+
+
+def make_fills(client: StubApiClient, n: int, seed: int = 1) -> list[dict]:
+    """Fills at random bar times (plus a few seconds) after the first 300 bars."""
+    rng = np.random.default_rng(seed)
+    fills = []
+    for i in range(n):
+        symbol = list(client.bars)[i % len(client.bars)]
+        index = client.bars[symbol].index
+        ts = index[rng.integers(300, len(index))] + pd.Timedelta(seconds=7)
+        fills.append({
+            "id": i, "symbol": symbol, "side": "buy", "price": 100.0, "quantity": 10,
+            "executed_at": ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+    return fills
+
+
+def per_fill_snapshot(client: StubApiClient, fill: dict):
+    """Reference: the 250 bars up to the fill, indicators on that window."""
+    bars = client.get_ohlcv_bars(fill["symbol"], "15Min", end=fill["executed_at"], last_n_bars=250)
+    return _compute_indicator_snapshot(_bars_to_dataframe(bars))
+
+
+class TestComputeFillSnapshots:
+    """Tests for _compute_fill_snapshots."""
+
+    def test_one_request_per_symbol_timeframe(self):
+        client = StubApiClient()
+        fills = make_fills(client, 40)
+        fills.append({**fills[0], "timeframe": "1Hour"})
+
+        snapshots = _compute_fill_snapshots(fills, client)
+
+        assert len(snapshots) == len(fills)
+        assert sorted((r[0], r[1]) for r in client.bar_requests) == [
+            ("AAPL", "15Min"), ("AAPL", "1Hour"), ("MSFT", "15Min"),
+        ]
+
+    def test_matches_per_fill_window(self):
+        """Each snapshot equals indicators computed on the bars up to that fill."""
+        client = StubApiClient()
+        fills = make_fills(client, 12)
+
+        snapshots = _compute_fill_snapshots(fills, client)
+
+        for fill, snapshot in zip(fills, snapshots):
+            expected = per_fill_snapshot(client, fill)
+            assert snapshot.keys() == expected.keys()
+            # Rolling windows match exactly; EMAs only differ by warm-up length
+            assert snapshot == pytest.approx(expected, rel=1e-3)
+            for key in ("rv_15", "rv_60", "vwap_60", "breakout_20", "volume"):
+                if key in expected:
+                    assert snapshot[key] == pytest.approx(expected[key], rel=1e-9)
+
+    def test_window_covers_history_before_earliest_fill(self):
+        client = StubApiClient(symbols=("AAPL",))
+        fills = make_fills(client, 5)
+
+        _compute_fill_snapshots(fills, client)
+
+        (_, _, start, end, _), = client.bar_requests
+        earliest = min(pd.Timestamp(f["executed_at"]).tz_localize(None) for f in fills)
+        history = client.bars["AAPL"].loc[pd.Timestamp(start).tz_localize(None):earliest]
+        assert len(history) == 250
+        assert end == max(f["executed_at"] for f in fills)
+
+    def test_fills_without_history_or_data_are_skipped(self):
+        client = StubApiClient(symbols=("AAPL",))
+        index = client.bars["AAPL"].index
+        fills = [
+            {"symbol": "AAPL", "executed_at": index[10].isoformat()},    # < 30 bars before
+            {"symbol": "AAPL", "executed_at": index[400].isoformat()},
+            {"symbol": "NOPE", "executed_at": index[400].isoformat()},   # no bars
+            {"symbol": "AAPL", "executed_at": None},
+            {"symbol": "AAPL", "executed_at": "not a time"},
+        ]
+
+        snapshots = _compute_fill_snapshots(fills, client)
+
+        assert [s is not None for s in snapshots] == [False, True, False, False, False]
+
+
+def test_compute_baseline_stats_end_to_end():
+    client = StubApiClient()
+    client.fills = make_fills(client, 20)
+
+    stats = compute_baseline_stats(account_id=1, api_client=client, min_fills=5)
+
+    assert stats["fill_count"] == 20
+    assert client.saved is stats
+    assert len(client.bar_requests) == 2
@@ -520,3 +520,84 @@ class TestScoreComputation:
         score = orchestrator._compute_score(items)
         # WARNING is -5 points: 100 - 5 = 95
         assert score == 95.0
+
+
+class TestEvaluateMany:
+    """Tests for batch evaluation."""
+
+    def _intent(self, symbol: str, timeframe: str = "1Hour", entry: float = 150.0) -> TradeIntent:
+        return TradeIntent(
+            user_id=1,
+            symbol=symbol,
+            direction=TradeDirection.LONG,
+            timeframe=timeframe,
+            entry_price=entry,
+            stop_loss=entry - 5,
+            profit_target=entry + 10,
+        )
+
+    def _evaluator(self) -> Mock:
+        evaluator = Mock(spec=Evaluator)
+        evaluator.name = "echo"
+        evaluator.evaluate.side_effect = lambda intent, context, config: [EvaluationItem(
+            evaluator="echo",
+            code="E0",
+            severity=Severity.WARNING,
+            title=f"{context.symbol} {intent.entry_price}",
+            message="echo",
+        )]
+        return evaluator
+
+    def _builder(self, fail_symbols: tuple = ()) -> Mock:
+        builder = Mock(spec=ContextPackBuilder)
+
+        def build(symbol, timeframe, **kwargs):
+            if symbol in fail_symbols:
+                raise RuntimeError("data service unavailable")
+            return ContextPack(symbol=symbol, timestamp=datetime(2025, 1, 1), primary_timeframe=timeframe)
+
+        builder.build.side_effect = build
+        return builder
+
+    def test_results_in_input_order(self):
+        """Results line up with the input intents."""
+        orchestrator = EvaluatorOrchestrator(context_builder=self._builder())
+        orchestrator._evaluators = [self._evaluator()]
+        intents = [self._intent(sym, entry=100.0 + i) for i, sym in enumerate(["AAPL", "MSFT", "aapl", "NVDA", "MSFT"])]
+
+        results = orchestrator.evaluate_many(intents, max_workers=4)
+
+        assert [r.intent for r in results] == intents
+        assert [r.items[0].title for r in results] == [
+            f"{i.symbol} {i.entry_price}" for i in intents
+        ]
+
+    def test_context_built_once_per_group(self):
+        """Intents sharing symbol and timeframe share one context build."""
+        builder = self._builder()
+        orchestrator = EvaluatorOrchestrator(context_builder=builder)
+        orchestrator._evaluators = [self._evaluator()]
+        intents = [self._intent("AAPL"), self._intent("AAPL"), self._intent("AAPL", "5Min"), self._intent("MSFT")]
+
+        orchestrator.evaluate_many(intents)
+
+        built = sorted((c.kwargs["symbol"], c.kwargs["timeframe"]) for c in builder.build.call_args_list)
+        assert built == [("AAPL", "1Hour"), ("AAPL", "5Min"), ("MSFT", "1Hour")]
+
+    def test_context_failure_isolated_to_group(self):
+        """A failed context build flags its own intents only."""
+        orchestrator = EvaluatorOrchestrator(context_builder=self._builder(fail_symbols=("MSFT",)))
+        orchestrator._evaluators = [self._evaluator()]
+
+        results = orchestrator.evaluate_many([self._intent("AAPL"), self._intent("MSFT")])
+
+        assert [i.code for i in results[0].items] == ["E0"]
+        assert sorted(i.code for i in results[1].items) == ["E0", "ERR002"]
+
+    def test_empty_input(self):
+        """No intents yields no results and no context builds."""
+        builder = self._builder()
+        orchestrator = EvaluatorOrchestrator(context_builder=builder)
+
+        assert orchestrator.evaluate_many([]) == []
+        builder.build.assert_not_called()
@@ -0,0 +1,51 @@
+"""Tests for shared memory helpers."""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.shared_memory import SharedMemoryStore
+
+
+class TestSharedMemoryStore:
+    """Tests for SharedMemoryStore and handles."""
+
+    def test_array_round_trip(self):
+        """Shared arrays re-attach with identical contents."""
+        array = np.arange(12, dtype=np.float32).reshape(3, 4)
+        with SharedMemoryStore() as store:
+            handle = pickle.loads(pickle.dumps(store.share_array(array)))
+            with handle.open() as shared:
+                np.testing.assert_array_equal(shared, array)
+                assert shared.dtype == np.float32
+                assert not shared.flags.writeable
+
+    def test_frame_round_trip_preserves_tz_index(self):
+        """DataFrames keep columns, dtypes and tz-aware index."""
+        index = pd.date_range("2024-01-02 09:30", periods=5, freq="1min", tz="America/New_York", name="timestamp")
+        df = pd.DataFrame({
+            "close": np.linspace(100, 101, 5),
+            "volume": np.arange(5, dtype=np.int64),
+        }, index=index)
+
+        with SharedMemoryStore() as store:
+            handle = pickle.loads(pickle.dumps(store.share_frame(df)))
+            with handle.open() as shared:
+                pd.testing.assert_frame_equal(shared, df, check_freq=False)
+
+    def test_object_columns_rejected(self):
+        """Non-numeric columns cannot be shared."""
+        df = pd.DataFrame({"symbol": ["AAPL", "MSFT"]})
+        with SharedMemoryStore() as store:
+            with pytest.raises(TypeError):
+                store.share_frame(df)
+
+    def test_close_unlinks_blocks(self):
+        """Closing the store releases all blocks."""
+        store = SharedMemoryStore()
+        store.share_array(np.ones(10))
+        assert store.nbytes >= 80
+        store.close()
+        assert store.nbytes == 0
@@ -165,6 +165,9 @@ def _shutdown_orchestrators():
         _reviewer_orchestrator = None
         logger.info("ReviewerOrchestrator stopped on app shutdown")
 
+    from src.api.analysis_jobs import shutdown_analysis_job_manager
+    shutdown_analysis_job_manager()
+
     try:
         from src.messaging.bus import get_message_bus
         bus = get_message_bus()